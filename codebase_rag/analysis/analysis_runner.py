@@ -3,7 +3,10 @@ from __future__ import annotations
 import json
 import os
 import time
+from contextlib import AbstractContextManager, nullcontext
+from dataclasses import replace
 from datetime import UTC, datetime
+from functools import partial
 from pathlib import Path
 
 from loguru import logger
@@ -13,7 +16,11 @@ from codebase_rag.core.config import settings
 
 from ..services.protocols import IngestorProtocol, QueryProtocol
 from ..utils.git_delta import get_git_head
+from ..utils.source_store import SourceStore
 from .dead_code_verifier import verify_dead_code
+from .graph_index import GraphIndex
+from .graph_snapshot import GraphSnapshot
+from .incremental import IncrementalState
 from .mixins import (
     AnalysisConfigMixin,
     AnalysisGraphAccessMixin,
@@ -21,6 +28,7 @@ from .mixins import (
     DeadCodeExportsMixin,
     DependenciesMixin,
     HotspotsMixin,
+    IncrementalAnalysisMixin,
     MigrationPlanMixin,
     OutputUtilsMixin,
     QualityMixin,
@@ -36,6 +44,7 @@ from .mixins import (
 )
 from .modules import (
     AnalysisContext,
+    AnalysisModule,
     ApiCallChainModule,
     ApiComplianceModule,
     ComplexityModule,
@@ -53,8 +62,17 @@ from .modules import (
     SecurityModule,
 )
 from .protocols import AnalysisRunnerProtocol
+from .scheduler import (
+    AnalysisTask,
+    TaskOutcome,
+    merge_outcomes,
+    run_task_graph,
+    serialized_ingestor,
+)
 from .types import NodeRecord, RelationshipRecord
 
+_FAST_SCOPED_ANALYSES = frozenset({"dead_code", "unused_imports"})
+
 
 class AnalysisRunner(
     AnalysisConfigMixin,
@@ -63,6 +81,7 @@ class AnalysisRunner(
     ComplexityMixin,
     DependenciesMixin,
     HotspotsMixin,
+    IncrementalAnalysisMixin,
     MigrationPlanMixin,
     OutputUtilsMixin,
     QualityMixin,
@@ -77,10 +96,21 @@ class AnalysisRunner(
     UsageInMemoryMixin,
     AnalysisRunnerProtocol,
 ):
-    def __init__(self, ingestor: IngestorProtocol, repo_path: Path) -> None:
+    def __init__(
+        self,
+        ingestor: IngestorProtocol,
+        repo_path: Path,
+        *,
+        source_store: SourceStore | None = None,
+    ) -> None:
         self.ingestor = ingestor
         self.repo_path = repo_path
         self.project_name = repo_path.resolve().name
+        self._graph_index_cache: GraphIndex | None = None
+        self._graph_snapshot_cache: GraphSnapshot | None = None
+        self._incremental_state: IncrementalState | None = None
+        self._shared_source_store = source_store
+        self._source_store_cache: SourceStore | None = source_store
 
     def run_all(self) -> None:
         if not isinstance(self.ingestor, QueryProtocol):
@@ -107,8 +137,9 @@ class AnalysisRunner(
         fast_incremental = str(
             os.getenv("CODEGRAPH_ANALYSIS_INCREMENTAL_FAST", "")
         ).lower() in {"1", "true", "yes"}
-        if incremental_paths is not None and fast_incremental and modules is None:
-            modules = {"dead_code", "unused_imports"}
+        fast_scope = (
+            incremental_paths is not None and fast_incremental and modules is None
+        )
         module_paths = self._resolve_module_paths(incremental_paths)
         use_db = str(os.getenv("CODEGRAPH_ANALYSIS_DB", "1")).lower() not in {
             "0",
@@ -127,11 +158,25 @@ class AnalysisRunner(
         if nodes:
             module_path_map = self._build_module_path_map(nodes)
             node_by_id = {node.node_id: node for node in nodes}
+            graph_index = self._graph_index(nodes, relationships)
         else:
             module_path_map = {}
             node_by_id = {}
+            graph_index = None
+
+        scope = (
+            self._analysis_scope(
+                nodes, relationships, module_path_map, incremental_paths
+            )
+            if incremental_paths is not None and nodes
+            else None
+        )
+        state_path = self.repo_path / ".codebase_rag" / "incremental_state.json"
+        state = IncrementalState.load(state_path, scope)
 
         summary: dict[str, object] = {}
+        self._source_store_cache = self._shared_source_store
+        source_store = self._source_store()
 
         context = AnalysisContext(
             runner=self,
@@ -144,48 +189,124 @@ class AnalysisRunner(
             use_db=use_db,
             summary=summary,
             dead_code_verifier=self._get_dead_code_verifier(),
+            graph_index=graph_index,
+            source_store=source_store,
         )
 
         module_registry = self._build_default_modules()
         module_names = {module.get_name() for module in module_registry}
-        for module in module_registry:
-            name = module.get_name()
-            if not self._should_run(name, modules):
-                continue
-            result = module.run(context)
-            if result:
-                summary[name] = result
-
-        self._run_supplemental_analyses(
-            summary,
-            modules,
-            module_names,
-            nodes,
-            relationships,
-            node_by_id,
-            module_path_map,
-            module_paths,
-            incremental_paths,
-            use_db,
+        tasks = [
+            AnalysisTask(
+                module.get_name(),
+                partial(self._run_module, module, context),
+                inputs=module.inputs,
+                outputs=module.outputs,
+                incremental=module.incremental,
+            )
+            for module in module_registry
+            if self._should_run(module.get_name(), modules)
+        ]
+        tasks.extend(
+            self._supplemental_tasks(
+                modules=modules,
+                module_names=module_names,
+                nodes=nodes,
+                relationships=relationships,
+                node_by_id=node_by_id,
+                module_path_map=module_path_map,
+                module_paths=module_paths,
+                incremental_paths=incremental_paths,
+                use_db=use_db,
+            )
         )
+        if fast_scope:
+            tasks = [
+                task
+                for task in tasks
+                if task.incremental or task.name in _FAST_SCOPED_ANALYSES
+            ]
+        with self._derived_graph_writes():
+            self._incremental_state = state
+            try:
+                merge_outcomes(summary, self._run_tasks(tasks))
+            finally:
+                self._incremental_state = None
+            if state.merged or state.rebuilt:
+                state.save(state_path)
+            if scope is not None:
+                summary["incremental"] = state.report(
+                    task.name for task in tasks if not task.incremental
+                )
 
-        if summary:
-            self._write_analysis_report(summary)
+            self._graph_index_cache = None
+            self._source_store_cache = self._shared_source_store
+            if summary and (source_store.stats.hits or source_store.stats.misses):
+                summary["source_store"] = source_store.stats.as_dict()
 
-        self.ingestor.flush_all()
+            if summary:
+                self._write_analysis_report(summary)
 
-        if incremental_paths is not None and fast_incremental:
-            return summary
+            self.ingestor.flush_all()
 
-        nodes, relationships = self._load_graph_data(self.ingestor)
-        if not nodes:
+        if needs_graph and not nodes:
             logger.info("Analysis skipped: no nodes found")
             return {}
 
         return summary
 
+    def _derived_graph_writes(self) -> AbstractContextManager[object]:
+        # (H) Analysis output is rebuilt on every run; writing it back must not
+        # (H) invalidate the graph snapshot it was computed from.
+        derived_writes = getattr(self.ingestor, "derived_writes", None)
+        return derived_writes() if callable(derived_writes) else nullcontext()
+
+    def _run_tasks(self, tasks: list[AnalysisTask]) -> list[TaskOutcome]:
+        workers = max(1, min(int(settings.CODEGRAPH_ANALYSIS_WORKERS), len(tasks)))
+        ingestor = self.ingestor
+        if workers > 1:
+            self.ingestor = serialized_ingestor(ingestor)
+        started = time.perf_counter()
+        try:
+            outcomes = run_task_graph(tasks, max_workers=workers)
+        finally:
+            self.ingestor = ingestor
+        elapsed = time.perf_counter() - started
+        if outcomes:
+            self._write_json_report(
+                "analysis_timings.json",
+                {
+                    "workers": workers,
+                    "wall_seconds": round(elapsed, 4),
+                    "task_seconds": round(sum(o.seconds for o in outcomes), 4),
+                    "tasks": [
+                        {
+                            "name": outcome.name,
+                            "seconds": round(outcome.seconds, 4),
+                            "depends_on": list(outcome.depends_on),
+                        }
+                        for outcome in outcomes
+                    ],
+                },
+            )
+            slowest = max(outcomes, key=lambda outcome: outcome.seconds)
+            logger.debug(
+                "Analysis ran {} tasks on {} workers in {:.2f}s (slowest: {} {:.2f}s)",
+                len(outcomes),
+                workers,
+                elapsed,
+                slowest.name,
+                slowest.seconds,
+            )
+        return outcomes
+
+    @staticmethod
+    def _run_module(
+        module: AnalysisModule, context: AnalysisContext, summary: dict[str, object]
+    ) -> dict[str, object]:
+        return module.run(replace(context, summary=summary))
+
     @staticmethod
-    def _build_default_modules() -> list:
+    def _build_default_modules() -> list[AnalysisModule]:
         return [
             ComplexityModule(),
             DeadCodeModule(),
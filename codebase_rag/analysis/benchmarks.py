@@ -26,10 +26,10 @@ def _timed_run(
     runner: AnalysisRunner,
     modules: set[str] | None,
     incremental_paths: list[str] | None = None,
-) -> float:
+) -> tuple[float, dict[str, object]]:
     start = time.perf_counter()
-    runner.run_modules(modules, incremental_paths=incremental_paths)
-    return time.perf_counter() - start
+    summary = runner.run_modules(modules, incremental_paths=incremental_paths)
+    return time.perf_counter() - start, summary
 
 
 def _summarize_durations(durations: list[float]) -> dict[str, float]:
@@ -62,7 +62,7 @@ def run_analysis_benchmarks(
 
     full_durations: list[float] = []
     for _ in range(max(runs, 1)):
-        full_durations.append(_timed_run(runner, modules_set))
+        full_durations.append(_timed_run(runner, modules_set)[0])
 
     full_result = {
         "runs": len(full_durations),
@@ -72,9 +72,11 @@ def run_analysis_benchmarks(
     incremental_result: dict[str, Any]
     incremental_paths: list[str] | None = None
     if base_rev:
-        changed, _ = get_git_delta(repo_path, base_rev)
+        changed, deleted = get_git_delta(repo_path, base_rev)
         changed = filter_existing(changed)
-        incremental_paths = [str(path.relative_to(repo_path)) for path in changed]
+        incremental_paths = [
+            str(path.relative_to(repo_path)) for path in (*changed, *deleted)
+        ]
     if incremental_paths is None:
         incremental_result = {
             "status": "skipped",
@@ -82,15 +84,28 @@ def run_analysis_benchmarks(
         }
     else:
         incremental_durations: list[float] = []
+        incremental_summary: dict[str, object] = {}
         for _ in range(max(runs, 1)):
-            incremental_durations.append(
-                _timed_run(runner, modules_set, incremental_paths=incremental_paths)
+            duration, incremental_summary = _timed_run(
+                runner, modules_set, incremental_paths=incremental_paths
             )
+            incremental_durations.append(duration)
+        durations = _summarize_durations(incremental_durations)
+        scope = cast(dict[str, Any], incremental_summary.get("incremental") or {})
         incremental_result = {
             "runs": len(incremental_durations),
             "changed_files": len(incremental_paths),
             "base_rev": base_rev,
-            **_summarize_durations(incremental_durations),
+            **durations,
+            "affected_files": scope.get("affected_files"),
+            "affected_nodes": scope.get("affected_nodes"),
+            "merged": scope.get("merged", []),
+            "full_only": scope.get("full_only", []),
+            "time_ratio": (
+                round(durations["avg_seconds"] / full_result["avg_seconds"], 4)
+                if full_result["avg_seconds"]
+                else None
+            ),
         }
 
     dead_code_result = runner.run_modules({"dead_code_ai"})
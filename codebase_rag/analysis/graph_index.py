@@ -0,0 +1,478 @@
+from __future__ import annotations
+
+import heapq
+from array import array
+from collections.abc import Callable, Collection, Iterable, Iterator, Sequence
+from dataclasses import dataclass
+from itertools import accumulate, chain, islice, repeat
+from operator import add, sub
+
+from loguru import logger
+
+from ..utils.graph_cycles import tarjan_components
+from .types import NodeRecord, RelationshipRecord
+
+_DENSE_TYPECODE = "i"
+_NODE_ID_TYPECODE = "q"
+_EXACT_REACH_BUDGET_BYTES = 256 * 1024 * 1024
+_REACH_SKETCH_SIZE = 256
+_HASH_MASK = (1 << 64) - 1
+
+
+@dataclass(frozen=True, slots=True)
+class _CompressedAdjacency:
+    offsets: array
+    neighbors: array
+
+    def neighbors_of(self, dense_id: int) -> array:
+        return self.neighbors[self.offsets[dense_id] : self.offsets[dense_id + 1]]
+
+    def degree(self, dense_id: int) -> int:
+        return self.offsets[dense_id + 1] - self.offsets[dense_id]
+
+
+def _compress(sources: array, targets: array, node_count: int) -> _CompressedAdjacency:
+    counts = array(_DENSE_TYPECODE, bytes(4 * (node_count + 1)))
+    for source in sources:
+        counts[source + 1] += 1
+    offsets = array(_DENSE_TYPECODE, accumulate(counts))
+    cursor = offsets[:-1]
+    neighbors = array(_DENSE_TYPECODE, bytes(4 * len(targets)))
+    for source, target in zip(sources, targets):
+        neighbors[cursor[source]] = target
+        cursor[source] += 1
+    return _CompressedAdjacency(offsets=offsets, neighbors=neighbors)
+
+
+def _condensation_children(
+    components: Sequence[Sequence[int]],
+    component_of: array,
+    adjacencies: Sequence[_CompressedAdjacency],
+) -> list[list[int]]:
+    children: list[list[int]] = []
+    for position, members in enumerate(components):
+        targets = {
+            component_of[successor]
+            for member in members
+            for adjacency in adjacencies
+            for successor in adjacency.neighbors_of(member)
+        }
+        targets.discard(position)
+        children.append(sorted(targets))
+    return children
+
+
+def _exact_reach_counts(
+    components: Sequence[Sequence[int]],
+    children: Sequence[Sequence[int]],
+    remaining_parents: array,
+    budget_bytes: int,
+) -> array | None:
+    counts = array(_DENSE_TYPECODE, repeat(0, len(components)))
+    live: dict[int, tuple[int, int]] = {}
+    live_bytes = 0
+    first_bit = 0
+    for position, members in enumerate(components):
+        low_bit, bits = first_bit, (1 << len(members)) - 1
+        first_bit += len(members)
+        for child in children[position]:
+            child_low, child_bits = live[child]
+            if child_low < low_bit:
+                bits <<= low_bit - child_low
+                low_bit = child_low
+            bits |= child_bits << (child_low - low_bit)
+            remaining_parents[child] -= 1
+            if not remaining_parents[child]:
+                del live[child]
+                live_bytes -= (child_bits.bit_length() + 7) // 8
+        counts[position] = bits.bit_count()
+        if remaining_parents[position]:
+            live[position] = (low_bit, bits)
+            live_bytes += (bits.bit_length() + 7) // 8
+            if live_bytes > budget_bytes:
+                return None
+    return counts
+
+
+def _sketch_hash(dense: int) -> int:
+    value = (dense + 0x9E3779B97F4A7C15) & _HASH_MASK
+    value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & _HASH_MASK
+    value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & _HASH_MASK
+    return value ^ (value >> 31)
+
+
+def _sketch_reach_counts(
+    components: Sequence[Sequence[int]],
+    children: Sequence[Sequence[int]],
+    remaining_parents: array,
+    sketch_size: int,
+) -> array:
+    counts = array(_DENSE_TYPECODE, repeat(0, len(components)))
+    node_count = sum(len(members) for members in components)
+    live: dict[int, list[int]] = {}
+    for position, members in enumerate(components):
+        hashes = {_sketch_hash(member) for member in members}
+        for child in children[position]:
+            hashes.update(live[child])
+            remaining_parents[child] -= 1
+            if not remaining_parents[child]:
+                del live[child]
+        sketch = heapq.nsmallest(sketch_size, hashes)
+        if len(sketch) < sketch_size:
+            counts[position] = len(sketch)
+        else:
+            estimate = (sketch_size - 1) * (_HASH_MASK + 1) // (sketch[-1] + 1)
+            counts[position] = min(node_count, max(sketch_size, estimate))
+        if remaining_parents[position]:
+            live[position] = sketch
+    return counts
+
+
+class GraphIndex:
+    __slots__ = (
+        "_dense_ids",
+        "_edge_sources",
+        "_edge_targets",
+        "_incoming",
+        "_known_node_count",
+        "_node_ids",
+        "_outgoing",
+        "_source_lengths",
+        "_sources",
+    )
+
+    def __init__(
+        self,
+        node_ids: array,
+        dense_ids: dict[int, int],
+        known_node_count: int,
+        edge_sources: dict[str, array],
+        edge_targets: dict[str, array],
+    ) -> None:
+        self._node_ids = node_ids
+        self._dense_ids = dense_ids
+        self._known_node_count = known_node_count
+        self._edge_sources = edge_sources
+        self._edge_targets = edge_targets
+        self._outgoing: dict[str, _CompressedAdjacency] = {}
+        self._incoming: dict[str, _CompressedAdjacency] = {}
+        self._sources: tuple[object, object] = (None, None)
+        self._source_lengths: tuple[int, int] = (0, 0)
+
+    @classmethod
+    def build(
+        cls,
+        nodes: Sequence[NodeRecord],
+        relationships: Sequence[RelationshipRecord],
+    ) -> GraphIndex:
+        node_ids = array(_NODE_ID_TYPECODE)
+        dense_ids: dict[int, int] = {}
+        for node in nodes:
+            if node.node_id not in dense_ids:
+                dense_ids[node.node_id] = len(node_ids)
+                node_ids.append(node.node_id)
+        known_node_count = len(node_ids)
+
+        edge_sources: dict[str, array] = {}
+        edge_targets: dict[str, array] = {}
+        for rel in relationships:
+            source = dense_ids.get(rel.from_id)
+            if source is None:
+                source = dense_ids[rel.from_id] = len(node_ids)
+                node_ids.append(rel.from_id)
+            target = dense_ids.get(rel.to_id)
+            if target is None:
+                target = dense_ids[rel.to_id] = len(node_ids)
+                node_ids.append(rel.to_id)
+            rel_type = str(rel.rel_type)
+            sources = edge_sources.get(rel_type)
+            if sources is None:
+                sources = edge_sources[rel_type] = array(_DENSE_TYPECODE)
+                edge_targets[rel_type] = array(_DENSE_TYPECODE)
+            sources.append(source)
+            edge_targets[rel_type].append(target)
+
+        index = cls(node_ids, dense_ids, known_node_count, edge_sources, edge_targets)
+        index._sources = (nodes, relationships)
+        index._source_lengths = (len(nodes), len(relationships))
+        return index
+
+    def is_built_from(
+        self,
+        nodes: Sequence[NodeRecord],
+        relationships: Sequence[RelationshipRecord],
+    ) -> bool:
+        return (
+            self._sources[0] is nodes
+            and self._sources[1] is relationships
+            and self._source_lengths == (len(nodes), len(relationships))
+        )
+
+    @property
+    def node_count(self) -> int:
+        return len(self._node_ids)
+
+    @property
+    def rel_types(self) -> frozenset[str]:
+        return frozenset(self._edge_sources)
+
+    def edge_count(self, rel_types: str | Iterable[str] | None = None) -> int:
+        types = self._edge_sources if rel_types is None else self._types(rel_types)
+        return sum(len(self._edge_sources[rel_type]) for rel_type in types)
+
+    def dangling_edge_count(self) -> int:
+        known = self._known_node_count
+        return sum(
+            1
+            for rel_type, sources in self._edge_sources.items()
+            for source, target in zip(sources, self._edge_targets[rel_type])
+            if source >= known or target >= known
+        )
+
+    def edges(self, rel_types: str | Iterable[str]) -> Iterator[tuple[int, int]]:
+        node_ids = self._node_ids
+        for rel_type in self._types(rel_types):
+            sources = self._edge_sources[rel_type]
+            for source, target in zip(sources, self._edge_targets[rel_type]):
+                yield node_ids[source], node_ids[target]
+
+    def successors(self, node_id: int, rel_types: str | Iterable[str]) -> list[int]:
+        return self._neighbors(node_id, rel_types, outgoing=True)
+
+    def predecessors(self, node_id: int, rel_types: str | Iterable[str]) -> list[int]:
+        return self._neighbors(node_id, rel_types, outgoing=False)
+
+    def out_edges(
+        self, node_id: int, rel_types: str | Iterable[str]
+    ) -> list[tuple[int, str]]:
+        return self._typed_neighbors(node_id, rel_types, outgoing=True)
+
+    def in_edges(
+        self, node_id: int, rel_types: str | Iterable[str]
+    ) -> list[tuple[int, str]]:
+        return self._typed_neighbors(node_id, rel_types, outgoing=False)
+
+    def out_degree(self, node_id: int, rel_types: str | Iterable[str]) -> int:
+        return self._degree(node_id, rel_types, outgoing=True)
+
+    def in_degree(self, node_id: int, rel_types: str | Iterable[str]) -> int:
+        return self._degree(node_id, rel_types, outgoing=False)
+
+    def out_degrees(self, rel_types: str | Iterable[str]) -> dict[int, int]:
+        return self._degrees(rel_types, outgoing=True)
+
+    def in_degrees(self, rel_types: str | Iterable[str]) -> dict[int, int]:
+        return self._degrees(rel_types, outgoing=False)
+
+    def edge_types_between(self, source_id: int, target_id: int) -> list[str]:
+        source = self._dense_ids.get(source_id)
+        target = self._dense_ids.get(target_id)
+        if source is None or target is None:
+            return []
+        matches: list[str] = []
+        for rel_type in self._edge_sources:
+            adjacency = self._adjacency(rel_type, outgoing=True)
+            matches.extend(
+                rel_type
+                for neighbor in adjacency.neighbors_of(source)
+                if neighbor == target
+            )
+        return matches
+
+    def adjacency(
+        self,
+        rel_types: str | Iterable[str],
+        *,
+        within: Collection[int] | None = None,
+    ) -> dict[int, set[int]]:
+        graph: dict[int, set[int]] = {}
+        for source_id, target_id in self.edges(rel_types):
+            if within is not None and (
+                source_id not in within or target_id not in within
+            ):
+                continue
+            graph.setdefault(source_id, set()).add(target_id)
+        return graph
+
+    def reachable(
+        self, start_ids: Iterable[int], rel_types: str | Iterable[str]
+    ) -> set[int]:
+        adjacencies = [
+            self._adjacency(rel_type, outgoing=True)
+            for rel_type in self._types(rel_types)
+        ]
+        seen: set[int] = set()
+        stack = [
+            dense
+            for start_id in start_ids
+            if (dense := self._dense_ids.get(start_id)) is not None
+        ]
+        while stack:
+            current = stack.pop()
+            if current in seen:
+                continue
+            seen.add(current)
+            for adjacency in adjacencies:
+                stack.extend(adjacency.neighbors_of(current))
+        node_ids = self._node_ids
+        return {node_ids[dense] for dense in seen}
+
+    def neighborhood(
+        self, start_ids: Iterable[int], rel_types: str | Iterable[str], *, hops: int
+    ) -> set[int]:
+        adjacencies = [
+            self._adjacency(rel_type, outgoing=outgoing)
+            for rel_type in self._types(rel_types)
+            for outgoing in (True, False)
+        ]
+        seen = {
+            dense
+            for start_id in start_ids
+            if (dense := self._dense_ids.get(start_id)) is not None
+        }
+        frontier = list(seen)
+        for _ in range(hops):
+            if not frontier:
+                break
+            reached: list[int] = []
+            for current in frontier:
+                for adjacency in adjacencies:
+                    for neighbor in adjacency.neighbors_of(current):
+                        if neighbor not in seen:
+                            seen.add(neighbor)
+                            reached.append(neighbor)
+            frontier = reached
+        node_ids = self._node_ids
+        return {node_ids[dense] for dense in seen}
+
+    def reachable_counts(
+        self,
+        rel_types: str | Iterable[str],
+        *,
+        exact_budget_bytes: int = _EXACT_REACH_BUDGET_BYTES,
+        sketch_size: int = _REACH_SKETCH_SIZE,
+    ) -> dict[int, int]:
+        adjacencies = [
+            self._adjacency(rel_type, outgoing=True)
+            for rel_type in self._types(rel_types)
+        ]
+        if not adjacencies:
+            return {}
+        components = tarjan_components(
+            len(self._node_ids), self._successor_function(adjacencies)
+        )
+        component_of = array(_DENSE_TYPECODE, repeat(0, len(self._node_ids)))
+        for position, members in enumerate(components):
+            for member in members:
+                component_of[member] = position
+        children = _condensation_children(components, component_of, adjacencies)
+        parent_counts = array(_DENSE_TYPECODE, repeat(0, len(components)))
+        for targets in children:
+            for child in targets:
+                parent_counts[child] += 1
+
+        counts = _exact_reach_counts(
+            components,
+            children,
+            array(_DENSE_TYPECODE, parent_counts),
+            exact_budget_bytes,
+        )
+        if counts is None:
+            logger.info(
+                "Reachability bitsets exceeded {} bytes; estimating counts for {} components",
+                exact_budget_bytes,
+                len(components),
+            )
+            counts = _sketch_reach_counts(
+                components, children, parent_counts, sketch_size
+            )
+        node_ids = self._node_ids
+        return {
+            node_ids[member]: counts[position] - 1
+            for position, members in enumerate(components)
+            if counts[position] > 1
+            for member in members
+        }
+
+    @staticmethod
+    def _successor_function(
+        adjacencies: Sequence[_CompressedAdjacency],
+    ) -> Callable[[int], Iterable[int]]:
+        if len(adjacencies) == 1:
+            return adjacencies[0].neighbors_of
+        return lambda dense: chain.from_iterable(
+            adjacency.neighbors_of(dense) for adjacency in adjacencies
+        )
+
+    def _neighbors(
+        self, node_id: int, rel_types: str | Iterable[str], *, outgoing: bool
+    ) -> list[int]:
+        dense = self._dense_ids.get(node_id)
+        if dense is None:
+            return []
+        node_ids = self._node_ids
+        result: list[int] = []
+        for rel_type in self._types(rel_types):
+            adjacency = self._adjacency(rel_type, outgoing=outgoing)
+            result.extend(
+                node_ids[neighbor] for neighbor in adjacency.neighbors_of(dense)
+            )
+        return result
+
+    def _typed_neighbors(
+        self, node_id: int, rel_types: str | Iterable[str], *, outgoing: bool
+    ) -> list[tuple[int, str]]:
+        dense = self._dense_ids.get(node_id)
+        if dense is None:
+            return []
+        node_ids = self._node_ids
+        result: list[tuple[int, str]] = []
+        for rel_type in self._types(rel_types):
+            adjacency = self._adjacency(rel_type, outgoing=outgoing)
+            result.extend(
+                (node_ids[neighbor], rel_type)
+                for neighbor in adjacency.neighbors_of(dense)
+            )
+        return result
+
+    def _degree(
+        self, node_id: int, rel_types: str | Iterable[str], *, outgoing: bool
+    ) -> int:
+        dense = self._dense_ids.get(node_id)
+        if dense is None:
+            return 0
+        return sum(
+            self._adjacency(rel_type, outgoing=outgoing).degree(dense)
+            for rel_type in self._types(rel_types)
+        )
+
+    def _degrees(
+        self, rel_types: str | Iterable[str], *, outgoing: bool
+    ) -> dict[int, int]:
+        totals: Iterable[int] = repeat(0, len(self._node_ids))
+        for rel_type in self._types(rel_types):
+            offsets = self._adjacency(rel_type, outgoing=outgoing).offsets
+            totals = map(add, totals, map(sub, islice(offsets, 1, None), offsets))
+        return {
+            node_id: count for node_id, count in zip(self._node_ids, totals) if count
+        }
+
+    def _adjacency(self, rel_type: str, *, outgoing: bool) -> _CompressedAdjacency:
+        cache = self._outgoing if outgoing else self._incoming
+        compressed = cache.get(rel_type)
+        if compressed is None:
+            sources = self._edge_sources[rel_type]
+            targets = self._edge_targets[rel_type]
+            compressed = cache[rel_type] = (
+                _compress(sources, targets, len(self._node_ids))
+                if outgoing
+                else _compress(targets, sources, len(self._node_ids))
+            )
+        return compressed
+
+    def _types(self, rel_types: str | Iterable[str]) -> list[str]:
+        if isinstance(rel_types, str):
+            rel_type = str(rel_types)
+            return [rel_type] if rel_type in self._edge_sources else []
+        wanted = {str(rel_type) for rel_type in rel_types}
+        return [rel_type for rel_type in self._edge_sources if rel_type in wanted]
@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+import json
+import marshal
+import os
+import struct
+import sys
+from array import array
+from dataclasses import dataclass
+from pathlib import Path
+
+from loguru import logger
+
+from .types import NodeRecord, RelationshipRecord
+
+GRAPH_SNAPSHOT_VERSION = 1
+_MAGIC = b"CGGS"
+_PREFIX = struct.Struct("<4sI")
+_ID_TYPECODE = "q"
+_INDEX_TYPECODE = "I"
+_SECTIONS = (
+    ("node_ids", _ID_TYPECODE),
+    ("node_labels", _INDEX_TYPECODE),
+    ("rel_from", _ID_TYPECODE),
+    ("rel_to", _ID_TYPECODE),
+    ("rel_types", _INDEX_TYPECODE),
+)
+
+
+@dataclass(frozen=True, slots=True)
+class GraphSnapshotKey:
+    project_name: str
+    git_head: str | None
+    generation: str | None
+
+    @property
+    def cacheable(self) -> bool:
+        return self.git_head is not None and self.generation is not None
+
+
+@dataclass(slots=True)
+class GraphSnapshot:
+    key: GraphSnapshotKey
+    nodes: list[NodeRecord]
+    relationships: list[RelationshipRecord]
+
+    @classmethod
+    def load(cls, path: Path, key: GraphSnapshotKey) -> GraphSnapshot | None:
+        try:
+            data = memoryview(path.read_bytes())
+            magic, header_size = _PREFIX.unpack_from(data)
+            if magic != _MAGIC:
+                return None
+            offset = _PREFIX.size
+            header = json.loads(bytes(data[offset : offset + header_size]))
+            offset += header_size
+            if header.get("version") != GRAPH_SNAPSHOT_VERSION or (
+                header.get("marshal") != marshal.version
+            ):
+                return None
+            if header.get("key") != [key.project_name, key.git_head, key.generation]:
+                return None
+            sizes: dict[str, int] = header["sizes"]
+            columns: dict[str, array] = {}
+            for name, typecode in _SECTIONS:
+                column = array(typecode)
+                column.frombytes(data[offset : offset + sizes[name]])
+                if header.get("byteorder") != sys.byteorder:
+                    column.byteswap()
+                columns[name] = column
+                offset += sizes[name]
+            node_props = marshal.loads(data[offset : offset + sizes["node_props"]])
+            offset += sizes["node_props"]
+            rel_props = marshal.loads(data[offset : offset + sizes["rel_props"]])
+        except (OSError, ValueError, EOFError, TypeError, KeyError, struct.error):
+            return None
+
+        label_sets: list[list[str]] = header["label_sets"]
+        rel_types: list[str] = header["rel_types"]
+        nodes = [
+            NodeRecord(
+                node_id=node_id,
+                labels=list(label_sets[label_index]),
+                properties=properties,
+            )
+            for node_id, label_index, properties in zip(
+                columns["node_ids"], columns["node_labels"], node_props, strict=True
+            )
+        ]
+        relationships = [
+            RelationshipRecord(
+                from_id=from_id,
+                to_id=to_id,
+                rel_type=rel_types[type_index],
+                properties=properties,
+            )
+            for from_id, to_id, type_index, properties in zip(
+                columns["rel_from"],
+                columns["rel_to"],
+                columns["rel_types"],
+                rel_props,
+                strict=True,
+            )
+        ]
+        return cls(key, nodes, relationships)
+
+    def save(self, path: Path) -> bool:
+        label_index: dict[tuple[str, ...], int] = {}
+        type_index: dict[str, int] = {}
+        columns = {
+            "node_ids": array(_ID_TYPECODE, (node.node_id for node in self.nodes)),
+            "node_labels": array(
+                _INDEX_TYPECODE,
+                (
+                    label_index.setdefault(tuple(node.labels), len(label_index))
+                    for node in self.nodes
+                ),
+            ),
+            "rel_from": array(
+                _ID_TYPECODE, (rel.from_id for rel in self.relationships)
+            ),
+            "rel_to": array(_ID_TYPECODE, (rel.to_id for rel in self.relationships)),
+            "rel_types": array(
+                _INDEX_TYPECODE,
+                (
+                    type_index.setdefault(rel.rel_type, len(type_index))
+                    for rel in self.relationships
+                ),
+            ),
+        }
+        try:
+            blobs = {
+                "node_props": marshal.dumps([node.properties for node in self.nodes]),
+                "rel_props": marshal.dumps(
+                    [rel.properties for rel in self.relationships]
+                ),
+            }
+        except ValueError as exc:
+            logger.debug("Graph snapshot not cached: {}", exc)
+            return False
+
+        sections = [columns[name].tobytes() for name, _ in _SECTIONS]
+        header = json.dumps(
+            {
+                "version": GRAPH_SNAPSHOT_VERSION,
+                "marshal": marshal.version,
+                "byteorder": sys.byteorder,
+                "key": [
+                    self.key.project_name,
+                    self.key.git_head,
+                    self.key.generation,
+                ],
+                "label_sets": [list(labels) for labels in label_index],
+                "rel_types": list(type_index),
+                "sizes": {
+                    **{
+                        name: len(section)
+                        for (name, _), section in zip(_SECTIONS, sections)
+                    },
+                    **{name: len(blob) for name, blob in blobs.items()},
+                },
+            },
+            ensure_ascii=False,
+        ).encode()
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            staging = path.with_name(f"{path.name}.tmp")
+            with staging.open("wb") as handle:
+                handle.write(_PREFIX.pack(_MAGIC, len(header)))
+                handle.write(header)
+                for section in sections:
+                    handle.write(section)
+                handle.write(blobs["node_props"])
+                handle.write(blobs["rel_props"])
+            os.replace(staging, path)
+        except OSError as exc:
+            logger.debug("Graph snapshot not cached: {}", exc)
+            return False
+        return True
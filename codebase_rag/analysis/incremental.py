@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from ..core.constants import ENCODING_UTF8
+
+INCREMENTAL_STATE_VERSION = 1
+
+PartitionedRecords = dict[str, Any]
+
+
+@dataclass(frozen=True, slots=True)
+class AnalysisScope:
+    changed_paths: frozenset[str]
+    paths: frozenset[str]
+    node_ids: frozenset[int]
+    hops: int
+
+    def covers(self, path: str | None) -> bool:
+        return path is not None and path in self.paths
+
+    def as_dict(self) -> dict[str, int]:
+        return {
+            "changed_files": len(self.changed_paths),
+            "affected_files": len(self.paths),
+            "affected_nodes": len(self.node_ids),
+            "hops": self.hops,
+        }
+
+
+@dataclass(slots=True)
+class IncrementalState:
+    metrics: dict[str, PartitionedRecords] = field(default_factory=dict)
+    scope: AnalysisScope | None = None
+    merged: list[str] = field(default_factory=list)
+    rebuilt: list[str] = field(default_factory=list)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    @classmethod
+    def load(cls, path: Path, scope: AnalysisScope | None) -> IncrementalState:
+        try:
+            payload = json.loads(path.read_text(encoding=ENCODING_UTF8))
+        except (OSError, ValueError):
+            return cls(scope=scope)
+        if not isinstance(payload, dict) or (
+            payload.get("version") != INCREMENTAL_STATE_VERSION
+        ):
+            return cls(scope=scope)
+        metrics = payload.get("metrics") or {}
+        return cls(
+            metrics={
+                str(name): dict(records)
+                for name, records in metrics.items()
+                if isinstance(records, dict)
+            },
+            scope=scope,
+        )
+
+    def save(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        staging = path.with_name(f"{path.name}.tmp")
+        with self._lock:
+            payload = {"version": INCREMENTAL_STATE_VERSION, "metrics": self.metrics}
+            staging.write_text(
+                json.dumps(payload, ensure_ascii=False), encoding=ENCODING_UTF8
+            )
+        os.replace(staging, path)
+
+    def records(
+        self,
+        key: str,
+        compute: Callable[[AnalysisScope | None], PartitionedRecords],
+    ) -> PartitionedRecords:
+        with self._lock:
+            previous = self.metrics.get(key)
+        scope = self.scope if previous is not None else None
+        fresh = compute(scope)
+        with self._lock:
+            if scope is None or previous is None:
+                merged = dict(fresh)
+                self.rebuilt.append(key)
+            else:
+                merged = {
+                    path: record
+                    for path, record in previous.items()
+                    if path not in scope.paths
+                }
+                merged.update(fresh)
+                self.merged.append(key)
+            self.metrics[key] = merged
+        return merged
+
+    def report(self, full_only: Iterable[str]) -> dict[str, Any]:
+        if self.scope is None:
+            return {}
+        return {
+            "mode": "incremental",
+            **self.scope.as_dict(),
+            "merged": sorted(self.merged),
+            "rebuilt": sorted(self.rebuilt),
+            "full_only": sorted(full_only),
+        }
@@ -51,7 +51,7 @@ class IncrementalAnalyzer:
 
         return self.runner.run_modules(
             modules=modules,
-            incremental_paths=changes.changed,
+            incremental_paths=[*changes.changed, *changes.deleted],
         )
 
     @staticmethod
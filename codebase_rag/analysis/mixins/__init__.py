@@ -4,6 +4,7 @@ from .dead_code_exports import DeadCodeExportsMixin
 from .dependencies import DependenciesMixin
 from .graph_access import AnalysisGraphAccessMixin
 from .hotspots import HotspotsMixin
+from .incremental import IncrementalAnalysisMixin
 from .migration_plan import MigrationPlanMixin
 from .output_utils import OutputUtilsMixin
 from .quality import QualityMixin
@@ -24,6 +25,7 @@ __all__ = [
     "DeadCodeExportsMixin",
     "DependenciesMixin",
     "HotspotsMixin",
+    "IncrementalAnalysisMixin",
     "MigrationPlanMixin",
     "OutputUtilsMixin",
     "QualityMixin",
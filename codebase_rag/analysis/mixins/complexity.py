@@ -1,13 +1,20 @@
 from __future__ import annotations
 
-import re
-
 from codebase_rag.core import constants as cs
 
-from ...utils.source_extraction import extract_source_lines
+from ..incremental import AnalysisScope
 from ..protocols import AnalysisRunnerProtocol
 from ..types import NodeRecord
 
+_COMPLEXITY_FIELDS = (
+    "total",
+    "max",
+    "cognitive_total",
+    "cognitive_max",
+    "measured",
+    "unmeasured",
+)
+
 
 class ComplexityMixin:
     def _compute_complexity(
@@ -15,72 +22,59 @@ class ComplexityMixin:
         nodes: list[NodeRecord],
         module_path_map: dict[str, str],
     ) -> dict[str, float]:
-        total = 0
-        max_complexity = 0
-        measured = 0
-        decision_keywords = {
-            "if",
-            "elif",
-            "else",
-            "for",
-            "while",
-            "do",
-            "case",
-            "catch",
-            "switch",
-            "when",
-            "match",
+        records = self._partitioned_records(
+            "complexity",
+            lambda scope: self._complexity_by_path(nodes, module_path_map, scope),
+        )
+        total = sum(record["total"] for record in records.values())
+        cognitive_total = sum(record["cognitive_total"] for record in records.values())
+        measured = sum(record["measured"] for record in records.values())
+        unmeasured = sum(record["unmeasured"] for record in records.values())
+        max_complexity = max((record["max"] for record in records.values()), default=0)
+        max_cognitive = max(
+            (record["cognitive_max"] for record in records.values()), default=0
+        )
+
+        return {
+            "average": total / measured if measured else 0.0,
+            "max": float(max_complexity),
+            "count": float(measured),
+            "cognitive_average": cognitive_total / measured if measured else 0.0,
+            "cognitive_max": float(max_cognitive),
+            "unmeasured": float(unmeasured),
         }
+
+    def _complexity_by_path(
+        self: AnalysisRunnerProtocol,
+        nodes: list[NodeRecord],
+        module_path_map: dict[str, str],
+        scope: AnalysisScope | None,
+    ) -> dict[str, dict[str, int]]:
+        records: dict[str, dict[str, int]] = {}
         for node in nodes:
             if (
                 cs.NodeLabel.FUNCTION.value not in node.labels
                 and cs.NodeLabel.METHOD.value not in node.labels
             ):
                 continue
-
-            qn = str(node.properties.get(cs.KEY_QUALIFIED_NAME) or "")
             path = self._resolve_node_path(node, module_path_map)
-            start_line = int(str(node.properties.get(cs.KEY_START_LINE) or 0))
-            end_line = int(str(node.properties.get(cs.KEY_END_LINE) or 0))
-            if not path or not start_line or not end_line:
+            if not path or not self._is_runtime_source_path(path):
                 continue
-            if not self._is_runtime_source_path(path):
+            if scope is not None and not scope.covers(path):
                 continue
 
-            source = extract_source_lines(self.repo_path / path, start_line, end_line)
-            if not source:
+            record = records.get(path)
+            if record is None:
+                record = records[path] = dict.fromkeys(_COMPLEXITY_FIELDS, 0)
+            complexity = node.properties.get(cs.KEY_COMPLEXITY)
+            if complexity is None:
+                record["unmeasured"] += 1
                 continue
-
-            lines = source.splitlines()
-            complexity = 1
-            for line in lines:
-                tokens = re.split(r"\W+", line)
-                if any(token in decision_keywords for token in tokens):
-                    complexity += 1
-                if "&&" in line or "||" in line or "??" in line:
-                    complexity += 1
-                if "?" in line and ":" in line:
-                    complexity += 1
-
-            self.ingestor.ensure_node_batch(
-                (
-                    cs.NodeLabel.METHOD
-                    if cs.NodeLabel.METHOD.value in node.labels
-                    else cs.NodeLabel.FUNCTION
-                ),
-                {
-                    cs.KEY_QUALIFIED_NAME: qn,
-                    "complexity": complexity,
-                    "lines_of_code": end_line - start_line + 1,
-                },
-            )
-            total += complexity
-            max_complexity = max(max_complexity, complexity)
-            measured += 1
-
-        average = total / measured if measured else 0.0
-        return {
-            "average": average,
-            "max": float(max_complexity),
-            "count": float(measured),
-        }
+            complexity = int(str(complexity))
+            cognitive = int(str(node.properties.get(cs.KEY_COGNITIVE_COMPLEXITY) or 0))
+            record["total"] += complexity
+            record["max"] = max(record["max"], complexity)
+            record["cognitive_total"] += cognitive
+            record["cognitive_max"] = max(record["cognitive_max"], cognitive)
+            record["measured"] += 1
+        return records
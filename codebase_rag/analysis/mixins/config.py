@@ -43,11 +43,11 @@ class AnalysisConfigMixin:
         base_head = cast(Any, self)._get_latest_git_head()
         if not base_head:
             return None
-        changed, _ = get_git_delta(self.repo_path, base_head)
+        changed, deleted = get_git_delta(self.repo_path, base_head)
         changed = filter_existing(changed)
-        if not changed:
+        if not changed and not deleted:
             return []
-        return [str(path.relative_to(self.repo_path)) for path in changed]
+        return [str(path.relative_to(self.repo_path)) for path in (*changed, *deleted)]
 
     def _get_latest_git_head(self: AnalysisRunnerProtocol) -> str | None:
         try:
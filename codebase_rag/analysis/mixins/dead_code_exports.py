@@ -3,7 +3,7 @@ from __future__ import annotations
 import re
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import Any, cast
+from typing import Any
 
 from ...core import constants as cs
 from ..protocols import AnalysisRunnerProtocol
@@ -627,23 +627,7 @@ class DeadCodeExportsMixin:
         self: AnalysisRunnerProtocol,
         path: str,
     ) -> str:
-        cache = getattr(self, "_dead_code_source_text_cache", None)
-        if not isinstance(cache, dict):
-            cache = {}
-            setattr(self, "_dead_code_source_text_cache", cache)
-        if path in cache:
-            return cast(str, cache[path])
-
-        file_path = self.repo_path / path
-        if not file_path.exists() or not file_path.is_file():
-            cache[path] = ""
-            return ""
-        try:
-            source_text = file_path.read_text(encoding="utf-8", errors="ignore")
-        except Exception:
-            source_text = ""
-        cache[path] = source_text
-        return source_text
+        return self._read_source_text(path) or ""
 
     @staticmethod
     def _count_symbol_occurrences(source_text: str, name: str) -> int:
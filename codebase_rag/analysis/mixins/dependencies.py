@@ -15,11 +15,9 @@ class DependenciesMixin:
         relationships: list[RelationshipRecord],
         node_by_id: dict[int, NodeRecord],
     ) -> dict[str, int]:
-        fan_in: dict[int, int] = {}
-        for rel in relationships:
-            if rel.rel_type != cs.RelationshipType.CALLS:
-                continue
-            fan_in[rel.to_id] = fan_in.get(rel.to_id, 0) + 1
+        fan_in = self._graph_index(nodes, relationships).in_degrees(
+            cs.RelationshipType.CALLS
+        )
 
         risky = [
             {
@@ -1,18 +1,25 @@
 from __future__ import annotations
 
-import json
 import os
+import threading
 from typing import TYPE_CHECKING, Any, cast
 
+from loguru import logger
+
 from codebase_rag.core import constants as cs
+from codebase_rag.core.config import settings
 from codebase_rag.graph_db.cypher_queries import (
     CYPHER_EXPORT_PROJECT_NODES,
     CYPHER_EXPORT_PROJECT_NODES_PAGED,
     CYPHER_EXPORT_PROJECT_RELATIONSHIPS,
     CYPHER_EXPORT_PROJECT_RELATIONSHIPS_PAGED,
+    CYPHER_GRAPH_GENERATION,
 )
 
 from ...utils.git_delta import get_git_head
+from ...utils.source_store import SourceStore
+from ..graph_index import GraphIndex
+from ..graph_snapshot import GraphSnapshot, GraphSnapshotKey
 from ..protocols import AnalysisRunnerProtocol
 from ..types import NodeRecord, RelationshipRecord
 
@@ -20,6 +27,10 @@ if TYPE_CHECKING:
     from ...services.protocols import QueryProtocol
 
 
+# (H) Analysis tasks run on a thread pool and may all ask for the index at once.
+_GRAPH_INDEX_LOCK = threading.Lock()
+
+
 class AnalysisGraphAccessMixin:
     def _load_graph_data(
         self: AnalysisRunnerProtocol, ingestor: QueryProtocol
@@ -32,26 +43,17 @@ class AnalysisGraphAccessMixin:
             "yes",
         }
 
-        cache_path = self.repo_path / "output" / "analysis" / "graph_cache.json"
-        if use_cache and cache_path.exists():
-            try:
-                cache_payload = json.loads(
-                    cache_path.read_text(encoding=cs.ENCODING_UTF8)
-                )
-                if cache_payload.get(
-                    "project_name"
-                ) == self.project_name and cache_payload.get(
-                    "git_head"
-                ) == get_git_head(self.repo_path):
-                    return (
-                        [NodeRecord(**item) for item in cache_payload.get("nodes", [])],
-                        [
-                            RelationshipRecord(**item)
-                            for item in cache_payload.get("relationships", [])
-                        ],
-                    )
-            except Exception:
-                pass
+        key: GraphSnapshotKey | None = None
+        cache_path = self.repo_path / ".codebase_rag" / "graph_cache.bin"
+        if use_cache:
+            key = cast(Any, self)._graph_snapshot_key(ingestor)
+            cached = getattr(self, "_graph_snapshot_cache", None)
+            if not (isinstance(cached, GraphSnapshot) and cached.key == key):
+                cached = GraphSnapshot.load(cache_path, key) if key.cacheable else None
+            if cached is not None:
+                setattr(self, "_graph_snapshot_cache", cached)
+                # (H) Hand out fresh lists so one run cannot reshape the next.
+                return list(cached.nodes), list(cached.relationships)
 
         if page_size > 0:
             raw_nodes = cast(Any, self)._fetch_paged(
@@ -99,24 +101,68 @@ class AnalysisGraphAccessMixin:
                 )
             )
 
-        if use_cache:
-            try:
-                cache_path.parent.mkdir(parents=True, exist_ok=True)
-                payload = {
-                    "project_name": self.project_name,
-                    "git_head": get_git_head(self.repo_path),
-                    "nodes": [node.__dict__ for node in nodes],
-                    "relationships": [rel.__dict__ for rel in rels],
-                }
-                cache_path.write_text(
-                    json.dumps(payload, ensure_ascii=False),
-                    encoding=cs.ENCODING_UTF8,
-                )
-            except Exception:
-                pass
+        if key is not None and key.cacheable:
+            snapshot = GraphSnapshot(key, list(nodes), list(rels))
+            snapshot.save(cache_path)
+            setattr(self, "_graph_snapshot_cache", snapshot)
 
         return nodes, rels
 
+    def _graph_snapshot_key(
+        self: AnalysisRunnerProtocol, ingestor: QueryProtocol
+    ) -> GraphSnapshotKey:
+        generation: str | None = None
+        try:
+            rows = ingestor.fetch_all(
+                CYPHER_GRAPH_GENERATION, {cs.KEY_PROJECT_NAME: self.project_name}
+            )
+        except Exception as exc:
+            logger.debug("Graph generation unavailable: {}", exc)
+            rows = []
+        if rows and (stamp := rows[0].get("graph_generation")) is not None:
+            generation = str(stamp)
+        return GraphSnapshotKey(
+            self.project_name, get_git_head(self.repo_path), generation
+        )
+
+    def _graph_index(
+        self,
+        nodes: list[NodeRecord],
+        relationships: list[RelationshipRecord],
+    ) -> GraphIndex:
+        with _GRAPH_INDEX_LOCK:
+            cached = getattr(self, "_graph_index_cache", None)
+            if isinstance(cached, GraphIndex) and cached.is_built_from(
+                nodes, relationships
+            ):
+                return cached
+            index = GraphIndex.build(nodes, relationships)
+            setattr(self, "_graph_index_cache", index)
+            return index
+
+    def _source_store(self) -> SourceStore:
+        cached = getattr(self, "_source_store_cache", None)
+        if isinstance(cached, SourceStore):
+            return cached
+        store = SourceStore(settings.CODEGRAPH_SOURCE_STORE_MAX_MB * cs.BYTES_PER_MB)
+        setattr(self, "_source_store_cache", store)
+        return store
+
+    def _read_source_text(
+        self: AnalysisRunnerProtocol, path: str, max_bytes: int | None = None
+    ) -> str | None:
+        return self._source_store().read_text(
+            self.repo_path / path, max_bytes=max_bytes
+        )
+
+    def _read_source_lines(
+        self: AnalysisRunnerProtocol, path: str, start_line: int, end_line: int
+    ) -> str | None:
+        source = self._source_store().read_lines(
+            self.repo_path / path, start_line, end_line
+        )
+        return source.strip() if source is not None else None
+
     def _fetch_paged(
         self,
         ingestor: QueryProtocol,
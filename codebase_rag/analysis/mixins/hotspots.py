@@ -15,11 +15,9 @@ class HotspotsMixin:
         relationships: list[RelationshipRecord],
         node_by_id: dict[int, NodeRecord],
     ) -> dict[str, int]:
-        fan_in: dict[int, int] = {}
-        for rel in relationships:
-            if rel.rel_type != cs.RelationshipType.CALLS:
-                continue
-            fan_in[rel.to_id] = fan_in.get(rel.to_id, 0) + 1
+        fan_in = self._graph_index(nodes, relationships).in_degrees(
+            cs.RelationshipType.CALLS
+        )
 
         hotspots: list[dict[str, object]] = []
         for node in nodes:
@@ -31,7 +29,7 @@ class HotspotsMixin:
             path = str(node.properties.get(cs.KEY_PATH) or "")
             if not self._is_runtime_source_path(path):
                 continue
-            complexity = int(str(node.properties.get("complexity") or 0))
+            complexity = int(str(node.properties.get(cs.KEY_COMPLEXITY) or 0))
             if complexity < 10:
                 continue
             calls_in = fan_in.get(node.node_id, 0)
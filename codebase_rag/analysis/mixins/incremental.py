@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+
+from codebase_rag.core import constants as cs
+from codebase_rag.core.config import settings
+
+from ..incremental import AnalysisScope, IncrementalState, PartitionedRecords
+from ..protocols import AnalysisRunnerProtocol
+from ..types import NodeRecord, RelationshipRecord
+
+
+class IncrementalAnalysisMixin:
+    _SCOPE_RELATION_TYPES = (cs.RelationshipType.CALLS, cs.RelationshipType.IMPORTS)
+    _SCOPE_LABELS = frozenset(
+        {
+            cs.NodeLabel.FUNCTION.value,
+            cs.NodeLabel.METHOD.value,
+            cs.NodeLabel.CLASS.value,
+        }
+    )
+
+    def _analysis_scope(
+        self: AnalysisRunnerProtocol,
+        nodes: list[NodeRecord],
+        relationships: list[RelationshipRecord],
+        module_path_map: dict[str, str],
+        changed_paths: list[str],
+    ) -> AnalysisScope:
+        changed = frozenset(path.replace("\\", "/") for path in changed_paths)
+        node_paths: dict[int, str] = {}
+        seeds: list[int] = []
+        for node in nodes:
+            path = node.properties.get(cs.KEY_PATH)
+            if not isinstance(path, str) and not (
+                IncrementalAnalysisMixin._SCOPE_LABELS.isdisjoint(node.labels)
+            ):
+                path = self._resolve_node_path(node, module_path_map)
+            if not isinstance(path, str) or not path:
+                continue
+            node_paths[node.node_id] = path
+            if path in changed:
+                seeds.append(node.node_id)
+
+        hops = max(0, int(settings.CODEGRAPH_ANALYSIS_INCREMENTAL_HOPS))
+        affected = self._graph_index(nodes, relationships).neighborhood(
+            seeds, IncrementalAnalysisMixin._SCOPE_RELATION_TYPES, hops=hops
+        )
+        paths = set(changed)
+        paths.update(path for node_id in affected if (path := node_paths.get(node_id)))
+        return AnalysisScope(changed, frozenset(paths), frozenset(affected), hops)
+
+    def _partitioned_records(
+        self,
+        key: str,
+        compute: Callable[[AnalysisScope | None], PartitionedRecords],
+    ) -> PartitionedRecords:
+        state = getattr(self, "_incremental_state", None)
+        if not isinstance(state, IncrementalState):
+            return compute(None)
+        return state.records(key, compute)
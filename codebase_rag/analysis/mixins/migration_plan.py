@@ -3,6 +3,7 @@ from __future__ import annotations
 from typing import Any
 
 from codebase_rag.core import constants as cs
+from codebase_rag.utils.graph_cycles import analyze_cycles
 
 from ..protocols import AnalysisRunnerProtocol
 from ..types import NodeRecord, RelationshipRecord
@@ -31,20 +32,17 @@ class MigrationPlanMixin:
         graph: dict[int, set[int]] = {}
         fan_in: dict[int, int] = {}
         fan_out: dict[int, int] = {}
-        for rel in relationships:
-            if rel.rel_type not in {
-                cs.RelationshipType.IMPORTS,
-                cs.RelationshipType.RESOLVES_IMPORT,
-            }:
+        for source_id, target_id in self._graph_index(nodes, relationships).edges(
+            (cs.RelationshipType.IMPORTS, cs.RelationshipType.RESOLVES_IMPORT)
+        ):
+            if source_id not in module_nodes or target_id not in module_nodes:
                 continue
-            if rel.from_id not in module_nodes or rel.to_id not in module_nodes:
-                continue
-            graph.setdefault(rel.from_id, set()).add(rel.to_id)
-            fan_out[rel.from_id] = fan_out.get(rel.from_id, 0) + 1
-            fan_in[rel.to_id] = fan_in.get(rel.to_id, 0) + 1
+            graph.setdefault(source_id, set()).add(target_id)
+            fan_out[source_id] = fan_out.get(source_id, 0) + 1
+            fan_in[target_id] = fan_in.get(target_id, 0) + 1
 
-        cycles = self._collect_cycles(graph)
-        cyclic_nodes = {node_id for cycle in cycles for node_id in cycle}
+        cycle_analysis = analyze_cycles(graph)
+        cyclic_nodes = cycle_analysis.cyclic_nodes
 
         module_scores: list[dict[str, object]] = []
         for node_id, node in module_nodes.items():
@@ -107,7 +105,7 @@ class MigrationPlanMixin:
 
         summary = {
             "module_count": len(module_nodes),
-            "cycle_count": len(cycles),
+            "cycle_count": len(cycle_analysis.cycles),
             "external_dependencies": len(external_nodes),
             "coverage_proxy": coverage_stats,
             "dependency_risk": risk_stats,
@@ -3,13 +3,14 @@ from __future__ import annotations
 import hashlib
 import os
 import re
-import subprocess
 from pathlib import Path
 from typing import TypedDict
 
+from loguru import logger
+
 from codebase_rag.core import constants as cs
 
-from ...utils.source_extraction import extract_source_lines
+from ...utils.churn_index import ChurnIndex
 from ..protocols import AnalysisRunnerProtocol
 from ..types import NodeRecord
 
@@ -133,50 +134,32 @@ class QualityMixin:
         if not file_paths:
             return {"files": 0}
 
-        churn: dict[str, int] = {path: 0 for path in file_paths}
-        owners: dict[str, dict[str, int]] = {path: {} for path in file_paths}
-
-        try:
-            result = subprocess.run(
-                ["git", "log", "--name-only", "--pretty=%H|%an"],
-                cwd=str(self.repo_path),
-                capture_output=True,
-                text=True,
-                check=False,
-            )
-            if result.returncode == 0:
-                current_author = None
-                for line in result.stdout.splitlines():
-                    if not line.strip():
-                        continue
-                    if "|" in line:
-                        _, author = line.split("|", 1)
-                        current_author = author.strip()
-                        continue
-                    path = line.strip().replace("\\", "/")
-                    if path in churn:
-                        churn[path] += 1
-                        if current_author:
-                            owners[path][current_author] = (
-                                owners[path].get(current_author, 0) + 1
-                            )
-        except Exception:
-            pass
+        index_path = self.repo_path / ".codebase_rag" / "churn_index.json"
+        index = ChurnIndex.load(index_path)
+        refresh = index.refresh(self.repo_path)
+        if refresh.changed:
+            try:
+                index.save(index_path)
+            except OSError as exc:
+                logger.debug("Failed to persist churn index: {}", exc)
 
+        churn = {path: index.churn.get(path, 0) for path in file_paths}
         top_churn = sorted(churn.items(), key=lambda item: item[1], reverse=True)[:10]
-        ownership = {
-            path: max(author_counts.items(), key=lambda item: item[1])[0]
-            for path, author_counts in owners.items()
-            if author_counts
-        }
+        ownership = {path: owner for path in file_paths if (owner := index.owner(path))}
 
         report_payload = {
             "top_churn": top_churn,
             "ownership": ownership,
+            "index": {
+                "head": index.head,
+                "mode": refresh.mode,
+                "commits_scanned": refresh.commits,
+                "commits_indexed": index.commits,
+            },
         }
         self._write_json_report("churn_report.json", report_payload)
 
-        return {"files": len(file_paths)}
+        return {"files": len(file_paths), "commits_scanned": refresh.commits}
 
     def _public_api_surface(
         self: AnalysisRunnerProtocol, nodes: list[NodeRecord]
@@ -265,7 +248,7 @@ class QualityMixin:
                 continue
             if self._should_skip_duplicate_path(path):
                 continue
-            source = extract_source_lines(self.repo_path / path, start_line, end_line)
+            source = self._read_source_lines(path, start_line, end_line)
             if not source:
                 continue
             normalized = QualityMixin._normalize_duplicate_source(source)
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
 import json
+from itertools import chain
+from pathlib import Path
 
 from codebase_rag.core import constants as cs
 
 from ...security.security_scanner import SecurityScanner
+from ..incremental import AnalysisScope
 from ..protocols import AnalysisRunnerProtocol
 from ..types import NodeRecord
 
@@ -13,21 +16,39 @@ class SecurityMixin:
     def _security_scan(
         self: AnalysisRunnerProtocol, nodes: list[NodeRecord]
     ) -> dict[str, int]:
-        file_paths = [
-            node.properties.get(cs.KEY_PATH)
-            for node in nodes
-            if cs.NodeLabel.FILE.value in node.labels
-        ]
-        file_paths = [str(path) for path in file_paths if isinstance(path, str)]
-
         scanner = SecurityScanner()
-        findings = scanner.scan_files(self.repo_path / path for path in file_paths)
+        records = self._partitioned_records(
+            "security",
+            lambda scope: self._security_findings_by_path(scanner, nodes, scope),
+        )
+        findings = list(chain.from_iterable(records.values()))
 
         output_dir = self.repo_path / "output" / "analysis"
         output_dir.mkdir(parents=True, exist_ok=True)
         report_path = output_dir / "security_report.json"
         report_path.write_text(
-            json.dumps([finding.to_payload() for finding in findings], indent=2),
+            json.dumps(findings, indent=2),
             encoding="utf-8",
         )
         return {"findings": len(findings)}
+
+    def _security_findings_by_path(
+        self: AnalysisRunnerProtocol,
+        scanner: SecurityScanner,
+        nodes: list[NodeRecord],
+        scope: AnalysisScope | None,
+    ) -> dict[str, list[dict[str, object]]]:
+        targets: dict[str, str] = {}
+        for node in nodes:
+            if cs.NodeLabel.FILE.value not in node.labels:
+                continue
+            path = node.properties.get(cs.KEY_PATH)
+            if not isinstance(path, str):
+                continue
+            if scope is not None and not scope.covers(path):
+                continue
+            targets.setdefault(str(self.repo_path / path), path)
+        records: dict[str, list[dict[str, object]]] = {}
+        for finding in scanner.scan_files(Path(target) for target in targets):
+            records.setdefault(targets[finding.path], []).append(finding.to_payload())
+        return records
@@ -35,12 +35,8 @@ class SecurityAuditMixin:
         findings: list[dict[str, object]] = []
 
         for path in file_paths:
-            file_path = self.repo_path / path
-            if not file_path.exists() or file_path.stat().st_size > 1_000_000:
-                continue
-            try:
-                content = file_path.read_text(encoding="utf-8", errors="ignore")
-            except Exception:
+            content = self._read_source_text(path, max_bytes=1_000_000)
+            if content is None:
                 continue
             if any(re.search(pattern, content) for pattern in sources) and any(
                 re.search(pattern, content) for pattern in sinks
@@ -123,14 +119,11 @@ class SecurityAuditMixin:
         }
 
         violations: list[dict[str, object]] = []
-        for rel in relationships:
-            if rel.rel_type not in {
-                cs.RelationshipType.IMPORTS,
-                cs.RelationshipType.RESOLVES_IMPORT,
-            }:
-                continue
-            source = module_nodes.get(rel.from_id)
-            target = module_nodes.get(rel.to_id)
+        for source_id, target_id in self._graph_index(nodes, relationships).edges(
+            (cs.RelationshipType.IMPORTS, cs.RelationshipType.RESOLVES_IMPORT)
+        ):
+            source = module_nodes.get(source_id)
+            target = module_nodes.get(target_id)
             if not source or not target:
                 continue
             src_path = str(source.properties.get(cs.KEY_PATH) or "")
@@ -3,11 +3,14 @@ from __future__ import annotations
 import keyword
 import os
 import re
+from collections.abc import Callable
+from itertools import chain
 from pathlib import Path
 
 from codebase_rag.core import constants as cs
 from codebase_rag.security.security_scanner import SecurityScanner
 
+from ..incremental import AnalysisScope
 from ..protocols import AnalysisRunnerProtocol
 from ..types import NodeRecord
 
@@ -134,107 +137,148 @@ class StaticChecksMixin:
                 counts[opener] = max(0, counts[opener] - 1)
         return any(count > 0 for count in counts.values())
 
-    def _unused_variables(
+    def _static_file_paths(
         self: AnalysisRunnerProtocol,
         nodes: list[NodeRecord],
-        file_paths: list[str] | None = None,
-    ) -> dict[str, int]:
-        file_paths = file_paths or self._collect_file_paths(nodes)
-        findings: list[dict[str, object]] = []
+        file_paths: list[str] | None,
+        scope: AnalysisScope | None,
+    ) -> list[str]:
+        if scope is not None:
+            return sorted(scope.paths)
+        return file_paths or self._collect_file_paths(nodes)
 
+    def _static_state_key(self: AnalysisRunnerProtocol, name: str) -> str:
+        include_tests = str(
+            os.getenv("CODEGRAPH_ANALYSIS_INCLUDE_TESTS", "")
+        ).lower() in {"1", "true", "yes"}
+        return f"{name}:tests" if include_tests else name
+
+    def _scan_static_files(
+        self: AnalysisRunnerProtocol,
+        file_paths: list[str],
+        scan: Callable[[str, str], list[dict[str, object]]],
+    ) -> dict[str, list[dict[str, object]]]:
+        records: dict[str, list[dict[str, object]]] = {}
         for path in file_paths:
             if self._should_skip_static_analysis_path(path):
                 continue
-            file_path = self.repo_path / path
-            if not file_path.exists() or file_path.stat().st_size > 1_000_000:
+            content = self._read_source_text(path, max_bytes=1_000_000)
+            if content is None:
                 continue
-            try:
-                content = file_path.read_text(encoding="utf-8", errors="ignore")
-            except Exception:
-                continue
-
-            suffix = file_path.suffix.lower()
-            if suffix in {".js", ".jsx", ".ts", ".tsx"}:
-                pattern = r"(?:let|const|var)\s+(\w+)"
-            elif suffix in {".py"}:
-                pattern = r"^\s*([a-zA-Z_][a-zA-Z0-9_]*)\s*="
-            else:
-                continue
-
-            for match in re.finditer(pattern, content, re.MULTILINE):
-                name = match.group(1)
-                if self._is_likely_ignored_variable(name):
-                    continue
-                usages = len(re.findall(rf"\b{re.escape(name)}\b", content))
-                if usages <= 1:
-                    findings.append({"path": path, "name": name, "usages": usages})
+            if findings := scan(path, content):
+                records[path] = findings
+        return records
 
+    def _unused_variables(
+        self: AnalysisRunnerProtocol,
+        nodes: list[NodeRecord],
+        file_paths: list[str] | None = None,
+    ) -> dict[str, int]:
+        records = self._partitioned_records(
+            self._static_state_key("unused_variables"),
+            lambda scope: self._scan_static_files(
+                self._static_file_paths(nodes, file_paths, scope),
+                self._unused_variables_in,
+            ),
+        )
+        findings = list(chain.from_iterable(records.values()))
         self._write_json_report("unused_variables_report.json", findings)
         return {
             "unused_variables": len(findings),
-            "files_with_unused": len({item["path"] for item in findings}),
+            "files_with_unused": len(records),
         }
 
+    def _unused_variables_in(self, path: str, content: str) -> list[dict[str, object]]:
+        suffix = Path(path).suffix.lower()
+        if suffix in {".js", ".jsx", ".ts", ".tsx"}:
+            pattern = r"(?:let|const|var)\s+(\w+)"
+        elif suffix in {".py"}:
+            pattern = r"^\s*([a-zA-Z_][a-zA-Z0-9_]*)\s*="
+        else:
+            return []
+
+        findings: list[dict[str, object]] = []
+        for match in re.finditer(pattern, content, re.MULTILINE):
+            name = match.group(1)
+            if self._is_likely_ignored_variable(name):
+                continue
+            usages = len(re.findall(rf"\b{re.escape(name)}\b", content))
+            if usages <= 1:
+                findings.append({"path": path, "name": name, "usages": usages})
+        return findings
+
     def _unreachable_code(
         self: AnalysisRunnerProtocol,
         nodes: list[NodeRecord],
         file_paths: list[str] | None = None,
     ) -> dict[str, int]:
-        file_paths = file_paths or self._collect_file_paths(nodes)
-        findings: list[dict[str, object]] = []
+        records = self._partitioned_records(
+            self._static_state_key("unreachable_code"),
+            lambda scope: self._scan_static_files(
+                self._static_file_paths(nodes, file_paths, scope),
+                self._unreachable_code_in,
+            ),
+        )
+        findings = list(chain.from_iterable(records.values()))
+        self._write_json_report("unreachable_code_report.json", findings)
+        return {
+            "unreachable_blocks": len(findings),
+            "files_with_unreachable": len(records),
+        }
 
-        for path in file_paths:
-            if self._should_skip_static_analysis_path(path):
+    def _unreachable_code_in(self, path: str, content: str) -> list[dict[str, object]]:
+        findings: list[dict[str, object]] = []
+        lines = content.splitlines()
+        for idx, line in enumerate(lines[:-1]):
+            if not self._is_control_transfer_line(line):
                 continue
-            file_path = self.repo_path / path
-            if not file_path.exists() or file_path.stat().st_size > 1_000_000:
+            if self._has_unclosed_delimiters(line):
                 continue
-            try:
-                lines = file_path.read_text(
-                    encoding="utf-8", errors="ignore"
-                ).splitlines()
-            except Exception:
+            next_idx, next_line_raw = self._next_executable_line(lines, idx)
+            if next_idx is None or next_line_raw is None:
+                continue
+            next_line = next_line_raw.strip()
+            if next_line.startswith(
+                ("}", "elif", "except", "finally", "case ", "default:")
+            ):
                 continue
 
-            for idx, line in enumerate(lines[:-1]):
-                if not self._is_control_transfer_line(line):
-                    continue
-                if self._has_unclosed_delimiters(line):
-                    continue
-                next_idx, next_line_raw = self._next_executable_line(lines, idx)
-                if next_idx is None or next_line_raw is None:
-                    continue
-                next_line = next_line_raw.strip()
-                if next_line.startswith(
-                    ("}", "elif", "except", "finally", "case ", "default:")
-                ):
-                    continue
-
-                current_indent = self._leading_indent(line)
-                next_indent = self._leading_indent(next_line_raw)
-                if next_indent < current_indent:
-                    continue
-
-                findings.append(
-                    {
-                        "path": path,
-                        "line": next_idx + 1,
-                        "code": next_line,
-                    }
-                )
+            current_indent = self._leading_indent(line)
+            next_indent = self._leading_indent(next_line_raw)
+            if next_indent < current_indent:
+                continue
 
-        self._write_json_report("unreachable_code_report.json", findings)
-        return {
-            "unreachable_blocks": len(findings),
-            "files_with_unreachable": len({item["path"] for item in findings}),
-        }
+            findings.append(
+                {
+                    "path": path,
+                    "line": next_idx + 1,
+                    "code": next_line,
+                }
+            )
+        return findings
 
     def _refactoring_candidates(
         self: AnalysisRunnerProtocol, nodes: list[NodeRecord]
     ) -> dict[str, int]:
         threshold = int(os.getenv("CODEGRAPH_REFACTOR_LOC_THRESHOLD", "50"))
-        candidates: list[dict[str, object]] = []
+        records = self._partitioned_records(
+            f"refactoring_candidates:{threshold}",
+            lambda scope: self._refactoring_candidates_by_path(nodes, threshold, scope),
+        )
+        candidates = list(chain.from_iterable(records.values()))
+        self._write_json_report("refactoring_candidates_report.json", candidates)
+        return {
+            "candidates": len(candidates),
+            "threshold": threshold,
+        }
 
+    def _refactoring_candidates_by_path(
+        self,
+        nodes: list[NodeRecord],
+        threshold: int,
+        scope: AnalysisScope | None,
+    ) -> dict[str, list[dict[str, object]]]:
+        records: dict[str, list[dict[str, object]]] = {}
         for node in nodes:
             if (
                 cs.NodeLabel.FUNCTION.value not in node.labels
@@ -244,13 +288,15 @@ class StaticChecksMixin:
             path = str(node.properties.get(cs.KEY_PATH) or "")
             if not self._is_runtime_source_path(path):
                 continue
+            if scope is not None and not scope.covers(path):
+                continue
             start_line = int(str(node.properties.get(cs.KEY_START_LINE) or 0))
             end_line = int(str(node.properties.get(cs.KEY_END_LINE) or 0))
             if not start_line or not end_line or end_line < start_line:
                 continue
             loc = end_line - start_line + 1
             if loc >= threshold:
-                candidates.append(
+                records.setdefault(path, []).append(
                     {
                         "qualified_name": node.properties.get(cs.KEY_QUALIFIED_NAME),
                         "path": path,
@@ -259,35 +305,36 @@ class StaticChecksMixin:
                         "lines_of_code": loc,
                     }
                 )
-
-        self._write_json_report("refactoring_candidates_report.json", candidates)
-        return {
-            "candidates": len(candidates),
-            "threshold": threshold,
-        }
+        return records
 
     def _secret_scan(
         self: AnalysisRunnerProtocol,
         nodes: list[NodeRecord],
         file_paths: list[str] | None = None,
     ) -> dict[str, int]:
-        file_paths = file_paths or self._collect_file_paths(nodes)
         scanner = SecurityScanner()
-        findings = []
-
-        for path in file_paths:
-            file_path = self.repo_path / path
-            if not file_path.exists() or file_path.stat().st_size > 1_000_000:
-                continue
-            try:
-                content = file_path.read_text(encoding="utf-8", errors="ignore")
-            except Exception:
-                continue
-            findings.extend(scanner.scan_secret_text(content, path))
-
-        payload = [finding.to_payload() for finding in findings]
+        records = self._partitioned_records(
+            "secret_scan",
+            lambda scope: self._secret_scan_by_path(
+                scanner, self._static_file_paths(nodes, file_paths, scope)
+            ),
+        )
+        payload = list(chain.from_iterable(records.values()))
         self._write_json_report("secret_scan_report.json", payload)
         return {
             "findings": len(payload),
             "files_with_findings": len({str(item["path"]) for item in payload}),
         }
+
+    def _secret_scan_by_path(
+        self: AnalysisRunnerProtocol, scanner: SecurityScanner, file_paths: list[str]
+    ) -> dict[str, list[dict[str, object]]]:
+        records: dict[str, list[dict[str, object]]] = {}
+        for path in file_paths:
+            content = self._read_source_text(path, max_bytes=1_000_000)
+            if content is None:
+                continue
+            findings = scanner.scan_secret_text(content, path)
+            if findings:
+                records[path] = [finding.to_payload() for finding in findings]
+        return records
@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+from bisect import bisect_left
+from itertools import accumulate
+
 from codebase_rag.core import constants as cs
 
+from ..incremental import AnalysisScope
 from ..protocols import AnalysisRunnerProtocol
 from ..types import NodeRecord
 
@@ -10,7 +14,18 @@ class StructureMixin:
     def _extract_parameters(
         self: AnalysisRunnerProtocol, nodes: list[NodeRecord]
     ) -> int:
-        count = 0
+        records = self._partitioned_records(
+            "parameters",
+            lambda scope: self._extract_parameters_by_path(nodes, scope),
+        )
+        return sum(records.values())
+
+    def _extract_parameters_by_path(
+        self: AnalysisRunnerProtocol,
+        nodes: list[NodeRecord],
+        scope: AnalysisScope | None,
+    ) -> dict[str, int]:
+        counts: dict[str, int] = {}
         for node in nodes:
             if (
                 cs.NodeLabel.FUNCTION.value not in node.labels
@@ -26,6 +41,8 @@ class StructureMixin:
             function_name = str(node.properties.get(cs.KEY_NAME) or "")
             start_line = int(str(node.properties.get(cs.KEY_START_LINE) or 0))
             path = str(node.properties.get(cs.KEY_PATH) or "")
+            if scope is not None and not scope.covers(path):
+                continue
 
             for index, param in enumerate(parameters):
                 if isinstance(param, dict):
@@ -77,70 +94,74 @@ class StructureMixin:
                         "parameter_name": name,
                     },
                 )
-                count += 1
-        return count
+                counts[path] = counts.get(path, 0) + 1
+        return counts
 
     def _detect_nested_functions(
         self: AnalysisRunnerProtocol,
         nodes: list[NodeRecord],
         module_path_map: dict[str, str],
     ) -> int:
-        count = 0
-        function_nodes = [
-            node
-            for node in nodes
-            if cs.NodeLabel.FUNCTION.value in node.labels
-            or cs.NodeLabel.METHOD.value in node.labels
-        ]
-
-        function_nodes.sort(
-            key=lambda n: (
-                str(n.properties.get(cs.KEY_PATH) or ""),
-                int(str(n.properties.get(cs.KEY_START_LINE) or 0)),
-            )
+        records = self._partitioned_records(
+            "nested_functions",
+            lambda scope: self._nested_functions_by_path(nodes, module_path_map, scope),
         )
+        return sum(records.values())
 
-        for i, inner in enumerate(function_nodes):
-            inner_qn = str(inner.properties.get(cs.KEY_QUALIFIED_NAME) or "")
-            inner_path = self._resolve_node_path(inner, module_path_map)
-            inner_start = int(str(inner.properties.get(cs.KEY_START_LINE) or 0))
-            inner_end = int(str(inner.properties.get(cs.KEY_END_LINE) or 0))
-            if not inner_path or not inner_start or not inner_end:
+    def _nested_functions_by_path(
+        self: AnalysisRunnerProtocol,
+        nodes: list[NodeRecord],
+        module_path_map: dict[str, str],
+        scope: AnalysisScope | None,
+    ) -> dict[str, int]:
+        spans_by_path: dict[str, list[tuple[int, int, NodeRecord]]] = {}
+        for node in nodes:
+            if (
+                cs.NodeLabel.FUNCTION.value not in node.labels
+                and cs.NodeLabel.METHOD.value not in node.labels
+            ):
                 continue
+            path = self._resolve_node_path(node, module_path_map)
+            start = int(str(node.properties.get(cs.KEY_START_LINE) or 0))
+            end = int(str(node.properties.get(cs.KEY_END_LINE) or 0))
+            if scope is not None and not scope.covers(path):
+                continue
+            if path and start and end:
+                spans_by_path.setdefault(path, []).append((start, end, node))
 
-            for outer in function_nodes[:i]:
-                outer_qn = str(outer.properties.get(cs.KEY_QUALIFIED_NAME) or "")
-                outer_path = self._resolve_node_path(outer, module_path_map)
-                outer_start = int(str(outer.properties.get(cs.KEY_START_LINE) or 0))
-                outer_end = int(str(outer.properties.get(cs.KEY_END_LINE) or 0))
-                if not outer_path or outer_path != inner_path:
+        counts: dict[str, int] = {}
+        for path, spans in spans_by_path.items():
+            spans.sort(key=lambda span: (span[0], -span[1]))
+            furthest_ends = list(accumulate((span[1] for span in spans), max))
+            for index, (_, inner_end, inner) in enumerate(spans):
+                outer_index = bisect_left(furthest_ends, inner_end, 0, index)
+                if outer_index == index:
                     continue
-                if outer_start <= inner_start and outer_end >= inner_end:
-                    self.ingestor.ensure_relationship_batch(
+                outer = spans[outer_index][2]
+                self.ingestor.ensure_relationship_batch(
+                    (
                         (
-                            (
-                                cs.NodeLabel.METHOD
-                                if cs.NodeLabel.METHOD.value in outer.labels
-                                else cs.NodeLabel.FUNCTION
-                            ),
-                            cs.KEY_QUALIFIED_NAME,
-                            outer_qn,
+                            cs.NodeLabel.METHOD
+                            if cs.NodeLabel.METHOD.value in outer.labels
+                            else cs.NodeLabel.FUNCTION
                         ),
-                        cs.RelationshipType.CONTAINS,
+                        cs.KEY_QUALIFIED_NAME,
+                        str(outer.properties.get(cs.KEY_QUALIFIED_NAME) or ""),
+                    ),
+                    cs.RelationshipType.CONTAINS,
+                    (
                         (
-                            (
-                                cs.NodeLabel.METHOD
-                                if cs.NodeLabel.METHOD.value in inner.labels
-                                else cs.NodeLabel.FUNCTION
-                            ),
-                            cs.KEY_QUALIFIED_NAME,
-                            inner_qn,
+                            cs.NodeLabel.METHOD
+                            if cs.NodeLabel.METHOD.value in inner.labels
+                            else cs.NodeLabel.FUNCTION
                         ),
-                        {cs.KEY_RELATION_TYPE: "nested_function"},
-                    )
-                    count += 1
-                    break
-        return count
+                        cs.KEY_QUALIFIED_NAME,
+                        str(inner.properties.get(cs.KEY_QUALIFIED_NAME) or ""),
+                    ),
+                    {cs.KEY_RELATION_TYPE: "nested_function"},
+                )
+                counts[path] = counts.get(path, 0) + 1
+        return counts
 
     def _primary_label(self: AnalysisRunnerProtocol, node: NodeRecord) -> str:
         if cs.NodeLabel.FUNCTION.value in node.labels:
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from codebase_rag.core import constants as cs
+from codebase_rag.utils.graph_cycles import analyze_cycles
 
 from ..protocols import AnalysisRunnerProtocol
 from ..types import NodeRecord, RelationshipRecord
@@ -30,6 +31,12 @@ class TopologyMixin:
         cs.RelationshipType.SECURED_BY,
         cs.RelationshipType.USES_COMPONENT,
     }
+    _IMPORT_RELATION_TYPES = (
+        cs.RelationshipType.IMPORTS,
+        cs.RelationshipType.RESOLVES_IMPORT,
+    )
+    _CYCLE_SAMPLES_PER_COMPONENT = 10
+    _CYCLE_TIME_BUDGET_SECONDS = 5.0
 
     @staticmethod
     def _is_actionable_symbol_name(name: str) -> bool:
@@ -90,32 +97,37 @@ class TopologyMixin:
         module_ids = {
             node.node_id for node in nodes if cs.NodeLabel.MODULE.value in node.labels
         }
-        graph: dict[int, set[int]] = {}
-        for rel in relationships:
-            if rel.rel_type not in {
-                cs.RelationshipType.IMPORTS,
-                cs.RelationshipType.RESOLVES_IMPORT,
-            }:
-                continue
-            if rel.from_id in module_ids and rel.to_id in module_ids:
-                graph.setdefault(rel.from_id, set()).add(rel.to_id)
+        graph = self._graph_index(nodes, relationships).adjacency(
+            TopologyMixin._IMPORT_RELATION_TYPES, within=module_ids
+        )
 
-        cycles = self._collect_cycles(graph)
+        analysis = analyze_cycles(
+            graph,
+            max_cycles_per_component=TopologyMixin._CYCLE_SAMPLES_PER_COMPONENT,
+            time_budget_seconds=TopologyMixin._CYCLE_TIME_BUDGET_SECONDS,
+        )
+        cycles = analysis.cycles
 
         cycles_payload = [
             {
                 "cycle": [
                     node.properties.get(cs.KEY_QUALIFIED_NAME)
-                    for node_id in cycle
+                    for node_id in [*cycle, cycle[0]]
                     if (node := node_by_id.get(node_id))
                 ]
             }
             for cycle in cycles
         ]
+        component_stats = analysis.component_stats()
         report_payload = {
             "summary": {
                 "cycles": len(cycles_payload),
                 "modules_in_graph": len(module_ids),
+                "cyclic_components": component_stats["components"],
+                "largest_cyclic_component": component_stats["largest_component"],
+                "modules_in_cycles": component_stats["nodes_in_components"],
+                "mean_cyclic_component_size": component_stats["mean_component_size"],
+                "cycles_truncated": analysis.truncated,
             },
             "reason": ("No import cycle detected" if not cycles_payload else None),
             "cycles": cycles_payload,
@@ -129,48 +141,38 @@ class TopologyMixin:
         relationships: list[RelationshipRecord],
         node_by_id: dict[int, NodeRecord],
     ) -> dict[str, int]:
-        fan_in: dict[int, int] = {}
-        fan_out: dict[int, int] = {}
+        graph = self._graph_index(nodes, relationships)
+        fan_in = graph.in_degrees(cs.RelationshipType.CALLS)
+        fan_out = graph.out_degrees(cs.RelationshipType.CALLS)
         production_fan_in: dict[int, int] = {}
         production_fan_out: dict[int, int] = {}
         semantic_fan_in: dict[int, int] = {}
         semantic_fan_out: dict[int, int] = {}
         semantic_in_breakdown: dict[int, dict[str, int]] = {}
         semantic_out_breakdown: dict[int, dict[str, int]] = {}
+        actionable_ids = {
+            node_id
+            for node_id, node in node_by_id.items()
+            if TopologyMixin._is_actionable_node(node)
+        }
 
-        for rel in relationships:
-            source_node = node_by_id.get(rel.from_id)
-            target_node = node_by_id.get(rel.to_id)
-
-            if rel.rel_type == cs.RelationshipType.CALLS:
-                fan_out[rel.from_id] = fan_out.get(rel.from_id, 0) + 1
-                fan_in[rel.to_id] = fan_in.get(rel.to_id, 0) + 1
-                if TopologyMixin._is_actionable_node(
-                    source_node
-                ) and TopologyMixin._is_actionable_node(target_node):
-                    production_fan_out[rel.from_id] = (
-                        production_fan_out.get(rel.from_id, 0) + 1
-                    )
-                    production_fan_in[rel.to_id] = (
-                        production_fan_in.get(rel.to_id, 0) + 1
-                    )
+        for source_id, target_id in graph.edges(cs.RelationshipType.CALLS):
+            if source_id in actionable_ids and target_id in actionable_ids:
+                production_fan_out[source_id] = production_fan_out.get(source_id, 0) + 1
+                production_fan_in[target_id] = production_fan_in.get(target_id, 0) + 1
 
-            if rel.rel_type not in TopologyMixin._SEMANTIC_FAN_RELATION_TYPES:
-                continue
-            if not TopologyMixin._is_actionable_node(
-                source_node
-            ) or not TopologyMixin._is_actionable_node(target_node):
-                continue
-
-            semantic_fan_out[rel.from_id] = semantic_fan_out.get(rel.from_id, 0) + 1
-            semantic_fan_in[rel.to_id] = semantic_fan_in.get(rel.to_id, 0) + 1
-            semantic_out_breakdown.setdefault(rel.from_id, {})[rel.rel_type] = (
-                semantic_out_breakdown.setdefault(rel.from_id, {}).get(rel.rel_type, 0)
-                + 1
-            )
-            semantic_in_breakdown.setdefault(rel.to_id, {})[rel.rel_type] = (
-                semantic_in_breakdown.setdefault(rel.to_id, {}).get(rel.rel_type, 0) + 1
-            )
+        for rel_type in sorted(
+            graph.rel_types & TopologyMixin._SEMANTIC_FAN_RELATION_TYPES
+        ):
+            for source_id, target_id in graph.edges(rel_type):
+                if source_id not in actionable_ids or target_id not in actionable_ids:
+                    continue
+                semantic_fan_out[source_id] = semantic_fan_out.get(source_id, 0) + 1
+                semantic_fan_in[target_id] = semantic_fan_in.get(target_id, 0) + 1
+                out_bucket = semantic_out_breakdown.setdefault(source_id, {})
+                out_bucket[rel_type] = out_bucket.get(rel_type, 0) + 1
+                in_bucket = semantic_in_breakdown.setdefault(target_id, {})
+                in_bucket[rel_type] = in_bucket.get(rel_type, 0) + 1
 
         report_payload = {
             "summary": {
@@ -226,24 +228,9 @@ class TopologyMixin:
         relationships: list[RelationshipRecord],
         node_by_id: dict[int, NodeRecord],
     ) -> dict[str, int]:
-        call_graph: dict[int, set[int]] = {}
-        for rel in relationships:
-            if rel.rel_type != cs.RelationshipType.CALLS:
-                continue
-            call_graph.setdefault(rel.from_id, set()).add(rel.to_id)
-
-        def reachable(start_id: int) -> set[int]:
-            seen: set[int] = set()
-            stack = [start_id]
-            while stack:
-                current = stack.pop()
-                if current in seen:
-                    continue
-                seen.add(current)
-                stack.extend(call_graph.get(current, set()))
-            seen.discard(start_id)
-            return seen
-
+        impacts = self._graph_index(nodes, relationships).reachable_counts(
+            cs.RelationshipType.CALLS
+        )
         production_results: list[dict[str, object]] = []
         ignored_results: list[dict[str, object]] = []
         for node in nodes:
@@ -252,7 +239,7 @@ class TopologyMixin:
                 and cs.NodeLabel.METHOD.value not in node.labels
             ):
                 continue
-            impact = len(reachable(node.node_id))
+            impact = impacts.get(node.node_id, 0)
             if impact:
                 payload = {
                     "qualified_name": node.properties.get(cs.KEY_QUALIFIED_NAME),
@@ -320,14 +307,11 @@ class TopologyMixin:
             return None
 
         violations: list[dict[str, object]] = []
-        for rel in relationships:
-            if rel.rel_type not in {
-                cs.RelationshipType.IMPORTS,
-                cs.RelationshipType.RESOLVES_IMPORT,
-            }:
-                continue
-            source = module_nodes.get(rel.from_id)
-            target = module_nodes.get(rel.to_id)
+        for source_id, target_id in self._graph_index(nodes, relationships).edges(
+            TopologyMixin._IMPORT_RELATION_TYPES
+        ):
+            source = module_nodes.get(source_id)
+            target = module_nodes.get(target_id)
             if not source or not target:
                 continue
             src_path = str(source.properties.get(cs.KEY_PATH) or "")
@@ -364,32 +348,6 @@ class TopologyMixin:
         self._write_json_report("layering_violations.json", report_payload)
         return {"violations": len(violations)}
 
-    @staticmethod
-    def _collect_cycles(graph: dict[int, set[int]]) -> list[list[int]]:
-        visited: set[int] = set()
-        stack: list[int] = []
-        on_stack: set[int] = set()
-        cycles: list[list[int]] = []
-
-        def dfs(node_id: int) -> None:
-            visited.add(node_id)
-            stack.append(node_id)
-            on_stack.add(node_id)
-            for next_id in graph.get(node_id, set()):
-                if next_id not in visited:
-                    dfs(next_id)
-                elif next_id in on_stack:
-                    cycle_start = stack.index(next_id)
-                    cycles.append(stack[cycle_start:] + [next_id])
-            stack.pop()
-            on_stack.discard(node_id)
-
-        for node_id in graph:
-            if node_id not in visited:
-                dfs(node_id)
-
-        return cycles
-
     @classmethod
     def _is_non_production_path(cls, path: str) -> bool:
         normalized = str(path or "").replace("\\", "/").lower()
@@ -4,6 +4,7 @@ import json
 import re
 from collections.abc import Iterable
 from datetime import UTC, datetime
+from pathlib import Path
 from typing import Any, cast
 
 from loguru import logger
@@ -15,24 +16,49 @@ from ..types import NodeRecord, RelationshipRecord
 
 
 class UsageInMemoryMixin:
+    _USAGE_RELATION_TYPES = (
+        cs.RelationshipType.CALLS,
+        cs.RelationshipType.USES_COMPONENT,
+        cs.RelationshipType.REQUESTS_ENDPOINT,
+        cs.RelationshipType.RESOLVES_IMPORT,
+        cs.RelationshipType.USES_ASSET,
+        cs.RelationshipType.HANDLES_ERROR,
+        cs.RelationshipType.MUTATES_STATE,
+    )
+    _DECORATOR_LINK_TYPES = (
+        cs.RelationshipType.DECORATES,
+        cs.RelationshipType.ANNOTATES,
+    )
+    _REGISTRATION_LINK_TYPES = (
+        cs.RelationshipType.HAS_ENDPOINT,
+        cs.RelationshipType.ROUTES_TO_ACTION,
+        cs.RelationshipType.REQUESTS_ENDPOINT,
+        cs.RelationshipType.REGISTERS_SERVICE,
+        cs.RelationshipType.REGISTERS_CALLBACK,
+        cs.RelationshipType.HOOKS,
+        cs.RelationshipType.REGISTERS_BLOCK,
+    )
+    _CLI_LINK_TYPES = (
+        cs.RelationshipType.USES_HANDLER,
+        cs.RelationshipType.USES_SERVICE,
+        cs.RelationshipType.REQUESTS_ENDPOINT,
+        cs.RelationshipType.ROUTES_TO_ACTION,
+    )
+    _CONFIG_REFERENCE_LINK_TYPES = (
+        cs.RelationshipType.IMPORTS,
+        cs.RelationshipType.RESOLVES_IMPORT,
+        cs.RelationshipType.USES_COMPONENT,
+    )
+
     def _symbol_usage(
         self: AnalysisRunnerProtocol,
         nodes: list[NodeRecord],
         relationships: list[RelationshipRecord],
         node_by_id: dict[int, NodeRecord],
     ) -> dict[str, int]:
-        usage_counts: dict[int, int] = {}
-        for rel in relationships:
-            if rel.rel_type in {
-                cs.RelationshipType.CALLS,
-                cs.RelationshipType.USES_COMPONENT,
-                cs.RelationshipType.REQUESTS_ENDPOINT,
-                cs.RelationshipType.RESOLVES_IMPORT,
-                cs.RelationshipType.USES_ASSET,
-                cs.RelationshipType.HANDLES_ERROR,
-                cs.RelationshipType.MUTATES_STATE,
-            }:
-                usage_counts[rel.to_id] = usage_counts.get(rel.to_id, 0) + 1
+        usage_counts = self._graph_index(nodes, relationships).in_degrees(
+            UsageInMemoryMixin._USAGE_RELATION_TYPES
+        )
 
         for node_id, count in usage_counts.items():
             node = node_by_id.get(node_id)
@@ -87,21 +113,8 @@ class UsageInMemoryMixin:
             "@public",
         }
 
-        call_graph: dict[int, set[int]] = {}
-        for rel in relationships:
-            if rel.rel_type != cs.RelationshipType.CALLS:
-                continue
-            call_graph.setdefault(rel.from_id, set()).add(rel.to_id)
-
-        reachable: set[int] = set()
-
-        def mark(node_id: int) -> None:
-            if node_id in reachable:
-                return
-            reachable.add(node_id)
-            for target in call_graph.get(node_id, set()):
-                mark(target)
-
+        graph = self._graph_index(nodes, relationships)
+        roots: list[int] = []
         for node in nodes:
             if (
                 cs.NodeLabel.FUNCTION.value not in node.labels
@@ -114,7 +127,8 @@ class UsageInMemoryMixin:
                 cast(Iterable[Any], node.properties.get(cs.KEY_DECORATORS) or [])
             )
             if name in entry_points or is_exported or (node_decorators & decorators):
-                mark(node.node_id)
+                roots.append(node.node_id)
+        reachable = graph.reachable(roots, cs.RelationshipType.CALLS)
 
         dead_nodes = [
             node
@@ -126,50 +140,6 @@ class UsageInMemoryMixin:
             and node.node_id not in reachable
         ]
 
-        call_in_degree_map: dict[int, int] = {}
-        relation_links_map: dict[int, dict[str, int]] = {}
-        for rel in relationships:
-            if rel.rel_type == cs.RelationshipType.CALLS:
-                call_in_degree_map[rel.to_id] = call_in_degree_map.get(rel.to_id, 0) + 1
-
-            rel_bucket = relation_links_map.setdefault(
-                rel.to_id,
-                {
-                    "decorator_links": 0,
-                    "registration_links": 0,
-                    "imported_by_cli_links": 0,
-                    "config_reference_links": 0,
-                },
-            )
-            if rel.rel_type in {
-                cs.RelationshipType.DECORATES,
-                cs.RelationshipType.ANNOTATES,
-            }:
-                rel_bucket["decorator_links"] += 1
-            if rel.rel_type in {
-                cs.RelationshipType.HAS_ENDPOINT,
-                cs.RelationshipType.ROUTES_TO_ACTION,
-                cs.RelationshipType.REQUESTS_ENDPOINT,
-                cs.RelationshipType.REGISTERS_SERVICE,
-                cs.RelationshipType.REGISTERS_CALLBACK,
-                cs.RelationshipType.HOOKS,
-                cs.RelationshipType.REGISTERS_BLOCK,
-            }:
-                rel_bucket["registration_links"] += 1
-            if rel.rel_type in {
-                cs.RelationshipType.USES_HANDLER,
-                cs.RelationshipType.USES_SERVICE,
-                cs.RelationshipType.REQUESTS_ENDPOINT,
-                cs.RelationshipType.ROUTES_TO_ACTION,
-            }:
-                rel_bucket["imported_by_cli_links"] += 1
-            if rel.rel_type in {
-                cs.RelationshipType.IMPORTS,
-                cs.RelationshipType.RESOLVES_IMPORT,
-                cs.RelationshipType.USES_COMPONENT,
-            }:
-                rel_bucket["config_reference_links"] += 1
-
         total_functions = len(
             [
                 node
@@ -185,8 +155,12 @@ class UsageInMemoryMixin:
                 "path": node.properties.get(cs.KEY_PATH),
                 "start_line": node.properties.get(cs.KEY_START_LINE),
                 "label": self._primary_label(node) or cs.NodeLabel.FUNCTION,
-                "call_in_degree": call_in_degree_map.get(node.node_id, 0),
-                "out_call_count": len(call_graph.get(node.node_id, set())),
+                "call_in_degree": graph.in_degree(
+                    node.node_id, cs.RelationshipType.CALLS
+                ),
+                "out_call_count": len(
+                    set(graph.successors(node.node_id, cs.RelationshipType.CALLS))
+                ),
                 "is_entrypoint_name": str(node.properties.get(cs.KEY_NAME) or "")
                 in entry_points,
                 "has_entry_decorator": bool(
@@ -198,17 +172,17 @@ class UsageInMemoryMixin:
                     )
                     & decorators
                 ),
-                "decorator_links": relation_links_map.get(node.node_id, {}).get(
-                    "decorator_links", 0
+                "decorator_links": graph.in_degree(
+                    node.node_id, UsageInMemoryMixin._DECORATOR_LINK_TYPES
                 ),
-                "registration_links": relation_links_map.get(node.node_id, {}).get(
-                    "registration_links", 0
+                "registration_links": graph.in_degree(
+                    node.node_id, UsageInMemoryMixin._REGISTRATION_LINK_TYPES
                 ),
-                "imported_by_cli_links": relation_links_map.get(node.node_id, {}).get(
-                    "imported_by_cli_links", 0
+                "imported_by_cli_links": graph.in_degree(
+                    node.node_id, UsageInMemoryMixin._CLI_LINK_TYPES
                 ),
-                "config_reference_links": relation_links_map.get(node.node_id, {}).get(
-                    "config_reference_links", 0
+                "config_reference_links": graph.in_degree(
+                    node.node_id, UsageInMemoryMixin._CONFIG_REFERENCE_LINK_TYPES
                 ),
                 "decorators": node.properties.get(cs.KEY_DECORATORS) or [],
                 "is_exported": bool(node.properties.get(cs.KEY_IS_EXPORTED)),
@@ -302,15 +276,11 @@ class UsageInMemoryMixin:
             return results
 
         for path in file_paths:
-            file_path = self.repo_path / path
-            if not file_path.exists() or file_path.stat().st_size > 1_000_000:
-                continue
-            try:
-                content = file_path.read_text(encoding="utf-8", errors="ignore")
-            except Exception:
+            content = self._read_source_text(path, max_bytes=1_000_000)
+            if content is None:
                 continue
 
-            suffix = file_path.suffix.lower()
+            suffix = Path(path).suffix.lower()
             if suffix in {".py"}:
                 imports = extract_imports_py(content)
             elif suffix in {".js", ".jsx", ".ts", ".tsx"}:
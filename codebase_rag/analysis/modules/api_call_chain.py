@@ -1,11 +1,12 @@
 from __future__ import annotations
 
 import re
-from collections import defaultdict, deque
+from collections import deque
 from typing import Any, cast
 
 from codebase_rag.core import constants as cs
 
+from ..graph_index import GraphIndex
 from .api_compliance import ApiComplianceModule
 from .base_module import AnalysisContext, AnalysisModule
 
@@ -19,6 +20,14 @@ class ApiCallChainModule(AnalysisModule):
         r"@(?:app|bp)\.route\(\s*['\"]([^'\"]+)['\"](?:\s*,\s*methods=\[([^\]]+)\])?[\s\S]*?\)\s*(?:async\s+def|def)\s+([A-Za-z_][A-Za-z0-9_]*)",
         re.IGNORECASE,
     )
+    _CHAIN_RELATION_TYPES = (
+        cs.RelationshipType.CALLS,
+        cs.RelationshipType.CONNECTS_TO_DATASTORE,
+        cs.RelationshipType.USES_CACHE,
+        cs.RelationshipType.USES_QUEUE,
+        cs.RelationshipType.OWNS_GRAPHQL_OPERATION,
+        cs.RelationshipType.CALLS_SERVICE,
+    )
 
     def get_name(self) -> str:
         return "api_call_chain"
@@ -37,17 +46,9 @@ class ApiCallChainModule(AnalysisModule):
         return self._build_report(context)
 
     def _build_report(self, context: AnalysisContext) -> dict[str, Any]:
-        rels_by_from: dict[int, list] = defaultdict(list)
-        rels_by_to: dict[int, list] = defaultdict(list)
-        for rel in context.relationships:
-            rels_by_from[rel.from_id].append(rel)
-            rels_by_to[rel.to_id].append(rel)
-
-        endpoint_entries = self._resolve_endpoints(
-            context,
-            rels_by_from=rels_by_from,
-            rels_by_to=rels_by_to,
-        )
+        graph = context.get_graph_index()
+
+        endpoint_entries = self._resolve_endpoints(context, graph=graph)
         if not endpoint_entries:
             context.runner._write_json_report(
                 "api_call_chain_report.json",
@@ -75,15 +76,15 @@ class ApiCallChainModule(AnalysisModule):
             handler_nodes = self._resolve_handler_nodes(
                 context,
                 entry=entry,
-                rels_by_from=rels_by_from,
-                rels_by_to=rels_by_to,
+                graph=graph,
                 limit=max_handlers,
             )
             if isinstance(endpoint_id, int):
                 requester_nodes = [
-                    context.node_by_id.get(rel.from_id)
-                    for rel in rels_by_to.get(endpoint_id, [])
-                    if rel.rel_type == cs.RelationshipType.REQUESTS_ENDPOINT
+                    context.node_by_id.get(source_id)
+                    for source_id in graph.predecessors(
+                        endpoint_id, cs.RelationshipType.REQUESTS_ENDPOINT
+                    )
                 ]
                 requesters = [
                     self._node_payload(node)
@@ -96,8 +97,7 @@ class ApiCallChainModule(AnalysisModule):
                     request_path_chain,
                 ) = self._collect_frontend_request_context(
                     endpoint_id,
-                    rels_by_from=rels_by_from,
-                    rels_by_to=rels_by_to,
+                    graph=graph,
                     context=context,
                     max_chains=max_requesters,
                     max_depth=max_depth + 2,
@@ -110,9 +110,10 @@ class ApiCallChainModule(AnalysisModule):
             controller_nodes = []
             if isinstance(endpoint_id, int):
                 controller_nodes = [
-                    context.node_by_id.get(rel.to_id)
-                    for rel in rels_by_from.get(endpoint_id, [])
-                    if rel.rel_type == cs.RelationshipType.ROUTES_TO_CONTROLLER
+                    context.node_by_id.get(target_id)
+                    for target_id in graph.successors(
+                        endpoint_id, cs.RelationshipType.ROUTES_TO_CONTROLLER
+                    )
                 ]
             controllers = [
                 self._node_payload(node)
@@ -127,7 +128,7 @@ class ApiCallChainModule(AnalysisModule):
                     continue
                 chain = self._collect_calls(
                     handler.node_id,
-                    rels_by_from,
+                    graph,
                     context.node_by_id,
                     context,
                     max_depth,
@@ -197,14 +198,9 @@ class ApiCallChainModule(AnalysisModule):
         self,
         context: AnalysisContext,
         *,
-        rels_by_from: dict[int, list],
-        rels_by_to: dict[int, list],
+        graph: GraphIndex,
     ) -> list[dict[str, object]]:
-        graph_endpoints = self._normalize_graph_endpoint_entries(
-            context,
-            rels_by_from=rels_by_from,
-            rels_by_to=rels_by_to,
-        )
+        graph_endpoints = self._normalize_graph_endpoint_entries(context, graph=graph)
         if graph_endpoints:
             return graph_endpoints
 
@@ -229,12 +225,8 @@ class ApiCallChainModule(AnalysisModule):
         for file_path in ApiComplianceModule._iter_files(
             repo_path, context.module_paths
         ):
-            try:
-                source = file_path.read_text(
-                    encoding=cs.ENCODING_UTF8,
-                    errors="ignore",
-                )
-            except Exception:
+            source = context.get_source_store().read_text(file_path)
+            if source is None:
                 continue
             relative = file_path.relative_to(repo_path).as_posix()
             for endpoint in ApiComplianceModule._extract_endpoints(source, file_path):
@@ -274,22 +266,23 @@ class ApiCallChainModule(AnalysisModule):
         context: AnalysisContext,
         *,
         entry: dict[str, object],
-        rels_by_from: dict[int, list],
-        rels_by_to: dict[int, list],
+        graph: GraphIndex,
         limit: int,
     ) -> list[Any]:
         endpoint_id = entry.get("node_id")
         if isinstance(endpoint_id, int):
             handler_nodes = [
-                context.node_by_id.get(rel.from_id)
-                for rel in rels_by_to.get(endpoint_id, [])
-                if rel.rel_type == cs.RelationshipType.HAS_ENDPOINT
+                context.node_by_id.get(source_id)
+                for source_id in graph.predecessors(
+                    endpoint_id, cs.RelationshipType.HAS_ENDPOINT
+                )
             ]
             handler_nodes.extend(
                 [
-                    context.node_by_id.get(rel.to_id)
-                    for rel in rels_by_from.get(endpoint_id, [])
-                    if rel.rel_type == cs.RelationshipType.ROUTES_TO_ACTION
+                    context.node_by_id.get(target_id)
+                    for target_id in graph.successors(
+                        endpoint_id, cs.RelationshipType.ROUTES_TO_ACTION
+                    )
                 ]
             )
             deduped: list[Any] = []
@@ -354,17 +347,17 @@ class ApiCallChainModule(AnalysisModule):
         self,
         endpoint_id: int,
         *,
-        rels_by_from: dict[int, list],
-        rels_by_to: dict[int, list],
+        graph: GraphIndex,
         context: AnalysisContext,
         max_chains: int,
         max_depth: int,
     ) -> tuple[list[dict[str, Any]], list[dict[str, Any]], list[dict[str, Any]]]:
         direct_requesters = [
-            context.node_by_id.get(rel.from_id)
-            for rel in rels_by_to.get(endpoint_id, [])
-            if rel.rel_type == cs.RelationshipType.REQUESTS_ENDPOINT
-            and rel.from_id in context.node_by_id
+            context.node_by_id.get(source_id)
+            for source_id in graph.predecessors(
+                endpoint_id, cs.RelationshipType.REQUESTS_ENDPOINT
+            )
+            if source_id in context.node_by_id
         ]
         endpoint_node = context.node_by_id.get(endpoint_id)
         endpoint_payload = (
@@ -381,7 +374,7 @@ class ApiCallChainModule(AnalysisModule):
                 continue
             raw_paths = self._walk_requester_paths(
                 requester.node_id,
-                rels_by_to=rels_by_to,
+                graph=graph,
                 context=context,
                 max_depth=max_depth,
                 max_paths=max_chains,
@@ -401,7 +394,7 @@ class ApiCallChainModule(AnalysisModule):
                 chain_nodes.append(endpoint_payload)
                 relationship_types = self._relationship_chain_for_path(
                     path,
-                    rels_by_from=rels_by_from,
+                    graph=graph,
                 )
                 relationship_types.append(cs.RelationshipType.REQUESTS_ENDPOINT)
                 request_chains.append(
@@ -436,7 +429,7 @@ class ApiCallChainModule(AnalysisModule):
         self,
         start_id: int,
         *,
-        rels_by_to: dict[int, list],
+        graph: GraphIndex,
         context: AnalysisContext,
         max_depth: int,
         max_paths: int,
@@ -450,20 +443,18 @@ class ApiCallChainModule(AnalysisModule):
                 continue
 
             upstream: list[tuple[int, str]] = []
-            for rel in rels_by_to.get(current_id, []):
-                if rel.rel_type not in {
-                    cs.RelationshipType.CALLS,
-                    cs.RelationshipType.USES_COMPONENT,
-                }:
-                    continue
-                upstream_node = context.node_by_id.get(rel.from_id)
+            for source_id, rel_type in graph.in_edges(
+                current_id,
+                (cs.RelationshipType.CALLS, cs.RelationshipType.USES_COMPONENT),
+            ):
+                upstream_node = context.node_by_id.get(source_id)
                 if upstream_node is None:
                     continue
                 if not self._is_frontend_request_node(context, upstream_node):
                     continue
-                if rel.from_id in path:
+                if source_id in path:
                     continue
-                upstream.append((rel.from_id, str(rel.rel_type)))
+                upstream.append((source_id, rel_type))
 
             if not upstream:
                 paths.append(path)
@@ -477,22 +468,13 @@ class ApiCallChainModule(AnalysisModule):
     def _relationship_chain_for_path(
         path: list[int],
         *,
-        rels_by_from: dict[int, list],
+        graph: GraphIndex,
     ) -> list[str]:
         relationship_types: list[str] = []
         for index in range(len(path) - 1):
-            source_id = path[index]
-            target_id = path[index + 1]
-            rel_type = next(
-                (
-                    str(rel.rel_type)
-                    for rel in rels_by_from.get(source_id, [])
-                    if rel.to_id == target_id
-                ),
-                "",
-            )
-            if rel_type:
-                relationship_types.append(rel_type)
+            rel_types = graph.edge_types_between(path[index], path[index + 1])
+            if rel_types:
+                relationship_types.append(rel_types[0])
         return relationship_types
 
     @staticmethod
@@ -510,8 +492,7 @@ class ApiCallChainModule(AnalysisModule):
         self,
         context: AnalysisContext,
         *,
-        rels_by_from: dict[int, list],
-        rels_by_to: dict[int, list],
+        graph: GraphIndex,
     ) -> list[dict[str, object]]:
         raw_entries: list[dict[str, object]] = []
         for node in context.nodes:
@@ -523,43 +504,45 @@ class ApiCallChainModule(AnalysisModule):
 
             handler_qns = {
                 str(
-                    context.node_by_id[rel.from_id].properties.get(
-                        cs.KEY_QUALIFIED_NAME
-                    )
+                    context.node_by_id[source_id].properties.get(cs.KEY_QUALIFIED_NAME)
                     or ""
                 ).strip()
-                for rel in rels_by_to.get(node.node_id, [])
-                if rel.rel_type == cs.RelationshipType.HAS_ENDPOINT
-                and rel.from_id in context.node_by_id
+                for source_id in graph.predecessors(
+                    node.node_id, cs.RelationshipType.HAS_ENDPOINT
+                )
+                if source_id in context.node_by_id
             }
             handler_qns.update(
                 {
                     str(
-                        context.node_by_id[rel.to_id].properties.get(
+                        context.node_by_id[target_id].properties.get(
                             cs.KEY_QUALIFIED_NAME
                         )
                         or ""
                     ).strip()
-                    for rel in rels_by_from.get(node.node_id, [])
-                    if rel.rel_type == cs.RelationshipType.ROUTES_TO_ACTION
-                    and rel.to_id in context.node_by_id
+                    for target_id in graph.successors(
+                        node.node_id, cs.RelationshipType.ROUTES_TO_ACTION
+                    )
+                    if target_id in context.node_by_id
                 }
             )
             exposed_module_paths = {
-                str(context.node_by_id[rel.from_id].properties.get(cs.KEY_PATH) or "")
+                str(context.node_by_id[source_id].properties.get(cs.KEY_PATH) or "")
                 .replace("\\", "/")
                 .strip()
-                for rel in rels_by_to.get(node.node_id, [])
-                if rel.rel_type == cs.RelationshipType.EXPOSES_ENDPOINT
-                and rel.from_id in context.node_by_id
+                for source_id in graph.predecessors(
+                    node.node_id, cs.RelationshipType.EXPOSES_ENDPOINT
+                )
+                if source_id in context.node_by_id
             }
             prefix_module_paths = {
-                str(context.node_by_id[rel.from_id].properties.get(cs.KEY_PATH) or "")
+                str(context.node_by_id[source_id].properties.get(cs.KEY_PATH) or "")
                 .replace("\\", "/")
                 .strip()
-                for rel in rels_by_to.get(node.node_id, [])
-                if rel.rel_type == cs.RelationshipType.PREFIXES_ENDPOINT
-                and rel.from_id in context.node_by_id
+                for source_id in graph.predecessors(
+                    node.node_id, cs.RelationshipType.PREFIXES_ENDPOINT
+                )
+                if source_id in context.node_by_id
             }
             raw_entries.append(
                 {
@@ -654,7 +637,7 @@ class ApiCallChainModule(AnalysisModule):
     @staticmethod
     def _collect_calls(
         start_id: int,
-        rels_by_from: dict[int, list],
+        graph: GraphIndex,
         node_by_id: dict[int, Any],
         context: AnalysisContext,
         max_depth: int,
@@ -673,17 +656,9 @@ class ApiCallChainModule(AnalysisModule):
             current_id, depth = queue.popleft()
             if depth >= max_depth:
                 continue
-            for rel in rels_by_from.get(current_id, []):
-                if rel.rel_type not in {
-                    cs.RelationshipType.CALLS,
-                    cs.RelationshipType.CONNECTS_TO_DATASTORE,
-                    cs.RelationshipType.USES_CACHE,
-                    cs.RelationshipType.USES_QUEUE,
-                    cs.RelationshipType.OWNS_GRAPHQL_OPERATION,
-                    cs.RelationshipType.CALLS_SERVICE,
-                }:
-                    continue
-                target_id = rel.to_id
+            for target_id, rel_type in graph.out_edges(
+                current_id, ApiCallChainModule._CHAIN_RELATION_TYPES
+            ):
                 if target_id in visited:
                     continue
                 visited.add(target_id)
@@ -693,12 +668,12 @@ class ApiCallChainModule(AnalysisModule):
                 if not ApiCallChainModule._should_include_chain_node(
                     context,
                     node,
-                    rel_type=str(rel.rel_type),
+                    rel_type=rel_type,
                     include_graphql=include_graphql,
                 ):
                     continue
                 payload = ApiCallChainModule._node_payload(node)
-                payload["relationship_type"] = str(rel.rel_type)
+                payload["relationship_type"] = rel_type
                 results.append(payload)
                 if len(results) >= max_nodes:
                     return results
@@ -45,13 +45,10 @@ class ApiComplianceModule(AnalysisModule):
         if not endpoints:
             repo_path = context.runner.repo_path
             files = self._iter_files(repo_path, context.module_paths)
+            source_store = context.get_source_store()
             for file_path in files:
-                try:
-                    source = file_path.read_text(
-                        encoding=cs.ENCODING_UTF8,
-                        errors="ignore",
-                    )
-                except Exception:
+                source = source_store.read_text(file_path)
+                if source is None:
                     continue
                 endpoints.extend(self._extract_endpoints(source, file_path))
             source_mode = "source_scan"
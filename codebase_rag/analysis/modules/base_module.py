@@ -1,10 +1,14 @@
 from __future__ import annotations
 
+import threading
 from abc import ABC, abstractmethod
 from collections.abc import Callable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
+from ...utils.source_store import SourceStore
+from ..graph_index import GraphIndex
+
 if TYPE_CHECKING:
     from ..analysis_runner import AnalysisRunner, NodeRecord, RelationshipRecord
 
@@ -21,9 +25,34 @@ class AnalysisContext:
     use_db: bool
     summary: dict[str, Any]
     dead_code_verifier: Callable[[dict[str, Any]], dict[str, Any] | None] | None = None
+    graph_index: GraphIndex | None = None
+    source_store: SourceStore | None = None
+    # (H) dataclasses.replace() hands the same lock to every per-module copy.
+    graph_index_lock: threading.Lock = field(
+        default_factory=threading.Lock, repr=False, compare=False
+    )
+
+    def get_graph_index(self) -> GraphIndex:
+        with self.graph_index_lock:
+            if self.graph_index is None or not self.graph_index.is_built_from(
+                self.nodes, self.relationships
+            ):
+                self.graph_index = GraphIndex.build(self.nodes, self.relationships)
+            return self.graph_index
+
+    def get_source_store(self) -> SourceStore:
+        if self.source_store is None:
+            self.source_store = SourceStore()
+        return self.source_store
 
 
 class AnalysisModule(ABC):
+    # (H) Names of analyses or outputs this module reads; the graph, sources and
+    # (H) database are loaded before any task runs and are not scheduled inputs.
+    inputs: frozenset[str] = frozenset()
+    outputs: frozenset[str] = frozenset()
+    incremental: bool = False
+
     @abstractmethod
     def get_name(self) -> str:
         raise NotImplementedError
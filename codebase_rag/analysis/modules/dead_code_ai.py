@@ -6,6 +6,8 @@ from .base_module import AnalysisContext, AnalysisModule
 
 
 class DeadCodeAIModule(AnalysisModule):
+    inputs = frozenset({"dead_code"})
+
     def get_name(self) -> str:
         return "dead_code_ai"
 
@@ -90,14 +90,10 @@ class DocumentationQualityModule(AnalysisModule):
         for path in paths[:200]:
             if not context.runner._is_runtime_source_path(path):
                 continue
-            file_path = context.runner.repo_path / path
-            if not file_path.exists():
-                continue
-            try:
-                content = file_path.read_text(
-                    encoding=cs.ENCODING_UTF8, errors="ignore"
-                )
-            except Exception:
+            content = context.get_source_store().read_text(
+                context.runner.repo_path / path
+            )
+            if content is None:
                 continue
             ratio = DocumentationQualityModule._comment_ratio(content)
             if ratio < 0.05:
@@ -6,6 +6,23 @@ from .base_module import AnalysisContext, AnalysisModule
 
 
 class MigrationModule(AnalysisModule):
+    inputs = frozenset(
+        {
+            "dependency_risk",
+            "performance_hotspots",
+            "test_coverage_proxy",
+            "layering_violations",
+        }
+    )
+    outputs = frozenset(
+        {
+            "dependency_risk",
+            "performance_hotspots",
+            "test_coverage_proxy",
+            "layering_violations",
+        }
+    )
+
     def get_name(self) -> str:
         return "migration_plan"
 
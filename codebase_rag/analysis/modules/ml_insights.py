@@ -7,6 +7,8 @@ from .base_module import AnalysisContext, AnalysisModule
 
 
 class MLInsightsModule(AnalysisModule):
+    inputs = frozenset({"migration_plan"})
+
     def get_name(self) -> str:
         return "ml_insights"
 
@@ -5,7 +5,6 @@ from typing import Any
 
 from codebase_rag.core import constants as cs
 
-from ...utils.source_extraction import extract_source_lines
 from .base_module import AnalysisContext, AnalysisModule
 
 
@@ -60,9 +59,7 @@ class PerformanceAnalysisModule(AnalysisModule):
             if not context.runner._is_runtime_source_path(path):
                 continue
 
-            source = extract_source_lines(
-                context.runner.repo_path / path, start_line, end_line
-            )
+            source = context.runner._read_source_lines(path, start_line, end_line)
             if not source:
                 continue
 
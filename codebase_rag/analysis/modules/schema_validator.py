@@ -15,7 +15,7 @@ class SchemaValidatorModule(AnalysisModule):
         if not context.nodes or not context.relationships:
             return {}
 
-        node_ids = {node.node_id for node in context.nodes}
+        graph = context.get_graph_index()
         contains_types = {
             cs.RelationshipType.CONTAINS_PACKAGE.value,
             cs.RelationshipType.CONTAINS_FOLDER.value,
@@ -24,10 +24,7 @@ class SchemaValidatorModule(AnalysisModule):
             cs.RelationshipType.CONTAINS.value,
         }
 
-        incoming_contains: set[int] = set()
-        for rel in context.relationships:
-            if rel.rel_type in contains_types:
-                incoming_contains.add(rel.to_id)
+        incoming_contains = graph.in_degrees(contains_types)
 
         orphan_nodes = [
             node.node_id
@@ -40,11 +37,7 @@ class SchemaValidatorModule(AnalysisModule):
             cs.RelationshipType.RETURNS_TYPE.value,
             cs.RelationshipType.PARAMETER_TYPE.value,
         }
-        type_edges_by_source = {
-            rel.from_id
-            for rel in context.relationships
-            if rel.rel_type in type_edge_types
-        }
+        type_edges_by_source = graph.out_degrees(type_edge_types)
 
         missing_types = [
             node.node_id
@@ -56,14 +49,8 @@ class SchemaValidatorModule(AnalysisModule):
             and node.node_id not in type_edges_by_source
         ]
 
-        broken_refs = [
-            rel
-            for rel in context.relationships
-            if rel.from_id not in node_ids or rel.to_id not in node_ids
-        ]
-
         return {
             "orphan_nodes": len(orphan_nodes),
             "missing_types": len(missing_types),
-            "broken_refs": len(broken_refs),
+            "broken_refs": graph.dangling_edge_count(),
         }
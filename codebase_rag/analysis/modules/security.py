@@ -6,6 +6,8 @@ from .base_module import AnalysisContext, AnalysisModule
 
 
 class SecurityModule(AnalysisModule):
+    incremental = True
+
     def get_name(self) -> str:
         return "security"
 
@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+from collections.abc import Callable
 from pathlib import Path
 from typing import Any, Protocol, runtime_checkable
 
 from ..services.protocols import IngestorProtocol
+from ..utils.source_store import SourceStore
+from .graph_index import GraphIndex
+from .incremental import AnalysisScope, PartitionedRecords
 from .types import NodeRecord, RelationshipRecord
 
 
@@ -19,7 +23,21 @@ class AnalysisRunnerProtocol(Protocol):
         self, node: NodeRecord, module_path_map: dict[str, str]
     ) -> str | None: ...
 
-    def _collect_cycles(self, graph: dict[int, set[int]]) -> list[list[int]]: ...
+    def _graph_index(
+        self,
+        nodes: list[NodeRecord],
+        relationships: list[RelationshipRecord],
+    ) -> GraphIndex: ...
+
+    def _source_store(self) -> SourceStore: ...
+
+    def _read_source_text(
+        self, path: str, max_bytes: int | None = None
+    ) -> str | None: ...
+
+    def _read_source_lines(
+        self, path: str, start_line: int, end_line: int
+    ) -> str | None: ...
 
     def _write_json_report(self, filename: str, payload: object) -> Path: ...
 
@@ -31,16 +49,48 @@ class AnalysisRunnerProtocol(Protocol):
 
     def _analysis_output_dir(self) -> Path: ...
 
+    def _analysis_scope(
+        self,
+        nodes: list[NodeRecord],
+        relationships: list[RelationshipRecord],
+        module_path_map: dict[str, str],
+        changed_paths: list[str],
+    ) -> AnalysisScope: ...
+
+    def _partitioned_records(
+        self,
+        key: str,
+        compute: Callable[[AnalysisScope | None], PartitionedRecords],
+    ) -> PartitionedRecords: ...
+
     def _extract_parameters(self, nodes: list[NodeRecord]) -> dict[str, Any]: ...
 
+    def _extract_parameters_by_path(
+        self, nodes: list[NodeRecord], scope: AnalysisScope | None
+    ) -> dict[str, int]: ...
+
     def _detect_nested_functions(
         self, nodes: list[NodeRecord], module_path_map: dict[str, str]
     ) -> dict[str, Any]: ...
 
+    def _nested_functions_by_path(
+        self,
+        nodes: list[NodeRecord],
+        module_path_map: dict[str, str],
+        scope: AnalysisScope | None,
+    ) -> dict[str, int]: ...
+
     def _compute_complexity(
         self, nodes: list[NodeRecord], module_path_map: dict[str, str]
     ) -> dict[str, Any]: ...
 
+    def _complexity_by_path(
+        self,
+        nodes: list[NodeRecord],
+        module_path_map: dict[str, str],
+        scope: AnalysisScope | None,
+    ) -> dict[str, dict[str, int]]: ...
+
     def _symbol_usage_db(self, module_paths: list[str] | None) -> dict[str, Any]: ...
 
     def _symbol_usage(
@@ -74,6 +124,10 @@ class AnalysisRunnerProtocol(Protocol):
 
     def _security_scan(self, nodes: list[NodeRecord]) -> dict[str, Any]: ...
 
+    def _security_findings_by_path(
+        self, scanner: Any, nodes: list[NodeRecord], scope: AnalysisScope | None
+    ) -> dict[str, list[dict[str, object]]]: ...
+
     def _test_coverage_proxy(self, nodes: list[NodeRecord]) -> dict[str, Any]: ...
 
     def _blast_radius(
@@ -237,20 +291,54 @@ class AnalysisRunnerProtocol(Protocol):
 
     def _leading_indent(self, line: str) -> int: ...
 
+    def _static_file_paths(
+        self,
+        nodes: list[NodeRecord],
+        file_paths: list[str] | None,
+        scope: AnalysisScope | None,
+    ) -> list[str]: ...
+
+    def _static_state_key(self, name: str) -> str: ...
+
+    def _scan_static_files(
+        self,
+        file_paths: list[str],
+        scan: Callable[[str, str], list[dict[str, object]]],
+    ) -> dict[str, list[dict[str, object]]]: ...
+
     def _unused_variables(
         self, nodes: list[NodeRecord], file_paths: list[str] | None = None
     ) -> dict[str, Any]: ...
 
+    def _unused_variables_in(
+        self, path: str, content: str
+    ) -> list[dict[str, object]]: ...
+
+    def _unreachable_code_in(
+        self, path: str, content: str
+    ) -> list[dict[str, object]]: ...
+
     def _unreachable_code(
         self, nodes: list[NodeRecord], file_paths: list[str] | None = None
     ) -> dict[str, Any]: ...
 
     def _refactoring_candidates(self, nodes: list[NodeRecord]) -> dict[str, Any]: ...
 
+    def _refactoring_candidates_by_path(
+        self,
+        nodes: list[NodeRecord],
+        threshold: int,
+        scope: AnalysisScope | None,
+    ) -> dict[str, list[dict[str, object]]]: ...
+
     def _secret_scan(
         self, nodes: list[NodeRecord], file_paths: list[str] | None = None
     ) -> dict[str, Any]: ...
 
+    def _secret_scan_by_path(
+        self, scanner: Any, file_paths: list[str]
+    ) -> dict[str, list[dict[str, object]]]: ...
+
     def _api_stability_trend(self, api_stats: Any) -> dict[str, Any]: ...
 
     def _format_migration_prompt(
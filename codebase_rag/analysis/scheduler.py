@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any
+
+from codebase_rag.data_models.types_defs import PropertyDict, PropertyValue, ResultRow
+
+from ..services.protocols import IngestorProtocol, QueryProtocol
+
+TaskRunner = Callable[[dict[str, Any]], Any]
+
+
+@dataclass(frozen=True, slots=True)
+class AnalysisTask:
+    name: str
+    run: TaskRunner
+    inputs: frozenset[str] = frozenset()
+    outputs: frozenset[str] = frozenset()
+    store_empty: bool = False
+    incremental: bool = False
+
+    @property
+    def provides(self) -> frozenset[str]:
+        return self.outputs | {self.name}
+
+
+@dataclass(slots=True)
+class TaskOutcome:
+    name: str
+    result: Any = None
+    extra: dict[str, Any] = field(default_factory=dict)
+    depends_on: tuple[str, ...] = ()
+    seconds: float = 0.0
+    store_empty: bool = False
+
+
+class SerializedIngestor:
+    def __init__(self, ingestor: IngestorProtocol) -> None:
+        self._ingestor = ingestor
+        self._lock = threading.RLock()
+
+    def ensure_node_batch(self, label: str, properties: PropertyDict) -> None:
+        with self._lock:
+            self._ingestor.ensure_node_batch(label, properties)
+
+    def ensure_relationship_batch(
+        self,
+        from_spec: tuple[str, str, PropertyValue],
+        rel_type: str,
+        to_spec: tuple[str, str, PropertyValue],
+        properties: PropertyDict | None = None,
+    ) -> None:
+        with self._lock:
+            self._ingestor.ensure_relationship_batch(
+                from_spec, rel_type, to_spec, properties
+            )
+
+    def flush_all(self) -> None:
+        with self._lock:
+            self._ingestor.flush_all()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._ingestor, name)
+
+
+class SerializedQueryIngestor(SerializedIngestor):
+    _ingestor: QueryProtocol
+
+    def fetch_all(
+        self, query: str, params: PropertyDict | None = None
+    ) -> list[ResultRow]:
+        with self._lock:
+            return self._ingestor.fetch_all(query, params)
+
+    def execute_write(self, query: str, params: PropertyDict | None = None) -> None:
+        with self._lock:
+            self._ingestor.execute_write(query, params)
+
+
+def serialized_ingestor(ingestor: IngestorProtocol) -> SerializedIngestor:
+    # (H) Only expose query methods the wrapped ingestor has, so hasattr() and
+    # (H) QueryProtocol checks inside tasks see the same capabilities.
+    if isinstance(ingestor, QueryProtocol):
+        return SerializedQueryIngestor(ingestor)
+    return SerializedIngestor(ingestor)
+
+
+def task_dependencies(tasks: Sequence[AnalysisTask]) -> list[tuple[int, ...]]:
+    dependencies: list[tuple[int, ...]] = []
+    for index, task in enumerate(tasks):
+        dependencies.append(
+            tuple(
+                earlier
+                for earlier in range(index)
+                if tasks[earlier].provides & task.inputs
+            )
+        )
+    return dependencies
+
+
+def run_task_graph(
+    tasks: Sequence[AnalysisTask], *, max_workers: int = 1
+) -> list[TaskOutcome]:
+    dependencies = task_dependencies(tasks)
+    outcomes = [
+        TaskOutcome(
+            name=task.name,
+            depends_on=tuple(
+                tasks[dependency].name for dependency in dependencies[index]
+            ),
+            store_empty=task.store_empty,
+        )
+        for index, task in enumerate(tasks)
+    ]
+    if max_workers <= 1:
+        for index, task in enumerate(tasks):
+            _execute(
+                task, outcomes[index], _visible_summary(dependencies, outcomes, index)
+            )
+        return outcomes
+
+    remaining = [len(deps) for deps in dependencies]
+    dependents: list[list[int]] = [[] for _ in tasks]
+    for index, deps in enumerate(dependencies):
+        for dependency in deps:
+            dependents[dependency].append(index)
+
+    with ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="analysis"
+    ) as executor:
+        running: dict[Future[None], int] = {}
+
+        def submit(index: int) -> None:
+            future = executor.submit(
+                _execute,
+                tasks[index],
+                outcomes[index],
+                _visible_summary(dependencies, outcomes, index),
+            )
+            running[future] = index
+
+        for index, pending in enumerate(remaining):
+            if not pending:
+                submit(index)
+        while running:
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in sorted(done, key=running.__getitem__):
+                index = running.pop(future)
+                if (error := future.exception()) is not None:
+                    for other in running:
+                        other.cancel()
+                    raise error
+                for dependent in dependents[index]:
+                    remaining[dependent] -= 1
+                    if not remaining[dependent]:
+                        submit(dependent)
+    return outcomes
+
+
+def merge_outcomes(
+    summary: dict[str, Any], outcomes: Sequence[TaskOutcome]
+) -> dict[str, Any]:
+    for outcome in outcomes:
+        summary.update(outcome.extra)
+        if outcome.result or outcome.store_empty:
+            summary[outcome.name] = outcome.result
+    return summary
+
+
+def _visible_summary(
+    dependencies: Sequence[tuple[int, ...]],
+    outcomes: Sequence[TaskOutcome],
+    index: int,
+) -> dict[str, Any]:
+    return merge_outcomes(
+        {}, [outcomes[dependency] for dependency in dependencies[index]]
+    )
+
+
+def _execute(task: AnalysisTask, outcome: TaskOutcome, summary: dict[str, Any]) -> None:
+    inherited = dict(summary)
+    started = time.perf_counter()
+    try:
+        outcome.result = task.run(summary)
+    finally:
+        outcome.seconds = time.perf_counter() - started
+    outcome.extra = {
+        key: value
+        for key, value in summary.items()
+        if key not in inherited or inherited[key] is not value
+    }
@@ -2,7 +2,7 @@ import asyncio
 import os
 import sys
 from pathlib import Path
-from typing import Literal, cast
+from typing import Any, Literal, cast
 
 if sys.platform == "win32":
     os.environ.setdefault("PYTHONIOENCODING", "utf-8")
@@ -20,7 +20,7 @@ from codebase_rag.core import cli_help as ch
 from codebase_rag.core import constants as cs
 from codebase_rag.core import logs as ls
 from codebase_rag.graph_db.graph_updater import GraphUpdater
-from codebase_rag.infrastructure.parser_loader import load_parsers
+from codebase_rag.infrastructure.language_runtime import LanguageRuntime
 from codebase_rag.services.cleanup_service import CleanupService
 from codebase_rag.services.protobuf_service import ProtobufFileIngestor
 from codebase_rag.tools.health_checker import HealthChecker
@@ -253,18 +253,21 @@ def start(
                     cleanup_service.wipe_embeddings()
             ingestor.ensure_constraints()
 
-            parsers, queries = load_parsers()
-
-            updater = GraphUpdater(
-                ingestor,
-                repo_to_update,
-                parsers,
-                queries,
-                unignore_paths,
-                exclude_paths,
-                force_full_reparse=clean,
-            )
-            updater.run()
+            language_runtime = LanguageRuntime()
+            try:
+                updater = GraphUpdater(
+                    ingestor,
+                    repo_to_update,
+                    language_runtime.parsers,
+                    language_runtime.queries,
+                    unignore_paths,
+                    exclude_paths,
+                    force_full_reparse=clean,
+                    language_runtime=language_runtime,
+                )
+                updater.run()
+            finally:
+                language_runtime.shutdown()
 
             if output:
                 _info(style(cs.CLI_MSG_EXPORTING_TO.format(path=output), cs.Color.CYAN))
@@ -341,12 +344,20 @@ def index(
         ingestor = ProtobufFileIngestor(
             output_path=output_proto_dir, split_index=split_index
         )
-        parsers, queries = load_parsers()
-        updater = GraphUpdater(
-            ingestor, repo_to_index, parsers, queries, unignore_paths, exclude_paths
-        )
-
-        updater.run()
+        language_runtime = LanguageRuntime()
+        try:
+            updater = GraphUpdater(
+                ingestor,
+                repo_to_index,
+                language_runtime.parsers,
+                language_runtime.queries,
+                unignore_paths,
+                exclude_paths,
+                language_runtime=language_runtime,
+            )
+            updater.run()
+        finally:
+            language_runtime.shutdown()
         _info(style(cs.CLI_MSG_INDEXING_DONE, cs.Color.GREEN))
 
     except Exception as e:
@@ -672,6 +683,22 @@ def benchmark(
     app_context.console.print(f"  Client profile average: {client_profile_average}")
     cypher_average = summary_dict.get("cypher_average", 0.0)
     app_context.console.print(f"  Cypher average: {cypher_average}")
+    parser_startup = report.get("parser_startup")
+    if isinstance(parser_startup, dict):
+        for label, key in (("on demand", "on_demand"), ("all", "all_languages")):
+            startup = cast(dict[str, object], parser_startup.get(key, {}))
+            app_context.console.print(
+                f"  Grammar cold start ({label}): {startup.get('seconds')}s, "
+                f"RSS {startup.get('rss_before_mb')} -> "
+                f"{startup.get('rss_after_mb')} MB"
+            )
+        all_languages = cast(dict[str, Any], parser_startup.get("all_languages", {}))
+        query_cache = cast(dict[str, Any], all_languages.get("query_cache") or {})
+        if query_cache:
+            app_context.console.print(
+                f"  Query cache: {query_cache.get('compiles')} compiles, "
+                f"persistent hit rate {query_cache.get('l2', {}).get('hit_rate')}"
+            )
     output_path = report.get("output_path")
     if isinstance(output_path, str) and output_path.strip():
         app_context.console.print(f"  Output: {output_path}")
@@ -203,6 +203,15 @@ class AppConfig(BaseSettings):
     CODEGRAPH_SELECTIVE_UPDATE: bool = False
     CODEGRAPH_INCREMENTAL_CACHE: bool = False
     CODEGRAPH_WRITE_ANALYSIS_GRAPH_NODES: bool = False
+    CODEGRAPH_SOURCE_STORE_MAX_MB: int = 256
+    CODEGRAPH_GRAMMAR_PRELOAD_WORKERS: int = 2
+    CODEGRAPH_QUERY_CACHE_SIZE: int = 1000
+    CODEGRAPH_QUERY_CACHE_PERSIST: bool = True
+    CODEGRAPH_QUERY_CACHE_PATH: str | None = None
+    CODEGRAPH_SECURITY_SCAN_WORKERS: int = 4
+    CODEGRAPH_SECURITY_SCAN_MAX_FILE_BYTES: int = 1_000_000
+    CODEGRAPH_ANALYSIS_WORKERS: int = 4
+    CODEGRAPH_ANALYSIS_INCREMENTAL_HOPS: int = 1
 
     AGENT_RETRIES: int = 3
     AGENT_MAX_STEPS: int = 6
@@ -424,11 +424,6 @@ CPP_IMPORT_PARTITION_PREFIX = "import :"
 CPP_PARTITION_PREFIX = "partition_"
 EXTERNAL_PATH_SEGMENT = "__external__"
 
-# (H) Trie internal keys
-TRIE_TYPE_KEY = "__type__"
-TRIE_QN_KEY = "__qn__"
-TRIE_INTERNAL_PREFIX = "__"
-
 
 class UniqueKeyType(StrEnum):
     """Enumerates the property keys used as unique identifiers for node labels."""
@@ -736,6 +731,9 @@ EXCLUDED_DEPENDENCY_NAMES = frozenset({"python", "php"})
 # (H) Byte size constants
 BYTES_PER_MB = 1024 * 1024
 
+# (H) Security scanning: corpora below this size are scanned in-process
+SECURITY_SCAN_PARALLEL_MIN_BYTES = 8 * BYTES_PER_MB
+
 # (H) Property keys
 KEY_PARAMETERS = "parameters"
 KEY_DECORATORS = "decorators"
@@ -743,6 +741,9 @@ KEY_DOCSTRING = "docstring"
 KEY_IS_EXPORTED = "is_exported"
 KEY_IS_ENTRY_POINT = "is_entry_point"
 KEY_SIGNATURE_LITE = "signature_lite"
+KEY_COMPLEXITY = "complexity"
+KEY_COGNITIVE_COMPLEXITY = "cognitive_complexity"
+KEY_LINES_OF_CODE = "lines_of_code"
 KEY_LANGUAGE = "language"
 KEY_MODULE_QN = "module_qn"
 KEY_REPO_REL_PATH = "repo_rel_path"
@@ -780,6 +781,13 @@ CSPROJ_SUFFIX = ".csproj"
 
 # (H) Cypher queries
 CYPHER_DEFAULT_LIMIT = 50
+CYPHER_STREAM_PAGE_SIZE = 500
+CYPHER_STREAM_MAX_IDLE_CONNECTIONS = 4
+MEMGRAPH_CONNECT_TIMEOUT_SECONDS = 15.0
+
+# (H) Mermaid export caps applied server-side for MCP exports
+MERMAID_MCP_MAX_NODES = 2000
+MERMAID_MCP_MAX_EDGES = 5000
 
 CYPHER_QUERY_EMBEDDINGS = """
 MATCH (m:Module)-[:DEFINES]->(n)
@@ -2060,12 +2068,16 @@ GOMOD_COMMENT_PREFIX = "//"
 # (H) Gemfile parsing patterns
 GEMFILE_GEM_PREFIX = "gem "
 
+# (H) Semantic pass source/tree memo size (files)
+PARSED_SOURCE_CACHE_MAX_ENTRIES = 256
+
 # (H) Import processor cache config
 IMPORT_CACHE_TTL = 3600
 IMPORT_CACHE_DIR = ".cache/codebase_rag"
 IMPORT_CACHE_FILE = "stdlib_cache.json"
 IMPORT_CACHE_KEY = "cache"
 IMPORT_TIMESTAMPS_KEY = "timestamps"
+QUERY_CACHE_FILE = "compiled_queries.json"
 
 # (H) Tree-sitter Python import node types
 TS_IMPORT_STATEMENT = "import_statement"
@@ -2244,6 +2256,7 @@ TS_PARENTHESIZED_EXPRESSION = "parenthesized_expression"
 TS_ATTRIBUTE = "attribute"
 
 FIELD_OPERATOR = "operator"
+FIELD_ALTERNATIVE = "alternative"
 
 # (H) Derived node type tuples for class ingestion
 CPP_CLASS_TYPES = (CppNodeType.CLASS_SPECIFIER, TS_STRUCT_SPECIFIER)
@@ -3520,6 +3533,256 @@ SPEC_LUA_MODULE_TYPES = (TS_LUA_CHUNK,)
 SPEC_LUA_CALL_TYPES = (TS_LUA_FUNCTION_CALL,)
 SPEC_LUA_IMPORT_TYPES = (TS_LUA_FUNCTION_CALL,)
 
+# (H) LANGUAGE_SPECS complexity tables: decision nodes add one cyclomatic path,
+# (H) nesting nodes add one cognitive point plus the current nesting depth,
+# (H) flat branch nodes (else/elif) add one cognitive point without nesting.
+SPEC_PY_DECISION_TYPES = (
+    "if_statement",
+    "elif_clause",
+    TS_PY_FOR_STATEMENT,
+    "while_statement",
+    "except_clause",
+    "conditional_expression",
+    TS_PY_FOR_IN_CLAUSE,
+    "if_clause",
+    "case_clause",
+)
+SPEC_PY_NESTING_TYPES = (
+    "if_statement",
+    TS_PY_FOR_STATEMENT,
+    "while_statement",
+    "except_clause",
+    "conditional_expression",
+    "match_statement",
+)
+SPEC_PY_FLAT_BRANCH_TYPES = ("elif_clause", "else_clause")
+SPEC_PY_LOGICAL_OPERATORS = ("and", "or")
+
+SPEC_JS_DECISION_TYPES = (
+    "if_statement",
+    "for_statement",
+    "for_in_statement",
+    "while_statement",
+    "do_statement",
+    "catch_clause",
+    "ternary_expression",
+    "switch_case",
+)
+SPEC_JS_NESTING_TYPES = (
+    "if_statement",
+    "for_statement",
+    "for_in_statement",
+    "while_statement",
+    "do_statement",
+    "catch_clause",
+    "ternary_expression",
+    "switch_statement",
+)
+SPEC_JS_FLAT_BRANCH_TYPES = ("else_clause",)
+SPEC_JS_LOGICAL_OPERATORS = ("&&", "||", "??")
+
+SPEC_JAVA_DECISION_TYPES = (
+    "if_statement",
+    "for_statement",
+    TS_ENHANCED_FOR_STATEMENT,
+    "while_statement",
+    "do_statement",
+    "catch_clause",
+    "ternary_expression",
+    "switch_label",
+)
+SPEC_JAVA_NESTING_TYPES = (
+    "if_statement",
+    "for_statement",
+    TS_ENHANCED_FOR_STATEMENT,
+    "while_statement",
+    "do_statement",
+    "catch_clause",
+    "ternary_expression",
+    "switch_expression",
+)
+SPEC_C_STYLE_LOGICAL_OPERATORS = ("&&", "||")
+
+SPEC_GO_DECISION_TYPES = (
+    "if_statement",
+    "for_statement",
+    "expression_case",
+    "type_case",
+    "communication_case",
+)
+SPEC_GO_NESTING_TYPES = (
+    "if_statement",
+    "for_statement",
+    "expression_switch_statement",
+    "type_switch_statement",
+    "select_statement",
+)
+
+SPEC_RS_DECISION_TYPES = (
+    "if_expression",
+    "for_expression",
+    "while_expression",
+    "loop_expression",
+    "match_arm",
+)
+SPEC_RS_NESTING_TYPES = (
+    "if_expression",
+    "for_expression",
+    "while_expression",
+    "loop_expression",
+    "match_expression",
+)
+SPEC_RS_FLAT_BRANCH_TYPES = ("else_clause",)
+
+SPEC_CPP_DECISION_TYPES = (
+    "if_statement",
+    "for_statement",
+    "for_range_loop",
+    "while_statement",
+    "do_statement",
+    "catch_clause",
+    "conditional_expression",
+    "case_statement",
+)
+SPEC_CPP_NESTING_TYPES = (
+    "if_statement",
+    "for_statement",
+    "for_range_loop",
+    "while_statement",
+    "do_statement",
+    "catch_clause",
+    "conditional_expression",
+    "switch_statement",
+)
+SPEC_CPP_FLAT_BRANCH_TYPES = ("else_clause",)
+
+SPEC_CS_DECISION_TYPES = (
+    "if_statement",
+    "for_statement",
+    "foreach_statement",
+    "while_statement",
+    "do_statement",
+    "catch_clause",
+    "conditional_expression",
+    "switch_section",
+    "switch_expression_arm",
+)
+SPEC_CS_NESTING_TYPES = (
+    "if_statement",
+    "for_statement",
+    "foreach_statement",
+    "while_statement",
+    "do_statement",
+    "catch_clause",
+    "conditional_expression",
+    "switch_statement",
+    "switch_expression",
+)
+SPEC_CS_LOGICAL_OPERATORS = ("&&", "||", "??")
+
+SPEC_PHP_DECISION_TYPES = (
+    "if_statement",
+    "else_if_clause",
+    "for_statement",
+    "foreach_statement",
+    "while_statement",
+    "do_statement",
+    "catch_clause",
+    "conditional_expression",
+    "case_statement",
+)
+SPEC_PHP_NESTING_TYPES = (
+    "if_statement",
+    "for_statement",
+    "foreach_statement",
+    "while_statement",
+    "do_statement",
+    "catch_clause",
+    "conditional_expression",
+    "switch_statement",
+)
+SPEC_PHP_FLAT_BRANCH_TYPES = ("else_if_clause", "else_clause")
+SPEC_PHP_LOGICAL_OPERATORS = ("&&", "||", "and", "or", "??")
+
+SPEC_RUBY_DECISION_TYPES = (
+    "if",
+    "elsif",
+    "unless",
+    "while",
+    "until",
+    "for",
+    "when",
+    "rescue",
+    "conditional",
+    "if_modifier",
+    "unless_modifier",
+    "while_modifier",
+    "until_modifier",
+)
+SPEC_RUBY_NESTING_TYPES = (
+    "if",
+    "unless",
+    "while",
+    "until",
+    "for",
+    "case",
+    "rescue",
+    "conditional",
+)
+SPEC_RUBY_FLAT_BRANCH_TYPES = ("elsif", "else")
+SPEC_RUBY_LOGICAL_OPERATORS = ("&&", "||", "and", "or")
+
+SPEC_KOTLIN_DECISION_TYPES = (
+    "if_expression",
+    "for_statement",
+    "while_statement",
+    "do_while_statement",
+    "catch_block",
+    "when_entry",
+    "elvis_expression",
+)
+SPEC_KOTLIN_NESTING_TYPES = (
+    "if_expression",
+    "for_statement",
+    "while_statement",
+    "do_while_statement",
+    "catch_block",
+    "when_expression",
+)
+
+SPEC_SCALA_DECISION_TYPES = (
+    "if_expression",
+    "for_expression",
+    "while_expression",
+    "do_while_expression",
+    "catch_clause",
+    "case_clause",
+)
+SPEC_SCALA_NESTING_TYPES = (
+    "if_expression",
+    "for_expression",
+    "while_expression",
+    "do_while_expression",
+    "catch_clause",
+    "match_expression",
+)
+
+SPEC_LUA_DECISION_TYPES = (
+    "if_statement",
+    "elseif_statement",
+    "for_statement",
+    "while_statement",
+    "repeat_statement",
+)
+SPEC_LUA_NESTING_TYPES = (
+    "if_statement",
+    "for_statement",
+    "while_statement",
+    "repeat_statement",
+)
+SPEC_LUA_FLAT_BRANCH_TYPES = ("elseif_statement", "else_statement")
+SPEC_LUA_LOGICAL_OPERATORS = ("and", "or")
+
 # (H) Health check constants
 HEALTH_CHECK_DOCKER_RUNNING = "Docker daemon is running"
 HEALTH_CHECK_DOCKER_NOT_RUNNING = "Docker daemon is not running"
@@ -3560,6 +3823,16 @@ HEALTH_CHECK_TOOL_TIMEOUT_ERROR = (
 )
 HEALTH_CHECK_TOOL_FAILED_MSG = "Check failed"
 
+HEALTH_CHECK_PARSER_STARTUP = (
+    "Grammar cold start: {on_demand_count} repo language(s) in "
+    "{on_demand_seconds:.2f}s (RSS {on_demand_rss}), all {all_count} in "
+    "{all_seconds:.2f}s (RSS {all_rss})"
+)
+HEALTH_CHECK_PARSER_STARTUP_FAILED = "Tree-sitter grammars failed to load"
+HEALTH_CHECK_PARSER_STARTUP_MSG = "Loaded: {languages}"
+HEALTH_CHECK_PARSER_RSS = "{before:.1f} -> {after:.1f} MB"
+HEALTH_CHECK_PARSER_RSS_UNKNOWN = "n/a"
+
 HEALTH_CHECK_TOOLS = [
     ("GEMINI_API_KEY", "Gemini"),
     ("OPENAI_API_KEY", "OpenAI"),
@@ -148,6 +148,13 @@ class LanguageSpec:
         function_query (str | None): An optional, overriding tree-sitter query for functions.
         class_query (str | None): An optional, overriding tree-sitter query for classes.
         call_query (str | None): An optional, overriding tree-sitter query for calls.
+        decision_node_types (tuple[str, ...]): Node types that add a cyclomatic path.
+        nesting_node_types (tuple[str, ...]): Node types that add cognitive complexity
+            weighted by nesting depth and nest their children one level deeper.
+        flat_branch_node_types (tuple[str, ...]): Branch nodes (else/elif) that add
+            cognitive complexity without a nesting penalty.
+        logical_operator_types (tuple[str, ...]): Operator tokens of short-circuit
+            boolean expressions.
     """
 
     language: SupportedLanguage | str
@@ -164,6 +171,10 @@ class LanguageSpec:
     function_query: str | None = None
     class_query: str | None = None
     call_query: str | None = None
+    decision_node_types: tuple[str, ...] = ()
+    nesting_node_types: tuple[str, ...] = ()
+    flat_branch_node_types: tuple[str, ...] = ()
+    logical_operator_types: tuple[str, ...] = ()
 
 
 @dataclass
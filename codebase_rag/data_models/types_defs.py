@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from collections import defaultdict
 from collections.abc import Awaitable, Callable, ItemsView, KeysView, Sequence
+from contextlib import AbstractContextManager
 from dataclasses import dataclass
 from enum import StrEnum
 from pathlib import Path
@@ -115,9 +116,6 @@ class NodeType(StrEnum):
     UNION = "Union"
 
 
-type TrieNode = dict[str, TrieNode | QualifiedName | NodeType]
-"""A node in the FunctionRegistryTrie."""
-
 type FunctionRegistry = dict[QualifiedName, NodeType]
 """A direct mapping from qualified names to their node types."""
 
@@ -167,6 +165,13 @@ class LoadableProtocol(Protocol):
     def _ensure_loaded(self) -> None: ...
 
 
+class LockableProtocol(Protocol):
+    """A protocol for objects that guard their state with a re-entrant lock."""
+
+    @property
+    def _lock(self) -> AbstractContextManager[object]: ...
+
+
 class CursorProtocol(Protocol):
     """A protocol for a database cursor, abstracting over different DB drivers."""
 
@@ -181,6 +186,16 @@ class CursorProtocol(Protocol):
     @property
     def description(self) -> Sequence[ColumnDescriptor] | None: ...
     def fetchall(self) -> list[tuple[PropertyValue, ...]]: ...
+    def fetchmany(self, size: int = ...) -> list[tuple[ResultValue, ...]]: ...
+
+
+class ConnectionProtocol(Protocol):
+    """A protocol for a database connection that hands out cursors."""
+
+    autocommit: bool
+
+    def cursor(self) -> CursorProtocol: ...
+    def close(self) -> None: ...
 
 
 class PathValidatorProtocol(Protocol):
@@ -339,6 +354,21 @@ class CancelledResult(NamedTuple):
     cancelled: bool
 
 
+class BoundedRows(NamedTuple):
+    """Rows kept within a row/character budget while streaming a query result."""
+
+    rows: list[ResultRow]
+    truncated: bool
+    rows_scanned: int
+
+
+class ComplexityMetrics(NamedTuple):
+    """Cyclomatic and cognitive complexity computed from a function's AST."""
+
+    cyclomatic: int
+    cognitive: int
+
+
 class CgrignorePatterns(NamedTuple):
     """Patterns for excluding and including files, loaded from .cgrignore."""
 
@@ -1,3 +1,3 @@
-from .mermaid_exporter import MermaidExporter
+from .mermaid_exporter import GraphQueryMermaidExporter, MermaidExporter
 
-__all__ = ["MermaidExporter"]
+__all__ = ["GraphQueryMermaidExporter", "MermaidExporter"]
@@ -1,14 +1,23 @@
 from __future__ import annotations
 
-from collections.abc import Iterable
+from collections.abc import Generator, Iterable, Mapping
+from contextlib import closing
 from dataclasses import dataclass
 from pathlib import Path
+from typing import cast
 
 from loguru import logger
 
 from codebase_rag.core import constants as cs
 from codebase_rag.data_models.models import GraphNode, GraphRelationship
+from codebase_rag.data_models.types_defs import PropertyValue, ResultRow
+from codebase_rag.graph_db.cypher_queries import (
+    CYPHER_MERMAID_DEPENDENCY_NODES,
+    build_mermaid_edges_query,
+    build_mermaid_nodes_query,
+)
 from codebase_rag.graph_db.graph_loader import GraphLoader
+from codebase_rag.services.protocols import QueryProtocol
 
 
 @dataclass
@@ -26,108 +35,43 @@ class MermaidExporter:
         self.loader.load()
 
     def export(self, diagram: str, output_path: str) -> Path:
-        diagram = diagram.lower().strip()
-        if diagram == "module":
-            content = self._build_module_graph()
-        elif diagram == "call":
-            content = self._build_call_graph()
-        elif diagram in {"flow", "flowchart"}:
-            content = self._build_call_graph()
-        elif diagram == "dependency":
-            content = self._build_dependency_graph()
-        elif diagram == "class":
-            content = self._build_class_graph()
-        elif diagram == "entity":
-            content = self._build_entity_graph()
-        else:
-            raise ValueError(f"Unknown diagram type: {diagram}")
-
-        output = Path(output_path)
-        output.parent.mkdir(parents=True, exist_ok=True)
-        output.write_text(content, encoding=cs.ENCODING_UTF8)
-        return output
+        content = self._build_from_spec(_resolve_diagram(diagram))
+        return _write_output(content, output_path)
 
     def _build_module_graph(self) -> str:
-        module_nodes = self._filter_nodes_by_label(cs.NodeLabel.MODULE.value)
-        module_ids = {node.node_id for node in module_nodes}
-        edges = self._filter_relationships(
-            module_ids,
-            module_ids,
-            {cs.RelationshipType.IMPORTS.value},
-        )
-        return self._render_mermaid("Module Graph", module_nodes, edges)
+        return self._build_from_spec(_DIAGRAM_SPECS["module"])
 
     def _build_call_graph(self) -> str:
-        function_nodes = self._filter_nodes_by_labels(
-            {
-                cs.NodeLabel.FUNCTION.value,
-                cs.NodeLabel.METHOD.value,
-            }
-        )
-        func_ids = {node.node_id for node in function_nodes}
-        edges = self._filter_relationships(
-            func_ids,
-            func_ids,
-            {cs.RelationshipType.CALLS.value},
-        )
-        return self._render_mermaid("Call Graph", function_nodes, edges)
+        return self._build_from_spec(_DIAGRAM_SPECS["call"])
 
     def _build_dependency_graph(self) -> str:
-        project_nodes = self._filter_nodes_by_label(cs.NodeLabel.PROJECT.value)
-        external_nodes = self._filter_nodes_by_label(
-            cs.NodeLabel.EXTERNAL_PACKAGE.value
-        )
-        project_ids = {node.node_id for node in project_nodes}
-        external_ids = {node.node_id for node in external_nodes}
-        edges = self._filter_relationships(
-            project_ids,
-            external_ids,
-            {cs.RelationshipType.DEPENDS_ON_EXTERNAL.value},
-        )
-        return self._render_mermaid(
-            "Dependency Graph", project_nodes + external_nodes, edges
-        )
+        return self._build_from_spec(_DIAGRAM_SPECS["dependency"])
 
     def _build_class_graph(self) -> str:
-        class_nodes = self._filter_nodes_by_label(cs.NodeLabel.CLASS.value)
-        interface_nodes = self._filter_nodes_by_label(cs.NodeLabel.INTERFACE.value)
-        enum_nodes = self._filter_nodes_by_label(cs.NodeLabel.ENUM.value)
-        nodes = class_nodes + interface_nodes + enum_nodes
-        node_ids = {node.node_id for node in nodes}
-        edges = self._filter_relationships(
-            node_ids,
-            node_ids,
-            {
-                cs.RelationshipType.INHERITS.value,
-                cs.RelationshipType.IMPLEMENTS.value,
-                cs.RelationshipType.OVERRIDES.value,
-            },
-        )
-        return self._render_mermaid("Class Graph", nodes, edges)
+        return self._build_from_spec(_DIAGRAM_SPECS["class"])
 
     def _build_entity_graph(self) -> str:
-        project_nodes = self._filter_nodes_by_label(cs.NodeLabel.PROJECT.value)
-        folder_nodes = self._filter_nodes_by_label(cs.NodeLabel.FOLDER.value)
-        file_nodes = self._filter_nodes_by_label(cs.NodeLabel.FILE.value)
-        module_nodes = self._filter_nodes_by_label(cs.NodeLabel.MODULE.value)
-        nodes = project_nodes + folder_nodes + file_nodes + module_nodes
-        node_ids = {node.node_id for node in nodes}
-        edges = self._filter_relationships(
-            node_ids,
-            node_ids,
-            {
-                cs.RelationshipType.CONTAINS_FOLDER.value,
-                cs.RelationshipType.CONTAINS_FILE.value,
-                cs.RelationshipType.CONTAINS_MODULE.value,
-                cs.RelationshipType.CONTAINS_PACKAGE.value,
-            },
-        )
-        return self._render_mermaid("Entity Graph", nodes, edges)
+        return self._build_from_spec(_DIAGRAM_SPECS["entity"])
+
+    def _build_from_spec(self, spec: _DiagramSpec) -> str:
+        nodes = self._filter_nodes_by_labels(spec.node_labels)
+        from_ids = {
+            node.node_id
+            for node in nodes
+            if any(label in spec.from_labels for label in node.labels)
+        }
+        to_ids = {
+            node.node_id
+            for node in nodes
+            if any(label in spec.to_labels for label in node.labels)
+        }
+        edges = self._filter_relationships(from_ids, to_ids, set(spec.rel_types))
+        return self._render_mermaid(spec.title, nodes, edges)
 
     def _filter_nodes_by_label(self, label: str) -> list[GraphNode]:
         return self.loader.find_nodes_by_label(label)
 
-    def _filter_nodes_by_labels(self, labels: set[str]) -> list[GraphNode]:
+    def _filter_nodes_by_labels(self, labels: Iterable[str]) -> list[GraphNode]:
         nodes: list[GraphNode] = []
         for label in labels:
             nodes.extend(self.loader.find_nodes_by_label(label))
@@ -166,10 +110,9 @@ class MermaidExporter:
                 and len(node_map) >= self.config.max_nodes
             ):
                 break
-            node_id = f"n{node.node_id}"
-            label = self._node_label(node)
-            node_map[node.node_id] = node_id
-            lines.append(f'  {node_id}["{label}"]')
+            node_map[node.node_id] = _append_node_line(
+                lines, node.node_id, self._node_label(node)
+            )
 
         for rel in relationships:
             from_node = node_map.get(rel.from_id)
@@ -178,19 +121,215 @@ class MermaidExporter:
                 continue
             lines.append(f"  {from_node} --> {to_node}")
 
-        if len(lines) == 2:
-            logger.warning("Mermaid export produced an empty diagram: {}", title)
-        return "\n".join(lines) + "\n"
+        return _finish_diagram(title, lines)
 
     @staticmethod
     def _node_label(node: GraphNode) -> str:
-        name = node.properties.get(cs.KEY_NAME)
-        if isinstance(name, str) and name:
-            return name
-        qn = node.properties.get(cs.KEY_QUALIFIED_NAME)
-        if isinstance(qn, str) and qn:
-            return qn
-        path = node.properties.get(cs.KEY_PATH)
-        if isinstance(path, str) and path:
-            return path
-        return str(node.node_id)
+        return _display_label(node.node_id, node.properties)
+
+
+class GraphQueryMermaidExporter:
+    """
+    Builds Mermaid diagrams directly from project-scoped Cypher queries.
+
+    Each diagram type issues one node query and one edge query against the
+    active project only, with the configured node and edge caps pushed into the
+    queries as `LIMIT` clauses. Rows are consumed as a stream, so the cost of an
+    export is proportional to the diagram rather than to the whole database.
+    """
+
+    def __init__(
+        self,
+        ingestor: QueryProtocol,
+        project_name: str,
+        config: MermaidConfig | None = None,
+    ) -> None:
+        self.ingestor = ingestor
+        self.project_name = project_name
+        self.config = config or MermaidConfig()
+
+    def export(self, diagram: str, output_path: str) -> Path:
+        content = self.build(diagram)
+        return _write_output(content, output_path)
+
+    def build(self, diagram: str) -> str:
+        spec = _resolve_diagram(diagram)
+        lines = [f"%% {spec.title}", f"graph {self.config.direction}"]
+        node_map = self._collect_nodes(spec, lines)
+        if node_map:
+            self._collect_edges(spec, node_map, lines)
+        return _finish_diagram(spec.title, lines)
+
+    def _collect_nodes(self, spec: _DiagramSpec, lines: list[str]) -> dict[int, str]:
+        max_nodes = self.config.max_nodes
+        if spec.nodes_query is not None:
+            query = spec.nodes_query
+            if max_nodes is not None:
+                query = f"{query.rstrip()}\nLIMIT {int(max_nodes)}\n"
+        else:
+            query = build_mermaid_nodes_query(spec.node_labels, max_nodes)
+
+        node_map: dict[int, str] = {}
+        with closing(
+            self._iter_rows(query, {"project_name": self.project_name})
+        ) as rows:
+            for row in rows:
+                if max_nodes is not None and len(node_map) >= max_nodes:
+                    break
+                node_id = row.get("node_id")
+                if not isinstance(node_id, int) or node_id in node_map:
+                    continue
+                node_map[node_id] = _append_node_line(
+                    lines, node_id, _display_label(node_id, row)
+                )
+        return node_map
+
+    def _collect_edges(
+        self, spec: _DiagramSpec, node_map: dict[int, str], lines: list[str]
+    ) -> None:
+        max_edges = self.config.max_edges
+        restrict_to_ids = (
+            self.config.max_nodes is not None and len(node_map) >= self.config.max_nodes
+        )
+        query = build_mermaid_edges_query(
+            spec.from_labels,
+            spec.to_labels,
+            spec.rel_types,
+            max_edges,
+            scope_target=spec.scope_target,
+            restrict_to_ids=restrict_to_ids,
+        )
+        params: dict[str, PropertyValue] = {"project_name": self.project_name}
+        if restrict_to_ids:
+            params["node_ids"] = list(node_map)
+
+        emitted = 0
+        with closing(self._iter_rows(query, params)) as rows:
+            for row in rows:
+                if max_edges is not None and emitted >= max_edges:
+                    break
+                from_node = node_map.get(cast(int, row.get("from_id")))
+                to_node = node_map.get(cast(int, row.get("to_id")))
+                if not from_node or not to_node:
+                    continue
+                lines.append(f"  {from_node} --> {to_node}")
+                emitted += 1
+
+    def _iter_rows(
+        self, query: str, params: dict[str, PropertyValue]
+    ) -> Generator[ResultRow, None, None]:
+        stream_rows = getattr(self.ingestor, "stream_rows", None)
+        if callable(stream_rows):
+            yield from stream_rows(query, params)
+        else:
+            yield from self.ingestor.fetch_all(query, params)
+
+
+@dataclass(frozen=True)
+class _DiagramSpec:
+    title: str
+    from_labels: tuple[str, ...]
+    to_labels: tuple[str, ...]
+    rel_types: tuple[str, ...]
+    scope_target: bool = True
+    nodes_query: str | None = None
+
+    @property
+    def node_labels(self) -> tuple[str, ...]:
+        labels = list(self.from_labels)
+        labels.extend(label for label in self.to_labels if label not in labels)
+        return tuple(labels)
+
+
+_FUNCTION_LABELS = (cs.NodeLabel.FUNCTION.value, cs.NodeLabel.METHOD.value)
+_CLASS_LABELS = (
+    cs.NodeLabel.CLASS.value,
+    cs.NodeLabel.INTERFACE.value,
+    cs.NodeLabel.ENUM.value,
+)
+_ENTITY_LABELS = (
+    cs.NodeLabel.PROJECT.value,
+    cs.NodeLabel.FOLDER.value,
+    cs.NodeLabel.FILE.value,
+    cs.NodeLabel.MODULE.value,
+)
+
+_DIAGRAM_SPECS: dict[str, _DiagramSpec] = {
+    "module": _DiagramSpec(
+        title="Module Graph",
+        from_labels=(cs.NodeLabel.MODULE.value,),
+        to_labels=(cs.NodeLabel.MODULE.value,),
+        rel_types=(cs.RelationshipType.IMPORTS.value,),
+    ),
+    "call": _DiagramSpec(
+        title="Call Graph",
+        from_labels=_FUNCTION_LABELS,
+        to_labels=_FUNCTION_LABELS,
+        rel_types=(cs.RelationshipType.CALLS.value,),
+    ),
+    "dependency": _DiagramSpec(
+        title="Dependency Graph",
+        from_labels=(cs.NodeLabel.PROJECT.value,),
+        to_labels=(cs.NodeLabel.EXTERNAL_PACKAGE.value,),
+        rel_types=(cs.RelationshipType.DEPENDS_ON_EXTERNAL.value,),
+        scope_target=False,
+        nodes_query=CYPHER_MERMAID_DEPENDENCY_NODES,
+    ),
+    "class": _DiagramSpec(
+        title="Class Graph",
+        from_labels=_CLASS_LABELS,
+        to_labels=_CLASS_LABELS,
+        rel_types=(
+            cs.RelationshipType.INHERITS.value,
+            cs.RelationshipType.IMPLEMENTS.value,
+            cs.RelationshipType.OVERRIDES.value,
+        ),
+    ),
+    "entity": _DiagramSpec(
+        title="Entity Graph",
+        from_labels=_ENTITY_LABELS,
+        to_labels=_ENTITY_LABELS,
+        rel_types=(
+            cs.RelationshipType.CONTAINS_FOLDER.value,
+            cs.RelationshipType.CONTAINS_FILE.value,
+            cs.RelationshipType.CONTAINS_MODULE.value,
+            cs.RelationshipType.CONTAINS_PACKAGE.value,
+        ),
+    ),
+}
+_DIAGRAM_ALIASES = {"flow": "call", "flowchart": "call"}
+
+
+def _resolve_diagram(diagram: str) -> _DiagramSpec:
+    key = diagram.lower().strip()
+    spec = _DIAGRAM_SPECS.get(_DIAGRAM_ALIASES.get(key, key))
+    if spec is None:
+        raise ValueError(f"Unknown diagram type: {key}")
+    return spec
+
+
+def _append_node_line(lines: list[str], node_id: int, label: str) -> str:
+    mermaid_id = f"n{node_id}"
+    lines.append(f'  {mermaid_id}["{label}"]')
+    return mermaid_id
+
+
+def _display_label(node_id: int, properties: Mapping[str, object]) -> str:
+    for key in (cs.KEY_NAME, cs.KEY_QUALIFIED_NAME, cs.KEY_PATH):
+        value = properties.get(key)
+        if isinstance(value, str) and value:
+            return value
+    return str(node_id)
+
+
+def _finish_diagram(title: str, lines: list[str]) -> str:
+    if len(lines) == 2:
+        logger.warning("Mermaid export produced an empty diagram: {}", title)
+    return "\n".join(lines) + "\n"
+
+
+def _write_output(content: str, output_path: str) -> Path:
+    output = Path(output_path)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(content, encoding=cs.ENCODING_UTF8)
+    return output
@@ -1,3 +1,5 @@
+from collections.abc import Sequence
+
 from codebase_rag.core.constants import CYPHER_DEFAULT_LIMIT
 
 CYPHER_DELETE_ALL = "MATCH (n) DETACH DELETE n;"
@@ -934,6 +936,116 @@ RETURN id(n) as from_id, id(m) as to_id, type(r) as type, properties(r) as prope
 SKIP $offset LIMIT $limit
 """
 
+CYPHER_GRAPH_GENERATION = """
+MATCH (p:Project {name: $project_name})
+RETURN p.graph_generation AS graph_generation
+"""
+"""Reads the stamp that keys cached snapshots of one project's exported subgraph.
+
+The ingestor stamps a fresh ``graph_generation`` after every ingest or sync
+flush that wrote, so added, removed and property-only changes all
+invalidate the snapshot. A project that was never stamped returns null and
+is not cached.
+"""
+
+CYPHER_BUMP_GRAPH_GENERATION = """
+MATCH (p:Project)
+WHERE $project_name IS NULL OR p.name = $project_name
+SET p.graph_generation = $graph_generation
+"""
+"""Marks a project's graph as changed; all projects when the name is unknown.
+
+The stamp is a fresh token rather than a counter so that wiping and
+re-ingesting a project can never reproduce an earlier value.
+"""
+
+CYPHER_MERMAID_DEPENDENCY_NODES = """
+MATCH (p:Project {name: $project_name})
+OPTIONAL MATCH (p)-[:DEPENDS_ON_EXTERNAL]->(e:ExternalPackage)
+WITH p, collect(DISTINCT e) AS externals
+UNWIND [p] + externals AS n
+RETURN id(n) AS node_id, n.name AS name, n.qualified_name AS qualified_name,
+       n.path AS path
+"""
+"""Returns the project node followed by the external packages it depends on."""
+
+
+def _label_predicate(var: str, labels: Sequence[str]) -> str:
+    return " OR ".join(f"{var}:{label}" for label in labels)
+
+
+def _project_scope_predicate(var: str) -> str:
+    return (
+        f"({var}.project_name = $project_name "
+        f"OR ({var}:Project AND {var}.name = $project_name))"
+    )
+
+
+def build_mermaid_nodes_query(labels: Sequence[str], limit: int | None) -> str:
+    """
+    Builds a project-scoped query returning the display columns of diagram nodes.
+
+    Args:
+        labels (Sequence[str]): Node labels to include in the diagram.
+        limit (int | None): Server-side node cap, or None for no cap.
+
+    Returns:
+        str: The Cypher query string, parameterised by `$project_name`.
+    """
+    limit_clause = f"\nLIMIT {int(limit)}" if limit is not None else ""
+    return f"""
+MATCH (n)
+WHERE ({_label_predicate("n", labels)})
+  AND {_project_scope_predicate("n")}
+RETURN id(n) AS node_id, n.name AS name, n.qualified_name AS qualified_name,
+       n.path AS path{limit_clause}
+"""
+
+
+def build_mermaid_edges_query(
+    from_labels: Sequence[str],
+    to_labels: Sequence[str],
+    rel_types: Sequence[str],
+    limit: int | None,
+    *,
+    scope_target: bool = True,
+    restrict_to_ids: bool = False,
+) -> str:
+    """
+    Builds a project-scoped query returning the endpoint ids of diagram edges.
+
+    Args:
+        from_labels (Sequence[str]): Allowed labels for the source node.
+        to_labels (Sequence[str]): Allowed labels for the target node.
+        rel_types (Sequence[str]): Relationship types to include.
+        limit (int | None): Server-side edge cap, or None for no cap.
+        scope_target (bool): Whether the target must also belong to the project.
+            Disabled for shared nodes such as external packages.
+        restrict_to_ids (bool): Whether both endpoints must be in `$node_ids`,
+            used when the node set itself was capped.
+
+    Returns:
+        str: The Cypher query string, parameterised by `$project_name` and,
+        when `restrict_to_ids` is set, `$node_ids`.
+    """
+    conditions = [
+        f"({_label_predicate('a', from_labels)})",
+        f"({_label_predicate('b', to_labels)})",
+        _project_scope_predicate("a"),
+    ]
+    if scope_target:
+        conditions.append(_project_scope_predicate("b"))
+    if restrict_to_ids:
+        conditions.append("id(a) IN $node_ids AND id(b) IN $node_ids")
+    where_clause = "\n  AND ".join(conditions)
+    limit_clause = f"\nLIMIT {int(limit)}" if limit is not None else ""
+    return f"""
+MATCH (a)-[r:{"|".join(rel_types)}]->(b)
+WHERE {where_clause}
+RETURN id(a) AS from_id, id(b) AS to_id{limit_clause}
+"""
+
+
 CYPHER_RETURN_COUNT = "RETURN count(r) as created"
 """A query fragment to return the count of created relationships."""
 CYPHER_SET_PROPS_RETURN_COUNT = "SET r += row.props\nRETURN count(r) as created"
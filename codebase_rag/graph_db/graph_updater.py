@@ -1,6 +1,6 @@
 import json
 from collections import defaultdict
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from pathlib import Path
 from typing import Any
 
@@ -9,12 +9,14 @@ from tree_sitter import Parser
 
 from codebase_rag.core import constants as cs
 from codebase_rag.core import logs as ls
+from codebase_rag.core.config import settings
 from codebase_rag.data_models.types_defs import (
     EmbeddingQueryResult,
     LanguageQueries,
     ResultRow,
     SimpleNameLookup,
 )
+from codebase_rag.infrastructure.language_runtime import LanguageRuntime
 from codebase_rag.parsers.core.factory import ProcessorFactory
 from codebase_rag.parsers.core.incremental_cache import (
     GitDeltaCache,
@@ -47,6 +49,7 @@ from codebase_rag.services import (
 )
 from codebase_rag.state.registry_cache import BoundedASTCache, FunctionRegistryTrie
 from codebase_rag.utils.file_utils import is_dependency_file
+from codebase_rag.utils.source_store import SourceStore
 
 
 class GraphUpdater:
@@ -60,11 +63,14 @@ class GraphUpdater:
         exclude_paths: frozenset[str] | None = None,
         force_full_reparse: bool = False,
         progress_logger: Callable[[str, dict[str, Any]], None] | None = None,
+        *,
+        language_runtime: LanguageRuntime | None = None,
     ):
         self.ingestor = ingestor
         self.repo_path = repo_path
         self.parsers = parsers
         self.queries = queries
+        self.language_runtime = language_runtime
         self.project_name = repo_path.resolve().name
         if hasattr(self.ingestor, "__dict__"):
             from typing import cast
@@ -81,7 +87,14 @@ class GraphUpdater:
         self.function_registry = FunctionRegistryTrie(
             simple_name_lookup=self.simple_name_lookup
         )
-        self.ast_cache = BoundedASTCache(ttl_seconds=config.ast_cache_ttl)
+        self.source_store = SourceStore(
+            settings.CODEGRAPH_SOURCE_STORE_MAX_MB * cs.BYTES_PER_MB
+        )
+        self.ast_cache = BoundedASTCache(
+            ttl_seconds=config.ast_cache_ttl,
+            source_store=self.source_store,
+            parser_for=self.parsers.get,
+        )
         self.unignore_paths = unignore_paths
         self.exclude_paths = exclude_paths
 
@@ -143,6 +156,7 @@ class GraphUpdater:
             ast_cache=self.ast_cache,
             unignore_paths=self.unignore_paths,
             exclude_paths=self.exclude_paths,
+            source_store=self.source_store,
         )
 
         self.state_service = GraphStateService(
@@ -151,6 +165,7 @@ class GraphUpdater:
             ast_cache=self.ast_cache,
             function_registry=self.function_registry,
             simple_name_lookup=self.simple_name_lookup,
+            source_store=self.source_store,
         )
 
         self.declarative_enabled = config.declarative_enabled
@@ -170,6 +185,7 @@ class GraphUpdater:
             )
 
     def run(self) -> None:
+        self.source_store.clear()
         self._progress("ingest_stage", {"stage": "project_init"})
         project_props = {
             cs.KEY_NAME: self.project_name,
@@ -190,6 +206,9 @@ class GraphUpdater:
         self._progress("ingest_stage", {"stage": "structure"})
         logger.info(ls.PASS_1_STRUCTURE)
         self.factory.structure_processor.identify_structure()
+        repo_languages = frozenset(self.factory.structure_processor.languages)
+        if self.language_runtime is not None:
+            self.language_runtime.preload(repo_languages)
 
         if self.pre_scan_enabled:
             self._progress("ingest_stage", {"stage": "pre_scan"})
@@ -198,8 +217,12 @@ class GraphUpdater:
                 project_name=self.project_name,
                 exclude_paths=self.exclude_paths,
                 unignore_paths=self.unignore_paths,
+                source_store=self.source_store,
             ).run()
 
+        self.ensure_languages(repo_languages)
+        self._log_language_runtime_summary()
+
         self._progress("ingest_stage", {"stage": "parse"})
         logger.info(ls.PASS_2_FILES)
         if self.git_delta_enabled and self.git_delta_cache:
@@ -243,6 +266,7 @@ class GraphUpdater:
             import_processor=self.factory.import_processor,
             module_qn_to_file_path=self.factory.module_qn_to_file_path,
             pre_scan_index=self.pre_scan_index,
+            source_store=self.source_store,
         )
         context = GraphUpdaterContext(
             ingestor=self.ingestor,
@@ -270,7 +294,9 @@ class GraphUpdater:
         logger.info(ls.ANALYSIS_COMPLETE)
         self.ingestor.flush_all()
 
-        AnalysisRunnerService(self.analysis_enabled).run(self.ingestor, self.repo_path)
+        AnalysisRunnerService(self.analysis_enabled).run(
+            self.ingestor, self.repo_path, source_store=self.source_store
+        )
 
         self._progress("ingest_stage", {"stage": "embeddings"})
         SemanticEmbeddingService(
@@ -280,6 +306,7 @@ class GraphUpdater:
             project_name=self.project_name,
             phase2_integration_enabled=self.config.phase2_integration_enabled,
             phase2_embedding_strategy=self.config.phase2_embedding_strategy,
+            source_store=self.source_store,
         ).generate_semantic_embeddings()
 
         if isinstance(self.ingestor, QueryProtocol):
@@ -287,9 +314,14 @@ class GraphUpdater:
             from codebase_rag.tools.graph_algorithms import GraphAlgorithms
 
             logger.info("Running MAGE Graph Algorithms...")
-            GraphAlgorithms(self.ingestor).run_all(has_changes=not git_delta_no_changes)
+            GraphAlgorithms(self.ingestor, project_name=self.project_name).run_all(
+                has_changes=not git_delta_no_changes
+            )
 
         PerformanceProfileService(self.performance_optimizer).log_summary_if_enabled()
+        self._log_call_resolution_summary()
+        self._log_ast_cache_summary()
+        self._log_source_store_summary()
 
         GitDeltaHeadService(
             self.git_delta_enabled, self.git_delta_cache
@@ -300,6 +332,58 @@ class GraphUpdater:
     def remove_file_from_state(self, file_path: Path) -> None:
         self.state_service.remove_file_from_state(file_path)
 
+    def ensure_languages(self, languages: Iterable[cs.SupportedLanguage]) -> None:
+        if self.language_runtime is not None:
+            self.language_runtime.ensure(languages)
+
+    def _log_language_runtime_summary(self) -> None:
+        if self.language_runtime is None:
+            return
+        report = self.language_runtime.startup_report()
+        logger.info(
+            "Grammars loaded on demand: {} in {:.3f}s",
+            ", ".join(report.languages) or "none",
+            report.seconds,
+        )
+        self._progress("language_runtime", report.as_dict())
+
+    def _log_call_resolution_summary(self) -> None:
+        stats = self.factory.call_processor.resolution_stats
+        logger.info(
+            "Call resolution fallback: {} cache hits, {} misses, {} ambiguous, "
+            "{} invalidated",
+            stats.hits,
+            stats.misses,
+            stats.ambiguous,
+            stats.invalidations,
+        )
+        self._progress("call_resolution", stats.as_dict())
+
+    def _log_ast_cache_summary(self) -> None:
+        stats = self.ast_cache.stats()
+        logger.info(
+            "AST cache: {} trees resident, {} spilled to handles, {} re-parsed "
+            "({} failed)",
+            stats["size"],
+            stats["spilled"],
+            stats["reparses"],
+            stats["reparse_failures"],
+        )
+        self._progress("ast_cache", stats)
+
+    def _log_source_store_summary(self) -> None:
+        stats = self.source_store.stats
+        logger.info(
+            "Source store: {} files read ({} bytes), {} duplicate reads avoided, "
+            "{} evictions",
+            stats.misses,
+            stats.bytes_read,
+            stats.duplicate_reads_avoided,
+            stats.evictions,
+        )
+        self._progress("source_store", stats.as_dict())
+        self.source_store.clear()
+
     def _progress(self, kind: str, payload: dict[str, Any]) -> None:
         if self.progress_logger:
             self.progress_logger(kind, payload)
@@ -8,6 +8,7 @@ from cross-cutting concerns.
 
 Decorators:
 -   `ensure_loaded`: Ensures a resource is loaded before a method is called.
+-   `synchronized`: Runs a method while holding the instance's lock.
 -   `timing_decorator`: Logs the execution time of a synchronous function.
 -   `async_timing_decorator`: Logs the execution time of an asynchronous function.
 -   `validate_project_path`: Validates that a file path argument is within the
@@ -31,6 +32,7 @@ from loguru import logger
 from codebase_rag.core import logs as ls
 from codebase_rag.data_models.types_defs import (
     LoadableProtocol,
+    LockableProtocol,
     PathValidatorProtocol,
 )
 from codebase_rag.infrastructure import exceptions as ex
@@ -57,6 +59,28 @@ def ensure_loaded[T](func: Callable[..., T]) -> Callable[..., T]:
     return wrapper
 
 
+def synchronized[T](func: Callable[..., T]) -> Callable[..., T]:
+    """
+    Decorator that runs a method while holding the instance's lock.
+
+    It expects the class instance (`self`) to have a re-entrant `_lock`, so
+    synchronized methods may call each other.
+
+    Args:
+        func: The method to wrap.
+
+    Returns:
+        The wrapped method.
+    """
+
+    @wraps(func)
+    def wrapper(self: LockableProtocol, *args, **kwargs) -> T:
+        with self._lock:
+            return func(self, *args, **kwargs)
+
+    return wrapper
+
+
 def timing_decorator[**P, T](func: Callable[P, T]) -> Callable[P, T]:
     """
     Decorator that logs the execution time of a synchronous function.
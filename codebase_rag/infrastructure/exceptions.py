@@ -52,6 +52,7 @@ DATA_NOT_LOADED = "Data should be loaded"
 
 # (H) Parser errors
 NO_LANGUAGES = "No Tree-sitter languages available."
+LANGUAGE_BLOCKED = "Tree-sitter grammar for {lang} is blocked on this platform."
 
 # (H) LLM errors
 LLM_INIT_CYPHER = "Failed to initialize CypherGenerator: {error}"
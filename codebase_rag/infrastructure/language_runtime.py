@@ -0,0 +1,397 @@
+"""
+This module loads tree-sitter grammars and compiles their queries on demand.
+
+`LanguageRuntime` owns the `parsers` and `queries` dictionaries shared with
+`GraphUpdater`, the MCP tools and the file editor. Both start empty and are
+filled in place as languages are requested, so a process only pays for the
+grammars of the repositories it actually touches. Grammars are loaded through
+`LazyParserFactory`, and the languages found by a repository inventory can be
+preloaded on background threads while the structure and pre-scan passes run.
+"""
+
+from __future__ import annotations
+
+import importlib
+import os
+import threading
+import time
+from collections.abc import Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import partial
+from pathlib import Path
+from typing import Any
+
+from loguru import logger
+from tree_sitter import Parser
+
+from codebase_rag.core import constants as cs
+from codebase_rag.core import logs as ls
+from codebase_rag.core.config import settings
+from codebase_rag.data_models.types_defs import LanguageQueries
+from codebase_rag.parsers.core.lazy_parser_factory import LazyParserFactory
+from codebase_rag.parsers.core.query_cache import get_shared_query_cache
+from codebase_rag.utils.path_utils import should_skip_path
+
+from .language_spec import get_language_spec_for_path
+from .parser_loader import (
+    LANGUAGE_LIBRARIES,
+    compile_language_queries,
+    load_language_grammar,
+)
+
+
+def language_of(path: Path) -> cs.SupportedLanguage | None:
+    """
+    Returns the supported language of a file, judged by its name alone.
+
+    Args:
+        path (Path): The file path.
+
+    Returns:
+        cs.SupportedLanguage | None: The language, or None for unsupported files.
+    """
+    spec = get_language_spec_for_path(path)
+    if spec is None or not isinstance(spec.language, cs.SupportedLanguage):
+        return None
+    return spec.language
+
+
+def scan_repository_languages(
+    repo_path: Path,
+    *,
+    exclude_paths: frozenset[str] | None = None,
+    unignore_paths: frozenset[str] | None = None,
+) -> frozenset[cs.SupportedLanguage]:
+    """
+    Lists the languages present in a repository without reading any file.
+
+    Skipped directories are pruned from the walk, and once a language has been
+    seen its remaining files are not checked again.
+
+    Args:
+        repo_path (Path): The repository root.
+        exclude_paths (frozenset[str] | None): Paths to explicitly exclude.
+        unignore_paths (frozenset[str] | None): Paths to include even if ignored.
+
+    Returns:
+        frozenset[cs.SupportedLanguage]: The languages with at least one file.
+    """
+    found: set[cs.SupportedLanguage] = set()
+    for root, dirs, files in os.walk(repo_path):
+        root_path = Path(root)
+        dirs[:] = [
+            name
+            for name in dirs
+            if not should_skip_path(
+                root_path / name,
+                repo_path,
+                exclude_paths=exclude_paths,
+                unignore_paths=unignore_paths,
+            )
+        ]
+        for name in files:
+            file_path = root_path / name
+            language = language_of(file_path)
+            if (
+                language is not None
+                and language not in found
+                and not should_skip_path(
+                    file_path,
+                    repo_path,
+                    exclude_paths=exclude_paths,
+                    unignore_paths=unignore_paths,
+                )
+            ):
+                found.add(language)
+    return frozenset(found)
+
+
+def resident_memory_mb() -> float | None:
+    """
+    Returns the resident set size of this process in MB.
+
+    Returns:
+        float | None: The RSS, or None when neither psutil nor /proc is available.
+    """
+    try:
+        psutil = importlib.import_module("psutil")
+        return psutil.Process().memory_info().rss / cs.BYTES_PER_MB
+    except Exception:
+        pass
+    try:
+        with open("/proc/self/statm", encoding=cs.ENCODING_UTF8) as statm:
+            resident_pages = int(statm.read().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE") / cs.BYTES_PER_MB
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+@dataclass
+class LanguageStartupReport:
+    """Cold-start cost of loading a set of languages in this process."""
+
+    languages: tuple[str, ...] = ()
+    failed: tuple[str, ...] = ()
+    seconds: float = 0.0
+    rss_before_mb: float | None = None
+    rss_after_mb: float | None = None
+    per_language: dict[str, float] = field(default_factory=dict)
+    query_cache: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def rss_delta_mb(self) -> float | None:
+        if self.rss_before_mb is None or self.rss_after_mb is None:
+            return None
+        return self.rss_after_mb - self.rss_before_mb
+
+    def as_dict(self) -> dict[str, Any]:
+        delta = self.rss_delta_mb
+        return {
+            "languages": list(self.languages),
+            "failed": list(self.failed),
+            "seconds": round(self.seconds, 4),
+            "rss_before_mb": _round_mb(self.rss_before_mb),
+            "rss_after_mb": _round_mb(self.rss_after_mb),
+            "rss_delta_mb": _round_mb(delta),
+            "per_language": {
+                name: round(seconds, 4) for name, seconds in self.per_language.items()
+            },
+            "query_cache": self.query_cache,
+        }
+
+
+def _round_mb(value: float | None) -> float | None:
+    return round(value, 1) if value is not None else None
+
+
+class LanguageRuntime:
+    """
+    Parsers and compiled queries, loaded per language on first request.
+
+    `parsers` and `queries` are plain dictionaries updated in place, so they can
+    be handed to `GraphUpdater` before any language has been loaded. A language
+    is loaded at most once; concurrent requests for it wait on the same load.
+    """
+
+    def __init__(
+        self, *, preload_workers: int = settings.CODEGRAPH_GRAMMAR_PRELOAD_WORKERS
+    ) -> None:
+        self.parsers: dict[cs.SupportedLanguage, Parser] = {}
+        self.queries: dict[cs.SupportedLanguage, LanguageQueries] = {}
+        self.load_seconds: dict[cs.SupportedLanguage, float] = {}
+        self.failed: dict[cs.SupportedLanguage, str] = {}
+        self._factory = LazyParserFactory(num_loader_threads=1)
+        for lang_name in LANGUAGE_LIBRARIES:
+            self._factory.register_loader(
+                lang_name, partial(load_language_grammar, lang_name)
+            )
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(preload_workers, 1),
+            thread_name_prefix="grammar-preload",
+        )
+        self._pending: dict[cs.SupportedLanguage, Future[bool]] = {}
+        self._lock = threading.Lock()
+
+    def preload(self, languages: Iterable[cs.SupportedLanguage]) -> None:
+        """
+        Starts loading languages in the background without waiting for them.
+
+        Args:
+            languages (Iterable[cs.SupportedLanguage]): The languages to load.
+        """
+        for lang_name in languages:
+            self._submit(lang_name)
+
+    def ensure(
+        self, languages: Iterable[cs.SupportedLanguage]
+    ) -> frozenset[cs.SupportedLanguage]:
+        """
+        Loads the given languages, waiting for any load already in progress.
+
+        Args:
+            languages (Iterable[cs.SupportedLanguage]): The languages to load.
+
+        Returns:
+            frozenset[cs.SupportedLanguage]: The requested languages now available.
+        """
+        requested = tuple(dict.fromkeys(languages))
+        for future in [self._submit(lang_name) for lang_name in requested]:
+            future.result()
+        return frozenset(
+            lang_name for lang_name in requested if lang_name in self.parsers
+        )
+
+    def parser_for(self, lang_name: cs.SupportedLanguage) -> Parser | None:
+        """
+        Returns the parser of a language, loading it first if needed.
+
+        Args:
+            lang_name (cs.SupportedLanguage): The language.
+
+        Returns:
+            Parser | None: The parser, or None if the grammar is unavailable.
+        """
+        self.ensure((lang_name,))
+        return self.parsers.get(lang_name)
+
+    def preload_repository(
+        self,
+        repo_path: Path,
+        *,
+        exclude_paths: frozenset[str] | None = None,
+        unignore_paths: frozenset[str] | None = None,
+    ) -> Future[frozenset[cs.SupportedLanguage]]:
+        """
+        Inventories a repository in the background and preloads its languages.
+
+        Args:
+            repo_path (Path): The repository root.
+            exclude_paths (frozenset[str] | None): Paths to explicitly exclude.
+            unignore_paths (frozenset[str] | None): Paths to include even if ignored.
+
+        Returns:
+            Future: Resolves to the languages found once they have been queued.
+        """
+
+        def inventory() -> frozenset[cs.SupportedLanguage]:
+            languages = scan_repository_languages(
+                repo_path, exclude_paths=exclude_paths, unignore_paths=unignore_paths
+            )
+            self.preload(languages)
+            return languages
+
+        return self._executor.submit(inventory)
+
+    def startup_report(self) -> LanguageStartupReport:
+        """Summarizes the languages loaded so far and how long each one took."""
+        return LanguageStartupReport(
+            languages=tuple(str(lang_name) for lang_name in self.parsers),
+            failed=tuple(str(lang_name) for lang_name in self.failed),
+            seconds=sum(self.load_seconds.values()),
+            per_language={
+                str(lang_name): seconds
+                for lang_name, seconds in self.load_seconds.items()
+            },
+            query_cache=get_shared_query_cache().stats(),
+        )
+
+    def shutdown(self) -> None:
+        """Waits for background loads to finish and stops the loader threads."""
+        self._executor.shutdown(wait=True)
+        self._factory.shutdown()
+
+    def _submit(self, lang_name: cs.SupportedLanguage) -> Future[bool]:
+        with self._lock:
+            future = self._pending.get(lang_name)
+            if future is None:
+                future = self._executor.submit(self._load, lang_name)
+                self._pending[lang_name] = future
+            return future
+
+    def _load(self, lang_name: cs.SupportedLanguage) -> bool:
+        started = time.perf_counter()
+        if not LANGUAGE_LIBRARIES.get(lang_name):
+            self.failed[lang_name] = ls.LIB_NOT_AVAILABLE.format(lang=lang_name)
+            logger.debug(self.failed[lang_name])
+            return False
+        try:
+            parser = self._factory.get_parser(lang_name)
+            language = self._factory.get_language(lang_name)
+            if parser is None or language is None:
+                raise RuntimeError(ls.LIB_NOT_AVAILABLE.format(lang=lang_name))
+            queries = compile_language_queries(lang_name, language, parser)
+        except Exception as e:
+            self.failed[lang_name] = str(e)
+            logger.warning(ls.GRAMMAR_LOAD_FAILED.format(lang=lang_name, error=e))
+            return False
+        self.queries[lang_name] = queries
+        self.parsers[lang_name] = parser
+        self.load_seconds[lang_name] = time.perf_counter() - started
+        logger.success(ls.GRAMMAR_LOADED.format(lang=lang_name))
+        return True
+
+
+_shared_runtime: LanguageRuntime | None = None
+_shared_runtime_lock = threading.Lock()
+
+
+def get_language_runtime() -> LanguageRuntime:
+    """
+    Gets or creates the process-wide runtime shared by long-lived services.
+
+    Returns:
+        LanguageRuntime: The shared runtime instance.
+    """
+    global _shared_runtime
+
+    with _shared_runtime_lock:
+        if _shared_runtime is None:
+            _shared_runtime = LanguageRuntime()
+        return _shared_runtime
+
+
+def measure_language_startup(
+    languages: Iterable[cs.SupportedLanguage] | None = None,
+) -> LanguageStartupReport:
+    """
+    Measures loading languages into a fresh runtime in this process.
+
+    Grammar packages imported by an earlier measurement stay imported, so only
+    the first measurement of a language reflects a true cold start.
+
+    Args:
+        languages (Iterable[cs.SupportedLanguage] | None): The languages to load.
+            Defaults to every language with a known grammar loader.
+
+    Returns:
+        LanguageStartupReport: The wall time and the RSS before and after.
+    """
+    selected = tuple(LANGUAGE_LIBRARIES if languages is None else languages)
+    runtime = LanguageRuntime(preload_workers=1)
+    rss_before = resident_memory_mb()
+    started = time.perf_counter()
+    try:
+        runtime.ensure(selected)
+    finally:
+        runtime.shutdown()
+    report = runtime.startup_report()
+    report.seconds = time.perf_counter() - started
+    report.rss_before_mb = rss_before
+    report.rss_after_mb = resident_memory_mb()
+    return report
+
+
+def compare_language_startup(
+    repo_path: Path,
+    *,
+    exclude_paths: frozenset[str] | None = None,
+    unignore_paths: frozenset[str] | None = None,
+) -> dict[str, Any]:
+    """
+    Compares loading a repository's languages with loading every language.
+
+    The repository's languages are measured first so that they start cold; the
+    full load then only adds the grammars on-demand loading would have skipped.
+
+    Args:
+        repo_path (Path): The repository root.
+        exclude_paths (frozenset[str] | None): Paths to explicitly exclude.
+        unignore_paths (frozenset[str] | None): Paths to include even if ignored.
+
+    Returns:
+        dict[str, Any]: The inventory time, then an `on_demand` and an
+            `all_languages` startup report.
+    """
+    started = time.perf_counter()
+    languages = scan_repository_languages(
+        repo_path, exclude_paths=exclude_paths, unignore_paths=unignore_paths
+    )
+    inventory_seconds = time.perf_counter() - started
+    on_demand = measure_language_startup(sorted(languages))
+    every_language = measure_language_startup()
+    return {
+        "inventory_seconds": round(inventory_seconds, 4),
+        "on_demand": on_demand.as_dict(),
+        "all_languages": every_language.as_dict(),
+    }
@@ -351,6 +351,10 @@ LANGUAGE_SPECS: dict[cs.SupportedLanguage, LanguageSpec] = {
         import_node_types=cs.SPEC_PY_IMPORT_TYPES,
         import_from_node_types=cs.SPEC_PY_IMPORT_FROM_TYPES,
         package_indicators=cs.SPEC_PY_PACKAGE_INDICATORS,
+        decision_node_types=cs.SPEC_PY_DECISION_TYPES,
+        nesting_node_types=cs.SPEC_PY_NESTING_TYPES,
+        flat_branch_node_types=cs.SPEC_PY_FLAT_BRANCH_TYPES,
+        logical_operator_types=cs.SPEC_PY_LOGICAL_OPERATORS,
     ),
     cs.SupportedLanguage.JS: LanguageSpec(
         language=cs.SupportedLanguage.JS,
@@ -361,6 +365,10 @@ LANGUAGE_SPECS: dict[cs.SupportedLanguage, LanguageSpec] = {
         call_node_types=cs.SPEC_JS_CALL_TYPES,
         import_node_types=cs.JS_TS_IMPORT_NODES,
         import_from_node_types=cs.JS_TS_IMPORT_NODES,
+        decision_node_types=cs.SPEC_JS_DECISION_TYPES,
+        nesting_node_types=cs.SPEC_JS_NESTING_TYPES,
+        flat_branch_node_types=cs.SPEC_JS_FLAT_BRANCH_TYPES,
+        logical_operator_types=cs.SPEC_JS_LOGICAL_OPERATORS,
     ),
     cs.SupportedLanguage.TS: LanguageSpec(
         language=cs.SupportedLanguage.TS,
@@ -378,6 +386,10 @@ LANGUAGE_SPECS: dict[cs.SupportedLanguage, LanguageSpec] = {
         call_node_types=cs.SPEC_JS_CALL_TYPES,
         import_node_types=cs.JS_TS_IMPORT_NODES,
         import_from_node_types=cs.JS_TS_IMPORT_NODES,
+        decision_node_types=cs.SPEC_JS_DECISION_TYPES,
+        nesting_node_types=cs.SPEC_JS_NESTING_TYPES,
+        flat_branch_node_types=cs.SPEC_JS_FLAT_BRANCH_TYPES,
+        logical_operator_types=cs.SPEC_JS_LOGICAL_OPERATORS,
     ),
     cs.SupportedLanguage.RUST: LanguageSpec(
         language=cs.SupportedLanguage.RUST,
@@ -424,6 +436,10 @@ LANGUAGE_SPECS: dict[cs.SupportedLanguage, LanguageSpec] = {
         (macro_invocation
             macro: (identifier) @name) @call
         """,
+        decision_node_types=cs.SPEC_RS_DECISION_TYPES,
+        nesting_node_types=cs.SPEC_RS_NESTING_TYPES,
+        flat_branch_node_types=cs.SPEC_RS_FLAT_BRANCH_TYPES,
+        logical_operator_types=cs.SPEC_C_STYLE_LOGICAL_OPERATORS,
     ),
     cs.SupportedLanguage.GO: LanguageSpec(
         language=cs.SupportedLanguage.GO,
@@ -434,6 +450,9 @@ LANGUAGE_SPECS: dict[cs.SupportedLanguage, LanguageSpec] = {
         call_node_types=cs.SPEC_GO_CALL_TYPES,
         import_node_types=cs.SPEC_GO_IMPORT_TYPES,
         import_from_node_types=cs.SPEC_GO_IMPORT_TYPES,
+        decision_node_types=cs.SPEC_GO_DECISION_TYPES,
+        nesting_node_types=cs.SPEC_GO_NESTING_TYPES,
+        logical_operator_types=cs.SPEC_C_STYLE_LOGICAL_OPERATORS,
     ),
     cs.SupportedLanguage.SCALA: LanguageSpec(
         language=cs.SupportedLanguage.SCALA,
@@ -444,6 +463,9 @@ LANGUAGE_SPECS: dict[cs.SupportedLanguage, LanguageSpec] = {
         call_node_types=cs.SPEC_SCALA_CALL_TYPES,
         import_node_types=cs.SPEC_SCALA_IMPORT_TYPES,
         import_from_node_types=cs.SPEC_SCALA_IMPORT_TYPES,
+        decision_node_types=cs.SPEC_SCALA_DECISION_TYPES,
+        nesting_node_types=cs.SPEC_SCALA_NESTING_TYPES,
+        logical_operator_types=cs.SPEC_C_STYLE_LOGICAL_OPERATORS,
     ),
     cs.SupportedLanguage.JAVA: LanguageSpec(
         language=cs.SupportedLanguage.JAVA,
@@ -478,6 +500,9 @@ LANGUAGE_SPECS: dict[cs.SupportedLanguage, LanguageSpec] = {
         (object_creation_expression
             type: (type_identifier) @name) @call
         """,
+        decision_node_types=cs.SPEC_JAVA_DECISION_TYPES,
+        nesting_node_types=cs.SPEC_JAVA_NESTING_TYPES,
+        logical_operator_types=cs.SPEC_C_STYLE_LOGICAL_OPERATORS,
     ),
     cs.SupportedLanguage.CPP: LanguageSpec(
         language=cs.SupportedLanguage.CPP,
@@ -516,6 +541,10 @@ LANGUAGE_SPECS: dict[cs.SupportedLanguage, LanguageSpec] = {
     (new_expression) @call
     (delete_expression) @call
     """,
+        decision_node_types=cs.SPEC_CPP_DECISION_TYPES,
+        nesting_node_types=cs.SPEC_CPP_NESTING_TYPES,
+        flat_branch_node_types=cs.SPEC_CPP_FLAT_BRANCH_TYPES,
+        logical_operator_types=cs.SPEC_C_STYLE_LOGICAL_OPERATORS,
     ),
     cs.SupportedLanguage.CSHARP: LanguageSpec(
         language=cs.SupportedLanguage.CSHARP,
@@ -526,6 +555,9 @@ LANGUAGE_SPECS: dict[cs.SupportedLanguage, LanguageSpec] = {
         call_node_types=cs.SPEC_CS_CALL_TYPES,
         import_node_types=cs.IMPORT_NODES_USING,
         import_from_node_types=cs.IMPORT_NODES_USING,
+        decision_node_types=cs.SPEC_CS_DECISION_TYPES,
+        nesting_node_types=cs.SPEC_CS_NESTING_TYPES,
+        logical_operator_types=cs.SPEC_CS_LOGICAL_OPERATORS,
     ),
     cs.SupportedLanguage.PHP: LanguageSpec(
         language=cs.SupportedLanguage.PHP,
@@ -534,6 +566,10 @@ LANGUAGE_SPECS: dict[cs.SupportedLanguage, LanguageSpec] = {
         class_node_types=cs.SPEC_PHP_CLASS_TYPES,
         module_node_types=cs.SPEC_PHP_MODULE_TYPES,
         call_node_types=cs.SPEC_PHP_CALL_TYPES,
+        decision_node_types=cs.SPEC_PHP_DECISION_TYPES,
+        nesting_node_types=cs.SPEC_PHP_NESTING_TYPES,
+        flat_branch_node_types=cs.SPEC_PHP_FLAT_BRANCH_TYPES,
+        logical_operator_types=cs.SPEC_PHP_LOGICAL_OPERATORS,
     ),
     cs.SupportedLanguage.RUBY: LanguageSpec(
         language=cs.SupportedLanguage.RUBY,
@@ -544,6 +580,10 @@ LANGUAGE_SPECS: dict[cs.SupportedLanguage, LanguageSpec] = {
         call_node_types=cs.SPEC_RUBY_CALL_TYPES,
         import_node_types=cs.SPEC_RUBY_IMPORT_TYPES,
         import_from_node_types=cs.SPEC_RUBY_IMPORT_TYPES,
+        decision_node_types=cs.SPEC_RUBY_DECISION_TYPES,
+        nesting_node_types=cs.SPEC_RUBY_NESTING_TYPES,
+        flat_branch_node_types=cs.SPEC_RUBY_FLAT_BRANCH_TYPES,
+        logical_operator_types=cs.SPEC_RUBY_LOGICAL_OPERATORS,
     ),
     cs.SupportedLanguage.KOTLIN: LanguageSpec(
         language=cs.SupportedLanguage.KOTLIN,
@@ -554,6 +594,9 @@ LANGUAGE_SPECS: dict[cs.SupportedLanguage, LanguageSpec] = {
         call_node_types=cs.SPEC_KOTLIN_CALL_TYPES,
         import_node_types=cs.SPEC_KOTLIN_IMPORT_TYPES,
         import_from_node_types=cs.SPEC_KOTLIN_IMPORT_TYPES,
+        decision_node_types=cs.SPEC_KOTLIN_DECISION_TYPES,
+        nesting_node_types=cs.SPEC_KOTLIN_NESTING_TYPES,
+        logical_operator_types=cs.SPEC_C_STYLE_LOGICAL_OPERATORS,
     ),
     cs.SupportedLanguage.YAML: LanguageSpec(
         language=cs.SupportedLanguage.YAML,
@@ -583,6 +626,10 @@ LANGUAGE_SPECS: dict[cs.SupportedLanguage, LanguageSpec] = {
         module_node_types=cs.SPEC_LUA_MODULE_TYPES,
         call_node_types=cs.SPEC_LUA_CALL_TYPES,
         import_node_types=cs.SPEC_LUA_IMPORT_TYPES,
+        decision_node_types=cs.SPEC_LUA_DECISION_TYPES,
+        nesting_node_types=cs.SPEC_LUA_NESTING_TYPES,
+        flat_branch_node_types=cs.SPEC_LUA_FLAT_BRANCH_TYPES,
+        logical_operator_types=cs.SPEC_LUA_LOGICAL_OPERATORS,
     ),
     cs.SupportedLanguage.HTML: LanguageSpec(
         language=cs.SupportedLanguage.HTML,
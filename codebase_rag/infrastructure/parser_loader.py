@@ -4,6 +4,8 @@ import os
 import shutil
 import subprocess
 import sys
+import threading
+from collections.abc import Iterable, Mapping
 from copy import deepcopy
 from pathlib import Path
 
@@ -17,6 +19,10 @@ from codebase_rag.data_models.types_defs import (
     LanguageLoader,
     LanguageQueries,
 )
+from codebase_rag.parsers.core.query_cache import (
+    compile_query,
+    get_shared_query_cache,
+)
 from codebase_rag.parsers.query.query_engine_adapter import apply_scm_query_overrides
 
 from . import exceptions as ex
@@ -186,14 +192,12 @@ def _try_import_language(
         return _try_load_from_submodule(lang_name)
 
 
-def _import_language_loaders() -> dict[cs.SupportedLanguage, LanguageLoader]:
-    """Imports all configured language loaders.
-
-    It iterates through a predefined list of languages and attempts to load each one.
+def _language_imports() -> dict[cs.SupportedLanguage, LanguageImport]:
+    """Lists the Python packages that provide each bundled grammar.
 
     Returns:
-        dict[cs.SupportedLanguage, LanguageLoader]: A dictionary mapping language names
-            to their loader functions.
+        dict[cs.SupportedLanguage, LanguageImport]: The import description of every
+            language that ships as a standard package.
     """
     language_imports: list[LanguageImport] = [
         LanguageImport(
@@ -341,19 +345,57 @@ def _import_language_loaders() -> dict[cs.SupportedLanguage, LanguageLoader]:
             cs.SupportedLanguage.SVELTE,
         ),
     ]
+    return {lang_import.lang_key: lang_import for lang_import in language_imports}
 
-    loaders: dict[cs.SupportedLanguage, LanguageLoader] = {
-        lang_import.lang_key: _try_import_language(
+
+def _loader_languages(
+    language_imports: Mapping[cs.SupportedLanguage, LanguageImport],
+) -> tuple[cs.SupportedLanguage, ...]:
+    return tuple(
+        dict.fromkeys(
+            [*language_imports, *(cs.SupportedLanguage(key) for key in LANGUAGE_SPECS)]
+        )
+    )
+
+
+def _resolve_language_loader(
+    lang_name: cs.SupportedLanguage, lang_import: LanguageImport | None
+) -> LanguageLoader:
+    """Resolves the loader of one language, importing only its grammar package.
+
+    Args:
+        lang_name (cs.SupportedLanguage): The language to resolve.
+        lang_import (LanguageImport | None): Its package import, if it ships as one.
+
+    Returns:
+        LanguageLoader: The language loader function, or None if it fails.
+    """
+    loader = (
+        _try_import_language(
             lang_import.module_path,
             lang_import.attr_name,
             lang_import.submodule_name,
         )
-        for lang_import in language_imports
+        if lang_import is not None
+        else None
+    )
+    return loader if loader is not None else _try_load_from_submodule(lang_name)
+
+
+def _import_language_loaders() -> dict[cs.SupportedLanguage, LanguageLoader]:
+    """Imports all configured language loaders.
+
+    It iterates through a predefined list of languages and attempts to load each one.
+
+    Returns:
+        dict[cs.SupportedLanguage, LanguageLoader]: A dictionary mapping language names
+            to their loader functions.
+    """
+    language_imports = _language_imports()
+    loaders: dict[cs.SupportedLanguage, LanguageLoader] = {
+        lang_name: _resolve_language_loader(lang_name, language_imports.get(lang_name))
+        for lang_name in _loader_languages(language_imports)
     }
-    for lang_key in LANGUAGE_SPECS:
-        lang_name = cs.SupportedLanguage(lang_key)
-        if lang_name not in loaders or loaders[lang_name] is None:
-            loaders[lang_name] = _try_load_from_submodule(lang_name)
 
     if (
         loaders.get(cs.SupportedLanguage.VUE) is None
@@ -365,9 +407,50 @@ def _import_language_loaders() -> dict[cs.SupportedLanguage, LanguageLoader]:
     return loaders
 
 
-_language_loaders = _import_language_loaders()
+class _LazyLanguageLoaders(Mapping[cs.SupportedLanguage, LanguageLoader]):
+    """Language loaders resolved on first lookup.
+
+    A grammar package is imported only when its language is first requested, so
+    a process that never touches a language never pays for importing it.
+    """
+
+    def __init__(self) -> None:
+        self._imports = _language_imports()
+        self._languages = _loader_languages(self._imports)
+        self._loaders: dict[cs.SupportedLanguage, LanguageLoader] = {}
+        self._lock = threading.RLock()
 
-LANGUAGE_LIBRARIES: dict[cs.SupportedLanguage, LanguageLoader] = _language_loaders
+    def __getitem__(self, key: cs.SupportedLanguage | str) -> LanguageLoader:
+        try:
+            lang_name = cs.SupportedLanguage(key)
+        except ValueError as e:
+            raise KeyError(key) from e
+        if lang_name not in self._languages:
+            raise KeyError(key)
+        with self._lock:
+            if lang_name not in self._loaders:
+                self._loaders[lang_name] = self._resolve(lang_name)
+            return self._loaders[lang_name]
+
+    def __iter__(self):
+        return iter(self._languages)
+
+    def __len__(self) -> int:
+        return len(self._languages)
+
+    def _resolve(self, lang_name: cs.SupportedLanguage) -> LanguageLoader:
+        loader = _resolve_language_loader(lang_name, self._imports.get(lang_name))
+        if loader is None and lang_name == cs.SupportedLanguage.VUE:
+            html_loader = self[cs.SupportedLanguage.HTML]
+            if html_loader is not None:
+                logger.info("Using html grammar fallback for vue files.")
+                return html_loader
+        return loader
+
+
+LANGUAGE_LIBRARIES: Mapping[cs.SupportedLanguage, LanguageLoader] = (
+    _LazyLanguageLoaders()
+)
 
 
 def _build_query_pattern(node_types: tuple[str, ...], capture_name: str) -> str:
@@ -439,7 +522,7 @@ def _create_optional_query(language: Language, pattern: str | None) -> Query | N
     """
     if not pattern or not pattern.strip():
         return None
-    return Query(language, pattern)
+    return compile_query(language, pattern)
 
 
 def _create_locals_query(
@@ -458,7 +541,7 @@ def _create_locals_query(
     if not locals_pattern:
         return None
     try:
-        return Query(language, locals_pattern)
+        return compile_query(language, locals_pattern)
     except Exception as e:
         logger.debug(ls.LOCALS_QUERY_FAILED.format(lang=lang_name, error=e))
         return None
@@ -522,9 +605,53 @@ def _coerce_language(lang_obj: object) -> Language:
     return Language(lang_obj)
 
 
+def load_language_grammar(lang_name: cs.SupportedLanguage) -> Language:
+    """Imports the grammar of a single language.
+
+    Args:
+        lang_name (cs.SupportedLanguage): The language to load.
+
+    Raises:
+        RuntimeError: If the grammar is blocked on this platform or not installed.
+
+    Returns:
+        Language: The tree-sitter Language object.
+    """
+    if _is_windows_unsupported(lang_name):
+        raise RuntimeError(ex.LANGUAGE_BLOCKED.format(lang=lang_name))
+    lang_lib = LANGUAGE_LIBRARIES.get(lang_name)
+    if not lang_lib:
+        raise RuntimeError(ls.LIB_NOT_AVAILABLE.format(lang=lang_name))
+    return _coerce_language(lang_lib())
+
+
+def compile_language_queries(
+    lang_name: cs.SupportedLanguage, language: Language, parser: Parser
+) -> LanguageQueries:
+    """Compiles the queries of a single language, including `.scm` overrides.
+
+    Compilation goes through the shared query cache, whose persistent index is
+    flushed afterwards so the next process can skip known-invalid patterns.
+
+    Args:
+        lang_name (cs.SupportedLanguage): The language to compile queries for.
+        language (Language): Its tree-sitter Language object.
+        parser (Parser): The parser bound to that language.
+
+    Returns:
+        LanguageQueries: The compiled queries for the language.
+    """
+    lang_config = deepcopy(LANGUAGE_SPECS[lang_name])
+    queries = {
+        lang_name: _create_language_queries(language, parser, lang_config, lang_name)
+    }
+    compiled = apply_scm_query_overrides({lang_name: parser}, queries)[lang_name]
+    get_shared_query_cache().flush()
+    return compiled
+
+
 def _process_language(
     lang_name: cs.SupportedLanguage,
-    lang_config: LanguageSpec,
     parsers: dict[cs.SupportedLanguage, Parser],
     queries: dict[cs.SupportedLanguage, LanguageQueries],
 ) -> bool:
@@ -532,7 +659,6 @@ def _process_language(
 
     Args:
         lang_name (cs.SupportedLanguage): The language to process.
-        lang_config (LanguageSpec): The configuration for the language.
         parsers (dict): The dictionary to store the created parser in.
         queries (dict): The dictionary to store the created queries in.
 
@@ -545,18 +671,15 @@ def _process_language(
         )
         return False
 
-    lang_lib = LANGUAGE_LIBRARIES.get(lang_name)
-    if not lang_lib:
+    if not LANGUAGE_LIBRARIES.get(lang_name):
         logger.debug(ls.LIB_NOT_AVAILABLE.format(lang=lang_name))
         return False
 
     try:
-        language = _coerce_language(lang_lib())
+        language = load_language_grammar(lang_name)
         parser = Parser(language)
+        queries[lang_name] = compile_language_queries(lang_name, language, parser)
         parsers[lang_name] = parser
-        queries[lang_name] = _create_language_queries(
-            language, parser, lang_config, lang_name
-        )
         logger.success(ls.GRAMMAR_LOADED.format(lang=lang_name))
         return True
     except Exception as e:
@@ -580,14 +703,21 @@ def _is_windows_unsupported(lang_name: cs.SupportedLanguage) -> bool:
     return str(lang_name).lower() in blocked
 
 
-def load_parsers() -> tuple[
+def load_parsers(
+    languages: Iterable[cs.SupportedLanguage] | None = None,
+) -> tuple[
     dict[cs.SupportedLanguage, Parser], dict[cs.SupportedLanguage, LanguageQueries]
 ]:
     """Loads all available tree-sitter parsers and queries.
 
     This is the main entry point of the module. It iterates through all languages
     defined in `LANGUAGE_SPECS`, attempts to load them, and returns the successfully
-    loaded parsers and queries.
+    loaded parsers and queries. Long-running callers that only need the languages
+    of one repository should prefer `LanguageRuntime`, which loads on demand.
+
+    Args:
+        languages (Iterable[cs.SupportedLanguage] | None): Restricts loading to
+            these languages. Defaults to every language in `LANGUAGE_SPECS`.
 
     Raises:
         RuntimeError: If no languages could be loaded at all.
@@ -602,9 +732,10 @@ def load_parsers() -> tuple[
     available_languages: list[cs.SupportedLanguage] = []
     unavailable_languages: list[cs.SupportedLanguage] = []
 
-    for lang_key, lang_config in deepcopy(LANGUAGE_SPECS).items():
+    selected = LANGUAGE_SPECS if languages is None else dict.fromkeys(languages)
+    for lang_key in selected:
         lang_name = cs.SupportedLanguage(lang_key)
-        if _process_language(lang_name, lang_config, parsers, queries):
+        if _process_language(lang_name, parsers, queries):
             available_languages.append(lang_name)
         else:
             unavailable_languages.append(lang_name)
@@ -612,8 +743,6 @@ def load_parsers() -> tuple[
     if not available_languages:
         raise RuntimeError(ex.NO_LANGUAGES)
 
-    queries = apply_scm_query_overrides(parsers, queries)
-
     logger.info(ls.INITIALIZED_PARSERS.format(languages=", ".join(available_languages)))
     if unavailable_languages:
         logger.warning(
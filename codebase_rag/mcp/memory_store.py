@@ -0,0 +1,476 @@
+from __future__ import annotations
+
+import json
+import os
+import re
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from itertools import islice
+from pathlib import Path
+
+from loguru import logger
+
+from codebase_rag.core import constants as cs
+from codebase_rag.core import logs as lg
+
+_JOURNAL_FILENAME = "entries.jsonl"
+_LEGACY_FILENAME = "entries.json"
+_COMPACTION_FACTOR = 2
+_SUCCESS_TAGS = frozenset({"allow", "success", "ok"})
+
+
+@dataclass
+class _IndexedEntry:
+    record: dict[str, object]
+    text_terms: frozenset[str]
+    tags: frozenset[str]
+    chain_signature: str
+    chain_terms: frozenset[str]
+    vector: dict[str, float]
+    norm: float
+    success: bool
+    index_terms: frozenset[str] = field(default_factory=frozenset)
+
+
+class MCPMemoryStore:
+    """
+    Append-only MCP memory journal with an in-memory inverted index.
+
+    Entries are appended to ``entries.jsonl`` one line at a time and the journal
+    is compacted once evicted lines outnumber live ones. Term and tag postings,
+    sparse-vector norms and success flags are computed once per entry, so pattern
+    queries only visit entries that share a term or tag with the query.
+    """
+
+    def __init__(self, project_root: str, max_entries: int = 1000) -> None:
+        self._max_entries = max(1, max_entries)
+        storage_dir = Path(project_root) / ".codebase_rag" / "mcp_memory"
+        self._journal_path = storage_dir / _JOURNAL_FILENAME
+        self._legacy_path = storage_dir / _LEGACY_FILENAME
+        self._entries: dict[int, _IndexedEntry] = {}
+        self._term_postings: dict[str, set[int]] = {}
+        self._tag_postings: dict[str, set[int]] = {}
+        self._chain_entries: set[int] = set()
+        self._next_seq = 0
+        self._journal_lines = 0
+        self._load_entries()
+
+    def add_entry(self, text: str, tags: list[str]) -> dict[str, object]:
+        record: dict[str, object] = {
+            "text": text,
+            "tags": tags,
+            "timestamp": int(time.time()),
+            "vector": self._build_sparse_vector(text),
+            "chain_signature": self._extract_chain_signature(text),
+        }
+        self._index_record(record)
+        self._append_to_journal(record)
+        self._evict_overflow()
+        if self._journal_lines > self._max_entries * _COMPACTION_FACTOR:
+            self._compact_journal()
+        return record
+
+    def list_entries(self, limit: int = 50) -> list[dict[str, object]]:
+        newest_first = reversed(self._entries.values())
+        return [entry.record for entry in islice(newest_first, max(0, limit))]
+
+    def query_patterns(
+        self,
+        query: str,
+        filter_tags: list[str] | None = None,
+        success_only: bool = False,
+        limit: int = 20,
+    ) -> list[dict[str, object]]:
+        chain_rates = self.get_chain_success_rates(query=query, limit=50)
+        chain_rate_map: dict[str, float] = {
+            str(item.get("chain_signature", "")): self._to_float(
+                item.get("success_rate", 0.0)
+            )
+            for item in chain_rates
+            if isinstance(item, dict)
+        }
+        query_vector = self._build_sparse_vector(query)
+        query_norm = self._vector_norm(query_vector)
+        query_terms = self._index_terms(query)
+        normalized_tags = {
+            tag.strip().lower() for tag in (filter_tags or []) if tag.strip()
+        }
+
+        candidates = self._candidate_ids(query_terms, query_vector)
+        if normalized_tags and candidates is None:
+            candidates = self._ids_with_all_tags(normalized_tags)
+        elif normalized_tags and candidates is not None:
+            candidates = {
+                seq for seq in candidates if normalized_tags <= self._entries[seq].tags
+            }
+        if candidates is None:
+            candidates = set(self._entries)
+
+        ranked: list[tuple[int, int, dict[str, object]]] = []
+        for seq in candidates:
+            entry = self._entries[seq]
+            if success_only and not entry.success:
+                continue
+
+            score = 0
+            for term in query_terms:
+                if term in entry.text_terms:
+                    score += 3
+                if term in entry.tags:
+                    score += 2
+            vector_similarity = self._indexed_similarity(
+                query_vector, query_norm, entry
+            )
+            score += int(round(vector_similarity * 10))
+            if entry.chain_signature and not query_terms.isdisjoint(entry.chain_terms):
+                score += 2
+            if query_terms and score == 0:
+                continue
+
+            entry_with_score = dict(entry.record)
+            entry_with_score["score"] = score
+            entry_with_score["vector_similarity"] = round(vector_similarity, 4)
+            if entry.chain_signature:
+                entry_with_score["chain_success_rate"] = round(
+                    chain_rate_map.get(entry.chain_signature, 0.0),
+                    4,
+                )
+            ranked.append((score, seq, entry_with_score))
+
+        ranked.sort(key=lambda item: (item[0], item[1]), reverse=True)
+        return [item[2] for item in ranked[: max(0, limit)]]
+
+    def get_chain_success_rates(
+        self,
+        query: str,
+        limit: int = 10,
+    ) -> list[dict[str, object]]:
+        query_vector = self._build_sparse_vector(query)
+        query_norm = self._vector_norm(query_vector)
+        query_terms = self._index_terms(query)
+        candidates = self._candidate_ids(query_terms, query_vector)
+        chain_ids = (
+            self._chain_entries
+            if candidates is None
+            else self._chain_entries & candidates
+        )
+        aggregates: dict[str, dict[str, float | int]] = {}
+
+        for seq in sorted(chain_ids, reverse=True):
+            entry = self._entries[seq]
+            vector_similarity = self._indexed_similarity(
+                query_vector, query_norm, entry
+            )
+            bucket = aggregates.setdefault(
+                entry.chain_signature,
+                {
+                    "success_count": 0,
+                    "total_count": 0,
+                    "last_seen": 0,
+                    "query_relevance": 0.0,
+                },
+            )
+            bucket["total_count"] += 1
+            if entry.success:
+                bucket["success_count"] += 1
+            bucket["last_seen"] = max(
+                int(bucket["last_seen"]),
+                self._to_int(entry.record.get("timestamp", 0)),
+            )
+            bucket["query_relevance"] = max(
+                float(bucket["query_relevance"]), vector_similarity
+            )
+
+        rows: list[dict[str, object]] = []
+        for chain_signature, bucket in aggregates.items():
+            total_count = int(bucket["total_count"])
+            success_count = int(bucket["success_count"])
+            success_rate = (success_count / total_count) if total_count > 0 else 0.0
+            rows.append(
+                {
+                    "chain_signature": chain_signature,
+                    "success_count": success_count,
+                    "total_count": total_count,
+                    "success_rate": round(success_rate, 4),
+                    "last_seen": int(bucket["last_seen"]),
+                    "query_relevance": round(float(bucket["query_relevance"]), 4),
+                }
+            )
+
+        rows.sort(
+            key=lambda item: (
+                self._to_float(item.get("success_rate", 0.0)),
+                self._to_int(item.get("total_count", 0)),
+                self._to_float(item.get("query_relevance", 0.0)),
+                self._to_int(item.get("last_seen", 0)),
+            ),
+            reverse=True,
+        )
+        bounded_limit = max(1, min(self._to_int(limit, 10), 100))
+        return rows[:bounded_limit]
+
+    def _candidate_ids(
+        self, query_terms: frozenset[str], query_vector: dict[str, float]
+    ) -> set[int] | None:
+        if not query_terms and not query_vector:
+            return None
+        candidates: set[int] = set()
+        for term in query_terms | query_vector.keys():
+            candidates.update(self._term_postings.get(term, ()))
+            candidates.update(self._tag_postings.get(term, ()))
+        return candidates
+
+    def _ids_with_all_tags(self, tags: set[str]) -> set[int]:
+        postings = sorted((self._tag_postings.get(tag, set()) for tag in tags), key=len)
+        result = set(postings[0])
+        for posting in postings[1:]:
+            result &= posting
+            if not result:
+                break
+        return result
+
+    def _index_record(self, record: dict[str, object]) -> int:
+        raw_tags = record.get("tags", [])
+        tags = raw_tags if isinstance(raw_tags, list) else []
+        raw_vector = record.get("vector", {})
+        vector = (
+            {str(key): self._to_float(value) for key, value in raw_vector.items()}
+            if isinstance(raw_vector, dict)
+            else {}
+        )
+        text = str(record.get("text", ""))
+        chain_signature = str(record.get("chain_signature", "")).strip().lower()
+        entry = _IndexedEntry(
+            record=record,
+            text_terms=self._index_terms(text),
+            tags=frozenset(str(tag).lower() for tag in tags),
+            chain_signature=chain_signature,
+            chain_terms=self._index_terms(chain_signature),
+            vector=vector,
+            norm=self._vector_norm(vector),
+            success=self._is_success_record(record),
+        )
+        entry.index_terms = entry.text_terms | entry.chain_terms | vector.keys()
+
+        seq = self._next_seq
+        self._next_seq += 1
+        self._entries[seq] = entry
+        for term in entry.index_terms:
+            self._term_postings.setdefault(term, set()).add(seq)
+        for tag in entry.tags:
+            self._tag_postings.setdefault(tag, set()).add(seq)
+        if chain_signature:
+            self._chain_entries.add(seq)
+        return seq
+
+    def _evict_overflow(self) -> None:
+        while len(self._entries) > self._max_entries:
+            seq = next(iter(self._entries))
+            entry = self._entries.pop(seq)
+            self._discard_postings(self._term_postings, entry.index_terms, seq)
+            self._discard_postings(self._tag_postings, entry.tags, seq)
+            self._chain_entries.discard(seq)
+
+    @staticmethod
+    def _discard_postings(
+        postings: dict[str, set[int]], keys: Iterable[str], seq: int
+    ) -> None:
+        for key in keys:
+            posting = postings.get(key)
+            if posting is None:
+                continue
+            posting.discard(seq)
+            if not posting:
+                del postings[key]
+
+    def _load_entries(self) -> None:
+        try:
+            if self._journal_path.exists():
+                with self._journal_path.open(encoding=cs.ENCODING_UTF8) as handle:
+                    for line in handle:
+                        self._journal_lines += 1
+                        record = self._parse_journal_line(line)
+                        if record is not None:
+                            self._index_record(record)
+                            self._evict_overflow()
+                return
+            if self._legacy_path.exists():
+                self._migrate_legacy_entries()
+        except Exception as exc:
+            logger.warning(
+                lg.MCP_SERVER_TOOL_ERROR.format(name="memory_load", error=exc)
+            )
+
+    @staticmethod
+    def _parse_journal_line(line: str) -> dict[str, object] | None:
+        stripped = line.strip()
+        if not stripped:
+            return None
+        try:
+            parsed = json.loads(stripped)
+        except json.JSONDecodeError:
+            return None
+        return parsed if isinstance(parsed, dict) else None
+
+    def _migrate_legacy_entries(self) -> None:
+        parsed = json.loads(self._legacy_path.read_text(encoding=cs.ENCODING_UTF8))
+        if isinstance(parsed, list):
+            for record in reversed(parsed[: self._max_entries]):
+                if isinstance(record, dict):
+                    self._index_record(record)
+        self._compact_journal()
+        self._legacy_path.unlink(missing_ok=True)
+
+    def _append_to_journal(self, record: dict[str, object]) -> None:
+        self._journal_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._journal_path.open("a", encoding=cs.ENCODING_UTF8) as handle:
+            handle.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self._journal_lines += 1
+
+    def _compact_journal(self) -> None:
+        self._journal_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self._journal_path.with_suffix(".jsonl.tmp")
+        with tmp_path.open("w", encoding=cs.ENCODING_UTF8) as handle:
+            for entry in self._entries.values():
+                handle.write(json.dumps(entry.record, ensure_ascii=False) + "\n")
+        os.replace(tmp_path, self._journal_path)
+        self._journal_lines = len(self._entries)
+
+    @classmethod
+    def _is_success_record(cls, entry: dict[str, object]) -> bool:
+        tags = entry.get("tags", [])
+        if isinstance(tags, list) and any(
+            str(tag).lower() in _SUCCESS_TAGS for tag in tags
+        ):
+            return True
+
+        text = entry.get("text")
+        if not isinstance(text, str):
+            return False
+        try:
+            payload = json.loads(text)
+        except json.JSONDecodeError:
+            return False
+        if not isinstance(payload, dict):
+            return False
+        decision = str(payload.get("decision", "")).lower()
+        status = str(payload.get("status", "")).lower()
+        result = str(payload.get("result", "")).lower()
+        return (
+            decision in {"allow", "success"}
+            or status
+            in {
+                "ok",
+                "success",
+            }
+            or result in {"success", "ok"}
+        )
+
+    @staticmethod
+    def _to_int(value: object, default: int = 0) -> int:
+        if isinstance(value, bool):
+            return int(value)
+        if isinstance(value, int):
+            return value
+        if isinstance(value, float):
+            return int(value)
+        if isinstance(value, str):
+            candidate = value.strip()
+            if not candidate:
+                return default
+            try:
+                return int(float(candidate))
+            except ValueError:
+                return default
+        return default
+
+    @staticmethod
+    def _to_float(value: object, default: float = 0.0) -> float:
+        if isinstance(value, bool):
+            return float(int(value))
+        if isinstance(value, int | float):
+            return float(value)
+        if isinstance(value, str):
+            candidate = value.strip()
+            if not candidate:
+                return default
+            try:
+                return float(candidate)
+            except ValueError:
+                return default
+        return default
+
+    @staticmethod
+    def _tokenize_text(value: str) -> list[str]:
+        return [
+            token
+            for token in re.split(r"[^a-zA-Z0-9_]+", value.lower())
+            if token and len(token) >= 2
+        ]
+
+    @classmethod
+    def _index_terms(cls, value: str) -> frozenset[str]:
+        terms: set[str] = set()
+        for token in cls._tokenize_text(value):
+            terms.add(token)
+            if "_" in token:
+                terms.update(part for part in token.split("_") if len(part) >= 2)
+        return frozenset(terms)
+
+    @classmethod
+    def _build_sparse_vector(cls, value: str) -> dict[str, float]:
+        if not value.strip():
+            return {}
+        tokens = cls._tokenize_text(value)
+        if not tokens:
+            return {}
+        counts: dict[str, int] = {}
+        for token in tokens:
+            counts[token] = counts.get(token, 0) + 1
+        max_count = max(counts.values()) if counts else 1
+        return {token: round(count / max_count, 6) for token, count in counts.items()}
+
+    @staticmethod
+    def _vector_norm(vector: dict[str, float]) -> float:
+        return sum(value * value for value in vector.values()) ** 0.5
+
+    @staticmethod
+    def _indexed_similarity(
+        query_vector: dict[str, float], query_norm: float, entry: _IndexedEntry
+    ) -> float:
+        if query_norm <= 0 or entry.norm <= 0:
+            return 0.0
+        entry_vector = entry.vector
+        dot = sum(
+            weight * entry_vector[token]
+            for token, weight in query_vector.items()
+            if token in entry_vector
+        )
+        if dot <= 0:
+            return 0.0
+        return max(0.0, min(1.0, dot / (query_norm * entry.norm)))
+
+    @staticmethod
+    def _extract_chain_signature(text: str) -> str:
+        try:
+            payload = json.loads(text)
+        except json.JSONDecodeError:
+            return ""
+        if not isinstance(payload, dict):
+            return ""
+
+        candidate_lists = [
+            payload.get("tool_history"),
+            payload.get("chain"),
+            payload.get("flow"),
+            payload.get("tools"),
+        ]
+        for candidate in candidate_lists:
+            if isinstance(candidate, list):
+                normalized = [
+                    str(item).strip().lower() for item in candidate if str(item).strip()
+                ]
+                if normalized:
+                    return " -> ".join(normalized)
+        return ""
@@ -5,6 +5,7 @@ import os
 import random
 import re
 import time
+from collections.abc import Iterable, Mapping, Sequence
 from pathlib import Path
 from types import SimpleNamespace
 from typing import Any, cast
@@ -30,6 +31,7 @@ from codebase_rag.core.config import settings
 from codebase_rag.core.semantic_schema_metadata import build_semantic_schema_metadata
 from codebase_rag.data_models.models import ToolMetadata
 from codebase_rag.data_models.types_defs import (
+    BoundedRows,
     CodeSnippetResultDict,
     DeleteProjectErrorResult,
     DeleteProjectResult,
@@ -45,7 +47,10 @@ from codebase_rag.data_models.types_defs import (
     QueryResultDict,
     ResultRow,
 )
-from codebase_rag.exporters.mermaid_exporter import MermaidExporter
+from codebase_rag.exporters.mermaid_exporter import (
+    GraphQueryMermaidExporter,
+    MermaidConfig,
+)
 from codebase_rag.graph_db.cypher_queries import (
     CYPHER_GET_LATEST_ANALYSIS_REPORT,
     CYPHER_GET_LATEST_METRIC,
@@ -58,7 +63,8 @@ from codebase_rag.graph_db.cypher_queries import (
 )
 from codebase_rag.graph_db.graph_updater import GraphUpdater
 from codebase_rag.infrastructure import tool_errors as te
-from codebase_rag.infrastructure.parser_loader import load_parsers
+from codebase_rag.infrastructure.language_runtime import get_language_runtime
+from codebase_rag.mcp.memory_store import MCPMemoryStore
 from codebase_rag.policy.engine import MCPPolicyEngine
 from codebase_rag.services.analysis_evidence import AnalysisEvidenceService
 from codebase_rag.services.cleanup_service import CleanupService
@@ -68,7 +74,10 @@ from codebase_rag.services.context7_persistence import (
     Context7MemoryStore,
     Context7Persistence,
 )
-from codebase_rag.services.graph_service import MemgraphIngestor
+from codebase_rag.services.graph_service import (
+    MemgraphIngestor,
+    take_rows_within_budget,
+)
 from codebase_rag.services.llm import CypherGenerator
 from codebase_rag.services.repo_semantics import RepoSemanticEnricher
 from codebase_rag.tools import tool_descriptions as td
@@ -109,348 +118,6 @@ _TEST_GENERATE_MAX_OUTPUT_LINES = 320
 _TEST_GENERATE_MAX_ITEMS = 8
 
 
-class MCPMemoryStore:
-    def __init__(self, project_root: str, max_entries: int = 1000) -> None:
-        self._max_entries = max_entries
-        self._storage_path = (
-            Path(project_root) / ".codebase_rag" / "mcp_memory" / "entries.json"
-        )
-        self._entries = self._load_entries()
-
-    def add_entry(self, text: str, tags: list[str]) -> dict[str, object]:
-        chain_signature = self._extract_chain_signature(text)
-        record = {
-            "text": text,
-            "tags": tags,
-            "timestamp": int(time.time()),
-            "vector": self._build_sparse_vector(text),
-            "chain_signature": chain_signature,
-        }
-        self._entries.insert(0, record)
-        self._entries = self._entries[: self._max_entries]
-        self._persist_entries()
-        return record
-
-    def list_entries(self, limit: int = 50) -> list[dict[str, object]]:
-        return self._entries[: max(0, limit)]
-
-    def query_patterns(
-        self,
-        query: str,
-        filter_tags: list[str] | None = None,
-        success_only: bool = False,
-        limit: int = 20,
-    ) -> list[dict[str, object]]:
-        chain_rates = self.get_chain_success_rates(query=query, limit=50)
-        chain_rate_map: dict[str, float] = {
-            str(item.get("chain_signature", "")): self._to_float(
-                item.get("success_rate", 0.0)
-            )
-            for item in chain_rates
-            if isinstance(item, dict)
-        }
-        query_vector = self._build_sparse_vector(query)
-        normalized_terms = [
-            token.strip().lower()
-            for token in query.replace("_", " ").split()
-            if token.strip()
-        ]
-        normalized_tags = {
-            tag.strip().lower() for tag in (filter_tags or []) if tag.strip()
-        }
-        ranked: list[tuple[int, int, dict[str, object]]] = []
-
-        for idx, entry in enumerate(self._entries):
-            tags = entry.get("tags", [])
-            text = str(entry.get("text", ""))
-            if not isinstance(tags, list):
-                tags = []
-            entry_tags = {str(tag).lower() for tag in tags}
-
-            if normalized_tags and not normalized_tags.issubset(entry_tags):
-                continue
-            if success_only and not self._is_success_record(entry):
-                continue
-
-            score = 0
-            lowered_text = text.lower()
-            for term in normalized_terms:
-                if term in lowered_text:
-                    score += 3
-                if term in entry_tags:
-                    score += 2
-            if normalized_terms and score == 0 and not query_vector:
-                continue
-
-            entry_vector_raw = entry.get("vector", {})
-            entry_vector = (
-                cast(dict[str, float], entry_vector_raw)
-                if isinstance(entry_vector_raw, dict)
-                else {}
-            )
-            vector_similarity = self._cosine_similarity(query_vector, entry_vector)
-            score += int(round(vector_similarity * 10))
-
-            chain_signature = str(entry.get("chain_signature", "")).strip().lower()
-            if chain_signature and any(
-                term in chain_signature for term in normalized_terms
-            ):
-                score += 2
-
-            if normalized_terms and score == 0:
-                continue
-
-            recency_bonus = max(0, len(self._entries) - idx)
-            entry_with_score = dict(entry)
-            entry_with_score["score"] = score
-            entry_with_score["vector_similarity"] = round(vector_similarity, 4)
-            if chain_signature:
-                entry_with_score["chain_success_rate"] = round(
-                    chain_rate_map.get(chain_signature, 0.0),
-                    4,
-                )
-            ranked.append((score, recency_bonus, entry_with_score))
-
-        ranked.sort(key=lambda item: (item[0], item[1]), reverse=True)
-        return [item[2] for item in ranked[: max(0, limit)]]
-
-    @staticmethod
-    def _is_success_record(entry: dict[str, object]) -> bool:
-        tags = entry.get("tags", [])
-        if isinstance(tags, list) and any(
-            str(tag).lower() in {"allow", "success", "ok"} for tag in tags
-        ):
-            return True
-
-        text = entry.get("text")
-        if not isinstance(text, str):
-            return False
-        try:
-            payload = json.loads(text)
-        except json.JSONDecodeError:
-            return False
-        if not isinstance(payload, dict):
-            return False
-        decision = str(payload.get("decision", "")).lower()
-        status = str(payload.get("status", "")).lower()
-        result = str(payload.get("result", "")).lower()
-        return (
-            decision in {"allow", "success"}
-            or status
-            in {
-                "ok",
-                "success",
-            }
-            or result in {"success", "ok"}
-        )
-
-    def _load_entries(self) -> list[dict[str, object]]:
-        if not self._storage_path.exists():
-            return []
-        try:
-            raw = self._storage_path.read_text(encoding=cs.ENCODING_UTF8)
-            parsed = json.loads(raw)
-            if isinstance(parsed, list):
-                return [item for item in parsed if isinstance(item, dict)]
-            return []
-        except Exception as exc:
-            logger.warning(
-                lg.MCP_SERVER_TOOL_ERROR.format(name="memory_load", error=exc)
-            )
-            return []
-
-    def _persist_entries(self) -> None:
-        self._storage_path.parent.mkdir(parents=True, exist_ok=True)
-        self._storage_path.write_text(
-            json.dumps(self._entries, ensure_ascii=False, indent=2),
-            encoding=cs.ENCODING_UTF8,
-        )
-
-    def get_chain_success_rates(
-        self,
-        query: str,
-        limit: int = 10,
-    ) -> list[dict[str, object]]:
-        query_vector = self._build_sparse_vector(query)
-        normalized_terms = {
-            token.strip().lower()
-            for token in query.replace("_", " ").split()
-            if token.strip()
-        }
-        aggregates: dict[str, dict[str, object]] = {}
-
-        for entry in self._entries:
-            chain_signature = str(entry.get("chain_signature", "")).strip().lower()
-            if not chain_signature:
-                continue
-
-            text = str(entry.get("text", ""))
-            entry_vector_raw = entry.get("vector", {})
-            entry_vector = (
-                cast(dict[str, float], entry_vector_raw)
-                if isinstance(entry_vector_raw, dict)
-                else {}
-            )
-            vector_similarity = self._cosine_similarity(query_vector, entry_vector)
-            term_match = any(
-                term in chain_signature or term in text.lower()
-                for term in normalized_terms
-            )
-            if normalized_terms and not term_match and vector_similarity <= 0.0:
-                continue
-
-            bucket = aggregates.get(chain_signature)
-            if bucket is None:
-                bucket = {
-                    "chain_signature": chain_signature,
-                    "success_count": 0,
-                    "total_count": 0,
-                    "last_seen": 0,
-                    "query_relevance": 0.0,
-                }
-                aggregates[chain_signature] = bucket
-
-            bucket["total_count"] = self._to_int(bucket.get("total_count", 0)) + 1
-            if self._is_success_record(entry):
-                bucket["success_count"] = (
-                    self._to_int(bucket.get("success_count", 0)) + 1
-                )
-            bucket["last_seen"] = max(
-                self._to_int(bucket.get("last_seen", 0)),
-                self._to_int(entry.get("timestamp", 0)),
-            )
-            bucket["query_relevance"] = max(
-                self._to_float(bucket.get("query_relevance", 0.0)),
-                self._to_float(vector_similarity),
-            )
-
-        rows: list[dict[str, object]] = []
-        for chain_signature, bucket in aggregates.items():
-            total_count = self._to_int(bucket.get("total_count", 0))
-            success_count = self._to_int(bucket.get("success_count", 0))
-            success_rate = (success_count / total_count) if total_count > 0 else 0.0
-            rows.append(
-                {
-                    "chain_signature": chain_signature,
-                    "success_count": success_count,
-                    "total_count": total_count,
-                    "success_rate": round(success_rate, 4),
-                    "last_seen": self._to_int(bucket.get("last_seen", 0)),
-                    "query_relevance": round(
-                        self._to_float(bucket.get("query_relevance", 0.0)), 4
-                    ),
-                }
-            )
-
-        rows.sort(
-            key=lambda item: (
-                self._to_float(item.get("success_rate", 0.0)),
-                self._to_int(item.get("total_count", 0)),
-                self._to_float(item.get("query_relevance", 0.0)),
-                self._to_int(item.get("last_seen", 0)),
-            ),
-            reverse=True,
-        )
-        bounded_limit = max(1, min(self._to_int(limit, 10), 100))
-        return rows[:bounded_limit]
-
-    @staticmethod
-    def _to_int(value: object, default: int = 0) -> int:
-        if isinstance(value, bool):
-            return int(value)
-        if isinstance(value, int):
-            return value
-        if isinstance(value, float):
-            return int(value)
-        if isinstance(value, str):
-            candidate = value.strip()
-            if not candidate:
-                return default
-            try:
-                return int(float(candidate))
-            except ValueError:
-                return default
-        return default
-
-    @staticmethod
-    def _to_float(value: object, default: float = 0.0) -> float:
-        if isinstance(value, bool):
-            return float(int(value))
-        if isinstance(value, int | float):
-            return float(value)
-        if isinstance(value, str):
-            candidate = value.strip()
-            if not candidate:
-                return default
-            try:
-                return float(candidate)
-            except ValueError:
-                return default
-        return default
-
-    @staticmethod
-    def _tokenize_text(value: str) -> list[str]:
-        return [
-            token
-            for token in re.split(r"[^a-zA-Z0-9_]+", value.lower())
-            if token and len(token) >= 2
-        ]
-
-    @classmethod
-    def _build_sparse_vector(cls, value: str) -> dict[str, float]:
-        if not value.strip():
-            return {}
-        tokens = cls._tokenize_text(value)
-        if not tokens:
-            return {}
-        counts: dict[str, int] = {}
-        for token in tokens:
-            counts[token] = counts.get(token, 0) + 1
-        max_count = max(counts.values()) if counts else 1
-        return {token: round(count / max_count, 6) for token, count in counts.items()}
-
-    @staticmethod
-    def _cosine_similarity(
-        left: dict[str, float],
-        right: dict[str, float],
-    ) -> float:
-        if not left or not right:
-            return 0.0
-        overlap = set(left.keys()) & set(right.keys())
-        if not overlap:
-            return 0.0
-        dot = sum(left[token] * right[token] for token in overlap)
-        left_norm = sum(value * value for value in left.values()) ** 0.5
-        right_norm = sum(value * value for value in right.values()) ** 0.5
-        if left_norm <= 0 or right_norm <= 0:
-            return 0.0
-        return max(0.0, min(1.0, dot / (left_norm * right_norm)))
-
-    @staticmethod
-    def _extract_chain_signature(text: str) -> str:
-        try:
-            payload = json.loads(text)
-        except json.JSONDecodeError:
-            return ""
-        if not isinstance(payload, dict):
-            return ""
-
-        candidate_lists = [
-            payload.get("tool_history"),
-            payload.get("chain"),
-            payload.get("flow"),
-            payload.get("tools"),
-        ]
-        for candidate in candidate_lists:
-            if isinstance(candidate, list):
-                normalized = [
-                    str(item).strip().lower() for item in candidate if str(item).strip()
-                ]
-                if normalized:
-                    return " -> ".join(normalized)
-        return ""
-
-
 class MCPImpactGraphService:
     _IMPACT_REL_TYPES = (
         "CALLS|IMPORTS|INHERITS|USES|HAS_ENDPOINT|REQUESTS_ENDPOINT|"
@@ -2807,7 +2474,10 @@ class MCPToolsRegistry:
         self.cypher_gen = cypher_gen
         self._orchestrator_prompt = normalize_orchestrator_prompt(orchestrator_prompt)
 
-        self.parsers, self.queries = load_parsers()
+        self.language_runtime = get_language_runtime()
+        self.language_runtime.preload_repository(Path(project_root).resolve())
+        self.parsers = self.language_runtime.parsers
+        self.queries = self.language_runtime.queries
 
         self.code_retriever: CodeRetriever | None = None
         self.file_editor: FileEditor | None = None
@@ -3950,41 +3620,43 @@ class MCPToolsRegistry:
         )
 
     @staticmethod
-    def _split_rows_into_chunks(
-        rows: list[dict[str, object]],
+    def _split_rows_into_chunks[R](
+        rows: list[R],
         chunk_size: int = 25,
-    ) -> list[list[dict[str, object]]]:
+    ) -> list[list[R]]:
         bounded_chunk_size = max(1, int(chunk_size))
         return [
             rows[idx : idx + bounded_chunk_size]
             for idx in range(0, len(rows), bounded_chunk_size)
         ]
 
-    def _cap_query_results(
-        self,
-        rows: list[dict[str, object]],
-    ) -> tuple[list[dict[str, object]], bool, int]:
-        max_rows = max(1, int(settings.MCP_QUERY_RESULT_MAX_ROWS))
-        max_chars = max(2000, int(settings.MCP_QUERY_RESULT_MAX_CHARS))
-        capped_by_rows = rows[:max_rows]
-        capped_serialized = json.dumps(capped_by_rows, ensure_ascii=False)
-        if len(capped_serialized) <= max_chars:
-            return capped_by_rows, len(rows) > len(capped_by_rows), len(rows)
-
-        trimmed_rows: list[dict[str, object]] = []
-        current_chars = 2
-        for row in capped_by_rows:
-            row_chars = len(json.dumps(row, ensure_ascii=False))
-            projected = current_chars + row_chars + (1 if trimmed_rows else 0)
-            if projected > max_chars:
-                break
-            trimmed_rows.append(row)
-            current_chars = projected
-        return trimmed_rows, len(rows) > len(trimmed_rows), len(rows)
+    @staticmethod
+    def _query_result_budget() -> tuple[int, int]:
+        return (
+            max(1, int(settings.MCP_QUERY_RESULT_MAX_ROWS)),
+            max(2000, int(settings.MCP_QUERY_RESULT_MAX_CHARS)),
+        )
+
+    def _cap_query_results(self, rows: Iterable[ResultRow]) -> BoundedRows:
+        max_rows, max_chars = self._query_result_budget()
+        return take_rows_within_budget(rows, max_rows=max_rows, max_chars=max_chars)
+
+    def _fetch_bounded_rows(
+        self, query: str, params: dict[str, Any] | None = None
+    ) -> BoundedRows:
+        if not isinstance(self.ingestor, MemgraphIngestor):
+            return self._cap_query_results(self.ingestor.fetch_all(query, params))
+        max_rows, max_chars = self._query_result_budget()
+        return self.ingestor.fetch_bounded(
+            query, params, max_rows=max_rows, max_chars=max_chars
+        )
 
     @staticmethod
     def _build_graph_result_digest(
-        rows: list[dict[str, object]], max_items: int = 10
+        rows: Sequence[Mapping[str, object]],
+        max_items: int = 10,
+        *,
+        partial: bool = False,
     ) -> str:
         if not rows:
             return ""
@@ -3999,7 +3671,10 @@ class MCPToolsRegistry:
             else:
                 label_text = str(label_values)
             snippets.append(f"{label_text}:{name}")
-        return "; ".join(snippets)
+        digest = "; ".join(snippets)
+        if partial:
+            return f"{digest} (partial: first {len(rows)} rows of a truncated result)"
+        return digest
 
     async def _run_session_schema_preflight(
         self, project_name: str
@@ -5713,6 +5388,7 @@ class MCPToolsRegistry:
                 parsers=self.parsers,
                 queries=self.queries,
                 force_full_reparse=True,
+                language_runtime=self.language_runtime,
             )
 
             async def _run_updater() -> None:
@@ -5899,6 +5575,7 @@ class MCPToolsRegistry:
                 parsers=self.parsers,
                 queries=self.queries,
                 force_full_reparse=normalized_sync_mode == "full",
+                language_runtime=self.language_runtime,
             )
 
             timeout_seconds = max(60.0, float(settings.MCP_SYNC_GRAPH_TIMEOUT_SECONDS))
@@ -6214,7 +5891,9 @@ class MCPToolsRegistry:
         if self._file_editor_tool is not None:
             return self._file_editor_tool
         if self.file_editor is None:
-            self.file_editor = FileEditor(project_root=self.project_root)
+            self.file_editor = FileEditor(
+                project_root=self.project_root, language_runtime=self.language_runtime
+            )
         self._file_editor_tool = create_file_editor_tool(file_editor=self.file_editor)
         return self._file_editor_tool
 
@@ -8028,28 +7707,30 @@ class MCPToolsRegistry:
             )
             query_params: dict[str, Any] = {cs.KEY_PROJECT_NAME: project_name}
 
-            async def _read_once() -> list[dict[str, Any]]:
+            async def _read_once() -> BoundedRows:
                 return await asyncio.wait_for(
                     asyncio.to_thread(
-                        self.ingestor.fetch_all,
+                        self._fetch_bounded_rows,
                         cypher_query,
                         query_params,
                     ),
                     timeout=60.0,
                 )
 
-            results: list[dict[str, Any]] = []
+            fetched = BoundedRows([], False, 0)
+            results: list[ResultRow] = []
             repaired_attempts = 0
             max_repaired_attempts = 2
             parser_fallback_attempted = False
             deterministic_second_pass_attempted = False
             while True:
                 try:
-                    results = await self._run_with_retries(
+                    fetched = await self._run_with_retries(
                         _read_once,
                         attempts=3,
                         base_delay_seconds=0.5,
                     )
+                    results = fetched.rows
                 except Exception as exec_error:
                     if repaired_attempts >= max_repaired_attempts:
                         raise
@@ -8080,24 +7761,25 @@ class MCPToolsRegistry:
                             if template_scope_error is not None:
                                 continue
 
-                            async def _template_read_once() -> list[dict[str, Any]]:
+                            async def _template_read_once() -> BoundedRows:
                                 return await asyncio.wait_for(
                                     asyncio.to_thread(
-                                        self.ingestor.fetch_all,
+                                        self._fetch_bounded_rows,
                                         template_query,
                                         query_params,
                                     ),
                                     timeout=60.0,
                                 )
 
-                            template_results = await self._run_with_retries(
+                            template_fetched = await self._run_with_retries(
                                 _template_read_once,
                                 attempts=2,
                                 base_delay_seconds=0.3,
                             )
-                            if template_results:
+                            if template_fetched.rows:
                                 cypher_query = template_query
-                                results = template_results
+                                fetched = template_fetched
+                                results = fetched.rows
                                 break
                         except Exception:
                             continue
@@ -8141,7 +7823,10 @@ class MCPToolsRegistry:
                 )
                 fallback_results = fallback.get("results", [])
                 if isinstance(fallback_results, list):
-                    results = cast(list[dict[str, Any]], fallback_results)
+                    fetched = self._cap_query_results(
+                        cast(list[ResultRow], fallback_results)
+                    )
+                    results = fetched.rows
 
                 if isinstance(fallback.get("query_used"), str):
                     cypher_query = str(fallback.get("query_used"))
@@ -8187,10 +7872,12 @@ class MCPToolsRegistry:
             self._session_bump("query_success_count")
             self._session_bump("graph_evidence_count")
             self._session_bump("query_code_graph_success_count")
-            capped_results, truncated, total_rows = self._cap_query_results(results)
-            chunks = self._split_rows_into_chunks(results)
+            capped_results, truncated, total_rows = fetched
+            chunks = self._split_rows_into_chunks(capped_results)
             self._session_state["query_result_chunks"] = chunks
-            graph_digest = self._build_graph_result_digest(results)
+            graph_digest = self._build_graph_result_digest(
+                results, partial=fetched.truncated
+            )
             self._session_state["last_graph_result_digest"] = graph_digest
             query_digest_id = ""
             if total_rows > 0:
@@ -8220,7 +7907,10 @@ class MCPToolsRegistry:
             )
             summary = f"Query executed successfully. Returned {total_rows} rows."
             if truncated:
-                summary += f" Response truncated to {len(capped_results)} rows for context safety."
+                summary = (
+                    f"Query executed successfully. Returned at least {total_rows} rows."
+                    f" Response truncated to {len(capped_results)} rows for context safety."
+                )
             result_dict: QueryResultDict = QueryResultDict(
                 query_used=cypher_query,
                 results=cast(list[ResultRow], capped_results),
@@ -8908,28 +8598,31 @@ class MCPToolsRegistry:
                     }
                 return result_payload
 
-            async def _read_once() -> list[dict[str, Any]]:
+            async def _read_once() -> BoundedRows:
                 return await asyncio.wait_for(
                     asyncio.to_thread(
-                        self.ingestor.fetch_all,
+                        self._fetch_bounded_rows,
                         normalized_cypher,
                         cast(dict[str, Any], normalized_params),
                     ),
                     timeout=60.0,
                 )
 
-            results = await self._run_with_retries(
+            fetched = await self._run_with_retries(
                 _read_once,
                 attempts=3,
                 base_delay_seconds=0.5,
             )
+            results = fetched.rows
             query_digest_id = ""
             if len(results) > 0:
                 query_digest_id = self._mint_query_digest_id(
                     normalized_cypher, len(results)
                 )
                 self._session_state["last_graph_query_digest_id"] = query_digest_id
-                graph_digest = self._build_graph_result_digest(results)
+                graph_digest = self._build_graph_result_digest(
+                    results, partial=fetched.truncated
+                )
                 self._session_state["last_graph_result_digest"] = graph_digest
             self._session_bump("query_success_count")
             self._session_bump("graph_evidence_count")
@@ -8940,6 +8633,9 @@ class MCPToolsRegistry:
             )
             response_payload: dict[str, object] = {"status": "ok", "results": results}
             response_payload["query_digest_id"] = query_digest_id
+            if fetched.truncated:
+                response_payload["truncated"] = True
+                response_payload["rows_scanned"] = fetched.rows_scanned
             if flow_advisory is not None:
                 response_payload["flow_advisory"] = flow_advisory
             if normalization_notes:
@@ -9162,18 +8858,20 @@ class MCPToolsRegistry:
         self, diagram: str, output_path: str | None = None
     ) -> dict[str, object]:
         try:
-            graph_data = self.ingestor.export_graph_to_dict()
             output_dir = Path(self.project_root) / "output" / "mermaid"
-            output_dir.mkdir(parents=True, exist_ok=True)
-            graph_path = output_dir / "graph.json"
-            graph_path.write_text(
-                json.dumps(graph_data, ensure_ascii=False, indent=2),
-                encoding=cs.ENCODING_UTF8,
+            mermaid = GraphQueryMermaidExporter(
+                self.ingestor,
+                self._active_project_name(),
+                MermaidConfig(
+                    max_nodes=cs.MERMAID_MCP_MAX_NODES,
+                    max_edges=cs.MERMAID_MCP_MAX_EDGES,
+                ),
             )
-            mermaid = MermaidExporter(str(graph_path))
+            content = await asyncio.to_thread(mermaid.build, diagram)
             target = output_path or str(output_dir / f"{diagram}.mmd")
-            mermaid.export(diagram=diagram, output_path=target)
-            content = Path(target).read_text(encoding=cs.ENCODING_UTF8)
+            target_path = Path(target)
+            target_path.parent.mkdir(parents=True, exist_ok=True)
+            target_path.write_text(content, encoding=cs.ENCODING_UTF8)
             return {"status": "ok", "output_path": target, "content": content}
         except Exception as exc:
             return {"error": str(exc)}
@@ -9393,7 +9091,7 @@ class MCPToolsRegistry:
         context: str | None = None,
     ) -> dict[str, object]:
         self._set_execution_phase("retrieval", "analysis_bundle_for_goal")
-        bundle = self._analysis_evidence.build_bundle(
+        bundle = await self._analysis_evidence.build_bundle_async(
             "analysis_bundle_for_goal",
             goal=goal,
             context=context,
@@ -9409,7 +9107,7 @@ class MCPToolsRegistry:
         context: str | None = None,
     ) -> dict[str, object]:
         self._set_execution_phase("retrieval", "architecture_bundle")
-        bundle = self._analysis_evidence.build_bundle(
+        bundle = await self._analysis_evidence.build_bundle_async(
             "architecture_bundle",
             goal=goal,
             context=context,
@@ -9427,7 +9125,7 @@ class MCPToolsRegistry:
         file_path: str | None = None,
     ) -> dict[str, object]:
         self._set_execution_phase("retrieval", "change_bundle")
-        bundle = self._analysis_evidence.build_bundle(
+        bundle = await self._analysis_evidence.build_bundle_async(
             "change_bundle",
             goal=goal,
             context=context,
@@ -9447,7 +9145,7 @@ class MCPToolsRegistry:
         file_path: str | None = None,
     ) -> dict[str, object]:
         self._set_execution_phase("retrieval", "risk_bundle")
-        bundle = self._analysis_evidence.build_bundle(
+        bundle = await self._analysis_evidence.build_bundle_async(
             "risk_bundle",
             goal=goal,
             context=context,
@@ -9467,15 +9165,28 @@ class MCPToolsRegistry:
         file_path: str | None = None,
     ) -> dict[str, object]:
         self._set_execution_phase("retrieval", "test_bundle")
-        bundle = self._analysis_evidence.build_bundle(
-            "test_bundle",
-            goal=goal,
-            context=context,
-            qualified_name=qualified_name,
-            file_path=file_path,
-            session_state=self._session_state,
+        started = time.perf_counter()
+
+        async def _timed_test_selection() -> tuple[dict[str, object], float]:
+            selection_started = time.perf_counter()
+            selection = await asyncio.to_thread(self._build_test_selection_bundle)
+            return selection, (time.perf_counter() - selection_started) * 1000
+
+        bundle, (test_selection, selection_ms) = await asyncio.gather(
+            self._analysis_evidence.build_bundle_async(
+                "test_bundle",
+                goal=goal,
+                context=context,
+                qualified_name=qualified_name,
+                file_path=file_path,
+                session_state=self._session_state,
+            ),
+            _timed_test_selection(),
         )
-        bundle["test_selection"] = self._build_test_selection_bundle()
+        bundle["test_selection"] = test_selection
+        timings = cast(dict[str, float], bundle.setdefault("timings_ms", {}))
+        timings["test_selection"] = round(selection_ms, 3)
+        timings["total"] = round((time.perf_counter() - started) * 1000, 3)
         self._session_state["last_test_bundle"] = bundle
         bundle["ui_summary"] = str(bundle.get("summary", "")).strip()
         return bundle
@@ -10986,9 +10697,11 @@ LIMIT $limit
 
         bundles: dict[str, dict[str, object]] = {}
         resource_uris: list[str] = []
+        artifacts = self._analysis_evidence.load_artifact_metadata()
         for session_key, bundle_name, arguments in bundle_specs:
-            bundle = self._analysis_evidence.build_bundle(
+            bundle = self._analysis_evidence.build_bundle_from_artifacts(
                 bundle_name,
+                artifacts,
                 goal=arguments.get("goal") or None,
                 context=arguments.get("context") or None,
                 qualified_name=arguments.get("qualified_name") or None,
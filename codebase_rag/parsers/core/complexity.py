@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+from functools import cache
+from typing import TYPE_CHECKING, NamedTuple
+
+from codebase_rag.core import constants as cs
+from codebase_rag.data_models.types_defs import ComplexityMetrics, PropertyDict
+from codebase_rag.infrastructure.language_spec import LANGUAGE_SPECS
+
+if TYPE_CHECKING:
+    from tree_sitter import Node
+
+    from codebase_rag.data_models.models import LanguageSpec
+
+
+class _ComplexityTables(NamedTuple):
+    functions: frozenset[str]
+    decisions: frozenset[str]
+    nesting: frozenset[str]
+    flat_branches: frozenset[str]
+    operators: frozenset[str]
+
+
+@cache
+def _tables(spec: LanguageSpec) -> _ComplexityTables:
+    return _ComplexityTables(
+        functions=frozenset(spec.function_node_types),
+        decisions=frozenset(spec.decision_node_types),
+        nesting=frozenset(spec.nesting_node_types),
+        flat_branches=frozenset(spec.flat_branch_node_types),
+        operators=frozenset(spec.logical_operator_types),
+    )
+
+
+def compute_complexity(func_node: Node, spec: LanguageSpec) -> ComplexityMetrics:
+    """
+    Computes cyclomatic and cognitive complexity from a function's parsed AST.
+
+    Cyclomatic complexity is one plus every decision node and short-circuit
+    operator. Cognitive complexity follows the nesting-weighted model: nesting
+    nodes add one plus the current depth, else/elif branches add one, and a
+    run of identical logical operators adds one. Nested functions are skipped
+    because they are ingested and measured on their own.
+
+    Args:
+        func_node (Node): The function or method AST node.
+        spec (LanguageSpec): The language spec providing the node type tables.
+
+    Returns:
+        ComplexityMetrics with the cyclomatic and cognitive scores.
+    """
+    tables = _tables(spec)
+    cyclomatic = 1
+    cognitive = 0
+    stack: list[tuple[Node, int, bool]] = [
+        (child, 0, False) for child in reversed(func_node.children)
+    ]
+    while stack:
+        node, nesting, continues_else = stack.pop()
+        kind = node.type
+        if not node.is_named:
+            if kind in tables.operators:
+                cyclomatic += 1
+                if not _continues_operator_run(node):
+                    cognitive += 1
+            continue
+        if kind in tables.functions:
+            continue
+        if kind in tables.decisions:
+            cyclomatic += 1
+
+        child_nesting = nesting
+        alternatives: list[Node] = []
+        if kind in tables.nesting:
+            if not (continues_else or _is_else_if(node, tables.flat_branches)):
+                cognitive += 1 + nesting
+                child_nesting = nesting + 1
+            alternatives = node.children_by_field_name(cs.FIELD_ALTERNATIVE)
+        elif kind in tables.flat_branches:
+            cognitive += 1
+
+        for child in reversed(node.children):
+            if alternatives and child.type not in tables.flat_branches:
+                if child in alternatives:
+                    cognitive += 1
+                    stack.append((child, child_nesting, child.type in tables.nesting))
+                    continue
+            stack.append((child, child_nesting, False))
+    return ComplexityMetrics(cyclomatic=cyclomatic, cognitive=cognitive)
+
+
+def complexity_props(
+    func_node: Node, language: cs.SupportedLanguage | None
+) -> PropertyDict:
+    """
+    Builds the complexity properties stored on a Function or Method node.
+
+    Args:
+        func_node (Node): The function or method AST node.
+        language (cs.SupportedLanguage | None): The language of the source file.
+
+    Returns:
+        A dictionary with line count and, when the language defines decision
+        tables, cyclomatic and cognitive complexity.
+    """
+    props: PropertyDict = {
+        cs.KEY_LINES_OF_CODE: func_node.end_point[0] - func_node.start_point[0] + 1
+    }
+    spec = LANGUAGE_SPECS.get(language) if language else None
+    if spec is None or not spec.decision_node_types:
+        return props
+    metrics = compute_complexity(func_node, spec)
+    props[cs.KEY_COMPLEXITY] = metrics.cyclomatic
+    props[cs.KEY_COGNITIVE_COMPLEXITY] = metrics.cognitive
+    return props
+
+
+def _is_else_if(node: Node, flat_branches: frozenset[str]) -> bool:
+    parent = node.parent
+    return (
+        parent is not None
+        and parent.type in flat_branches
+        and parent.named_child_count == 1
+    )
+
+
+def _continues_operator_run(token: Node) -> bool:
+    expression = token.parent
+    if expression is None:
+        return False
+    outer = expression.parent
+    if outer is None or outer.type != expression.type:
+        return False
+    operator = outer.child_by_field_name(cs.FIELD_OPERATOR)
+    return operator is not None and operator.type == token.type
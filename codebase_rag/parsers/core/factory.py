@@ -13,6 +13,7 @@ from codebase_rag.parsers.pipeline.import_processor import ImportProcessor
 from codebase_rag.parsers.pipeline.structure_processor import StructureProcessor
 from codebase_rag.parsers.type_inference import TypeInferenceEngine
 from codebase_rag.services.protocols import IngestorProtocol
+from codebase_rag.utils.source_store import SourceStore
 
 
 class ProcessorFactory:
@@ -45,6 +46,8 @@ class ProcessorFactory:
         ast_cache: ASTCacheProtocol,
         unignore_paths: frozenset[str] | None = None,
         exclude_paths: frozenset[str] | None = None,
+        *,
+        source_store: SourceStore | None = None,
     ) -> None:
         """
         Initialize the ProcessorFactory.
@@ -59,6 +62,7 @@ class ProcessorFactory:
             ast_cache: AST cache.
             unignore_paths: Set of paths to unignore.
             exclude_paths: Set of paths to exclude.
+            source_store: Run-scoped store shared by every file reader.
         """
         self.ingestor = ingestor
         self.repo_path = repo_path
@@ -69,6 +73,7 @@ class ProcessorFactory:
         self.ast_cache = ast_cache
         self.unignore_paths = unignore_paths
         self.exclude_paths = exclude_paths
+        self.source_store = source_store or SourceStore()
 
         self.module_qn_to_file_path: dict[str, Path] = {}
 
@@ -122,6 +127,7 @@ class ProcessorFactory:
                 simple_name_lookup=self.simple_name_lookup,
                 import_processor=self.import_processor,
                 module_qn_to_file_path=self.module_qn_to_file_path,
+                source_store=self.source_store,
             )
         return self._definition_processor
 
@@ -159,5 +165,6 @@ class ProcessorFactory:
                 class_inheritance=self.definition_processor.class_inheritance,
                 type_inference=self.type_inference,
                 module_qn_to_file_path=self.module_qn_to_file_path,
+                source_store=self.source_store,
             )
         return self._call_processor
@@ -174,11 +174,7 @@ class LazyParserFactory:
 
                 lang_obj = self._loaders[language]()
 
-                parser = Parser()
-                set_language = getattr(parser, "set_language", None)
-                if not set_language:
-                    raise AttributeError("Parser.set_language is not available")
-                set_language(lang_obj)
+                parser = Parser(lang_obj)
 
                 self._parsers[language] = parser
                 self._languages[language] = lang_obj
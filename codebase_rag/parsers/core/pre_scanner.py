@@ -9,6 +9,7 @@ from loguru import logger
 from codebase_rag.core import constants as cs
 from codebase_rag.infrastructure.language_spec import get_language_spec_for_path
 from codebase_rag.utils.path_utils import should_skip_path
+from codebase_rag.utils.source_store import SourceStore
 
 
 @dataclass
@@ -64,6 +65,8 @@ class PreScanner:
         project_name: str,
         exclude_paths: frozenset[str] | None = None,
         unignore_paths: frozenset[str] | None = None,
+        *,
+        source_store: SourceStore | None = None,
     ) -> None:
         """Initialize the pre-scanner.
 
@@ -72,6 +75,8 @@ class PreScanner:
             project_name: Project name used in qualified module paths.
             exclude_paths: Optional ignore patterns for paths to skip.
             unignore_paths: Optional patterns to re-include paths.
+            source_store: Optional run-scoped store that keeps the file
+                contents for the parse that follows.
 
         Returns:
             None.
@@ -80,6 +85,7 @@ class PreScanner:
         self.project_name = project_name
         self.exclude_paths = exclude_paths
         self.unignore_paths = unignore_paths
+        self.source_store = source_store or SourceStore()
 
     def scan_repo(self) -> PreScanIndex:
         """Scan the repository and build a symbol-to-module index.
@@ -133,9 +139,8 @@ class PreScanner:
         Returns:
             Set of symbol names extracted from the file.
         """
-        try:
-            text = file_path.read_text(encoding="utf-8", errors="ignore")
-        except OSError:
+        text = self.source_store.read_text(file_path)
+        if text is None:
             return set()
 
         match language:
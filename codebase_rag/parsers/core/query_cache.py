@@ -1,13 +1,23 @@
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
+import os
+import threading
 import time
 from collections import OrderedDict
 from collections.abc import Callable
 from dataclasses import dataclass
+from functools import cache
+from importlib import metadata
+from pathlib import Path
 from typing import Any
 
-from tree_sitter import Query
+from tree_sitter import Language, Query, QueryError
+
+from ...core import constants as cs
+from ...core.config import settings
 
 
 @dataclass
@@ -139,6 +149,155 @@ class QueryCache:
         return self.stats.evictions / total_puts if total_puts > 0 else 0.0
 
 
+class PersistentQueryIndex:
+    """
+    File-backed record of query compilation outcomes.
+
+    tree-sitter Query objects cannot be serialized, so the index stores what
+    is learned from compiling one instead: whether the text compiles against
+    the grammar, its pattern and capture counts, and the error message of an
+    invalid query. Keys embed the grammar fingerprint and the py-tree-sitter
+    version, so upgrading either never reuses outcomes recorded against
+    another version. Several processes may share one index file; each flush
+    merges its records into what is on disk instead of overwriting it.
+    """
+
+    VERSION = 2
+    FLUSH_ATTEMPTS = 3
+
+    def __init__(self, path: Path | str):
+        """
+        Initialize PersistentQueryIndex.
+
+        Args:
+            path: JSON file holding the index; loaded on first access
+        """
+        self.path = Path(path)
+        self.stats = CacheStats()
+        self._entries: dict[str, dict[str, Any]] | None = None
+        self._pending: dict[str, dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def lookup(self, key: str) -> dict[str, Any] | None:
+        """
+        Get the recorded outcome for a query key.
+
+        Args:
+            key: Cache key built by query_key()
+
+        Returns:
+            The recorded outcome or None
+        """
+        with self._lock:
+            entry = self._load().get(key)
+            if entry is None:
+                self.stats.misses += 1
+            else:
+                self.stats.hits += 1
+            return entry
+
+    def record(
+        self,
+        key: str,
+        *,
+        valid: bool,
+        patterns: int = 0,
+        captures: int = 0,
+        error: str | None = None,
+    ) -> None:
+        """
+        Record the outcome of compiling a query.
+
+        Args:
+            key: Cache key built by query_key()
+            valid: Whether the query compiled
+            patterns: Pattern count of the compiled query
+            captures: Capture count of the compiled query
+            error: Compiler message for an invalid query
+        """
+        entry: dict[str, Any] = {
+            "valid": valid,
+            "patterns": patterns,
+            "captures": captures,
+        }
+        if error is not None:
+            entry["error"] = error
+        with self._lock:
+            entries = self._load()
+            if entries.get(key) != entry:
+                entries[key] = entry
+                self._pending[key] = entry
+
+    def flush(self) -> bool:
+        """
+        Merge pending records into the file on disk and replace it atomically.
+
+        Records another process flushed since this index was loaded are kept.
+        If a concurrent flush replaced the file between the merge and the
+        rename, the merge is retried so neither writer's records are lost.
+
+        Returns:
+            True if the file was written
+        """
+        with self._lock:
+            if not self._pending:
+                return False
+            for _ in range(self.FLUSH_ATTEMPTS):
+                merged = {**self._read_file(), **self._pending}
+                if not self._write_file(merged):
+                    return False
+                if self._pending.items() <= self._read_file().items():
+                    break
+            self._entries = merged
+            self._pending.clear()
+            return True
+
+    def size(self) -> int:
+        """Get number of recorded queries."""
+        with self._lock:
+            return len(self._load())
+
+    def clear(self) -> None:
+        """Drop all records, including the file on disk."""
+        with self._lock:
+            self._entries = {}
+            self._pending.clear()
+            self.path.unlink(missing_ok=True)
+
+    def _load(self) -> dict[str, dict[str, Any]]:
+        if self._entries is None:
+            self._entries = self._read_file()
+        return self._entries
+
+    def _read_file(self) -> dict[str, dict[str, Any]]:
+        try:
+            data = json.loads(self.path.read_text(encoding=cs.ENCODING_UTF8))
+        except (OSError, ValueError):
+            return {}
+        if isinstance(data, dict) and data.get("version") == self.VERSION:
+            entries = data.get("entries")
+            if isinstance(entries, dict):
+                return entries
+        return {}
+
+    def _write_file(self, entries: dict[str, dict[str, Any]]) -> bool:
+        payload = {"version": self.VERSION, "entries": entries}
+        tmp_path = self.path.with_name(
+            f"{self.path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+        )
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(json.dumps(payload), encoding=cs.ENCODING_UTF8)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logging.getLogger(__name__).debug(
+                f"Could not write query index {self.path}: {e}"
+            )
+            tmp_path.unlink(missing_ok=True)
+            return False
+        return True
+
+
 class CompositeQueryCache:
     """
     Multi-level cache for queries.
@@ -152,6 +311,7 @@ class CompositeQueryCache:
         self,
         l1_size: int = 1000,
         stats_callback: Callable[[CacheStats], None] | None = None,
+        l2: PersistentQueryIndex | None = None,
     ):
         """
         Initialize composite cache.
@@ -159,13 +319,19 @@ class CompositeQueryCache:
         Args:
             l1_size: L1 cache size
             stats_callback: Optional callback for stats updates
+            l2: Optional persistent index of compilation outcomes
         """
         self.l1_cache = QueryCache(max_size=l1_size)
+        self.l2_cache = l2
         self.stats_callback = stats_callback
+        self.compiles = 0
+        self.compile_time_ns = 0
+        self._lock = threading.RLock()
 
     def get(self, key: str) -> Query | None:
         """Get from L1 cache."""
-        result = self.l1_cache.get(key)
+        with self._lock:
+            result = self.l1_cache.get(key)
 
         if self.stats_callback:
             self.stats_callback(self.l1_cache.get_stats())
@@ -174,15 +340,72 @@ class CompositeQueryCache:
 
     def put(self, key: str, query: Query) -> None:
         """Put to L1 cache."""
-        self.l1_cache.put(key, query)
+        with self._lock:
+            self.l1_cache.put(key, query)
+
+    def get_or_compile(self, key: str, compile_fn: Callable[[], Query]) -> Query:
+        """
+        Get a compiled query, compiling it only on a miss.
+
+        A query the L2 index already knows to be invalid is rejected without
+        invoking the compiler.
+
+        Args:
+            key: Cache key built by query_key()
+            compile_fn: Compiles the query on a miss
+
+        Returns:
+            Compiled Query
+
+        Raises:
+            QueryError: If the query does not compile
+        """
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+        if self.l2_cache is not None:
+            entry = self.l2_cache.lookup(key)
+            if entry is not None and not entry.get("valid", True):
+                raise QueryError(entry.get("error", "invalid query"))
+        return self._compile(key, compile_fn)
+
+    def validate(self, key: str, compile_fn: Callable[[], Query]) -> bool:
+        """
+        Check whether a query compiles, answering from either level if possible.
+
+        Args:
+            key: Cache key built by query_key()
+            compile_fn: Compiles the query when neither level knows the outcome
+
+        Returns:
+            True if the query compiles
+        """
+        with self._lock:
+            if self.l1_cache.contains(key):
+                return True
+        if self.l2_cache is not None:
+            entry = self.l2_cache.lookup(key)
+            if entry is not None:
+                return bool(entry.get("valid"))
+        try:
+            self._compile(key, compile_fn)
+        except QueryError:
+            return False
+        return True
+
+    def flush(self) -> bool:
+        """Persist the L2 index, if any."""
+        return self.l2_cache.flush() if self.l2_cache is not None else False
 
     def clear(self) -> None:
         """Clear all levels."""
         self.l1_cache.clear()
+        if self.l2_cache is not None:
+            self.l2_cache.clear()
 
     def stats(self) -> dict[str, Any]:
         """Get cache statistics."""
-        return {
+        stats: dict[str, Any] = {
             "l1": {
                 "hits": self.l1_cache.stats.hits,
                 "misses": self.l1_cache.stats.misses,
@@ -190,8 +413,64 @@ class CompositeQueryCache:
                 "size": self.l1_cache.size(),
                 "max_size": self.l1_cache.max_size,
                 "eviction_rate": self.l1_cache.eviction_rate(),
-            }
+            },
+            "compiles": self.compiles,
+            "compile_seconds": self.compile_time_ns / 1e9,
         }
+        if self.l2_cache is not None:
+            stats["l2"] = {
+                "hits": self.l2_cache.stats.hits,
+                "misses": self.l2_cache.stats.misses,
+                "hit_rate": self.l2_cache.stats.hit_rate,
+                "size": self.l2_cache.size(),
+                "path": str(self.l2_cache.path),
+            }
+        return stats
+
+    def _compile(self, key: str, compile_fn: Callable[[], Query]) -> Query:
+        start_ns = time.perf_counter_ns()
+        try:
+            query = compile_fn()
+        except QueryError as e:
+            self._count_compile(start_ns)
+            if self.l2_cache is not None:
+                self.l2_cache.record(key, valid=False, error=str(e))
+            raise
+        self._count_compile(start_ns)
+        if self.l2_cache is not None:
+            self.l2_cache.record(
+                key,
+                valid=True,
+                patterns=_query_count(query.pattern_count),
+                captures=_query_count(query.capture_count),
+            )
+        self.put(key, query)
+        return query
+
+    def _count_compile(self, start_ns: int) -> None:
+        with self._lock:
+            self.compiles += 1
+            self.compile_time_ns += time.perf_counter_ns() - start_ns
+
+
+def _query_count(count: int | Callable[[], int]) -> int:
+    # (H) py-tree-sitter 0.25 exposes these counts as properties, while its
+    # (H) stub declares them as methods; accept either.
+    return count if isinstance(count, int) else count()
+
+
+@cache
+def binding_version() -> str:
+    """
+    Get the installed py-tree-sitter version for cache keys.
+
+    Returns:
+        Package version, or "unknown" when package metadata is unavailable
+    """
+    try:
+        return metadata.version("tree-sitter")
+    except metadata.PackageNotFoundError:
+        return "unknown"
 
 
 def make_cache_key(language: str, query_name: str, query_hash: int = 0) -> str:
@@ -209,3 +488,144 @@ def make_cache_key(language: str, query_name: str, query_hash: int = 0) -> str:
     if query_hash:
         return f"{language}:{query_name}:{query_hash}"
     return f"{language}:{query_name}"
+
+
+def grammar_fingerprint(language: Language) -> str:
+    """
+    Identify a grammar build for cache keys.
+
+    Args:
+        language: tree-sitter Language object
+
+    Returns:
+        Fingerprint that changes whenever the grammar does
+    """
+    version = getattr(language, "semantic_version", None)
+    parts = (
+        getattr(language, "name", None) or "unknown",
+        ".".join(str(part) for part in version) if version else "0",
+        str(getattr(language, "abi_version", 0)),
+        str(language.node_kind_count),
+        str(language.parse_state_count),
+    )
+    return "-".join(parts)
+
+
+def query_key(language: Language, query_text: str) -> str:
+    """
+    Create the cache key for a query text compiled against a grammar.
+
+    The key also carries the py-tree-sitter version, since the binding bundles
+    the query compiler and may accept or reject the same text differently.
+
+    Args:
+        language: tree-sitter Language object
+        query_text: Query source
+
+    Returns:
+        Cache key string
+    """
+    digest = hashlib.sha256(query_text.encode(cs.ENCODING_UTF8)).hexdigest()
+    return make_cache_key(
+        f"{grammar_fingerprint(language)}@{binding_version()}", digest
+    )
+
+
+_shared_cache: CompositeQueryCache | None = None
+_shared_cache_lock = threading.Lock()
+
+
+def query_index_path() -> Path:
+    """
+    Get the location of the persistent query index.
+
+    CODEGRAPH_QUERY_CACHE_PATH overrides the default file under the user
+    cache directory.
+
+    Returns:
+        Path of the JSON index file
+    """
+    if settings.CODEGRAPH_QUERY_CACHE_PATH:
+        return Path(settings.CODEGRAPH_QUERY_CACHE_PATH).expanduser()
+    return Path.home() / cs.IMPORT_CACHE_DIR / cs.QUERY_CACHE_FILE
+
+
+def _default_query_index() -> PersistentQueryIndex | None:
+    if not settings.CODEGRAPH_QUERY_CACHE_PERSIST:
+        return None
+    return PersistentQueryIndex(query_index_path())
+
+
+def get_shared_query_cache() -> CompositeQueryCache:
+    """
+    Get the process-wide query cache.
+
+    The cache is a module global, so workers forked after queries were
+    compiled inherit the compiled L1 entries.
+
+    Returns:
+        Shared CompositeQueryCache
+    """
+    global _shared_cache
+    with _shared_cache_lock:
+        if _shared_cache is None:
+            _shared_cache = CompositeQueryCache(
+                l1_size=settings.CODEGRAPH_QUERY_CACHE_SIZE,
+                l2=_default_query_index(),
+            )
+        return _shared_cache
+
+
+def set_shared_query_cache(cache: CompositeQueryCache | None) -> None:
+    """
+    Replace the process-wide query cache.
+
+    Args:
+        cache: New shared cache, or None to rebuild it from settings
+    """
+    global _shared_cache
+    with _shared_cache_lock:
+        _shared_cache = cache
+
+
+def compile_query(
+    language: Language, query_text: str, cache: CompositeQueryCache | None = None
+) -> Query:
+    """
+    Compile a query through the shared cache.
+
+    Args:
+        language: tree-sitter Language object
+        query_text: Query source
+        cache: Cache to use instead of the shared one
+
+    Returns:
+        Compiled Query
+
+    Raises:
+        QueryError: If the query does not compile
+    """
+    cache = cache or get_shared_query_cache()
+    return cache.get_or_compile(
+        query_key(language, query_text), lambda: Query(language, query_text)
+    )
+
+
+def query_compiles(
+    language: Language, query_text: str, cache: CompositeQueryCache | None = None
+) -> bool:
+    """
+    Check whether a query compiles, without compiling it when the outcome is known.
+
+    Args:
+        language: tree-sitter Language object
+        query_text: Query source
+        cache: Cache to use instead of the shared one
+
+    Returns:
+        True if the query compiles
+    """
+    cache = cache or get_shared_query_cache()
+    return cache.validate(
+        query_key(language, query_text), lambda: Query(language, query_text)
+    )
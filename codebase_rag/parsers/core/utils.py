@@ -18,6 +18,7 @@ from codebase_rag.data_models.types_defs import (
     SimpleNameLookup,
     TreeSitterNodeProtocol,
 )
+from codebase_rag.parsers.core.complexity import complexity_props
 from codebase_rag.utils.path_utils import is_test_path, to_posix
 
 if TYPE_CHECKING:
@@ -299,6 +300,7 @@ def ingest_method(
         cs.KEY_SIGNATURE: signature_lite,
         cs.KEY_SYMBOL_KIND: cs.NodeLabel.METHOD.value.lower(),
         cs.KEY_PARENT_QN: container_qn,
+        **complexity_props(method_node, language),
     }
     if module_qn:
         method_props[cs.KEY_MODULE_QN] = module_qn
@@ -9,6 +9,7 @@ from loguru import logger
 
 from codebase_rag.core import constants as cs
 from codebase_rag.services import IngestorProtocol
+from codebase_rag.utils.source_store import SourceStore
 
 
 @dataclass
@@ -52,10 +53,13 @@ class DjangoTemplateParser:
         repo_path: Path,
         project_name: str,
         ingestor: IngestorProtocol,
+        *,
+        source_store: SourceStore | None = None,
     ) -> None:
         self.repo_path = repo_path
         self.project_name = project_name
         self.ingestor = ingestor
+        self.source_store = source_store or SourceStore()
 
     @staticmethod
     def build_template_index(repo_path: Path) -> dict[str, str]:
@@ -234,9 +238,8 @@ class DjangoTemplateParser:
             template_index (dict[str, str]): The template index for resolution.
         """
         for file_path in files:
-            try:
-                source = file_path.read_text(encoding="utf-8", errors="ignore")
-            except Exception:
+            source = self.source_store.read_text(file_path)
+            if source is None:
                 continue
             if "{{" not in source and "{%" not in source:
                 continue
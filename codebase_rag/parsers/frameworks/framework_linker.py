@@ -25,6 +25,7 @@ from codebase_rag.parsers.pipeline.semantic_metadata import (
     sanitize_semantic_identity,
 )
 from codebase_rag.services import IngestorProtocol
+from codebase_rag.utils.source_store import SourceStore
 
 
 @dataclass
@@ -132,6 +133,8 @@ class FrameworkLinker:
         ingestor: IngestorProtocol,
         function_registry: FunctionRegistryTrieProtocol,
         simple_name_lookup: SimpleNameLookup,
+        *,
+        source_store: SourceStore | None = None,
     ) -> None:
         """
         Initialize the FrameworkLinker.
@@ -142,12 +145,14 @@ class FrameworkLinker:
             ingestor (IngestorProtocol): Ingestor for creating nodes and relationships.
             function_registry (FunctionRegistryTrieProtocol): Registry for resolving names.
             simple_name_lookup (SimpleNameLookup): Lookup for finding qualified names.
+            source_store (SourceStore | None): Shared run-scoped file contents.
         """
         self.repo_path = repo_path
         self.project_name = project_name
         self.ingestor = ingestor
         self.function_registry = function_registry
         self.simple_name_lookup = simple_name_lookup
+        self.source_store = source_store or SourceStore()
         self._template_index: dict[str, str] | None = None
         self._asset_index: dict[str, str] | None = None
         self._env_values = self._load_env_values()
@@ -200,9 +205,8 @@ class FrameworkLinker:
             }:
                 continue
 
-            try:
-                source = file_path.read_text(encoding="utf-8", errors="ignore")
-            except Exception:
+            source = self.source_store.read_text(file_path)
+            if source is None:
                 continue
 
             if file_path.suffix.lower() == cs.EXT_CS:
@@ -2652,10 +2656,9 @@ class FrameworkLinker:
         package_json = self.repo_path / "package.json"
         has_tailwind = bool(tailwind_files)
 
-        if package_json.exists():
-            content = package_json.read_text(encoding="utf-8", errors="ignore")
-            if "tailwindcss" in content:
-                has_tailwind = True
+        content = self.source_store.read_text(package_json)
+        if content is not None and "tailwindcss" in content:
+            has_tailwind = True
 
         if not has_tailwind:
             return
@@ -2696,9 +2699,8 @@ class FrameworkLinker:
 
     def _extract_php_controllers(self, file_path: Path) -> list[str]:
         """Extracts PHP controller classes defined in a file."""
-        try:
-            content = file_path.read_text(encoding="utf-8", errors="ignore")
-        except Exception:
+        content = self.source_store.read_text(file_path)
+        if content is None:
             return []
 
         controllers: list[str] = []
@@ -2806,7 +2808,12 @@ class FrameworkLinker:
             return
         from .django_template_parser import DjangoTemplateParser
 
-        parser = DjangoTemplateParser(self.repo_path, self.project_name, self.ingestor)
+        parser = DjangoTemplateParser(
+            self.repo_path,
+            self.project_name,
+            self.ingestor,
+            source_store=self.source_store,
+        )
         extraction = parser.parse_template(file_path, source)
         if (
             not extraction.tags
@@ -2982,11 +2989,8 @@ class FrameworkLinker:
 
     def _link_js_ts_requests(self, file_path: Path, handler_names: list[str]) -> None:
         """Links JS/TS files to the API endpoints they request (fetch/axios)."""
-        if not file_path.exists():
-            return
-        try:
-            source = file_path.read_text(encoding="utf-8", errors="ignore")
-        except Exception:
+        source = self.source_store.read_text(file_path)
+        if source is None:
             return
 
         module_qn = self._module_qn_for_path(file_path)
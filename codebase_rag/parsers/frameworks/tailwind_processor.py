@@ -13,6 +13,7 @@ from codebase_rag.core import constants as cs
 from codebase_rag.data_models.types_defs import LanguageQueries
 from codebase_rag.parsers.core.utils import normalize_query_captures
 from codebase_rag.services import IngestorProtocol
+from codebase_rag.utils.source_store import SourceStore
 
 _SCM_LANGUAGE_ALIAS: dict[cs.SupportedLanguage, str] = {
     cs.SupportedLanguage.TS: "javascript",
@@ -48,11 +49,14 @@ class TailwindUsageProcessor:
         repo_path: Path,
         project_name: str,
         queries: dict[cs.SupportedLanguage, LanguageQueries],
+        *,
+        source_store: SourceStore | None = None,
     ) -> None:
         self.ingestor = ingestor
         self.repo_path = repo_path
         self.project_name = project_name
         self.queries = queries
+        self.source_store = source_store or SourceStore()
         self._compiled_queries: dict[tuple[cs.SupportedLanguage, str], Query] = {}
         self._source_inline: set[str] = set()
         self._tailwind_asset_qn: str | None = None
@@ -97,9 +101,8 @@ class TailwindUsageProcessor:
         }:
             return
 
-        try:
-            source_text = file_path.read_text(encoding="utf-8", errors="ignore")
-        except Exception:
+        source_text = self.source_store.read_text(file_path)
+        if source_text is None:
             return
 
         if language in {
@@ -269,9 +272,8 @@ class TailwindUsageProcessor:
 
         for path in config_paths:
             config_rel_paths.append(str(path.relative_to(self.repo_path)))
-            try:
-                text = path.read_text(encoding="utf-8", errors="ignore")
-            except Exception:
+            text = self.source_store.read_text(path)
+            if text is None:
                 continue
 
             content_entries.update(self._extract_config_list(text, "content"))
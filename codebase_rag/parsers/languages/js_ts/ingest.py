@@ -17,6 +17,7 @@ from codebase_rag.data_models.types_defs import (
     SimpleNameLookup,
 )
 from codebase_rag.infrastructure.language_spec import get_language_spec_for_path
+from codebase_rag.parsers.core.complexity import complexity_props
 from codebase_rag.parsers.core.utils import (
     build_lite_signature,
     extract_param_names,
@@ -110,6 +111,7 @@ class JsTsIngestMixin(JsTsModuleSystemMixin):
             cs.KEY_MODULE_QN: module_qn,
             cs.KEY_SYMBOL_KIND: cs.NodeLabel.FUNCTION.value.lower(),
             cs.KEY_PARENT_QN: module_qn,
+            **complexity_props(function_node, language_value),
         }
         if namespace:
             function_props[cs.KEY_NAMESPACE] = namespace
@@ -38,9 +38,10 @@ from codebase_rag.parsers.core.utils import (
 from codebase_rag.parsers.type_inference import TypeInferenceEngine
 from codebase_rag.services.protocols import IngestorProtocol
 from codebase_rag.utils.path_utils import is_test_path
+from codebase_rag.utils.source_store import SourceStore
 
 from ..languages.cpp import utils as cpp_utils
-from .call_resolver import CallResolver
+from .call_resolver import CallResolutionStats, CallResolver
 from .dynamic_call_resolver import DynamicCallResolver
 from .import_processor import ImportProcessor
 from .python_map_dispatch import DispatchTarget, PythonMapDispatchAnalyzer
@@ -73,6 +74,8 @@ class CallProcessor:
         class_inheritance: dict[str, list[str]],
         type_inference: TypeInferenceEngine | None = None,
         module_qn_to_file_path: dict[str, Path] | None = None,
+        *,
+        source_store: SourceStore | None = None,
     ) -> None:
         """
         Initializes the CallProcessor.
@@ -85,11 +88,13 @@ class CallProcessor:
             import_processor (ImportProcessor): The processor that handled import statements.
             class_inheritance (dict[str, list[str]]): A map of class inheritance relationships.
             type_inference (TypeInferenceEngine | None): The engine for inferring variable types.
+            source_store (SourceStore | None): Shared run-scoped file contents.
         """
         self.ingestor = ingestor
         self.repo_path = repo_path
         self.project_name = project_name
         self._module_qn_to_file_path = module_qn_to_file_path or {}
+        self.source_store = source_store or SourceStore()
 
         self._resolver = CallResolver(
             function_registry=function_registry,
@@ -120,6 +125,11 @@ class CallProcessor:
             or framework_meta_enabled
         )
 
+    @property
+    def resolution_stats(self) -> CallResolutionStats:
+        """Hit, miss and ambiguity counters of the memoized registry fallback."""
+        return self._resolver.stats
+
     def _get_node_name(self, node: Node, field: str = cs.FIELD_NAME) -> str | None:
         """
         Extracts the text of a named child field from a tree-sitter node.
@@ -189,8 +199,12 @@ class CallProcessor:
         logger.debug(ls.CALL_PROCESSING_FILE.format(path=relative_path))
 
         try:
-            source_bytes = file_path.read_bytes()
-            source_text = source_bytes.decode(cs.ENCODING_UTF8, errors="ignore")
+            source_bytes = self.source_store.read_bytes(file_path)
+            if source_bytes is None:
+                source_bytes = file_path.read_bytes()
+            source_text = self.source_store.read_text(file_path)
+            if source_text is None:
+                source_text = source_bytes.decode(cs.ENCODING_UTF8, errors="ignore")
             module_qn = cs.SEPARATOR_DOT.join(
                 [self.project_name] + list(relative_path.with_suffix("").parts)
             )
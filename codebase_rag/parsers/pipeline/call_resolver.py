@@ -11,6 +11,7 @@ accurate call graph.
 from __future__ import annotations
 
 import re
+from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -30,6 +31,31 @@ if TYPE_CHECKING:
     from codebase_rag.parsers.type_inference import TypeInferenceEngine
 
 
+@dataclass(slots=True)
+class CallResolutionStats:
+    """Counters for the memoized registry fallback of a :class:`CallResolver`."""
+
+    hits: int = 0
+    misses: int = 0
+    ambiguous: int = 0
+    invalidations: int = 0
+
+    def as_dict(self) -> dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "ambiguous": self.ambiguous,
+            "invalidations": self.invalidations,
+        }
+
+
+@dataclass(slots=True)
+class _ModuleDistanceTable:
+    parts: list[str]
+    package_prefix: str
+    is_test: bool | None = None
+
+
 class CallResolver:
     """
     Resolves function and method calls to their fully qualified names.
@@ -72,6 +98,10 @@ class CallResolver:
         self.class_inheritance = class_inheritance
         self.type_inference = type_inference
         self.module_qn_to_file_path = module_qn_to_file_path or {}
+        self.stats = CallResolutionStats()
+        self._trie_cache: dict[tuple[str, str], tuple[int, str | None]] = {}
+        self._name_candidates: dict[str, tuple[int, list[tuple[str, bool]]]] = {}
+        self._distance_tables: dict[str, _ModuleDistanceTable] = {}
 
     def _resolve_class_qn_from_type(
         self, var_type: str, import_map: dict[str, str], module_qn: str
@@ -449,25 +479,112 @@ class CallResolver:
             )
             return None
 
-        possible_matches = self.function_registry.find_ending_with(search_name)
-        possible_matches = [
-            qn
-            for qn in possible_matches
-            if self._is_trie_candidate_allowed(qn, caller_module_qn=module_qn)
-        ]
-        if not possible_matches:
+        name_version = self._registry_name_version(search_name)
+        cache_key = (module_qn, search_name)
+        cached = self._trie_cache.get(cache_key) if name_version is not None else None
+        if cached is not None and cached[0] == name_version:
+            self.stats.hits += 1
+            best_candidate_qn = cached[1]
+        else:
+            if cached is not None:
+                self.stats.invalidations += 1
+            self.stats.misses += 1
+            best_candidate_qn = self._best_trie_candidate(
+                search_name, module_qn, name_version
+            )
+            if name_version is not None:
+                self._trie_cache[cache_key] = (name_version, best_candidate_qn)
+
+        if best_candidate_qn is None:
             logger.debug(ls.CALL_UNRESOLVED.format(call_name=call_name))
             return None
-
-        possible_matches.sort(
-            key=lambda qn: self._calculate_import_distance(qn, module_qn)
-        )
-        best_candidate_qn = possible_matches[0]
         logger.debug(
             ls.CALL_TRIE_FALLBACK.format(call_name=call_name, qn=best_candidate_qn)
         )
         return self.function_registry[best_candidate_qn], best_candidate_qn
 
+    def _best_trie_candidate(
+        self, search_name: str, module_qn: str, name_version: int | None
+    ) -> str | None:
+        """
+        Picks the registry entry ending with ``search_name`` closest to the caller.
+
+        With a versioned registry, the caller-independent candidate checks are
+        computed once per name and reused until the name's version changes.
+
+        Args:
+            search_name (str): The simple callee name.
+            module_qn (str): The caller module's qualified name.
+            name_version (int | None): Registry version of ``search_name``.
+
+        Returns:
+            str | None: The closest allowed candidate, or None if there is none.
+        """
+        if name_version is None:
+            possible_matches = [
+                qn
+                for qn in self.function_registry.find_ending_with(search_name)
+                if self._is_trie_candidate_allowed(qn, caller_module_qn=module_qn)
+            ]
+        else:
+            caller_is_test = self._caller_is_test(module_qn)
+            possible_matches = [
+                qn
+                for qn, is_test_symbol in self._callable_candidates(
+                    search_name, name_version
+                )
+                if caller_is_test or not is_test_symbol
+            ]
+        if not possible_matches:
+            return None
+        if len(possible_matches) > 1:
+            self.stats.ambiguous += 1
+        return min(
+            possible_matches,
+            key=lambda qn: self._calculate_import_distance(qn, module_qn),
+        )
+
+    def _callable_candidates(
+        self, search_name: str, name_version: int
+    ) -> list[tuple[str, bool]]:
+        cached = self._name_candidates.get(search_name)
+        if cached is not None and cached[0] == name_version:
+            return cached[1]
+        candidates = []
+        for qn in self.function_registry.find_ending_with(search_name):
+            node_type = self.function_registry.get(qn)
+            if node_type is None or not self._is_callable_node_type(node_type):
+                continue
+            if self._is_sql_migration_symbol(qn):
+                continue
+            candidates.append((qn, self._is_test_symbol_qn(qn)))
+        self._name_candidates[search_name] = (name_version, candidates)
+        return candidates
+
+    def _caller_is_test(self, module_qn: str) -> bool:
+        table = self._distance_table(module_qn)
+        if table.is_test is None:
+            table.is_test = self._is_test_module_qn(module_qn)
+        return table.is_test
+
+    def _distance_table(self, module_qn: str) -> _ModuleDistanceTable:
+        table = self._distance_tables.get(module_qn)
+        if table is None:
+            parts = module_qn.split(cs.SEPARATOR_DOT)
+            table = _ModuleDistanceTable(
+                parts=parts,
+                package_prefix=cs.SEPARATOR_DOT.join(parts[:-1]) + cs.SEPARATOR_DOT,
+            )
+            self._distance_tables[module_qn] = table
+        return table
+
+    def _registry_name_version(self, simple_name: str) -> int | None:
+        name_version = getattr(self.function_registry, "name_version", None)
+        if not callable(name_version):
+            return None
+        version = name_version(simple_name)
+        return version if isinstance(version, int) else None
+
     def _is_trie_candidate_allowed(
         self, candidate_qn: str, caller_module_qn: str
     ) -> bool:
@@ -1254,7 +1371,8 @@ class CallResolver:
         Returns:
             int: The calculated distance.
         """
-        caller_parts = caller_module_qn.split(cs.SEPARATOR_DOT)
+        table = self._distance_table(caller_module_qn)
+        caller_parts = table.parts
         candidate_parts = candidate_qn.split(cs.SEPARATOR_DOT)
 
         common_prefix = 0
@@ -1266,9 +1384,7 @@ class CallResolver:
 
         base_distance = max(len(caller_parts), len(candidate_parts)) - common_prefix
 
-        if candidate_qn.startswith(
-            cs.SEPARATOR_DOT.join(caller_parts[:-1]) + cs.SEPARATOR_DOT
-        ):
+        if candidate_qn.startswith(table.package_prefix):
             base_distance -= 1
 
         return base_distance
@@ -151,11 +151,14 @@ def extract_kubernetes_env_bindings(source: str) -> list[KubernetesEnvBinding]:
     return bindings
 
 
-def extract_python_env_observations(source: str) -> list[CodeEnvObservation]:
-    try:
-        tree = ast.parse(source)
-    except SyntaxError:
-        return []
+def extract_python_env_observations(
+    source: str, *, tree: ast.Module | None = None
+) -> list[CodeEnvObservation]:
+    if tree is None:
+        try:
+            tree = ast.parse(source)
+        except SyntaxError:
+            return []
 
     visitor = _PythonEnvVisitor()
     visitor.visit(tree)
@@ -25,6 +25,7 @@ from codebase_rag.parsers.pipeline.config_semantics import (
     extract_python_env_observations,
     extract_typescript_env_observations,
 )
+from codebase_rag.parsers.pipeline.fused_visitor import ParsedSourceCache
 from codebase_rag.parsers.pipeline.semantic_guardrails import (
     SEMANTIC_GUARDRAIL_LIMITS,
     apply_grouped_guardrail,
@@ -57,11 +58,13 @@ class ConfigSemanticsPass(ConfigParserMixin):
         repo_path: Path,
         project_name: str,
         function_registry,
+        source_cache: ParsedSourceCache | None = None,
     ) -> None:
         self.ingestor = ingestor
         self.repo_path = repo_path
         self.project_name = project_name
         self.function_registry = function_registry
+        self.source_cache = source_cache or ParsedSourceCache()
         self.enabled = is_semantic_pass_enabled("CODEGRAPH_CONFIG_SEMANTICS")
 
     def process_ast_cache(
@@ -136,7 +139,9 @@ class ConfigSemanticsPass(ConfigParserMixin):
                 language == cs.SupportedLanguage.PYTHON
                 and file_path.suffix == cs.EXT_PY
             ):
-                observations = extract_python_env_observations(source)
+                observations = extract_python_env_observations(
+                    source, tree=self.source_cache.python_tree(source)
+                )
             elif language in {
                 cs.SupportedLanguage.JS,
                 cs.SupportedLanguage.TS,
@@ -503,9 +508,5 @@ class ConfigSemanticsPass(ConfigParserMixin):
     def _feature_default(value: object) -> bool | None:
         return parse_env_truthiness(value)
 
-    @staticmethod
-    def _read_source(file_path: Path) -> str | None:
-        try:
-            return file_path.read_text(encoding=cs.ENCODING_UTF8)
-        except Exception:
-            return None
+    def _read_source(self, file_path: Path) -> str | None:
+        return self.source_cache.read(file_path)
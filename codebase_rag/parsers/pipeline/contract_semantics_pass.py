@@ -12,6 +12,7 @@ from codebase_rag.core import constants as cs
 from codebase_rag.parsers.frameworks.fastapi_semantics import (
     extract_fastapi_route_semantics,
 )
+from codebase_rag.parsers.pipeline.fused_visitor import ParsedSourceCache
 from codebase_rag.parsers.pipeline.openapi_contracts import (
     OpenApiEndpointContractBinding,
     extract_openapi_contract_surface,
@@ -44,11 +45,13 @@ class ContractSemanticsPass:
         repo_path: Path,
         project_name: str,
         function_registry,
+        source_cache: ParsedSourceCache | None = None,
     ) -> None:
         self.ingestor = ingestor
         self.repo_path = repo_path
         self.project_name = project_name
         self.function_registry = function_registry
+        self.source_cache = source_cache or ParsedSourceCache()
         self.enabled = is_semantic_pass_enabled("CODEGRAPH_CONTRACT_SEMANTICS")
 
     def process_ast_cache(
@@ -94,7 +97,9 @@ class ContractSemanticsPass:
             python_sources[file_path] = source
             module_qn = self._module_qn_for_path(file_path)
             relative_path = self._relative_path(file_path)
-            contract_defs = extract_python_contracts(source)
+            contract_defs = extract_python_contracts(
+                source, tree=self.source_cache.python_tree(source)
+            )
             created_contracts, created_fields = self._ingest_contract_definitions(
                 contract_defs=contract_defs,
                 contract_index=contract_index,
@@ -223,7 +228,9 @@ class ContractSemanticsPass:
             module_qn = self._module_qn_for_path(file_path)
             relative_path = self._relative_path(file_path)
             handler_contracts = extract_python_handler_contracts(
-                source, set(contract_index)
+                source,
+                set(contract_index),
+                tree=self.source_cache.python_tree(source),
             )
             for route in routes:
                 endpoint_qn = self._endpoint_qn(
@@ -588,12 +595,8 @@ class ContractSemanticsPass:
         normalized = file_path.name.lower()
         return "openapi" in normalized or "swagger" in normalized
 
-    @staticmethod
-    def _read_source(file_path: Path) -> str | None:
-        try:
-            return file_path.read_text(encoding="utf-8", errors="ignore")
-        except Exception as exc:
-            logger.warning(
-                "ContractSemanticsPass failed reading {}: {}", file_path, exc
-            )
-            return None
+    def _read_source(self, file_path: Path) -> str | None:
+        source = self.source_cache.read(file_path, errors="ignore")
+        if source is None:
+            logger.warning("ContractSemanticsPass failed reading {}", file_path)
+        return source
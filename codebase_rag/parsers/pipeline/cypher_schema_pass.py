@@ -57,6 +57,7 @@ from codebase_rag.infrastructure.language_spec import (
     _generic_file_to_module,
     _sql_get_name,
 )
+from codebase_rag.utils.source_store import SourceStore
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -569,10 +570,13 @@ class CypherSchemaPass:
         ingestor,
         repo_path: Path,
         project_name: str,
+        *,
+        source_store: SourceStore | None = None,
     ) -> None:
         self.ingestor = ingestor
         self.repo_path = repo_path
         self.project_name = project_name
+        self.source_store = source_store or SourceStore()
 
         self.enabled = os.getenv("CODEGRAPH_CYPHER_SCHEMA", "1").lower() not in {
             "0",
@@ -673,7 +677,9 @@ class CypherSchemaPass:
         Returns (label_count, constraint_count, index_count, text_index_count,
                  rel_type_count, syncs_to_count, connects_count).
         """
-        source = file_path.read_text(encoding="utf-8", errors="replace")
+        source = self.source_store.read_text(file_path)
+        if source is None:
+            return 0, 0, 0, 0, 0, 0, 0
         clean = _strip_cypher_comments(source)
 
         rel_path = file_path.relative_to(self.repo_path).as_posix()
@@ -932,9 +938,8 @@ class CypherSchemaPass:
 
         total = 0
         for file_path, _lang in code_items:
-            try:
-                source = file_path.read_text(encoding="utf-8", errors="ignore")
-            except Exception:
+            source = self.source_store.read_text(file_path)
+            if source is None:
                 continue
 
             func_matches = list(_CODE_FUNC_DEF_RE.finditer(source))
@@ -38,6 +38,7 @@ from codebase_rag.parsers.frameworks.framework_registry import FrameworkDetector
 from codebase_rag.parsers.handlers import get_handler
 from codebase_rag.parsers.languages.js_ts.ingest import JsTsIngestMixin
 from codebase_rag.utils.path_utils import is_test_path, to_posix
+from codebase_rag.utils.source_store import SourceStore
 
 from .dependency_parser import parse_dependencies
 from .function_ingest import FunctionIngestMixin
@@ -87,6 +88,8 @@ class DefinitionProcessor(
         simple_name_lookup: SimpleNameLookup,
         import_processor: ImportProcessor,
         module_qn_to_file_path: dict[str, Path],
+        *,
+        source_store: SourceStore | None = None,
     ):
         """
         Initializes the DefinitionProcessor.
@@ -99,6 +102,8 @@ class DefinitionProcessor(
             simple_name_lookup (SimpleNameLookup): A lookup table for simple names to qualified names.
             import_processor (ImportProcessor): The processor for handling imports.
             module_qn_to_file_path (dict[str, Path]): A mapping of module FQNs to their file paths.
+            source_store (SourceStore | None): Shared run-scoped file contents, so
+                later passes reuse the bytes read for parsing.
         """
         super().__init__()
         self.ingestor = ingestor
@@ -108,6 +113,7 @@ class DefinitionProcessor(
         self.simple_name_lookup = simple_name_lookup
         self.import_processor = import_processor
         self.module_qn_to_file_path = module_qn_to_file_path
+        self.source_store = source_store or SourceStore()
         self.module_qn_to_file_hash: dict[str, str] = {}
         self.class_inheritance: dict[str, list[str]] = {}
         self._handler = get_handler(cs.SupportedLanguage.PYTHON)
@@ -167,13 +173,13 @@ class DefinitionProcessor(
                     logger.warning(ls.DEF_NO_PARSER.format(language=language))
                     return None
                 if source_bytes is None:
-                    source_bytes = file_path.read_bytes()
+                    source_bytes = self._read_source_bytes(file_path)
                 tree = parser.parse(source_bytes)
                 root_node = tree.root_node
             else:
                 root_node = parsed_root
             if source_bytes is None:
-                source_bytes = file_path.read_bytes()
+                source_bytes = self._read_source_bytes(file_path)
             if source_text is None:
                 source_text = self._safe_decode_source(source_bytes)
 
@@ -284,6 +290,21 @@ class DefinitionProcessor(
             logger.error(ls.DEF_PARSE_FAILED.format(path=file_path, error=e))
             return None
 
+    def _read_source_bytes(self, file_path: Path) -> bytes:
+        """
+        Reads a file through the shared source store.
+
+        Args:
+            file_path (Path): The path of the file to read.
+
+        Returns:
+            The file contents; unreadable files raise the underlying ``OSError``.
+        """
+        source_bytes = self.source_store.read_bytes(file_path)
+        if source_bytes is None:
+            return file_path.read_bytes()
+        return source_bytes
+
     @staticmethod
     def _safe_decode_source(source_bytes: bytes) -> str:
         """
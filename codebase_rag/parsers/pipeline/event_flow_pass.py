@@ -8,6 +8,7 @@ from tree_sitter import Node
 
 from codebase_rag.core import constants as cs
 from codebase_rag.core.event_flow_identity import build_event_flow_canonical_key
+from codebase_rag.parsers.pipeline.fused_visitor import ParsedSourceCache
 from codebase_rag.parsers.pipeline.python_event_flows import (
     EventFlowObservation,
     extract_python_event_flows,
@@ -35,11 +36,13 @@ class EventFlowPass:
         repo_path: Path,
         project_name: str,
         function_registry,
+        source_cache: ParsedSourceCache | None = None,
     ) -> None:
         self.ingestor = ingestor
         self.repo_path = repo_path
         self.project_name = project_name
         self.function_registry = function_registry
+        self.source_cache = source_cache or ParsedSourceCache()
         self.enabled = is_semantic_pass_enabled("CODEGRAPH_EVENT_FLOW_SEMANTICS")
 
     def process_ast_cache(
@@ -59,7 +62,9 @@ class EventFlowPass:
             source = self._read_source(file_path)
             if source is None:
                 continue
-            observations = extract_python_event_flows(source)
+            observations = extract_python_event_flows(
+                source, tree=self.source_cache.python_tree(source)
+            )
             if not observations:
                 continue
             module_qn = self._module_qn_for_path(file_path)
@@ -339,9 +344,5 @@ class EventFlowPass:
     def _relative_path(self, file_path: Path) -> str:
         return str(file_path.relative_to(self.repo_path)).replace("\\", "/")
 
-    @staticmethod
-    def _read_source(file_path: Path) -> str | None:
-        try:
-            return file_path.read_text(encoding=cs.ENCODING_UTF8)
-        except Exception:
-            return None
+    def _read_source(self, file_path: Path) -> str | None:
+        return self.source_cache.read(file_path)
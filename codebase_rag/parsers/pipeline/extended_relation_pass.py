@@ -24,7 +24,12 @@ from tree_sitter import Node
 
 from codebase_rag.core import constants as cs
 from codebase_rag.data_models.types_defs import PropertyValue
+from codebase_rag.parsers.pipeline.fused_visitor import (
+    FusedAstVisitor,
+    NodeSubscription,
+)
 from codebase_rag.parsers.type_inference.enhanced_function_extractor import (
+    EXCEPTION_NODE_TYPES,
     EnhancedFunctionExtractor,
 )
 
@@ -58,9 +63,23 @@ class ExtendedRelationPass:
         self.repo_path = repo_path
         self.project_name = project_name
         self.queries = queries
+        self.exception_nodes: dict[Path, list[Node]] = {}
+
+    def node_subscriptions(self) -> tuple[NodeSubscription, ...]:
+        """Subscribes exception collection to throw and catch nodes."""
+        return (
+            NodeSubscription(
+                pass_id="extended_relations",
+                node_types=EXCEPTION_NODE_TYPES,
+                visit=self._record_exception_node,
+            ),
+        )
 
     def process_ast_cache(
-        self, ast_items: Iterable[tuple[Path, tuple[Node, cs.SupportedLanguage]]]
+        self,
+        ast_items: Iterable[tuple[Path, tuple[Node, cs.SupportedLanguage]]],
+        *,
+        discovered: bool = False,
     ) -> None:
         """
         Processes cached AST items to extract and ingest extended relationships.
@@ -71,11 +90,16 @@ class ExtendedRelationPass:
 
         Args:
             ast_items (Iterable): An iterable of (file_path, (root_node, language)) tuples.
+            discovered (bool): ``True`` when :meth:`node_subscriptions` were already
+                fed by a shared walk, so exception nodes need not be collected again.
         """
         extractor = EnhancedFunctionExtractor(
             repo_path=self.repo_path,
             project_name=self.project_name,
         )
+        if not discovered:
+            ast_items = list(ast_items)
+            FusedAstVisitor(self.node_subscriptions()).walk(ast_items)
 
         for file_path, (root_node, language) in ast_items:
             try:
@@ -84,6 +108,7 @@ class ExtendedRelationPass:
                     root_node=root_node,
                     language=language,
                     queries=self.queries,
+                    exception_nodes=self.exception_nodes.get(file_path, ()),
                 )
             except Exception as exc:
                 logger.warning("Extended relation extraction failed: {}", exc)
@@ -94,6 +119,9 @@ class ExtendedRelationPass:
                 self._ingest_decorator_relations(metadata, language)
                 self._ingest_exception_relations(metadata)
 
+    def _record_exception_node(self, file_path: Path, node: Node) -> None:
+        self.exception_nodes.setdefault(file_path, []).append(node)
+
     def _ingest_type_relations(self, metadata) -> None:
         """
         Ingests type-related relationships, such as return types and parameter types.
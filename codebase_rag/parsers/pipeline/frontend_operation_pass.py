@@ -13,6 +13,7 @@ from codebase_rag.parsers.pipeline.frontend_operations import (
     extract_openapi_operation_bindings,
     normalize_http_path,
 )
+from codebase_rag.parsers.pipeline.fused_visitor import ParsedSourceCache
 from codebase_rag.parsers.pipeline.openapi_contracts import (
     extract_openapi_contract_surface,
 )
@@ -34,11 +35,13 @@ class FrontendOperationPass:
         repo_path: Path,
         project_name: str,
         function_registry,
+        source_cache: ParsedSourceCache | None = None,
     ) -> None:
         self.ingestor = ingestor
         self.repo_path = repo_path
         self.project_name = project_name
         self.function_registry = function_registry
+        self.source_cache = source_cache or ParsedSourceCache()
         self.enabled = is_semantic_pass_enabled(
             "CODEGRAPH_FRONTEND_OPERATION_SEMANTICS"
         )
@@ -326,9 +329,5 @@ class FrontendOperationPass:
             f"endpoint.http.{method.upper()}:{normalized_path}"
         )
 
-    @staticmethod
-    def _read_source(file_path: Path) -> str | None:
-        try:
-            return file_path.read_text(encoding=cs.ENCODING_UTF8)
-        except Exception:
-            return None
+    def _read_source(self, file_path: Path) -> str | None:
+        return self.source_cache.read(file_path)
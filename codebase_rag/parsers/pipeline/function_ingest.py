@@ -31,6 +31,7 @@ from codebase_rag.data_models.types_defs import (
     SimpleNameLookup,
 )
 from codebase_rag.infrastructure.language_spec import LANGUAGE_FQN_SPECS, LanguageSpec
+from codebase_rag.parsers.core.complexity import complexity_props
 from codebase_rag.parsers.core.utils import (
     build_lite_signature,
     extract_param_names,
@@ -619,6 +620,7 @@ class FunctionIngestMixin:
             cs.KEY_MODULE_QN: module_qn,
             cs.KEY_SYMBOL_KIND: cs.NodeLabel.FUNCTION.value.lower(),
             cs.KEY_PARENT_QN: module_qn,
+            **complexity_props(func_node, language),
         }
         if namespace:
             props[cs.KEY_NAMESPACE] = namespace
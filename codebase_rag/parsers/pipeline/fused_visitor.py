@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+import ast
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from loguru import logger
+from tree_sitter import Node
+
+from codebase_rag.core import constants as cs
+from codebase_rag.utils.source_store import SourceStore
+
+AstCacheItem = tuple[Path, tuple[Node, cs.SupportedLanguage]]
+NodeVisitor = Callable[[Path, Node], None]
+
+
+@dataclass(frozen=True)
+class NodeSubscription:
+    """Interest of one pass in a set of tree-sitter node types."""
+
+    pass_id: str
+    node_types: frozenset[str]
+    visit: NodeVisitor
+    languages: frozenset[cs.SupportedLanguage] | None = None
+
+    def accepts(self, language: cs.SupportedLanguage) -> bool:
+        return self.languages is None or language in self.languages
+
+
+@dataclass
+class FusedWalkStats:
+    files: int = 0
+    nodes: int = 0
+    walk_seconds: float = 0.0
+    pass_seconds: dict[str, float] = field(default_factory=dict)
+    pass_matches: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def traversal_seconds(self) -> float:
+        return max(self.walk_seconds - sum(self.pass_seconds.values()), 0.0)
+
+
+def iter_tree(root_node: Node) -> Iterator[Node]:
+    """Yields every node below ``root_node`` in pre-order using a tree cursor."""
+    cursor = root_node.walk()
+    while True:
+        node = cursor.node
+        if node is not None:
+            yield node
+        if cursor.goto_first_child() or cursor.goto_next_sibling():
+            continue
+        while True:
+            if not cursor.goto_parent():
+                return
+            if cursor.goto_next_sibling():
+                break
+
+
+class FusedAstVisitor:
+    """Walks each cached tree once and dispatches nodes to every subscribed pass.
+
+    Files whose language has no subscriber are skipped without being walked.
+    Time spent inside each subscriber is attributed to its ``pass_id``; the
+    remainder of ``walk_seconds`` is the shared traversal cost.
+    """
+
+    def __init__(self, subscriptions: Iterable[NodeSubscription] = ()) -> None:
+        self._subscriptions: list[NodeSubscription] = list(subscriptions)
+        self._dispatch: dict[
+            cs.SupportedLanguage, dict[str, tuple[NodeSubscription, ...]]
+        ] = {}
+        self.stats = FusedWalkStats()
+
+    def __bool__(self) -> bool:
+        return bool(self._subscriptions)
+
+    def subscribe(self, subscription: NodeSubscription) -> None:
+        self._subscriptions.append(subscription)
+        self._dispatch.clear()
+
+    def walk(self, ast_items: Iterable[AstCacheItem]) -> FusedWalkStats:
+        stats = self.stats
+        for file_path, (root_node, language) in ast_items:
+            table = self._dispatch_table(language)
+            if not table:
+                continue
+            started = time.perf_counter()
+            visited = 0
+            for node in iter_tree(root_node):
+                visited += 1
+                subscribers = table.get(node.type)
+                if subscribers:
+                    self._dispatch_node(file_path, node, subscribers)
+            stats.files += 1
+            stats.nodes += visited
+            stats.walk_seconds += time.perf_counter() - started
+        return stats
+
+    def _dispatch_node(
+        self,
+        file_path: Path,
+        node: Node,
+        subscribers: tuple[NodeSubscription, ...],
+    ) -> None:
+        stats = self.stats
+        for subscription in subscribers:
+            started = time.perf_counter()
+            try:
+                subscription.visit(file_path, node)
+            except Exception as exc:
+                logger.warning(
+                    "{} failed on {} in {}: {}",
+                    subscription.pass_id,
+                    node.type,
+                    file_path,
+                    exc,
+                )
+            pass_id = subscription.pass_id
+            stats.pass_seconds[pass_id] = (
+                stats.pass_seconds.get(pass_id, 0.0) + time.perf_counter() - started
+            )
+            stats.pass_matches[pass_id] = stats.pass_matches.get(pass_id, 0) + 1
+
+    def _dispatch_table(
+        self, language: cs.SupportedLanguage
+    ) -> dict[str, tuple[NodeSubscription, ...]]:
+        table = self._dispatch.get(language)
+        if table is None:
+            grouped: dict[str, list[NodeSubscription]] = {}
+            for subscription in self._subscriptions:
+                if not subscription.accepts(language):
+                    continue
+                for node_type in subscription.node_types:
+                    grouped.setdefault(node_type, []).append(subscription)
+            table = {
+                node_type: tuple(subscribers)
+                for node_type, subscribers in grouped.items()
+            }
+            self._dispatch[language] = table
+        return table
+
+
+class ParsedSourceCache:
+    """Run-scoped memo of decoded file sources and their Python ``ast`` trees.
+
+    Semantic passes run one after another over the same files; sharing one
+    cache lets each file be decoded and parsed once instead of once per pass.
+    File contents come from the run's :class:`SourceStore`, so bytes already
+    read during parsing are not read from disk again. Trees are keyed by the
+    source string itself, so every pass that got its source from :meth:`read`
+    hits the same entry. Both memos keep at most ``max_entries`` items and
+    drop the least recently used first.
+    """
+
+    def __init__(
+        self,
+        *,
+        source_store: SourceStore | None = None,
+        max_entries: int = cs.PARSED_SOURCE_CACHE_MAX_ENTRIES,
+    ) -> None:
+        self.source_store = source_store or SourceStore()
+        self.max_entries = max_entries
+        self._sources: OrderedDict[tuple[Path, str], str | None] = OrderedDict()
+        self._trees: OrderedDict[str, ast.Module | None] = OrderedDict()
+        self.reads = 0
+        self.parses = 0
+        self.hits = 0
+
+    def read(self, file_path: Path, *, errors: str = "strict") -> str | None:
+        key = (file_path, errors)
+        if key in self._sources:
+            self.hits += 1
+            self._sources.move_to_end(key)
+            return self._sources[key]
+        self.reads += 1
+        source: str | None = None
+        if errors == "ignore":
+            source = self.source_store.read_text(file_path)
+        elif (data := self.source_store.read_bytes(file_path)) is not None:
+            try:
+                source = data.decode(cs.ENCODING_UTF8, errors=errors)
+            except UnicodeDecodeError:
+                source = None
+        self._remember(self._sources, key, source)
+        return source
+
+    def python_tree(self, source: str) -> ast.Module | None:
+        if source in self._trees:
+            self.hits += 1
+            self._trees.move_to_end(source)
+            return self._trees[source]
+        self.parses += 1
+        try:
+            tree: ast.Module | None = ast.parse(source)
+        except (SyntaxError, ValueError):
+            tree = None
+        self._remember(self._trees, source, tree)
+        return tree
+
+    def _remember[K, V](self, memo: OrderedDict[K, V], key: K, value: V) -> None:
+        memo[key] = value
+        while len(memo) > self.max_entries:
+            memo.popitem(last=False)
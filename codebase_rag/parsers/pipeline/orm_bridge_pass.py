@@ -43,6 +43,11 @@ from codebase_rag.infrastructure.language_spec import (
     _generic_file_to_module,
     _sql_get_name,
 )
+from codebase_rag.parsers.pipeline.fused_visitor import (
+    FusedAstVisitor,
+    NodeSubscription,
+)
+from codebase_rag.utils.source_store import SourceStore
 
 # ---------------------------------------------------------------------------
 # Regex patterns
@@ -179,12 +184,6 @@ def _detect_sql_usages(
 # ---------------------------------------------------------------------------
 
 
-def _walk(node: Node) -> Iterable[Node]:
-    yield node
-    for child in node.children:
-        yield from _walk(child)
-
-
 def _build_sql_qn(
     name: str,
     file_path: Path,
@@ -347,11 +346,15 @@ class OrmBridgePass:
         repo_path: Path,
         project_name: str,
         simple_name_lookup: dict[str, set[str]],
+        *,
+        source_store: SourceStore | None = None,
     ) -> None:
         self.ingestor = ingestor
         self.repo_path = repo_path
         self.project_name = project_name
         self.simple_name_lookup = simple_name_lookup
+        self.source_store = source_store or SourceStore()
+        self.sql_table_qn: dict[str, str] = {}
 
         self.enabled = os.getenv("CODEGRAPH_ORM_BRIDGE", "1").lower() not in {
             "0",
@@ -363,9 +366,21 @@ class OrmBridgePass:
     # Entry point
     # ------------------------------------------------------------------
 
+    def node_subscriptions(self) -> tuple[NodeSubscription, ...]:
+        return (
+            NodeSubscription(
+                pass_id="orm_bridge",
+                node_types=frozenset({"create_table"}),
+                visit=self._record_table_name,
+                languages=frozenset({cs.SupportedLanguage.SQL}),
+            ),
+        )
+
     def process_ast_cache(
         self,
         ast_items: Iterable[tuple[Path, tuple[Node, cs.SupportedLanguage]]],
+        *,
+        discovered: bool = False,
     ) -> None:
         if not self.enabled:
             return
@@ -388,17 +403,13 @@ class OrmBridgePass:
         # we still need to run even then because the raw-SQL scanner (QUERIES_TABLE)
         # has nothing to scan, but callers shouldn't crash.
 
-        # Build table_name → sql_qn lookup
-        sql_table_qn: dict[str, str] = {}
-        for file_path, root_node in sql_items:
-            for node in _walk(root_node):
-                if node.type == "create_table":
-                    name = _sql_get_name(node)
-                    if name:
-                        qn = _build_sql_qn(
-                            name, file_path, self.repo_path, self.project_name
-                        )
-                        sql_table_qn[name] = qn
+        # Build table_name → sql_qn lookup, unless a shared walk already did
+        if not discovered:
+            FusedAstVisitor(self.node_subscriptions()).walk(
+                (file_path, (root_node, cs.SupportedLanguage.SQL))
+                for file_path, root_node in sql_items
+            )
+        sql_table_qn = self.sql_table_qn
 
         if not sql_table_qn:
             return
@@ -425,6 +436,13 @@ class OrmBridgePass:
             len(orm_items),
         )
 
+    def _record_table_name(self, file_path: Path, node: Node) -> None:
+        name = _sql_get_name(node)
+        if name:
+            self.sql_table_qn[name] = _build_sql_qn(
+                name, file_path, self.repo_path, self.project_name
+            )
+
     # ------------------------------------------------------------------
     # Per-file processing
     # ------------------------------------------------------------------
@@ -437,9 +455,8 @@ class OrmBridgePass:
         tables_lower: dict[str, str],
     ) -> tuple[int, int]:
         """Returns (maps_to_table_count, queries_table_count)."""
-        try:
-            source = file_path.read_text(encoding="utf-8", errors="ignore")
-        except Exception:
+        source = self.source_store.read_text(file_path)
+        if source is None:
             return 0, 0
 
         detector = _LANGUAGE_DETECTORS.get(language)
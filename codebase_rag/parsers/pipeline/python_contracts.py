@@ -24,13 +24,16 @@ class ContractDefinition:
     total: bool = True
 
 
-def extract_python_contracts(source: str) -> list[ContractDefinition]:
+def extract_python_contracts(
+    source: str, *, tree: ast.Module | None = None
+) -> list[ContractDefinition]:
     """Extracts Python contract definitions for Pydantic, dataclass, and TypedDict."""
 
-    try:
-        tree = ast.parse(source)
-    except SyntaxError:
-        return []
+    if tree is None:
+        try:
+            tree = ast.parse(source)
+        except SyntaxError:
+            return []
 
     aliases = _build_aliases(tree)
     contracts: list[ContractDefinition] = []
@@ -57,13 +60,16 @@ def extract_python_contracts(source: str) -> list[ContractDefinition]:
 def extract_python_handler_contracts(
     source: str,
     known_contract_names: set[str],
+    *,
+    tree: ast.Module | None = None,
 ) -> dict[str, list[str]]:
     """Maps handler function names to referenced request contract names."""
 
-    try:
-        tree = ast.parse(source)
-    except SyntaxError:
-        return {}
+    if tree is None:
+        try:
+            tree = ast.parse(source)
+        except SyntaxError:
+            return {}
 
     aliases = _build_aliases(tree)
     handler_contracts: dict[str, list[str]] = {}
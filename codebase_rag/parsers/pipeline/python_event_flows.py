@@ -19,13 +19,16 @@ class EventFlowObservation:
     line_end: int | None = None
 
 
-def extract_python_event_flows(source: str) -> list[EventFlowObservation]:
+def extract_python_event_flows(
+    source: str, *, tree: ast.Module | None = None
+) -> list[EventFlowObservation]:
     """Extracts first-wave event/outbox/replay observations from Python source."""
 
-    try:
-        tree = ast.parse(source)
-    except SyntaxError:
-        return []
+    if tree is None:
+        try:
+            tree = ast.parse(source)
+        except SyntaxError:
+            return []
 
     aliases = _build_aliases(tree)
     collector = _EventFlowCollector(aliases)
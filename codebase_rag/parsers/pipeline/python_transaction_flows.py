@@ -45,13 +45,16 @@ class _MutableBoundary:
 
 def extract_python_transaction_flows(
     source: str,
+    *,
+    tree: ast.Module | None = None,
 ) -> tuple[list[TransactionBoundaryObservation], list[SideEffectObservation]]:
     """Extracts first-wave Python transaction boundaries and side-effect order."""
 
-    try:
-        tree = ast.parse(source)
-    except SyntaxError:
-        return ([], [])
+    if tree is None:
+        try:
+            tree = ast.parse(source)
+        except SyntaxError:
+            return ([], [])
 
     aliases = _build_aliases(tree)
     collector = _TransactionFlowCollector(aliases)
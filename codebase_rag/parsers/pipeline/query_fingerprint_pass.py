@@ -7,6 +7,7 @@ from loguru import logger
 from tree_sitter import Node
 
 from codebase_rag.core import constants as cs
+from codebase_rag.parsers.pipeline.fused_visitor import ParsedSourceCache
 from codebase_rag.parsers.pipeline.query_fingerprints import (
     QueryObservation,
     extract_python_query_observations,
@@ -35,11 +36,13 @@ class QueryFingerprintPass:
         repo_path: Path,
         project_name: str,
         function_registry,
+        source_cache: ParsedSourceCache | None = None,
     ) -> None:
         self.ingestor = ingestor
         self.repo_path = repo_path
         self.project_name = project_name
         self.function_registry = function_registry
+        self.source_cache = source_cache or ParsedSourceCache()
         self.enabled = is_semantic_pass_enabled("CODEGRAPH_QUERY_FINGERPRINT_SEMANTICS")
 
     def process_ast_cache(
@@ -64,7 +67,9 @@ class QueryFingerprintPass:
                 language == cs.SupportedLanguage.PYTHON
                 and file_path.suffix == cs.EXT_PY
             ):
-                observations = extract_python_query_observations(source)
+                observations = extract_python_query_observations(
+                    source, tree=self.source_cache.python_tree(source)
+                )
             elif language in {cs.SupportedLanguage.JS, cs.SupportedLanguage.TS} and (
                 file_path.suffix in {*cs.JS_EXTENSIONS, *cs.TS_EXTENSIONS}
             ):
@@ -477,9 +482,5 @@ class QueryFingerprintPass:
     def _relative_path(self, file_path: Path) -> str:
         return str(file_path.relative_to(self.repo_path)).replace("\\", "/")
 
-    @staticmethod
-    def _read_source(file_path: Path) -> str | None:
-        try:
-            return file_path.read_text(encoding=cs.ENCODING_UTF8)
-        except Exception:
-            return None
+    def _read_source(self, file_path: Path) -> str | None:
+        return self.source_cache.read(file_path)
@@ -64,13 +64,16 @@ class QueryObservation:
     line_end: int | None = None
 
 
-def extract_python_query_observations(source: str) -> list[QueryObservation]:
+def extract_python_query_observations(
+    source: str, *, tree: ast.Module | None = None
+) -> list[QueryObservation]:
     """Extracts query fingerprints from Python source."""
 
-    try:
-        tree = ast.parse(source)
-    except SyntaxError:
-        return []
+    if tree is None:
+        try:
+            tree = ast.parse(source)
+        except SyntaxError:
+            return []
 
     collector = _PythonQueryCollector()
     collector.visit(tree)
@@ -1,21 +1,27 @@
 from __future__ import annotations
 
 import os
-from collections.abc import Callable, Iterable, Sequence
-from dataclasses import dataclass
+import time
+from collections.abc import Callable, Collection, Iterable, Sequence
+from dataclasses import dataclass, replace
 from pathlib import Path
 from typing import Protocol, cast
 
-from tree_sitter import Node
+from loguru import logger
 
 from codebase_rag.core import constants as cs
+from codebase_rag.parsers.pipeline.fused_visitor import (
+    AstCacheItem,
+    FusedAstVisitor,
+    FusedWalkStats,
+    NodeSubscription,
+    ParsedSourceCache,
+)
+from codebase_rag.utils.source_store import SourceStore
 
 DISABLED_FLAG_VALUES = {"0", "false", "no", "off"}
 
 
-AstCacheItem = tuple[Path, tuple[Node, cs.SupportedLanguage]]
-
-
 class SemanticPassProtocol(Protocol):
     def process_ast_cache(self, ast_cache_items: Iterable[AstCacheItem]) -> None: ...
 
@@ -26,6 +32,8 @@ class SemanticPassContext:
     repo_path: Path
     project_name: str
     function_registry: object
+    source_cache: ParsedSourceCache | None = None
+    source_store: SourceStore | None = None
 
 
 @dataclass(frozen=True)
@@ -54,6 +62,7 @@ def _build_contract_pass(ctx: SemanticPassContext) -> SemanticPassProtocol:
             repo_path=ctx.repo_path,
             project_name=ctx.project_name,
             function_registry=ctx.function_registry,
+            source_cache=ctx.source_cache,
         ),
     )
 
@@ -68,6 +77,7 @@ def _build_event_flow_pass(ctx: SemanticPassContext) -> SemanticPassProtocol:
             repo_path=ctx.repo_path,
             project_name=ctx.project_name,
             function_registry=ctx.function_registry,
+            source_cache=ctx.source_cache,
         ),
     )
 
@@ -84,6 +94,7 @@ def _build_query_fingerprint_pass(ctx: SemanticPassContext) -> SemanticPassProto
             repo_path=ctx.repo_path,
             project_name=ctx.project_name,
             function_registry=ctx.function_registry,
+            source_cache=ctx.source_cache,
         ),
     )
 
@@ -98,6 +109,7 @@ def _build_transaction_flow_pass(ctx: SemanticPassContext) -> SemanticPassProtoc
             repo_path=ctx.repo_path,
             project_name=ctx.project_name,
             function_registry=ctx.function_registry,
+            source_cache=ctx.source_cache,
         ),
     )
 
@@ -114,6 +126,7 @@ def _build_frontend_operation_pass(ctx: SemanticPassContext) -> SemanticPassProt
             repo_path=ctx.repo_path,
             project_name=ctx.project_name,
             function_registry=ctx.function_registry,
+            source_cache=ctx.source_cache,
         ),
     )
 
@@ -130,6 +143,7 @@ def _build_config_semantics_pass(ctx: SemanticPassContext) -> SemanticPassProtoc
             repo_path=ctx.repo_path,
             project_name=ctx.project_name,
             function_registry=ctx.function_registry,
+            source_cache=ctx.source_cache,
         ),
     )
 
@@ -144,6 +158,7 @@ def _build_test_semantics_pass(ctx: SemanticPassContext) -> SemanticPassProtocol
             repo_path=ctx.repo_path,
             project_name=ctx.project_name,
             function_registry=ctx.function_registry,
+            source_cache=ctx.source_cache,
         ),
     )
 
@@ -215,6 +230,8 @@ class SemanticPassRegistry:
                 key=lambda definition: (definition.order, definition.pass_id),
             )
         )
+        self.last_timings: dict[str, float] = {}
+        self.last_walk_stats = FusedWalkStats()
 
     def ordered_definitions(self) -> tuple[SemanticPassDefinition, ...]:
         return self._definitions
@@ -227,9 +244,55 @@ class SemanticPassRegistry:
         )
 
     def run_enabled(self, ast_cache_items: Iterable[AstCacheItem]) -> list[str]:
-        items = tuple(ast_cache_items)
+        # (H) Walk re-iterable views per pass rather than copying every tree.
+        items = (
+            ast_cache_items
+            if isinstance(ast_cache_items, Collection)
+            else tuple(ast_cache_items)
+        )
+        # (H) Each pass reads every file before the next pass starts, so the
+        # (H) memo must hold the whole run (per decode mode, plus the extra repo
+        # (H) files config discovery reads) or the LRU evicts before any reuse.
+        context = replace(
+            self.context,
+            source_cache=self.context.source_cache
+            or ParsedSourceCache(
+                source_store=self.context.source_store,
+                max_entries=2 * len(items) + cs.PARSED_SOURCE_CACHE_MAX_ENTRIES,
+            ),
+        )
+        passes = [
+            (definition, definition.factory(context))
+            for definition in self.enabled_definitions()
+        ]
+        visitor = FusedAstVisitor(
+            subscription
+            for _, semantic_pass in passes
+            for subscription in _node_subscriptions(semantic_pass)
+        )
+        if visitor:
+            visitor.walk(items)
+        timings = dict(visitor.stats.pass_seconds)
         executed: list[str] = []
-        for definition in self.enabled_definitions():
-            definition.factory(self.context).process_ast_cache(items)
+        for definition, semantic_pass in passes:
+            started = time.perf_counter()
+            semantic_pass.process_ast_cache(items)
+            timings[definition.pass_id] = (
+                timings.get(definition.pass_id, 0.0) + time.perf_counter() - started
+            )
             executed.append(definition.pass_id)
+        self.last_walk_stats = visitor.stats
+        self.last_timings = timings
+        cache = cast(ParsedSourceCache, context.source_cache)
+        logger.debug(
+            "Semantic passes: {} file read(s), {} parse(s), {} shared hit(s)",
+            cache.reads,
+            cache.parses,
+            cache.hits,
+        )
         return executed
+
+
+def _node_subscriptions(semantic_pass: object) -> Iterable[NodeSubscription]:
+    subscriptions = getattr(semantic_pass, "node_subscriptions", None)
+    return subscriptions() if callable(subscriptions) else ()
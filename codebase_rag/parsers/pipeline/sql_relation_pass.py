@@ -35,6 +35,15 @@ from codebase_rag.infrastructure.language_spec import (
     _generic_file_to_module,
     _sql_get_name,
 )
+from codebase_rag.parsers.pipeline.fused_visitor import (
+    FusedAstVisitor,
+    NodeSubscription,
+    iter_tree,
+)
+
+_NAMED_DDL_TYPES = frozenset(
+    {"create_table", "create_index", "create_view", "create_materialized_view"}
+)
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -43,9 +52,7 @@ from codebase_rag.infrastructure.language_spec import (
 
 def _walk(node: Node) -> Iterable[Node]:
     """Depth-first walk of the entire subtree rooted at *node*."""
-    yield node
-    for child in node.children:
-        yield from _walk(child)
+    return iter_tree(node)
 
 
 def _text(node: Node | None) -> str | None:
@@ -313,6 +320,7 @@ class SqlRelationPass:
         self.repo_path = repo_path
         self.project_name = project_name
         self.function_registry = function_registry
+        self.table_qn_lookup: dict[str, str] = {}
 
         self.enabled = os.getenv("CODEGRAPH_SQL_RELATIONS", "1").lower() not in {
             "0",
@@ -324,11 +332,30 @@ class SqlRelationPass:
     # Entry point
     # ------------------------------------------------------------------
 
+    def node_subscriptions(self) -> tuple[NodeSubscription, ...]:
+        """Subscribes the table-name discovery walk to named SQL DDL nodes."""
+        return (
+            NodeSubscription(
+                pass_id="sql_relations",
+                node_types=_NAMED_DDL_TYPES,
+                visit=self._record_table_name,
+                languages=frozenset({cs.SupportedLanguage.SQL}),
+            ),
+        )
+
     def process_ast_cache(
         self,
         ast_items: Iterable[tuple[Path, tuple[Node, cs.SupportedLanguage]]],
+        *,
+        discovered: bool = False,
     ) -> None:
-        """Iterate all cached ASTs; process SQL files only."""
+        """Iterate all cached ASTs; process SQL files only.
+
+        Args:
+            ast_items: ``(file_path, (root_node, language))`` pairs from the AST cache.
+            discovered: ``True`` when :meth:`node_subscriptions` were already fed
+                by a shared walk, so table names need not be collected again.
+        """
         if not self.enabled:
             return
 
@@ -341,21 +368,12 @@ class SqlRelationPass:
             return
 
         # First pass: build table_name → qn lookup from every SQL file
-        table_qn_lookup: dict[str, str] = {}
-        for file_path, root_node in sql_items:
-            for node in _walk(root_node):
-                if node.type in (
-                    "create_table",
-                    "create_index",
-                    "create_view",
-                    "create_materialized_view",
-                ):
-                    name = _sql_get_name(node)
-                    if name:
-                        qn = _build_sql_qn(
-                            name, file_path, self.repo_path, self.project_name
-                        )
-                        table_qn_lookup[name] = qn
+        if not discovered:
+            FusedAstVisitor(self.node_subscriptions()).walk(
+                (file_path, (root_node, cs.SupportedLanguage.SQL))
+                for file_path, root_node in sql_items
+            )
+        table_qn_lookup = self.table_qn_lookup
 
         # Second pass: extract relationships
         for file_path, root_node in sql_items:
@@ -370,6 +388,13 @@ class SqlRelationPass:
             len(table_qn_lookup),
         )
 
+    def _record_table_name(self, file_path: Path, node: Node) -> None:
+        name = _sql_get_name(node)
+        if name:
+            self.table_qn_lookup[name] = _build_sql_qn(
+                name, file_path, self.repo_path, self.project_name
+            )
+
     # ------------------------------------------------------------------
     # Per-file dispatch
     # ------------------------------------------------------------------
@@ -17,7 +17,10 @@ from loguru import logger
 from codebase_rag.core import constants as cs
 from codebase_rag.core import logs
 from codebase_rag.data_models.types_defs import LanguageQueries, NodeIdentifier
-from codebase_rag.infrastructure.language_spec import get_language_spec_for_path
+from codebase_rag.infrastructure.language_spec import (
+    LANGUAGE_SPECS,
+    get_language_spec_for_path,
+)
 from codebase_rag.services import IngestorProtocol
 from codebase_rag.utils.path_utils import (
     compute_file_hash,
@@ -62,6 +65,7 @@ class StructureProcessor:
         self.project_name = project_name
         self.queries = queries
         self.structural_elements: dict[Path, str | None] = {}
+        self.languages: set[cs.SupportedLanguage] = set()
         self.unignore_paths = unignore_paths
         self.exclude_paths = exclude_paths
 
@@ -92,18 +96,35 @@ class StructureProcessor:
 
         This method performs a recursive walk of the repository, determines whether
         each directory is a package or a simple folder, and creates the corresponding
-        nodes and relationships in the graph.
+        nodes and relationships in the graph. The same walk records the languages
+        present in `languages`, which drives on-demand grammar loading.
         """
         directories = {self.repo_path}
         for path in self.repo_path.rglob(cs.GLOB_ALL):
-            if path.is_dir() and not should_skip_path(
-                path,
-                self.repo_path,
-                exclude_paths=self.exclude_paths,
-                unignore_paths=self.unignore_paths,
+            if path.is_dir():
+                if not should_skip_path(
+                    path,
+                    self.repo_path,
+                    exclude_paths=self.exclude_paths,
+                    unignore_paths=self.unignore_paths,
+                ):
+                    directories.add(path)
+                continue
+            lang_spec = get_language_spec_for_path(path)
+            if (
+                lang_spec is not None
+                and isinstance(lang_spec.language, cs.SupportedLanguage)
+                and lang_spec.language not in self.languages
+                and not should_skip_path(
+                    path,
+                    self.repo_path,
+                    exclude_paths=self.exclude_paths,
+                    unignore_paths=self.unignore_paths,
+                )
             ):
-                directories.add(path)
+                self.languages.add(lang_spec.language)
 
+        package_indicators = self._package_indicators()
         for root in sorted(directories):
             relative_root = root.relative_to(self.repo_path)
 
@@ -111,12 +132,6 @@ class StructureProcessor:
             parent_container_qn = self.structural_elements.get(parent_rel_path)
 
             is_package = False
-            package_indicators: set[str] = set()
-
-            for lang_queries in self.queries.values():
-                lang_config = lang_queries[cs.QUERY_CONFIG]
-                package_indicators.update(lang_config.package_indicators)
-
             for indicator in package_indicators:
                 if (root / indicator).exists():
                     is_package = True
@@ -183,6 +198,24 @@ class StructureProcessor:
                     (cs.NodeLabel.FOLDER, cs.KEY_PATH, to_posix(relative_root)),
                 )
 
+    def _package_indicators(self) -> set[str]:
+        """
+        Collects the package indicator files of the loaded and detected languages.
+
+        Detected languages contribute through their `LanguageSpec` so that package
+        detection does not have to wait for their grammars to be loaded.
+
+        Returns:
+            set[str]: File names that mark a directory as a package.
+        """
+        package_indicators: set[str] = set()
+        for lang_queries in tuple(self.queries.values()):
+            lang_config = lang_queries[cs.QUERY_CONFIG]
+            package_indicators.update(lang_config.package_indicators)
+        for language in self.languages:
+            package_indicators.update(LANGUAGE_SPECS[language].package_indicators)
+        return package_indicators
+
     def process_generic_file(self, file_path: Path, file_name: str) -> None:
         """
         Processes a generic file, creating a `File` node and linking it to its parent container.
@@ -52,14 +52,18 @@ class TestCaseObservation:
 
 
 def extract_python_test_cases(
-    source: str, *, default_suite_name: str
+    source: str,
+    *,
+    default_suite_name: str,
+    tree: ast.Module | None = None,
 ) -> list[TestCaseObservation]:
     """Extracts pytest and unittest test cases from Python source."""
 
-    try:
-        tree = ast.parse(source)
-    except SyntaxError:
-        return []
+    if tree is None:
+        try:
+            tree = ast.parse(source)
+        except SyntaxError:
+            return []
 
     cases: list[TestCaseObservation] = []
     for node in tree.body:
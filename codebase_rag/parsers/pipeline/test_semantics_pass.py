@@ -8,6 +8,7 @@ from loguru import logger
 from tree_sitter import Node
 
 from codebase_rag.core import constants as cs
+from codebase_rag.parsers.pipeline.fused_visitor import ParsedSourceCache
 from codebase_rag.parsers.pipeline.openapi_contracts import (
     extract_openapi_contract_surface,
 )
@@ -37,11 +38,13 @@ class TestSemanticsPass:
         repo_path: Path,
         project_name: str,
         function_registry,
+        source_cache: ParsedSourceCache | None = None,
     ) -> None:
         self.ingestor = ingestor
         self.repo_path = repo_path
         self.project_name = project_name
         self.function_registry = function_registry
+        self.source_cache = source_cache or ParsedSourceCache()
         self.enabled = is_semantic_pass_enabled("CODEGRAPH_TEST_SEMANTICS")
         self._endpoint_qn_cache: dict[tuple[str, str], str | None] = {}
 
@@ -71,13 +74,16 @@ class TestSemanticsPass:
                 and file_path.suffix == cs.EXT_PY
             ):
                 cases = extract_python_test_cases(
-                    source, default_suite_name=default_suite_name
+                    source,
+                    default_suite_name=default_suite_name,
+                    tree=self.source_cache.python_tree(source),
                 )
             elif language in {cs.SupportedLanguage.JS, cs.SupportedLanguage.TS} and (
                 file_path.suffix in {*cs.JS_EXTENSIONS, *cs.TS_EXTENSIONS}
             ):
                 cases = extract_javascript_test_cases(
-                    source, default_suite_name=default_suite_name
+                    source,
+                    default_suite_name=default_suite_name,
                 )
             else:
                 continue
@@ -156,7 +162,9 @@ class TestSemanticsPass:
                 language == cs.SupportedLanguage.PYTHON
                 and file_path.suffix == cs.EXT_PY
             ):
-                contract_defs = extract_python_contracts(source)
+                contract_defs = extract_python_contracts(
+                    source, tree=self.source_cache.python_tree(source)
+                )
             elif language == cs.SupportedLanguage.TS and file_path.suffix in {
                 cs.EXT_TS,
                 cs.EXT_TSX,
@@ -475,9 +483,5 @@ LIMIT 1
     def _relative_path(self, file_path: Path) -> str:
         return str(file_path.relative_to(self.repo_path)).replace("\\", "/")
 
-    @staticmethod
-    def _read_source(file_path: Path) -> str | None:
-        try:
-            return file_path.read_text(encoding=cs.ENCODING_UTF8)
-        except Exception:
-            return None
+    def _read_source(self, file_path: Path) -> str | None:
+        return self.source_cache.read(file_path)
@@ -8,6 +8,7 @@ from loguru import logger
 from tree_sitter import Node
 
 from codebase_rag.core import constants as cs
+from codebase_rag.parsers.pipeline.fused_visitor import ParsedSourceCache
 from codebase_rag.parsers.pipeline.python_transaction_flows import (
     SideEffectObservation,
     TransactionBoundaryObservation,
@@ -36,11 +37,13 @@ class TransactionFlowPass:
         repo_path: Path,
         project_name: str,
         function_registry,
+        source_cache: ParsedSourceCache | None = None,
     ) -> None:
         self.ingestor = ingestor
         self.repo_path = repo_path
         self.project_name = project_name
         self.function_registry = function_registry
+        self.source_cache = source_cache or ParsedSourceCache()
         self.enabled = is_semantic_pass_enabled("CODEGRAPH_TRANSACTION_FLOW_SEMANTICS")
 
     def process_ast_cache(
@@ -60,7 +63,9 @@ class TransactionFlowPass:
             source = self._read_source(file_path)
             if source is None:
                 continue
-            boundaries, side_effects = extract_python_transaction_flows(source)
+            boundaries, side_effects = extract_python_transaction_flows(
+                source, tree=self.source_cache.python_tree(source)
+            )
             if not boundaries and not side_effects:
                 continue
             relative_path = self._relative_path(file_path)
@@ -457,9 +462,5 @@ class TransactionFlowPass:
     def _relative_path(self, file_path: Path) -> str:
         return str(file_path.relative_to(self.repo_path)).replace("\\", "/")
 
-    @staticmethod
-    def _read_source(file_path: Path) -> str | None:
-        try:
-            return file_path.read_text(encoding=cs.ENCODING_UTF8)
-        except Exception:
-            return None
+    def _read_source(self, file_path: Path) -> str | None:
+        return self.source_cache.read(file_path)
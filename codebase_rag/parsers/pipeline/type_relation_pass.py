@@ -24,6 +24,7 @@ from codebase_rag.data_models.types_defs import (
     LanguageQueries,
 )
 from codebase_rag.services import IngestorProtocol
+from codebase_rag.utils.source_store import SourceStore
 
 
 class TypeRelationPass:
@@ -44,6 +45,8 @@ class TypeRelationPass:
         project_name: str,
         queries: dict[cs.SupportedLanguage, LanguageQueries],
         function_registry: FunctionRegistryTrieProtocol,
+        *,
+        source_store: SourceStore | None = None,
     ) -> None:
         """
         Initializes the TypeRelationPass.
@@ -54,8 +57,10 @@ class TypeRelationPass:
             project_name (str): The name of the project.
             queries (dict): A dictionary of language-specific tree-sitter queries.
             function_registry (FunctionRegistryTrieProtocol): A trie of all known functions/types.
+            source_store (SourceStore | None): Shared run-scoped file contents.
         """
         self.ingestor = ingestor
+        self.source_store = source_store or SourceStore()
         self.repo_path = repo_path
         self.project_name = project_name
         self.queries = queries
@@ -89,9 +94,8 @@ class TypeRelationPass:
                 cs.SupportedLanguage.PHP,
             }:
                 continue
-            try:
-                source = file_path.read_text(encoding="utf-8", errors="ignore")
-            except Exception:
+            source = self.source_store.read_text(file_path)
+            if source is None:
                 continue
 
             module_qn = self._module_qn_for_path(file_path)
@@ -10,6 +10,7 @@ from tree_sitter import Node, Query, QueryCursor
 
 from codebase_rag.core import constants as cs
 from codebase_rag.parsers.core.cache_manager import CacheManager
+from codebase_rag.parsers.core.query_cache import compile_query
 from codebase_rag.parsers.core.utils import normalize_query_captures
 
 _SCM_LANGUAGE_ALIAS: dict[str, str] = {
@@ -416,7 +417,7 @@ class QueryEngine:
             if not lang_obj:
                 raise ValueError(f"Cannot load language: {language}")
 
-            compiled = Query(lang_obj, query_string)
+            compiled = compile_query(lang_obj, query_string)
 
             logger.debug(f"Compiled query {language}.{query_name}")
 
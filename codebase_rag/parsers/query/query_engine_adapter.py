@@ -8,6 +8,7 @@ from tree_sitter import Language, Parser, Query
 
 from codebase_rag.core import constants as cs
 from codebase_rag.data_models.types_defs import LanguageQueries
+from codebase_rag.parsers.core.query_cache import compile_query, query_compiles
 
 _QUERY_NAME_MAP: dict[cs.SupportedLanguage, dict[str, str | list[str]]] = {
     cs.SupportedLanguage.PYTHON: {
@@ -484,7 +485,7 @@ def _compile_query(
     if not query_text.strip():
         return None
     try:
-        return Query(language, query_text)
+        return compile_query(language, query_text)
     except Exception as e:
         if log_warning:
             logger.warning(f"Failed to compile SCM query: {e}")
@@ -575,7 +576,7 @@ def _apply_language_override(
             )
             if not normalized_part:
                 continue
-            if _compile_query(language_obj, normalized_part, log_warning=False):
+            if query_compiles(language_obj, normalized_part):
                 valid_parts.append(normalized_part)
             else:
                 invalid_parts += 1
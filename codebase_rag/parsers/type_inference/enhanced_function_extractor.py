@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from collections.abc import Iterable
+from collections.abc import Iterable, Sequence
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -17,6 +17,10 @@ from codebase_rag.parsers.core.utils import (
 from codebase_rag.parsers.handlers.registry import get_handler
 from codebase_rag.utils.fqn_resolver import resolve_fqn_from_ast
 
+THROW_NODE_TYPES = frozenset({"raise_statement", "throw_statement"})
+CATCH_NODE_TYPES = frozenset({"except_clause", "catch_clause"})
+EXCEPTION_NODE_TYPES = THROW_NODE_TYPES | CATCH_NODE_TYPES
+
 
 @dataclass(frozen=True)
 class FunctionMetadata:
@@ -65,6 +69,7 @@ class EnhancedFunctionExtractor:
         root_node: Node,
         language: cs.SupportedLanguage,
         queries: dict,
+        exception_nodes: Sequence[Node] | None = None,
     ) -> list[FunctionMetadata]:
         """
         Extracts function metadata from the given AST root node.
@@ -74,6 +79,10 @@ class EnhancedFunctionExtractor:
             root_node (Node): The root AST node.
             language (cs.SupportedLanguage): The language of the file.
             queries (dict): Queries dictionary for the language.
+            exception_nodes (Sequence[Node] | None): Throw and catch nodes of
+                this file, in document order, already collected by a shared
+                walk. When given, each is attributed to its enclosing functions
+                instead of walking every function body again.
 
         Returns:
             list[FunctionMetadata]: A list of extracted function metadata objects.
@@ -91,11 +100,18 @@ class EnhancedFunctionExtractor:
 
         _, captures = result
         functions: list[FunctionMetadata] = []
-
-        for func_node in captures.get(cs.CAPTURE_FUNCTION, []):
-            if not isinstance(func_node, Node):
-                continue
-
+        func_nodes = [
+            node
+            for node in captures.get(cs.CAPTURE_FUNCTION, [])
+            if isinstance(node, Node)
+        ]
+        exceptions_by_function = (
+            None
+            if exception_nodes is None
+            else self._exceptions_by_function(func_nodes, exception_nodes)
+        )
+
+        for func_node in func_nodes:
             is_method = is_method_node(func_node, lang_spec)
             name = self._extract_function_name(func_node)
             if not name:
@@ -116,7 +132,10 @@ class EnhancedFunctionExtractor:
             decorators = handler.extract_decorators(func_node)
             return_type = self._extract_return_type(func_node)
             parameter_types = self._extract_parameter_types(func_node)
-            thrown, caught = self._extract_exception_types(func_node)
+            if exceptions_by_function is None:
+                thrown, caught = self._extract_exception_types(func_node)
+            else:
+                thrown, caught = exceptions_by_function.get(func_node.id, ([], []))
 
             functions.append(
                 FunctionMetadata(
@@ -315,15 +334,49 @@ class EnhancedFunctionExtractor:
         caught: list[str] = []
 
         for node in self._walk_nodes(func_node):
-            if node.type in {"raise_statement", "throw_statement"}:
+            if node.type in THROW_NODE_TYPES:
                 if exc_type := self._extract_exception_from_throw(node):
                     thrown.append(exc_type)
-            if node.type in {"except_clause", "catch_clause"}:
+            if node.type in CATCH_NODE_TYPES:
                 if exc_type := self._extract_exception_from_catch(node):
                     caught.append(exc_type)
 
         return thrown, caught
 
+    def _exceptions_by_function(
+        self, func_nodes: Sequence[Node], exception_nodes: Sequence[Node]
+    ) -> dict[int, tuple[list[str], list[str]]]:
+        """
+        Attributes pre-collected throw and catch nodes to their enclosing functions.
+
+        A node counts for every function it is nested in, matching what
+        :meth:`_extract_exception_types` finds by walking each function body.
+
+        Args:
+            func_nodes (Sequence[Node]): The captured function nodes of the file.
+            exception_nodes (Sequence[Node]): Throw and catch nodes in document order.
+
+        Returns:
+            dict[int, tuple[list[str], list[str]]]: ``(thrown, caught)`` keyed by
+                function node id.
+        """
+        found: dict[int, tuple[list[str], list[str]]] = {
+            node.id: ([], []) for node in func_nodes
+        }
+        for node in exception_nodes:
+            if node.type in THROW_NODE_TYPES:
+                exc_type, slot = self._extract_exception_from_throw(node), 0
+            else:
+                exc_type, slot = self._extract_exception_from_catch(node), 1
+            if not exc_type:
+                continue
+            current = node.parent
+            while current is not None:
+                if (entry := found.get(current.id)) is not None:
+                    entry[slot].append(exc_type)
+                current = current.parent
+        return found
+
     def _extract_exception_from_throw(self, node: ASTNode) -> str | None:
         """
         Extracts the exception class name from a throw/raise statement.
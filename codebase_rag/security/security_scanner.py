@@ -1,11 +1,19 @@
 from __future__ import annotations
 
+import multiprocessing
 import re
-from collections.abc import Iterable
-from dataclasses import dataclass
+from bisect import bisect_left
+from collections.abc import Iterable, Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, replace
+from functools import lru_cache
 from pathlib import Path
 
+from loguru import logger
+
 from codebase_rag.core import constants as cs
+from codebase_rag.core.config import settings
 from codebase_rag.core.config_semantic_identity import (
     is_secret_like_name,
     normalize_env_name,
@@ -42,67 +50,484 @@ class SecurityFinding:
         return payload
 
 
+# Non-ASCII characters the regex engine folds onto ASCII letters under
+# IGNORECASE. Replacing them before lowercasing mirrors the engine exactly for
+# ASCII literals and keeps string offsets unchanged.
+_ASCII_CASE_FOLDS = (
+    ("\u0130", "i"),
+    ("\u0131", "i"),
+    ("\u017f", "s"),
+    ("\u212a", "k"),
+)
+_QUANTIFIER_RE = re.compile(r"(?:[*+?]|\{(?:\d+|\d*,\d*)\})[?+]?")
+_GLOBAL_FLAGS_RE = re.compile(r"\(\?[aiLmsux]+\)")
+_CLASS_ESCAPES = frozenset("dDwWsSntrfva")
+_ASSERTION_ESCAPES = frozenset("bBAZ")
+_HEX_ESCAPE_LENGTHS = {"x": 2, "u": 4, "U": 8}
+_ITEM_LITERAL = "literal"
+_ITEM_CLASS = "class"
+_ITEM_ASSERTION = "at"
+_ITEM_OTHER = "other"
+
+
+@dataclass(frozen=True, slots=True)
+class _PatternItem:
+    kind: str
+    source: str
+    repeated: bool = False
+
+
+@dataclass(frozen=True, slots=True)
+class _CompiledPattern:
+    name: str
+    regex: re.Pattern[str]
+    category: str
+    # Literal runs every match contains; ASCII ones are lowercased when folded.
+    anchors: tuple[str, ...] = ()
+    # First anchor, with the single-character classes that may precede it.
+    lead: str | None = None
+    lead_regex: re.Pattern[str] | None = None
+    prefix: tuple[re.Pattern[str], ...] | None = None
+
+    @property
+    def folded(self) -> bool:
+        return bool(self.regex.flags & re.IGNORECASE)
+
+
+class _ScanText:
+    __slots__ = ("_contains", "_folded", "_lines", "_newlines", "text")
+
+    def __init__(self, text: str) -> None:
+        self.text = text
+        self._folded: str | None = None
+        self._newlines: list[int] | None = None
+        self._lines: list[str] | None = None
+        self._contains: dict[tuple[str, bool], bool] = {}
+
+    @property
+    def folded(self) -> str:
+        if self._folded is None:
+            folded = self.text
+            if not folded.isascii():
+                for source, target in _ASCII_CASE_FOLDS:
+                    if source in folded:
+                        folded = folded.replace(source, target)
+            self._folded = folded.lower()
+        return self._folded
+
+    def contains(self, literal: str, *, folded: bool) -> bool:
+        key = (literal, folded)
+        found = self._contains.get(key)
+        if found is None:
+            found = literal in (self.folded if folded else self.text)
+            self._contains[key] = found
+        return found
+
+    def line_number(self, offset: int) -> int:
+        if self._newlines is None:
+            self._newlines = _newline_offsets(self.text)
+        return bisect_left(self._newlines, offset) + 1
+
+    def line_text(self, line_number: int) -> str:
+        if self._lines is None:
+            self._lines = self.text.splitlines()
+        return (
+            self._lines[line_number - 1] if 0 < line_number <= len(self._lines) else ""
+        )
+
+
+def _newline_offsets(text: str) -> list[int]:
+    offsets: list[int] = []
+    position = text.find("\n")
+    while position != -1:
+        offsets.append(position)
+        position = text.find("\n", position + 1)
+    return offsets
+
+
+def _category_for_pattern(pattern_name: str) -> str:
+    if pattern_name.startswith("sql_"):
+        return "sql"
+    if pattern_name.startswith("xss_"):
+        return "xss"
+    return "secret"
+
+
+def _pattern_items(pattern: str) -> list[_PatternItem] | None:
+    # Top-level items of a pattern, enough to find its literal runs and the
+    # single-character items before them. Anything not classified with
+    # certainty (alternation, backreferences, octal or named escapes) returns
+    # None so the pattern is scanned with a plain finditer.
+    items: list[_PatternItem] = []
+    index = 0
+    while index < len(pattern):
+        char = pattern[index]
+        quantifier = _QUANTIFIER_RE.match(pattern, index)
+        if quantifier is not None:
+            if not items or items[-1].repeated or items[-1].kind == _ITEM_ASSERTION:
+                return None
+            items[-1] = replace(items[-1], repeated=True)
+            index = quantifier.end()
+            continue
+        end = index + 1
+        if char in {"|", ")"}:
+            return None
+        if char == "\\":
+            if end >= len(pattern):
+                return None
+            escape = pattern[end]
+            end += 1
+            if escape in _HEX_ESCAPE_LENGTHS:
+                end += _HEX_ESCAPE_LENGTHS[escape]
+                kind = _ITEM_CLASS
+            elif escape in _ASSERTION_ESCAPES:
+                kind = _ITEM_ASSERTION
+            elif escape in _CLASS_ESCAPES:
+                kind = _ITEM_CLASS
+            elif escape.isascii() and escape.isalnum():
+                return None
+            else:
+                kind = _ITEM_LITERAL
+        elif char == "[":
+            class_end = _class_end(pattern, index)
+            if class_end is None:
+                return None
+            end, kind = class_end, _ITEM_CLASS
+        elif char == "(":
+            # Global inline flags are already folded into the compiled flags.
+            if flags := _GLOBAL_FLAGS_RE.match(pattern, index):
+                index = flags.end()
+                continue
+            group_end = _group_end(pattern, index)
+            if group_end is None:
+                return None
+            end, kind = group_end, _ITEM_OTHER
+        elif char == ".":
+            kind = _ITEM_CLASS
+        elif char in "^$":
+            kind = _ITEM_ASSERTION
+        else:
+            kind = _ITEM_LITERAL
+        items.append(_PatternItem(kind, pattern[index:end]))
+        index = end
+    return items
+
+
+def _class_end(pattern: str, start: int) -> int | None:
+    index = start + 1
+    if pattern.startswith("^", index):
+        index += 1
+    if pattern.startswith("]", index):
+        index += 1
+    while index < len(pattern):
+        if pattern[index] == "\\":
+            index += 2
+            continue
+        if pattern[index] == "]":
+            return index + 1
+        index += 1
+    return None
+
+
+def _group_end(pattern: str, start: int) -> int | None:
+    depth = 0
+    index = start
+    while index < len(pattern):
+        char = pattern[index]
+        if char == "\\":
+            index += 2
+            continue
+        if char == "[":
+            class_end = _class_end(pattern, index)
+            if class_end is None:
+                return None
+            index = class_end
+            continue
+        if char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+            if depth == 0:
+                return index + 1
+        index += 1
+    return None
+
+
+def _compile_pattern(name: str, pattern: str) -> _CompiledPattern:
+    category = _category_for_pattern(name)
+    regex = re.compile(pattern, re.IGNORECASE if category == "secret" else 0)
+    items = None if regex.flags & re.VERBOSE else _pattern_items(pattern)
+    if items is None:
+        return _CompiledPattern(name, regex, category)
+    runs: list[tuple[int, str]] = []
+    run: list[str] = []
+    for index, item in enumerate(items):
+        if item.kind == _ITEM_LITERAL and not item.repeated:
+            run.append(item.source[-1])
+            continue
+        if run:
+            runs.append((index - len(run), "".join(run)))
+            run = []
+    if run:
+        runs.append((len(items) - len(run), "".join(run)))
+    if not runs:
+        return _CompiledPattern(name, regex, category)
+    folded = bool(regex.flags & re.IGNORECASE)
+    lead_index, lead = runs[0]
+    return _CompiledPattern(
+        name,
+        regex,
+        category,
+        anchors=tuple(
+            literal.lower() if folded and literal.isascii() else literal
+            for _, literal in runs
+        ),
+        lead=lead,
+        lead_regex=(
+            re.compile(re.escape(lead), regex.flags)
+            if folded and not lead.isascii()
+            else None
+        ),
+        prefix=_prefix_classes(items[:lead_index], regex.flags),
+    )
+
+
+def _prefix_classes(
+    items: Sequence[_PatternItem], flags: int
+) -> tuple[re.Pattern[str], ...] | None:
+    # Anchored scanning needs every item before the lead anchor to consume
+    # single characters; anything else falls back to a plain finditer.
+    classes: list[re.Pattern[str]] = []
+    for item in items:
+        if item.kind == _ITEM_ASSERTION:
+            continue
+        if item.kind == _ITEM_OTHER:
+            return None
+        try:
+            classes.append(re.compile(item.source, flags))
+        except re.error:
+            return None
+    return tuple(classes)
+
+
+@lru_cache(maxsize=8)
+def _compile_patterns(
+    patterns: tuple[tuple[str, str], ...],
+) -> tuple[_CompiledPattern, ...]:
+    return tuple(_compile_pattern(name, pattern) for name, pattern in patterns)
+
+
+def _anchors_present(compiled: _CompiledPattern, scan_text: _ScanText) -> bool:
+    for anchor in compiled.anchors:
+        if not compiled.folded or anchor.isascii():
+            if not scan_text.contains(anchor, folded=compiled.folded):
+                return False
+        elif anchor == compiled.lead and compiled.lead_regex is not None:
+            if compiled.lead_regex.search(scan_text.text) is None:
+                return False
+    return True
+
+
+def _lead_offsets(compiled: _CompiledPattern, scan_text: _ScanText) -> Iterator[int]:
+    lead = compiled.lead
+    if lead is None:
+        return
+    if compiled.folded and not lead.isascii():
+        if compiled.lead_regex is None:
+            return
+        found = compiled.lead_regex.search(scan_text.text)
+        while found is not None:
+            yield found.start()
+            found = compiled.lead_regex.search(scan_text.text, found.start() + 1)
+        return
+    haystack = scan_text.folded if compiled.folded else scan_text.text
+    needle = lead.lower() if compiled.folded else lead
+    offset = haystack.find(needle)
+    while offset != -1:
+        yield offset
+        offset = haystack.find(needle, offset + 1)
+
+
+def _iter_matches(
+    compiled: _CompiledPattern, scan_text: _ScanText
+) -> Iterator[re.Match[str]]:
+    # Same matches as regex.finditer(text): a match must contain an occurrence
+    # of the lead anchor, preceded only by characters of the prefix classes,
+    # so start positions are tried in order around those occurrences only.
+    text = scan_text.text
+    prefix = compiled.prefix
+    if prefix is None:
+        yield from compiled.regex.finditer(text)
+        return
+    regex = compiled.regex
+    position = 0
+    tried = 0
+    for offset in _lead_offsets(compiled, scan_text):
+        floor = max(position, tried)
+        if offset < floor:
+            continue
+        start = offset
+        while start > floor and any(
+            char_class.match(text, start - 1) for char_class in prefix
+        ):
+            start -= 1
+        for candidate in range(start, offset + 1):
+            match = regex.match(text, candidate)
+            if match is not None:
+                yield match
+                position = match.end()
+                break
+        tried = offset + 1
+
+
+def _read_scannable(file_path: Path, max_file_bytes: int) -> str | None:
+    try:
+        if file_path.stat().st_size > max_file_bytes:
+            return None
+        return file_path.read_text(encoding=cs.ENCODING_UTF8, errors="ignore")
+    except Exception:
+        return None
+
+
+def _scan_file_chunk(
+    paths: Sequence[Path],
+    patterns: list[tuple[str, str]],
+    max_file_bytes: int,
+    secret_only: bool,
+) -> list[SecurityFinding]:
+    scanner = SecurityScanner(workers=1, max_file_bytes=max_file_bytes)
+    scanner.patterns = patterns
+    return scanner._scan_paths(paths, secret_only=secret_only)
+
+
 class SecurityScanner:
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        *,
+        workers: int = settings.CODEGRAPH_SECURITY_SCAN_WORKERS,
+        max_file_bytes: int = settings.CODEGRAPH_SECURITY_SCAN_MAX_FILE_BYTES,
+    ) -> None:
         self.patterns = (
             SQL_INJECTION_PATTERNS + XSS_PATTERNS + HARDCODED_SECRET_PATTERNS
         )
+        self.workers = max(1, min(workers, multiprocessing.cpu_count()))
+        self.max_file_bytes = max_file_bytes
 
     def scan_text(self, text: str, path: str) -> list[SecurityFinding]:
+        return self._scan(text, path, secret_only=False)
+
+    def scan_secret_text(self, text: str, path: str) -> list[SecurityFinding]:
+        return self._scan(text, path, secret_only=True)
+
+    def scan_files(self, paths: Iterable[Path]) -> list[SecurityFinding]:
+        return self._scan_files(paths, secret_only=False)
+
+    def scan_secret_files(self, paths: Iterable[Path]) -> list[SecurityFinding]:
+        return self._scan_files(paths, secret_only=True)
+
+    def _scan(
+        self, text: str, path: str, *, secret_only: bool
+    ) -> list[SecurityFinding]:
         findings: list[SecurityFinding] = []
-        lines = text.splitlines()
-        for name, pattern in self.patterns:
-            category = self._category_for_pattern(name)
-            flags = re.IGNORECASE if category == "secret" else 0
-            for match in re.finditer(pattern, text, flags):
-                line_number = text[: match.start()].count("\n") + 1
-                line_text = (
-                    lines[line_number - 1] if 0 < line_number <= len(lines) else ""
-                )
+        scan_text = _ScanText(text)
+        for compiled in _compile_patterns(tuple(self.patterns)):
+            if secret_only and compiled.category != "secret":
+                continue
+            if not _anchors_present(compiled, scan_text):
+                continue
+            for match in _iter_matches(compiled, scan_text):
+                line_number = scan_text.line_number(match.start())
                 findings.append(
                     self._build_finding(
                         path=path,
-                        pattern_name=name,
+                        pattern_name=compiled.name,
                         line_number=line_number,
-                        line_text=line_text,
+                        line_text=(
+                            scan_text.line_text(line_number)
+                            if compiled.category == "secret"
+                            else ""
+                        ),
                         match=match,
                     )
                 )
         return findings
 
-    def scan_secret_text(self, text: str, path: str) -> list[SecurityFinding]:
-        return [
-            finding
-            for finding in self.scan_text(text, path)
-            if finding.category == "secret"
-        ]
-
-    def scan_files(self, paths: Iterable[Path]) -> list[SecurityFinding]:
-        findings: list[SecurityFinding] = []
+    def _scan_files(
+        self, paths: Iterable[Path], *, secret_only: bool
+    ) -> list[SecurityFinding]:
+        sized: list[tuple[Path, int]] = []
         for file_path in paths:
-            if not file_path.exists() or file_path.stat().st_size > 1_000_000:
-                continue
             try:
-                content = file_path.read_text(
-                    encoding=cs.ENCODING_UTF8, errors="ignore"
-                )
-            except Exception:
+                size = file_path.stat().st_size
+            except OSError:
                 continue
-            findings.extend(self.scan_text(content, str(file_path)))
-        return findings
+            if size <= self.max_file_bytes:
+                sized.append((file_path, size))
+        total_bytes = sum(size for _, size in sized)
+        if (
+            self.workers == 1
+            or len(sized) < 2 * self.workers
+            or total_bytes < cs.SECURITY_SCAN_PARALLEL_MIN_BYTES
+        ):
+            return self._scan_paths(
+                [file_path for file_path, _ in sized], secret_only=secret_only
+            )
+        return self._scan_parallel(sized, total_bytes, secret_only=secret_only)
 
-    def scan_secret_files(self, paths: Iterable[Path]) -> list[SecurityFinding]:
+    def _scan_paths(
+        self, paths: Iterable[Path], *, secret_only: bool
+    ) -> list[SecurityFinding]:
         findings: list[SecurityFinding] = []
         for file_path in paths:
-            if not file_path.exists() or file_path.stat().st_size > 1_000_000:
-                continue
-            try:
-                content = file_path.read_text(
-                    encoding=cs.ENCODING_UTF8, errors="ignore"
+            content = _read_scannable(file_path, self.max_file_bytes)
+            if content is not None:
+                findings.extend(
+                    self._scan(content, str(file_path), secret_only=secret_only)
                 )
-            except Exception:
-                continue
-            findings.extend(self.scan_secret_text(content, str(file_path)))
+        return findings
+
+    def _scan_parallel(
+        self, sized: list[tuple[Path, int]], total_bytes: int, *, secret_only: bool
+    ) -> list[SecurityFinding]:
+        # Contiguous chunks keep findings in input order once results are joined.
+        chunk_bytes = max(1, total_bytes // (self.workers * 4))
+        chunks: list[list[Path]] = [[]]
+        filled = 0
+        for file_path, size in sized:
+            if chunks[-1] and filled + size > chunk_bytes:
+                chunks.append([])
+                filled = 0
+            chunks[-1].append(file_path)
+            filled += size
+        logger.debug(
+            "Security scan of {} files ({} bytes) across {} workers",
+            len(sized),
+            total_bytes,
+            self.workers,
+        )
+        findings: list[SecurityFinding] = []
+        try:
+            with ProcessPoolExecutor(
+                max_workers=min(self.workers, len(chunks)),
+                mp_context=multiprocessing.get_context("spawn"),
+            ) as executor:
+                futures = [
+                    executor.submit(
+                        _scan_file_chunk,
+                        chunk,
+                        list(self.patterns),
+                        self.max_file_bytes,
+                        secret_only,
+                    )
+                    for chunk in chunks
+                ]
+                for future in futures:
+                    findings.extend(future.result())
+        except (BrokenProcessPool, OSError) as exc:
+            logger.warning("Parallel security scan failed, scanning inline: {}", exc)
+            return self._scan_paths(
+                [file_path for file_path, _ in sized], secret_only=secret_only
+            )
         return findings
 
     def _build_finding(
@@ -114,7 +539,7 @@ class SecurityScanner:
         line_text: str,
         match: re.Match[str],
     ) -> SecurityFinding:
-        category = self._category_for_pattern(pattern_name)
+        category = _category_for_pattern(pattern_name)
         secret_name = None
         masked = False
         if category == "secret":
@@ -133,14 +558,6 @@ class SecurityScanner:
             masked=masked,
         )
 
-    @staticmethod
-    def _category_for_pattern(pattern_name: str) -> str:
-        if pattern_name.startswith("sql_"):
-            return "sql"
-        if pattern_name.startswith("xss_"):
-            return "xss"
-        return "secret"
-
     def _extract_secret_name(
         self,
         *,
@@ -1,12 +1,18 @@
 from __future__ import annotations
 
+import asyncio
 import json
+import os
 import re
+import threading
 import time
+from collections import OrderedDict
 from pathlib import Path
 from typing import cast
 from urllib.parse import parse_qs, urlparse
 
+from loguru import logger
+
 from codebase_rag.core import constants as cs
 
 
@@ -16,6 +22,12 @@ class AnalysisEvidenceService:
     _MANIFEST_URI = "analysis://manifest"
     _OVERVIEW_URI = "analysis://overview"
     _BUNDLE_ARTIFACT_LIMIT = 8
+    _ARTIFACT_READ_CONCURRENCY = 8
+    _PAYLOAD_CACHE_LIMIT = 32
+    _BUNDLE_ARGUMENTS = ("goal", "context", "qualified_name", "file_path")
+    _ARTIFACT_INDEX_VERSION = 1
+    _ARTIFACT_INDEX_FILENAME = "analysis_artifact_index.json"
+    _SELECTION_FINDING_LIMIT = 3
     _TRUSTED_FINDING_LIMIT = 12
     _IGNORED_FINDING_LIMIT = 8
     _SUMMARY_KEY_BLACKLIST = {"summary", "reason", "metadata", "ui_summary"}
@@ -69,13 +81,22 @@ class AnalysisEvidenceService:
 
     def __init__(self, repo_path: str | Path) -> None:
         self.repo_path = Path(repo_path).resolve()
+        self._payload_cache: OrderedDict[Path, tuple[tuple[int, int], str]] = (
+            OrderedDict()
+        )
+        self._payload_cache_lock = threading.Lock()
+        self._index_path = (
+            self.repo_path / ".codebase_rag" / self._ARTIFACT_INDEX_FILENAME
+        )
+        self._index_entries: dict[str, dict[str, object]] | None = None
+        self._index_lock = threading.Lock()
 
     def list_artifacts(self) -> dict[str, object]:
-        artifacts = [self._artifact_metadata(path) for path in self._artifact_paths()]
+        artifacts = self.load_artifact_metadata()
         return {
             "count": len(artifacts),
             "artifacts": artifacts,
-            "resources": self.list_resources(),
+            "resources": self._resources_for(artifacts),
             "overview": self._build_overview(artifacts),
         }
 
@@ -95,6 +116,11 @@ class AnalysisEvidenceService:
         }
 
     def list_resources(self) -> list[dict[str, object]]:
+        return self._resources_for(self.load_artifact_metadata())
+
+    def _resources_for(
+        self, artifacts: list[dict[str, object]]
+    ) -> list[dict[str, object]]:
         resources: list[dict[str, object]] = [
             {
                 "uri": self._MANIFEST_URI,
@@ -120,14 +146,14 @@ class AnalysisEvidenceService:
                 }
             )
 
-        for path in self._artifact_paths():
-            metadata = self._artifact_metadata(path)
+        for metadata in artifacts:
+            name = str(metadata.get("name", ""))
             resources.append(
                 {
-                    "uri": f"{self._ARTIFACT_URI_PREFIX}{path.name}",
-                    "name": path.stem,
+                    "uri": f"{self._ARTIFACT_URI_PREFIX}{name}",
+                    "name": str(metadata.get("stem", "")),
                     "description": str(metadata.get("summary", "")).strip()
-                    or f"Normalized analysis artifact for {path.name}.",
+                    or f"Normalized analysis artifact for {name}.",
                     "mime_type": "application/json",
                 }
             )
@@ -144,9 +170,7 @@ class AnalysisEvidenceService:
         if normalized_uri == self._MANIFEST_URI:
             return self.list_artifacts()
         if normalized_uri == self._OVERVIEW_URI:
-            return self._build_overview(
-                [self._artifact_metadata(path) for path in self._artifact_paths()]
-            )
+            return self._build_overview(self.load_artifact_metadata())
 
         if normalized_uri.startswith(self._ARTIFACT_URI_PREFIX):
             artifact_name = normalized_uri.removeprefix(self._ARTIFACT_URI_PREFIX)
@@ -154,10 +178,10 @@ class AnalysisEvidenceService:
 
         if normalized_uri.startswith(self._BUNDLE_URI_PREFIX):
             bundle_name = normalized_uri.removeprefix(self._BUNDLE_URI_PREFIX)
+            bundle_name = bundle_name.partition("?")[0]
+            query = parse_qs(parsed.query)
             arguments = {
-                key: values[0]
-                for key, values in parse_qs(parsed.query).items()
-                if values
+                key: query[key][0] for key in self._BUNDLE_ARGUMENTS if query.get(key)
             }
             return self.build_bundle(
                 bundle_name,
@@ -261,7 +285,241 @@ class AnalysisEvidenceService:
         file_path: str | None = None,
         session_state: dict[str, object] | None = None,
     ) -> dict[str, object]:
-        artifacts = [self._artifact_metadata(path) for path in self._artifact_paths()]
+        started = time.perf_counter()
+        artifacts = self.load_artifact_metadata()
+        collected = time.perf_counter()
+        bundle = self._assemble_bundle(
+            bundle_name,
+            artifacts=artifacts,
+            goal=goal,
+            context=context,
+            qualified_name=qualified_name,
+            file_path=file_path,
+            session_state=session_state,
+        )
+        bundle["timings_ms"] = self._bundle_timings(started, collected)
+        return bundle
+
+    def build_bundle_from_artifacts(
+        self,
+        bundle_name: str,
+        artifacts: list[dict[str, object]],
+        *,
+        goal: str | None = None,
+        context: str | None = None,
+        qualified_name: str | None = None,
+        file_path: str | None = None,
+        session_state: dict[str, object] | None = None,
+    ) -> dict[str, object]:
+        # (H) The caller collected the artifacts, so only assembly is timed here.
+        started = time.perf_counter()
+        bundle = self._assemble_bundle(
+            bundle_name,
+            artifacts=artifacts,
+            goal=goal,
+            context=context,
+            qualified_name=qualified_name,
+            file_path=file_path,
+            session_state=session_state,
+        )
+        bundle["timings_ms"] = self._bundle_timings(started)
+        return bundle
+
+    async def build_bundle_async(
+        self,
+        bundle_name: str,
+        *,
+        goal: str | None = None,
+        context: str | None = None,
+        qualified_name: str | None = None,
+        file_path: str | None = None,
+        session_state: dict[str, object] | None = None,
+        max_concurrency: int | None = None,
+    ) -> dict[str, object]:
+        started = time.perf_counter()
+        artifacts = await self.collect_artifact_metadata(max_concurrency)
+        collected = time.perf_counter()
+        bundle = self._assemble_bundle(
+            bundle_name,
+            artifacts=artifacts,
+            goal=goal,
+            context=context,
+            qualified_name=qualified_name,
+            file_path=file_path,
+            session_state=session_state,
+        )
+        bundle["timings_ms"] = self._bundle_timings(started, collected)
+        return bundle
+
+    def load_artifact_metadata(self) -> list[dict[str, object]]:
+        current, stale = self._plan_index_refresh()
+        refreshed = {path.name: self._build_index_entry(path) for path in stale}
+        return self._apply_index_refresh(current, refreshed)
+
+    async def collect_artifact_metadata(
+        self, max_concurrency: int | None = None
+    ) -> list[dict[str, object]]:
+        current, stale = await asyncio.to_thread(self._plan_index_refresh)
+        semaphore = asyncio.Semaphore(
+            max(1, max_concurrency or self._ARTIFACT_READ_CONCURRENCY)
+        )
+
+        async def _load(path: Path) -> tuple[str, dict[str, object]]:
+            async with semaphore:
+                entry = await asyncio.to_thread(self._build_index_entry, path)
+                return path.name, entry
+
+        refreshed = dict(await asyncio.gather(*(_load(path) for path in stale)))
+        return await asyncio.to_thread(self._apply_index_refresh, current, refreshed)
+
+    def _plan_index_refresh(self) -> tuple[list[str], list[Path]]:
+        with self._index_lock:
+            entries = self._loaded_index()
+            current: list[str] = []
+            stale: list[Path] = []
+            for path in self._artifact_paths():
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                current.append(path.name)
+                entry = entries.get(path.name)
+                if (
+                    entry is None
+                    or entry.get("size_bytes") != stat.st_size
+                    or entry.get("mtime_ns") != stat.st_mtime_ns
+                ):
+                    stale.append(path)
+            return current, stale
+
+    def _apply_index_refresh(
+        self, current: list[str], refreshed: dict[str, dict[str, object]]
+    ) -> list[dict[str, object]]:
+        with self._index_lock:
+            entries = self._loaded_index()
+            entries.update(refreshed)
+            removed = set(entries) - set(current)
+            for name in removed:
+                del entries[name]
+            if refreshed or removed:
+                self._persist_index(entries)
+            return [
+                self._materialize_index_entry(entries[name])
+                for name in current
+                if name in entries
+            ]
+
+    def _loaded_index(self) -> dict[str, dict[str, object]]:
+        if self._index_entries is not None:
+            return self._index_entries
+        entries: dict[str, dict[str, object]] = {}
+        try:
+            raw = json.loads(self._index_path.read_text(encoding=cs.ENCODING_UTF8))
+            if (
+                isinstance(raw, dict)
+                and raw.get("version") == self._ARTIFACT_INDEX_VERSION
+                and isinstance(raw.get("artifacts"), dict)
+            ):
+                entries = {
+                    str(name): entry
+                    for name, entry in cast(dict[str, object], raw["artifacts"]).items()
+                    if isinstance(entry, dict)
+                }
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as exc:
+            logger.warning("Ignoring unreadable analysis artifact index: {}", exc)
+        self._index_entries = entries
+        return entries
+
+    def _persist_index(self, entries: dict[str, dict[str, object]]) -> None:
+        payload = {"version": self._ARTIFACT_INDEX_VERSION, "artifacts": entries}
+        tmp_path = self._index_path.with_suffix(".json.tmp")
+        try:
+            self._index_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(
+                json.dumps(payload, ensure_ascii=False, default=str),
+                encoding=cs.ENCODING_UTF8,
+            )
+            os.replace(tmp_path, self._index_path)
+        except OSError as exc:
+            logger.warning("Could not persist analysis artifact index: {}", exc)
+
+    def _build_index_entry(self, report_path: Path) -> dict[str, object]:
+        stat = report_path.stat()
+        metadata = self._artifact_metadata(
+            report_path, payload=self._parse_artifact(report_path)
+        )
+        haystack, finding_summaries = self._artifact_search_text(metadata)
+        return {
+            "size_bytes": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "metadata": metadata,
+            "search": {"text": haystack, "findings": finding_summaries},
+        }
+
+    def _materialize_index_entry(self, entry: dict[str, object]) -> dict[str, object]:
+        metadata = dict(cast(dict[str, object], entry.get("metadata", {})))
+        mtime_ns = self._coerce_int(entry.get("mtime_ns", 0))
+        metadata["freshness"] = self._freshness_payload(mtime_ns / 1_000_000_000)
+        return metadata
+
+    def _search_text_for(self, artifact: dict[str, object]) -> tuple[str, list[str]]:
+        with self._index_lock:
+            entry = (self._index_entries or {}).get(str(artifact.get("name", "")))
+        search = entry.get("search") if entry else None
+        if isinstance(search, dict):
+            search_dict = cast(dict[str, object], search)
+            return (
+                str(search_dict.get("text", "")),
+                [
+                    str(item)
+                    for item in cast(list[object], search_dict.get("findings", []))
+                ],
+            )
+        return self._artifact_search_text(artifact)
+
+    @classmethod
+    def _artifact_search_text(
+        cls, artifact: dict[str, object]
+    ) -> tuple[str, list[str]]:
+        haystack = " ".join(
+            [
+                str(artifact.get("name", "")),
+                str(artifact.get("kind", "")),
+                str(artifact.get("summary", "")),
+            ]
+        ).lower()
+        findings = cast(list[dict[str, object]], artifact.get("trusted_findings", []))
+        finding_summaries = [
+            str(finding.get("summary", "")).lower()
+            for finding in findings[: cls._SELECTION_FINDING_LIMIT]
+        ]
+        return haystack, finding_summaries
+
+    @staticmethod
+    def _bundle_timings(
+        started: float, collected: float | None = None
+    ) -> dict[str, float]:
+        finished = time.perf_counter()
+        timings: dict[str, float] = {}
+        if collected is not None:
+            timings["artifacts"] = round((collected - started) * 1000, 3)
+        timings["assembly"] = round((finished - (collected or started)) * 1000, 3)
+        timings["total"] = round((finished - started) * 1000, 3)
+        return timings
+
+    def _assemble_bundle(
+        self,
+        bundle_name: str,
+        *,
+        artifacts: list[dict[str, object]],
+        goal: str | None,
+        context: str | None,
+        qualified_name: str | None,
+        file_path: str | None,
+        session_state: dict[str, object] | None,
+    ) -> dict[str, object]:
         selected = self._select_bundle_artifacts(
             bundle_name,
             artifacts=artifacts,
@@ -382,7 +640,27 @@ class AnalysisEvidenceService:
         )
 
     def _parse_artifact(self, report_path: Path) -> object:
-        content = report_path.read_text(encoding=cs.ENCODING_UTF8)
+        stat = report_path.stat()
+        cache_key = (stat.st_mtime_ns, stat.st_size)
+        content: str | None = None
+        with self._payload_cache_lock:
+            cached = self._payload_cache.get(report_path)
+            if cached is not None and cached[0] == cache_key:
+                self._payload_cache.move_to_end(report_path)
+                content = cached[1]
+        if content is None:
+            content = report_path.read_text(encoding=cs.ENCODING_UTF8)
+            with self._payload_cache_lock:
+                self._payload_cache[report_path] = (cache_key, content)
+                self._payload_cache.move_to_end(report_path)
+                while len(self._payload_cache) > self._PAYLOAD_CACHE_LIMIT:
+                    self._payload_cache.popitem(last=False)
+        # (H) Parsing the cached text again is cheaper than deep-copying the
+        # (H) parsed tree, and still hands every caller a payload of its own.
+        return self._decode_payload(report_path, content)
+
+    @staticmethod
+    def _decode_payload(report_path: Path, content: str) -> object:
         if report_path.suffix.lower() == ".json":
             try:
                 return json.loads(content)
@@ -390,9 +668,13 @@ class AnalysisEvidenceService:
                 return {"raw_text": content}
         return content
 
-    def _artifact_metadata(self, report_path: Path) -> dict[str, object]:
+    def _artifact_metadata(
+        self, report_path: Path, *, payload: object | None = None
+    ) -> dict[str, object]:
         stat = report_path.stat()
-        parsed_payload = self._parse_artifact(report_path)
+        parsed_payload = (
+            self._parse_artifact(report_path) if payload is None else payload
+        )
         normalized = self._normalize_artifact(report_path, parsed_payload)
         return {
             "name": report_path.name,
@@ -732,20 +1014,11 @@ class AnalysisEvidenceService:
         scored: list[tuple[int, dict[str, object]]] = []
         for artifact in artifacts:
             score = 0
-            haystack = " ".join(
-                [
-                    str(artifact.get("name", "")),
-                    str(artifact.get("kind", "")),
-                    str(artifact.get("summary", "")),
-                ]
-            ).lower()
+            haystack, finding_summaries = self._search_text_for(artifact)
             for keyword in keywords:
                 if keyword and keyword in haystack:
                     score += 2
-            for finding in cast(
-                list[dict[str, object]], artifact.get("trusted_findings", [])
-            )[:3]:
-                summary = str(finding.get("summary", "")).lower()
+            for summary in finding_summaries:
                 for keyword in keywords:
                     if keyword and keyword in summary:
                         score += 1
@@ -0,0 +1,183 @@
+"""
+This module schedules the post-definition linking passes as a dependency graph.
+
+Each `GraphPass` declares the shared resources it reads and writes: the AST
+cache, the function registry, the import mapping, the simple-name lookup, the
+declarative query engine and the graph labels or relationship types it creates
+or links against. Two passes depend on each other only when one writes a
+resource the other touches, so passes that merely read the same inputs run
+concurrently on a worker pool while read-after-write, write-after-write and
+write-after-read hazards keep the declared order. Execution reuses the analysis
+task runner, and every run produces a `PassScheduleReport` with per-pass timings
+and the critical path.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+from codebase_rag.analysis.scheduler import AnalysisTask, TaskOutcome, run_task_graph
+
+AST_CACHE = "ast_cache"
+FUNCTION_REGISTRY = "function_registry"
+IMPORT_MAPPING = "import_mapping"
+SIMPLE_NAME_LOOKUP = "simple_name_lookup"
+QUERY_ENGINE = "query_engine"
+GRAPH_PREFIX = "graph:"
+GRAPH_ANY = f"{GRAPH_PREFIX}*"
+
+_READ_PREFIX = "read:"
+
+
+def graph(*names: str) -> frozenset[str]:
+    """
+    Builds graph resource names for node labels or relationship types.
+
+    Args:
+        *names: Node labels or relationship types touched by a pass.
+
+    Returns:
+        The matching resource names, e.g. ``graph:Endpoint``.
+    """
+    return frozenset(f"{GRAPH_PREFIX}{name}" for name in names)
+
+
+@dataclass(frozen=True)
+class GraphPass:
+    """A linking pass together with the shared resources it reads and writes."""
+
+    name: str
+    run: Callable[[], None]
+    reads: frozenset[str] = frozenset()
+    writes: frozenset[str] = frozenset()
+
+
+@dataclass(frozen=True)
+class PassTiming:
+    name: str
+    seconds: float
+    depends_on: tuple[str, ...]
+    finish: float
+
+
+@dataclass
+class PassScheduleReport:
+    """Per-pass timings of one scheduled run and its critical path."""
+
+    timings: list[PassTiming] = field(default_factory=list)
+    wall_seconds: float = 0.0
+    critical_path: tuple[str, ...] = ()
+    workers: int = 1
+
+    @property
+    def critical_seconds(self) -> float:
+        return max((timing.finish for timing in self.timings), default=0.0)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "workers": self.workers,
+            "wall_seconds": round(self.wall_seconds, 4),
+            "critical_seconds": round(self.critical_seconds, 4),
+            "critical_path": list(self.critical_path),
+            "passes": {
+                timing.name: {
+                    "seconds": round(timing.seconds, 4),
+                    "depends_on": list(timing.depends_on),
+                }
+                for timing in self.timings
+            },
+        }
+
+
+def _expand_reads(passes: Sequence[GraphPass]) -> list[frozenset[str]]:
+    written = frozenset(
+        resource
+        for graph_pass in passes
+        for resource in graph_pass.writes
+        if resource.startswith(GRAPH_PREFIX)
+    )
+    return [
+        (graph_pass.reads - {GRAPH_ANY}) | written
+        if GRAPH_ANY in graph_pass.reads
+        else graph_pass.reads
+        for graph_pass in passes
+    ]
+
+
+def _as_task(graph_pass: GraphPass, reads: frozenset[str]) -> AnalysisTask:
+    writes = graph_pass.writes
+    run = graph_pass.run
+    return AnalysisTask(
+        name=graph_pass.name,
+        run=lambda _summary: run(),
+        inputs=reads | writes | {f"{_READ_PREFIX}{name}" for name in writes},
+        outputs=writes | {f"{_READ_PREFIX}{name}" for name in reads},
+    )
+
+
+def _critical_path(outcomes: Sequence[TaskOutcome]) -> list[PassTiming]:
+    finish: dict[str, float] = {}
+    timings: list[PassTiming] = []
+    for outcome in outcomes:
+        start = max((finish[name] for name in outcome.depends_on), default=0.0)
+        finish[outcome.name] = start + outcome.seconds
+        timings.append(
+            PassTiming(
+                name=outcome.name,
+                seconds=outcome.seconds,
+                depends_on=outcome.depends_on,
+                finish=finish[outcome.name],
+            )
+        )
+    return timings
+
+
+def _finish(timing: PassTiming) -> float:
+    return timing.finish
+
+
+def _backtrack(timings: Sequence[PassTiming]) -> tuple[str, ...]:
+    if not timings:
+        return ()
+    by_name = {timing.name: timing for timing in timings}
+    current = max(timings, key=_finish)
+    path = [current.name]
+    while current.depends_on:
+        current = max((by_name[name] for name in current.depends_on), key=_finish)
+        path.append(current.name)
+    return tuple(reversed(path))
+
+
+def run_graph_passes(
+    passes: Sequence[GraphPass], *, max_workers: int = 1
+) -> PassScheduleReport:
+    """
+    Runs linking passes in declaration order, overlapping independent ones.
+
+    A pass waits for every earlier pass it conflicts with. Reading ``graph:*``
+    conflicts with every graph resource written by any other pass, which suits
+    passes that query the database as a whole. The first pass error is raised.
+
+    Args:
+        passes: The passes in their sequential order.
+        max_workers: Worker threads; ``1`` runs the passes one after another.
+
+    Returns:
+        The per-pass timings, the wall time and the critical path of the run.
+    """
+    tasks = [
+        _as_task(graph_pass, reads)
+        for graph_pass, reads in zip(passes, _expand_reads(passes))
+    ]
+    started = time.perf_counter()
+    outcomes = run_task_graph(tasks, max_workers=max_workers)
+    timings = _critical_path(outcomes)
+    return PassScheduleReport(
+        timings=timings,
+        wall_seconds=time.perf_counter() - started,
+        critical_path=_backtrack(timings),
+        workers=max(max_workers, 1),
+    )
@@ -11,11 +11,14 @@ all buffered data is flushed upon completion.
 
 from __future__ import annotations
 
+import json
 import socket
+import threading
 import types
+import uuid
 from collections import defaultdict
-from collections.abc import Generator, Sequence
-from contextlib import contextmanager
+from collections.abc import Generator, Iterable, Sequence
+from contextlib import closing, contextmanager
 from datetime import UTC, datetime
 from pathlib import Path
 
@@ -38,6 +41,8 @@ from codebase_rag.core.constants import (
 from codebase_rag.data_models.types_defs import (
     BatchParams,
     BatchWrapper,
+    BoundedRows,
+    ConnectionProtocol,
     CursorProtocol,
     GraphData,
     GraphMetadata,
@@ -49,6 +54,7 @@ from codebase_rag.data_models.types_defs import (
     ResultValue,
 )
 from codebase_rag.graph_db.cypher_queries import (
+    CYPHER_BUMP_GRAPH_GENERATION,
     CYPHER_DELETE_ALL,
     CYPHER_DELETE_PROJECT,
     CYPHER_EXPORT_NODES,
@@ -63,6 +69,42 @@ from codebase_rag.graph_db.cypher_queries import (
 
 from ..core import logs as ls
 from ..infrastructure import exceptions as ex
+from ..infrastructure.decorators import synchronized
+
+
+def take_rows_within_budget(
+    rows: Iterable[ResultRow], *, max_rows: int, max_chars: int
+) -> BoundedRows:
+    """
+    Consumes rows until a row or serialized-size budget is exhausted.
+
+    Each row is JSON-encoded exactly once and the running size of the encoded
+    list is tracked incrementally, so iteration stops at the first row that
+    would not fit instead of serializing the whole result up front.
+
+    Args:
+        rows (Iterable[ResultRow]): The rows to consume, typically a stream.
+        max_rows (int): The maximum number of rows to keep.
+        max_chars (int): The maximum length of the kept rows encoded as a JSON list.
+
+    Returns:
+        A `BoundedRows` tuple with the kept rows, whether any row was left out,
+        and how many rows were pulled from the iterable.
+    """
+    encoder = json.JSONEncoder(ensure_ascii=False, default=str)
+    kept: list[ResultRow] = []
+    used_chars = 2
+    scanned = 0
+    for row in rows:
+        scanned += 1
+        if len(kept) >= max_rows:
+            return BoundedRows(kept, True, scanned)
+        row_chars = len(encoder.encode(row)) + (2 if kept else 0)
+        if used_chars + row_chars > max_chars:
+            return BoundedRows(kept, True, scanned)
+        kept.append(row)
+        used_chars += row_chars
+    return BoundedRows(kept, False, scanned)
 
 
 class MemgraphIngestor:
@@ -103,6 +145,10 @@ class MemgraphIngestor:
             raise ValueError(ex.BATCH_SIZE)
         self.batch_size = batch_size
         self.conn: mgclient.Connection | None = None
+        self._lock = threading.RLock()
+        self._idle_stream_conns: list[ConnectionProtocol] = []
+        self._graph_written = False
+        self._derived_depth = 0
         self.node_buffer: list[tuple[str, dict[str, PropertyValue]]] = []
         self.relationship_buffer: list[
             tuple[
@@ -125,23 +171,36 @@ class MemgraphIngestor:
         # unresponsive Memgraph instance does not block the caller indefinitely
         # (mgclient.connect has no built-in connect_timeout parameter).
         _prev_timeout = socket.getdefaulttimeout()
-        socket.setdefaulttimeout(15.0)
+        socket.setdefaulttimeout(cs.MEMGRAPH_CONNECT_TIMEOUT_SECONDS)
         try:
-            if self._username is not None:
-                self.conn = mgclient.connect(
-                    host=self._host,
-                    port=self._port,
-                    username=self._username,
-                    password=self._password,
-                )
-            else:
-                self.conn = mgclient.connect(host=self._host, port=self._port)
+            self.conn = self._connect()
         finally:
             socket.setdefaulttimeout(_prev_timeout)
         self.conn.autocommit = True
         logger.info(ls.MG_CONNECTED)
         return self
 
+    def _connect(self, *, lazy: bool = False) -> ConnectionProtocol:
+        """
+        Opens a new connection to the configured Memgraph instance.
+
+        Args:
+            lazy (bool): Whether results are pulled from the server on demand
+                by `fetchmany` instead of being buffered in full by `execute`.
+
+        Returns:
+            The opened connection.
+        """
+        if self._username is not None:
+            return mgclient.connect(
+                host=self._host,
+                port=self._port,
+                username=self._username,
+                password=self._password,
+                lazy=lazy,
+            )
+        return mgclient.connect(host=self._host, port=self._port, lazy=lazy)
+
     def __exit__(
         self,
         exc_type: type | None,
@@ -164,6 +223,10 @@ class MemgraphIngestor:
                 logger.error(ls.MG_FLUSH_ERROR.format(error=flush_err))
         else:
             self.flush_all()
+        with self._lock:
+            idle, self._idle_stream_conns = self._idle_stream_conns, []
+        for stream_conn in idle:
+            stream_conn.close()
         if self.conn:
             self.conn.close()
             logger.info(ls.MG_DISCONNECTED)
@@ -186,6 +249,89 @@ class MemgraphIngestor:
             if cursor:
                 cursor.close()
 
+    @synchronized
+    def _execute_streaming(
+        self, query: str, params: dict[str, PropertyValue] | None
+    ) -> tuple[ConnectionProtocol, CursorProtocol]:
+        """
+        Executes a read query on a dedicated lazy connection.
+
+        pymgclient's default connection buffers the whole result inside
+        `execute`, so `fetchmany` alone would not bound what is pulled from
+        Memgraph. A lazy connection pulls rows as they are fetched, and closing
+        it discards whatever the server has not sent yet. An idle lazy
+        connection left by an earlier, fully read stream is reused before a new
+        one is opened. Only this step holds the ingestor lock; the pages are
+        read from the private connection afterwards.
+
+        Args:
+            query (str): The Cypher query to execute.
+            params (dict | None): A dictionary of parameters for the query.
+
+        Returns:
+            The lazy connection and its executed cursor; the caller hands both
+            to `_release_streaming`.
+        """
+        if not self.conn:
+            raise ConnectionError(ex.CONN)
+        if self._idle_stream_conns:
+            conn = self._idle_stream_conns.pop()
+        else:
+            conn = self._open_stream_connection()
+        try:
+            cursor = conn.cursor()
+            cursor.execute(query, params or {})
+        except Exception as e:
+            conn.close()
+            logger.error(ls.MG_CYPHER_ERROR.format(error=e))
+            logger.error(ls.MG_CYPHER_QUERY.format(query=query))
+            raise
+        return conn, cursor
+
+    def _open_stream_connection(self) -> ConnectionProtocol:
+        """
+        Opens a lazy connection after checking that Memgraph is reachable.
+
+        mgclient has no connect timeout, and streams are opened from worker
+        threads, so the process-wide socket default must not be changed here.
+        A plain socket with its own timeout probes the server first, which
+        bounds the wait on an unreachable instance.
+
+        Returns:
+            The opened lazy connection.
+        """
+        probe = socket.create_connection(
+            (self._host, self._port), timeout=cs.MEMGRAPH_CONNECT_TIMEOUT_SECONDS
+        )
+        probe.close()
+        return self._connect(lazy=True)
+
+    @synchronized
+    def _release_streaming(
+        self, conn: ConnectionProtocol, cursor: CursorProtocol, *, drained: bool
+    ) -> None:
+        """
+        Closes a stream's cursor and keeps its connection for the next stream.
+
+        A lazy connection can only run another query once its result has been
+        read to the end, so connections of abandoned streams are closed, which
+        also stops the server from sending the rest.
+
+        Args:
+            conn (ConnectionProtocol): The stream's lazy connection.
+            cursor (CursorProtocol): The stream's executed cursor.
+            drained (bool): Whether every row of the result was fetched.
+        """
+        cursor.close()
+        if (
+            drained
+            and self.conn
+            and len(self._idle_stream_conns) < cs.CYPHER_STREAM_MAX_IDLE_CONNECTIONS
+        ):
+            self._idle_stream_conns.append(conn)
+        else:
+            conn.close()
+
     def _cursor_to_results(self, cursor: CursorProtocol) -> list[ResultRow]:
         """
         Converts a database cursor's fetched data into a list of dictionaries.
@@ -203,6 +349,7 @@ class MemgraphIngestor:
             dict[str, ResultValue](zip(column_names, row)) for row in cursor.fetchall()
         ]
 
+    @synchronized
     def _execute_query(
         self,
         query: str,
@@ -233,6 +380,7 @@ class MemgraphIngestor:
                     logger.error(ls.MG_CYPHER_PARAMS.format(params=params))
                 raise
 
+    @synchronized
     def _execute_batch(self, query: str, params_list: Sequence[BatchParams]) -> None:
         """
         Executes a batch query using `UNWIND` for efficient bulk operations.
@@ -243,6 +391,7 @@ class MemgraphIngestor:
         """
         if not self.conn or not params_list:
             return
+        self._mark_graph_written()
         cursor = None
         try:
             cursor = self.conn.cursor()
@@ -264,6 +413,7 @@ class MemgraphIngestor:
             if cursor:
                 cursor.close()
 
+    @synchronized
     def _execute_batch_with_return(
         self, query: str, params_list: Sequence[BatchParams]
     ) -> list[ResultRow]:
@@ -340,6 +490,7 @@ class MemgraphIngestor:
                 pass
         logger.info(ls.MG_INDEXES_DONE)
 
+    @synchronized
     def ensure_node_batch(
         self, label: str, properties: dict[str, PropertyValue]
     ) -> None:
@@ -358,6 +509,7 @@ class MemgraphIngestor:
             logger.debug(ls.MG_NODE_BUFFER_FLUSH.format(size=self.batch_size))
             self.flush_nodes()
 
+    @synchronized
     def ensure_relationship_batch(
         self,
         from_spec: tuple[str, str, PropertyValue],
@@ -399,6 +551,7 @@ class MemgraphIngestor:
             self.flush_nodes()
             self.flush_relationships()
 
+    @synchronized
     def flush_nodes(self) -> None:
         """Flushes the buffered nodes to the database in batches by label."""
         if not self.node_buffer:
@@ -517,6 +670,7 @@ class MemgraphIngestor:
 
         return folder_path, Path(folder_path).name
 
+    @synchronized
     def flush_relationships(self) -> None:
         """Flushes the buffered relationships to the database in batches by pattern."""
         if not self.relationship_buffer:
@@ -678,13 +832,55 @@ class MemgraphIngestor:
 
         return existence_map
 
+    @synchronized
     def flush_all(self) -> None:
         """Flushes all buffered nodes and relationships to the database."""
         logger.info(ls.MG_FLUSH_START)
         self.flush_nodes()
         self.flush_relationships()
+        self._bump_graph_generation()
         logger.info(ls.MG_FLUSH_COMPLETE)
 
+    @contextmanager
+    def derived_writes(self) -> Generator[None, None, None]:
+        """
+        Marks the writes made inside the block as derived from the graph itself.
+
+        Analysis results written back into the graph are rebuilt on every run,
+        so they do not stamp a new ``graph_generation`` and cached graph
+        snapshots stay valid. Writes buffered before the block are flushed and
+        stamped first; writes buffered inside it are flushed on exit.
+        """
+        self.flush_all()
+        self._derived_depth += 1
+        try:
+            yield
+        finally:
+            try:
+                self.flush_all()
+            finally:
+                self._derived_depth -= 1
+
+    def _mark_graph_written(self) -> None:
+        if not self._derived_depth:
+            self._graph_written = True
+
+    def _bump_graph_generation(self) -> None:
+        """Stamps the project after writes so cached graph snapshots go stale."""
+        if not self._graph_written or not self.conn:
+            return
+        self._graph_written = False
+        try:
+            self._execute_query(
+                CYPHER_BUMP_GRAPH_GENERATION,
+                {
+                    cs.KEY_PROJECT_NAME: getattr(self, "project_name", None),
+                    "graph_generation": uuid.uuid4().hex,
+                },
+            )
+        except Exception as exc:
+            logger.warning("Could not bump graph generation: {}", exc)
+
     def fetch_all(
         self, query: str, params: dict[str, PropertyValue] | None = None
     ) -> list[ResultRow]:
@@ -701,6 +897,78 @@ class MemgraphIngestor:
         logger.debug(ls.MG_FETCH_QUERY.format(query=query, params=params))
         return self._execute_query(query, params)
 
+    def stream_rows(
+        self,
+        query: str,
+        params: dict[str, PropertyValue] | None = None,
+        page_size: int = cs.CYPHER_STREAM_PAGE_SIZE,
+    ) -> Generator[ResultRow, None, None]:
+        """
+        Executes a read query and yields rows page by page via `fetchmany`.
+
+        The query runs on its own lazy connection, so rows are only transferred
+        from Memgraph as pages are requested. Closing the generator early (for
+        example once a caller-side budget is exhausted) closes that connection
+        and stops the server from sending the rest of the result; a fully read
+        stream leaves its connection for the next one.
+
+        Args:
+            query (str): The Cypher query to execute.
+            params (dict | None): A dictionary of parameters for the query.
+            page_size (int): The number of rows fetched from the cursor per page.
+
+        Yields:
+            `ResultRow` dictionaries in result order.
+        """
+        logger.debug(ls.MG_FETCH_QUERY.format(query=query, params=params))
+        conn, cursor = self._execute_streaming(query, params)
+        drained = False
+        try:
+            if not cursor.description:
+                drained = True
+                return
+            column_names = [desc.name for desc in cursor.description]
+            while True:
+                page = cursor.fetchmany(max(1, page_size))
+                if not page:
+                    drained = True
+                    return
+                for row in page:
+                    yield dict[str, ResultValue](zip(column_names, row))
+        finally:
+            self._release_streaming(conn, cursor, drained=drained)
+
+    def fetch_bounded(
+        self,
+        query: str,
+        params: dict[str, PropertyValue] | None = None,
+        *,
+        max_rows: int,
+        max_chars: int,
+    ) -> BoundedRows:
+        """
+        Executes a read query and keeps only the rows that fit the given budget.
+
+        Rows are streamed with `fetchmany` over a lazy connection that is closed
+        as soon as the budget is exhausted, so oversized results are never
+        fully pulled from Memgraph. The ingestor lock is only held while the
+        query is sent, not while its rows are read.
+
+        Args:
+            query (str): The Cypher query to execute.
+            params (dict | None): A dictionary of parameters for the query.
+            max_rows (int): The maximum number of rows to keep.
+            max_chars (int): The maximum serialized JSON length of the kept rows.
+
+        Returns:
+            A `BoundedRows` tuple describing the kept rows.
+        """
+        page_size = min(cs.CYPHER_STREAM_PAGE_SIZE, max(1, max_rows) + 1)
+        with closing(self.stream_rows(query, params, page_size=page_size)) as stream:
+            return take_rows_within_budget(
+                stream, max_rows=max_rows, max_chars=max_chars
+            )
+
     def execute_write(
         self, query: str, params: dict[str, PropertyValue] | None = None
     ) -> None:
@@ -712,6 +980,7 @@ class MemgraphIngestor:
             params (dict | None): A dictionary of parameters for the query.
         """
         logger.debug(ls.MG_WRITE_QUERY.format(query=query, params=params))
+        self._mark_graph_written()
         self._execute_query(query, params)
 
     def export_graph_to_dict(self) -> GraphData:
@@ -49,6 +49,7 @@ class GraphUpdateConfig:
     pass2_resolver_enabled: bool
     reparse_registry_enabled: bool
     parse_strict_enabled: bool
+    pass_workers: int
 
 
 class GraphUpdateConfigService:
@@ -163,6 +164,8 @@ class GraphUpdateConfigService:
             "true",
             "yes",
         }
+        pass_workers_env = os.getenv("CODEGRAPH_PASS_WORKERS")
+        pass_workers = int(pass_workers_env) if pass_workers_env else 4
 
         return GraphUpdateConfig(
             ast_cache_ttl=ast_cache_ttl,
@@ -191,4 +194,5 @@ class GraphUpdateConfigService:
             pass2_resolver_enabled=pass2_resolver_enabled,
             reparse_registry_enabled=reparse_registry_enabled,
             parse_strict_enabled=parse_strict_enabled,
+            pass_workers=pass_workers,
         )
@@ -7,7 +7,8 @@ After all files have been parsed and their basic definitions (functions, classes
 have been ingested, this orchestrator runs a series of services in a specific
 order to build the relationships between these definitions. This includes resolving
 function calls, linking type hierarchies, processing framework-specific metadata,
-and analyzing cross-file dependencies.
+and analyzing cross-file dependencies. Passes that do not conflict on the
+resources they declare run concurrently.
 """
 
 from __future__ import annotations
@@ -18,9 +19,22 @@ from loguru import logger
 
 from codebase_rag.core import logs as ls
 
+from .graph_pass_scheduler import (
+    AST_CACHE,
+    FUNCTION_REGISTRY,
+    GRAPH_ANY,
+    IMPORT_MAPPING,
+    QUERY_ENGINE,
+    SIMPLE_NAME_LOOKUP,
+    GraphPass,
+    PassScheduleReport,
+    graph,
+    run_graph_passes,
+)
 from .graph_update_context import GraphUpdaterContext
 
 if TYPE_CHECKING:
+    from codebase_rag.data_models.types_defs import ASTCacheProtocol
     from codebase_rag.parsers.query.declarative_parser import DeclarativeParser
 
 
@@ -41,78 +55,252 @@ class GraphUpdateOrchestrator:
                                            services and data for the update process.
         """
         self.context = context
+        self.last_report = PassScheduleReport()
 
     def run_linking_and_passes(self) -> None:
         """
-        Executes all the linking and post-processing passes in sequence.
+        Executes all the linking and post-processing passes.
 
-        This method is the main entry point for the orchestration logic. It logs
-        the progress as it moves through each pass, from declarative parsing and
-        framework linking to call resolution and type analysis.
+        This method is the main entry point for the orchestration logic. The
+        passes are declared in their sequential order together with the
+        resources they read and write, and `run_graph_passes` overlaps the
+        ones that do not conflict on `config.pass_workers` threads. Passes
+        iterate the live AST cache one entry at a time, so a spilling cache
+        only keeps its bounded set of trees resident.
         """
         ctx = self.context
-
-        ctx.declarative_parser_service.run(
-            cast("DeclarativeParser | None", ctx.declarative_parser),
-            ctx.ast_cache,
-            ctx.queries,
+        self.last_report = run_graph_passes(
+            self.build_passes(ctx.ast_cache), max_workers=ctx.config.pass_workers
+        )
+        report = self.last_report
+        for timing in report.timings:
+            logger.debug(
+                "Pass {} took {:.3f}s (after: {})",
+                timing.name,
+                timing.seconds,
+                ", ".join(timing.depends_on) or "-",
+            )
+        logger.info(
+            "Linking passes finished in {:.2f}s on {} workers; critical path "
+            "{:.2f}s: {}",
+            report.wall_seconds,
+            report.workers,
+            report.critical_seconds,
+            " -> ".join(report.critical_path),
         )
 
-        if ctx.config.framework_metadata_enabled:
-            logger.info("Linking framework endpoints")
-            ctx.resolver_service.process_framework_links(ctx.simple_name_lookup)
+    def build_passes(self, ast_cache: ASTCacheProtocol) -> list[GraphPass]:
+        """
+        Declares the linking passes in order with their reads and writes.
 
-        ctx.resolver_service.process_semantic_passes(ctx.ast_cache)
+        Graph resources name the node labels a pass creates or the labels and
+        relationship types it links against, so a pass that queries or merges
+        onto nodes created by an earlier pass waits for it.
 
-        if (
-            ctx.config.tailwind_metadata_enabled
-            or ctx.config.framework_metadata_enabled
-        ):
-            logger.info("Linking Tailwind usage")
-            ctx.resolver_service.process_tailwind_usage(ctx.ast_cache)
+        Args:
+            ast_cache: The AST cache shared by the passes.
 
-        logger.info(ls.FOUND_FUNCTIONS.format(count=len(ctx.function_registry)))
-        logger.info(ls.PASS_3_CALLS)
-        ctx.resolver_service.process_function_calls(
-            ctx.ast_cache, ctx.factory.call_processor, ctx.queries
-        )
+        Returns:
+            The passes in their sequential order.
+        """
+        ctx = self.context
+        config = ctx.config
+        resolver = ctx.resolver_service
 
-        if ctx.config.pass2_resolver_enabled or ctx.config.framework_metadata_enabled:
-            logger.info("Running resolver pass 2")
-            ctx.resolver_service.process_resolver_pass(ctx.ast_cache)
+        def declarative() -> None:
+            ctx.declarative_parser_service.run(
+                cast("DeclarativeParser | None", ctx.declarative_parser),
+                ast_cache,
+                ctx.queries,
+            )
 
-        ctx.cross_file_resolver_service.log_summary(
-            ctx.factory.import_processor.import_mapping
-        )
+        def framework_links() -> None:
+            if config.framework_metadata_enabled:
+                logger.info("Linking framework endpoints")
+                resolver.process_framework_links(ctx.simple_name_lookup)
 
-        logger.info("Running type relation pass")
-        ctx.resolver_service.process_type_relations(ctx.ast_cache)
+        def tailwind() -> None:
+            if config.tailwind_metadata_enabled or config.framework_metadata_enabled:
+                logger.info("Linking Tailwind usage")
+                resolver.process_tailwind_usage(ast_cache)
 
-        logger.info("Running extended relation pass")
-        ctx.resolver_service.process_extended_relations(ctx.ast_cache)
+        def function_calls() -> None:
+            logger.info(ls.FOUND_FUNCTIONS.format(count=len(ctx.function_registry)))
+            logger.info(ls.PASS_3_CALLS)
+            resolver.process_function_calls(
+                ast_cache, ctx.factory.call_processor, ctx.queries
+            )
 
-        if ctx.config.reparse_registry_enabled:
-            logger.info("Running reparse registry resolver")
-            ctx.resolver_service.process_reparse_registry(ctx.ast_cache)
+        def resolver_pass() -> None:
+            if config.pass2_resolver_enabled or config.framework_metadata_enabled:
+                logger.info("Running resolver pass 2")
+                resolver.process_resolver_pass(ast_cache)
 
-        ctx.factory.definition_processor.process_all_method_overrides()
+        def type_relations() -> None:
+            logger.info("Running type relation pass")
+            resolver.process_type_relations(ast_cache)
 
-        logger.info("Running SQL structural relation pass (columns, FK, indexes)")
-        ctx.resolver_service.process_sql_relations(ctx.ast_cache)
+        def reparse_registry() -> None:
+            if config.reparse_registry_enabled:
+                logger.info("Running reparse registry resolver")
+                resolver.process_reparse_registry(ast_cache)
 
-        logger.info("Running ORM bridge pass (MAPS_TO_TABLE)")
-        ctx.resolver_service.process_orm_bridge(ctx.ast_cache, ctx.simple_name_lookup)
+        def cypher_schema() -> None:
+            logger.info(
+                "Running Cypher schema pass (GraphNodeLabel, constraints, SYNCS_TO)"
+            )
+            resolver.process_cypher_schema(ast_cache)
 
-        logger.info(
-            "Running Cypher schema pass (GraphNodeLabel, constraints, SYNCS_TO)"
-        )
-        ctx.resolver_service.process_cypher_schema(ctx.ast_cache)
+        def context7() -> None:
+            logger.info("Running Context7 semantic bridging")
+            resolver.process_context7_bridging()
 
-        logger.info("Running Context7 semantic bridging")
-        ctx.resolver_service.process_context7_bridging()
+        def topology() -> None:
+            logger.info("Running service/data/infra topology enrichment")
+            resolver.process_topology_enrichment()
 
-        logger.info("Running service/data/infra topology enrichment")
-        ctx.resolver_service.process_topology_enrichment()
+        def runtime_evidence() -> None:
+            logger.info("Running runtime evidence ingest")
+            resolver.process_runtime_evidence()
 
-        logger.info("Running runtime evidence ingest")
-        ctx.resolver_service.process_runtime_evidence()
+        return [
+            GraphPass(
+                "declarative",
+                declarative,
+                reads=frozenset({AST_CACHE}),
+                writes=frozenset({QUERY_ENGINE}),
+            ),
+            GraphPass(
+                "framework_links",
+                framework_links,
+                reads=frozenset({FUNCTION_REGISTRY, SIMPLE_NAME_LOOKUP}),
+                writes=graph(
+                    "Endpoint",
+                    "Contract",
+                    "Asset",
+                    "Hook",
+                    "AuthPolicy",
+                    "AuthScope",
+                    "Block",
+                    "DependencyProvider",
+                ),
+            ),
+            GraphPass(
+                "semantic_passes",
+                lambda: resolver.process_semantic_passes(ast_cache),
+                reads=frozenset({AST_CACHE, FUNCTION_REGISTRY})
+                | graph("Endpoint", "Contract"),
+                writes=graph(
+                    "EventFlow",
+                    "Queue",
+                    "QueryFingerprint",
+                    "SqlQuery",
+                    "CypherQuery",
+                    "DataStore",
+                    "GraphNodeLabel",
+                    "TransactionBoundary",
+                    "SideEffect",
+                    "ClientOperation",
+                    "EnvVar",
+                    "FeatureFlag",
+                    "SecretRef",
+                    "TestCase",
+                    "TestSuite",
+                    "ContractField",
+                    "Contract",
+                ),
+            ),
+            GraphPass(
+                "tailwind",
+                tailwind,
+                reads=frozenset({AST_CACHE}),
+                writes=graph("Asset", "TailwindUtility"),
+            ),
+            GraphPass(
+                "function_calls",
+                function_calls,
+                reads=frozenset({AST_CACHE, FUNCTION_REGISTRY, IMPORT_MAPPING}),
+                writes=graph("CALLS"),
+            ),
+            GraphPass(
+                "resolver_pass",
+                resolver_pass,
+                reads=frozenset({AST_CACHE, FUNCTION_REGISTRY, IMPORT_MAPPING})
+                | graph("Endpoint"),
+                writes=graph("Component", "Endpoint", "Parameter"),
+            ),
+            GraphPass(
+                "cross_file_summary",
+                lambda: ctx.cross_file_resolver_service.log_summary(
+                    ctx.factory.import_processor.import_mapping
+                ),
+                reads=frozenset({IMPORT_MAPPING}),
+            ),
+            GraphPass(
+                "type_relations",
+                type_relations,
+                reads=frozenset({AST_CACHE, FUNCTION_REGISTRY}),
+                writes=graph("Type"),
+            ),
+            GraphPass(
+                "tree_relations",
+                lambda: resolver.process_tree_relations(
+                    ast_cache, ctx.simple_name_lookup
+                ),
+                reads=frozenset({AST_CACHE, FUNCTION_REGISTRY, SIMPLE_NAME_LOOKUP}),
+                writes=graph("Type", "Column", "MAPS_TO_TABLE"),
+            ),
+            GraphPass(
+                "reparse_registry",
+                reparse_registry,
+                reads=frozenset({AST_CACHE, FUNCTION_REGISTRY}),
+                writes=graph("CALLS"),
+            ),
+            GraphPass(
+                "method_overrides",
+                ctx.factory.definition_processor.process_all_method_overrides,
+                reads=frozenset({FUNCTION_REGISTRY}),
+                writes=graph("OVERRIDES"),
+            ),
+            GraphPass(
+                "cypher_schema",
+                cypher_schema,
+                reads=frozenset({AST_CACHE}),
+                writes=graph("GraphNodeLabel", "GraphConstraint", "GraphRelType"),
+            ),
+            GraphPass(
+                "context7",
+                context7,
+                reads=frozenset({GRAPH_ANY}),
+                writes=graph("Library"),
+            ),
+            GraphPass(
+                "topology",
+                topology,
+                reads=frozenset({GRAPH_ANY}),
+                writes=graph(
+                    "Service",
+                    "InfraResource",
+                    "CacheStore",
+                    "GraphqlOperation",
+                    "Queue",
+                    "DataStore",
+                    "EnvVar",
+                    "SecretRef",
+                ),
+            ),
+            GraphPass(
+                "runtime_evidence",
+                runtime_evidence,
+                reads=graph(
+                    "Endpoint",
+                    "EventFlow",
+                    "Queue",
+                    "DataStore",
+                    "Service",
+                    "CacheStore",
+                    "GraphqlOperation",
+                ),
+                writes=graph("RuntimeArtifact", "RuntimeEvent"),
+            ),
+        ]
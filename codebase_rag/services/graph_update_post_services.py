@@ -27,6 +27,7 @@ from codebase_rag.infrastructure.language_spec import LANGUAGE_FQN_SPECS
 from codebase_rag.parsers.core.incremental_cache import GitDeltaCache
 from codebase_rag.parsers.core.pre_scanner import PreScanIndex, PreScanner
 from codebase_rag.parsers.pipeline.cross_file_resolver import CrossFileResolver
+from codebase_rag.parsers.pipeline.fused_visitor import FusedAstVisitor
 from codebase_rag.parsers.pipeline.semantic_pass_registry import (
     SemanticPassContext,
     SemanticPassRegistry,
@@ -38,6 +39,7 @@ from codebase_rag.utils.dependencies import has_semantic_dependencies
 from codebase_rag.utils.fqn_resolver import find_function_source_by_fqn
 from codebase_rag.utils.git_delta import get_git_head
 from codebase_rag.utils.source_extraction import extract_source_with_fallback
+from codebase_rag.utils.source_store import SourceStore
 
 from .protocols import QueryProtocol
 
@@ -67,6 +69,8 @@ class ResolverPassService:
         import_processor,
         module_qn_to_file_path: dict,
         pre_scan_index,
+        *,
+        source_store: SourceStore | None = None,
     ) -> None:
         """Initializes the resolver service."""
         self.ingestor = ingestor
@@ -77,12 +81,14 @@ class ResolverPassService:
         self.import_processor = import_processor
         self.module_qn_to_file_path = module_qn_to_file_path
         self.pre_scan_index = pre_scan_index
+        self.source_store = source_store or SourceStore()
         self.semantic_pass_registry = SemanticPassRegistry(
             SemanticPassContext(
                 ingestor=ingestor,
                 repo_path=repo_path,
                 project_name=project_name,
                 function_registry=function_registry,
+                source_store=self.source_store,
             )
         )
 
@@ -97,6 +103,7 @@ class ResolverPassService:
                 ingestor=self.ingestor,
                 function_registry=self.function_registry,
                 simple_name_lookup=simple_name_lookup,
+                source_store=self.source_store,
             ).link_repo()
         except Exception as exc:
             logger.warning("Framework linker failed: {}", exc)
@@ -113,6 +120,7 @@ class ResolverPassService:
                 repo_path=self.repo_path,
                 project_name=self.project_name,
                 queries=self.queries,
+                source_store=self.source_store,
             ).process_ast_cache(ast_cache.items())
         except Exception as exc:
             logger.warning("Tailwind usage processor failed: {}", exc)
@@ -120,10 +128,12 @@ class ResolverPassService:
     def process_semantic_passes(self, ast_cache: AstCacheProtocol) -> None:
         """Runs registered semantic passes in deterministic order."""
         try:
-            ast_cache_items = tuple(ast_cache.items())
+            ast_cache_items = ast_cache.items()
             for definition in self.semantic_pass_registry.enabled_definitions():
                 logger.info("Running {} pass", definition.display_name)
             self.semantic_pass_registry.run_enabled(ast_cache_items)
+            for pass_id, seconds in self.semantic_pass_registry.last_timings.items():
+                logger.info("Semantic pass {} took {:.3f}s", pass_id, seconds)
         except Exception as exc:
             logger.warning("Semantic pass registry failed: {}", exc)
 
@@ -134,8 +144,7 @@ class ResolverPassService:
         queries: dict,
     ) -> None:
         """Processes all function and method calls in the cached ASTs."""
-        ast_cache_items = list(ast_cache.items())
-        for file_path, (root_node, language) in ast_cache_items:
+        for file_path, (root_node, language) in ast_cache.items():
             call_processor.process_calls_in_file(
                 file_path, root_node, language, queries
             )
@@ -171,26 +180,11 @@ class ResolverPassService:
                 project_name=self.project_name,
                 queries=self.queries,
                 function_registry=self.function_registry,
+                source_store=self.source_store,
             ).process_ast_cache(ast_cache.items())
         except Exception as exc:
             logger.warning("Type relation pass failed: {}", exc)
 
-    def process_extended_relations(self, ast_cache: AstCacheProtocol) -> None:
-        """Runs the pass to create extended relationships like types and decorators."""
-        try:
-            from codebase_rag.parsers.pipeline.extended_relation_pass import (
-                ExtendedRelationPass,
-            )
-
-            ExtendedRelationPass(
-                ingestor=self.ingestor,
-                repo_path=self.repo_path,
-                project_name=self.project_name,
-                queries=self.queries,
-            ).process_ast_cache(ast_cache.items())
-        except Exception as exc:
-            logger.warning("Extended relation pass failed: {}", exc)
-
     def process_reparse_registry(self, ast_cache: AstCacheProtocol) -> None:
         """Runs the re-parse registry resolver for supplementary call resolution."""
         try:
@@ -220,35 +214,73 @@ class ResolverPassService:
         except Exception as exc:
             logger.warning("Context7 bridging failed: {}", exc)
 
-    def process_sql_relations(self, ast_cache: AstCacheProtocol) -> None:
-        """Runs the SQL structural relationship pass (columns, FK edges, index-table edges)."""
-        try:
-            from codebase_rag.parsers.pipeline.sql_relation_pass import SqlRelationPass
-
-            SqlRelationPass(
-                ingestor=self.ingestor,
-                repo_path=self.repo_path,
-                project_name=self.project_name,
-                function_registry=self.function_registry,
-            ).process_ast_cache(ast_cache.items())
-        except Exception as exc:
-            logger.warning("SQL relation pass failed: {}", exc)
-
-    def process_orm_bridge(
+    def process_tree_relations(
         self,
         ast_cache: AstCacheProtocol,
         simple_name_lookup: dict,
     ) -> None:
-        """Runs the ORM bridge pass (MAPS_TO_TABLE from ORM classes to SQL tables)."""
+        """
+        Runs the extended relation, SQL structural and ORM bridge passes.
+
+        Each pass starts by collecting nodes from the cached trees: throw and
+        catch sites for exception relations, table names from SQL DDL. They
+        share a single walk over the trees instead of each walking them
+        separately.
+        """
         try:
+            from codebase_rag.parsers.pipeline.extended_relation_pass import (
+                ExtendedRelationPass,
+            )
             from codebase_rag.parsers.pipeline.orm_bridge_pass import OrmBridgePass
+            from codebase_rag.parsers.pipeline.sql_relation_pass import (
+                SqlRelationPass,
+            )
 
-            OrmBridgePass(
+            extended_pass = ExtendedRelationPass(
+                ingestor=self.ingestor,
+                repo_path=self.repo_path,
+                project_name=self.project_name,
+                queries=self.queries,
+            )
+            sql_pass = SqlRelationPass(
+                ingestor=self.ingestor,
+                repo_path=self.repo_path,
+                project_name=self.project_name,
+                function_registry=self.function_registry,
+            )
+            orm_pass = OrmBridgePass(
                 ingestor=self.ingestor,
                 repo_path=self.repo_path,
                 project_name=self.project_name,
                 simple_name_lookup=simple_name_lookup,
-            ).process_ast_cache(ast_cache.items())
+                source_store=self.source_store,
+            )
+            ast_cache_items = ast_cache.items()
+            visitor = FusedAstVisitor(extended_pass.node_subscriptions())
+            for table_pass in (sql_pass, orm_pass):
+                if table_pass.enabled:
+                    for subscription in table_pass.node_subscriptions():
+                        visitor.subscribe(subscription)
+            visitor.walk(ast_cache_items)
+        except Exception as exc:
+            logger.warning("Tree relation discovery failed: {}", exc)
+            return
+
+        logger.info("Running extended relation pass")
+        try:
+            extended_pass.process_ast_cache(ast_cache_items, discovered=True)
+        except Exception as exc:
+            logger.warning("Extended relation pass failed: {}", exc)
+
+        logger.info("Running SQL structural relation pass (columns, FK, indexes)")
+        try:
+            sql_pass.process_ast_cache(ast_cache_items, discovered=True)
+        except Exception as exc:
+            logger.warning("SQL relation pass failed: {}", exc)
+
+        logger.info("Running ORM bridge pass (MAPS_TO_TABLE)")
+        try:
+            orm_pass.process_ast_cache(ast_cache_items, discovered=True)
         except Exception as exc:
             logger.warning("ORM bridge pass failed: {}", exc)
 
@@ -272,6 +304,7 @@ class ResolverPassService:
                 ingestor=self.ingestor,
                 repo_path=self.repo_path,
                 project_name=self.project_name,
+                source_store=self.source_store,
             ).process_ast_cache(ast_cache.items())
         except Exception as exc:
             logger.warning("Cypher schema pass failed: {}", exc)
@@ -283,6 +316,7 @@ class ResolverPassService:
                 repo_path=self.repo_path,
                 project_name=self.project_name,
                 ingestor=self.ingestor,
+                source_store=self.source_store,
             ).enrich()
             logger.info("Topology enrichment summary: {}", result)
         except Exception as exc:
@@ -295,6 +329,7 @@ class ResolverPassService:
                 repo_path=self.repo_path,
                 project_name=self.project_name,
                 ingestor=self.ingestor,
+                source_store=self.source_store,
             ).ingest_available()
             logger.info("Runtime evidence summary: {}", result)
         except Exception as exc:
@@ -314,12 +349,15 @@ class SemanticEmbeddingService:
         project_name: str,
         phase2_integration_enabled: bool = True,
         phase2_embedding_strategy: str = "semantic",
+        *,
+        source_store: SourceStore | None = None,
     ) -> None:
         """Initializes the semantic embedding service."""
         self.ingestor = ingestor
         self.repo_path = repo_path
         self.ast_cache = ast_cache
         self.project_name = project_name
+        self.source_store = source_store or SourceStore()
         self.phase2_integration_enabled = phase2_integration_enabled
         self.phase2_embedding_strategy = phase2_embedding_strategy
 
@@ -367,7 +405,6 @@ class SemanticEmbeddingService:
                 embedding_strategy = EmbeddingStrategy.SEMANTIC
 
             embedding_extractor.set_embedding_strategy(embedding_strategy)
-            file_text_cache: dict[str, str] = {}
             framework_cache: dict[tuple[str, str], str | None] = {}
 
             results = self.ingestor.fetch_all(
@@ -465,16 +502,12 @@ class SemanticEmbeddingService:
 
                             file_text = ""
                             if isinstance(file_path, str) and file_path:
-                                file_text = file_text_cache.get(file_path, "")
-                                if not file_text:
-                                    try:
-                                        file_text = (
-                                            self.repo_path / file_path
-                                        ).read_text(encoding="utf-8", errors="ignore")
-                                    except Exception:
-                                        file_text = ""
-                                    if file_text:
-                                        file_text_cache[file_path] = file_text
+                                file_text = (
+                                    self.source_store.read_text(
+                                        self.repo_path / file_path
+                                    )
+                                    or ""
+                                )
 
                             framework_key = (file_path or "", language)
                             framework = framework_cache.get(framework_key)
@@ -545,7 +578,12 @@ class SemanticEmbeddingService:
                 ast_extractor = ast_extractor_func
 
         return extract_source_with_fallback(
-            file_path_obj, start_line, end_line, qualified_name, ast_extractor
+            file_path_obj,
+            start_line,
+            end_line,
+            qualified_name,
+            ast_extractor,
+            source_store=self.source_store,
         )
 
     def _parse_embedding_result(self, row: ResultRow) -> EmbeddingQueryResult | None:
@@ -614,12 +652,15 @@ class PreScanService:
         project_name: str,
         exclude_paths: frozenset[str] | None,
         unignore_paths: frozenset[str] | None,
+        *,
+        source_store: SourceStore | None = None,
     ) -> None:
         """Initializes the pre-scan service."""
         self.repo_path = repo_path
         self.project_name = project_name
         self.exclude_paths = exclude_paths
         self.unignore_paths = unignore_paths
+        self.source_store = source_store
 
     def run(self) -> PreScanIndex:
         """
@@ -634,6 +675,7 @@ class PreScanService:
             project_name=self.project_name,
             exclude_paths=self.exclude_paths,
             unignore_paths=self.unignore_paths,
+            source_store=self.source_store,
         ).scan_repo()
 
 
@@ -688,18 +730,21 @@ class AnalysisRunnerService:
         """Initializes the analysis runner service."""
         self.enabled = enabled
 
-    def run(self, ingestor, repo_path: Path) -> None:
+    def run(
+        self, ingestor, repo_path: Path, *, source_store: SourceStore | None = None
+    ) -> None:
         """
         Runs the analysis runner if enabled.
 
         Args:
             ingestor: The graph database ingestor.
             repo_path (Path): The path to the repository.
+            source_store (SourceStore | None): The run's shared file contents.
         """
         if not self.enabled:
             return
         logger.info("Running analysis layer")
-        AnalysisRunner(ingestor, repo_path).run_all()
+        AnalysisRunner(ingestor, repo_path, source_store=source_store).run_all()
 
 
 class PerformanceProfileService:
@@ -257,7 +257,9 @@ class ParsePreparationService:
         parser = lang_queries.get(cs.KEY_PARSER)
         if not parser:
             return None
-        source_bytes = file_path.read_bytes()
+        source_bytes = self.factory.source_store.read_bytes(file_path)
+        if source_bytes is None:
+            source_bytes = file_path.read_bytes()
         source_text = self._decode_source(source_bytes)
         tree = parser.parse(source_bytes)
         root_node = tree.root_node
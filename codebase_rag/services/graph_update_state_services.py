@@ -21,6 +21,7 @@ from codebase_rag.data_models.types_defs import (
     FunctionRegistry,
     SimpleNameLookup,
 )
+from codebase_rag.utils.source_store import SourceStore
 
 
 class GraphStateService:
@@ -38,6 +39,8 @@ class GraphStateService:
         ast_cache: MutableMapping[Path, tuple[object, cs.SupportedLanguage]],
         function_registry: FunctionRegistry | None,
         simple_name_lookup: SimpleNameLookup,
+        *,
+        source_store: SourceStore | None = None,
     ) -> None:
         """
         Initializes the GraphStateService.
@@ -48,12 +51,15 @@ class GraphStateService:
             ast_cache (MutableMapping): The cache for storing parsed ASTs.
             function_registry (FunctionRegistry | None): The registry of all known functions.
             simple_name_lookup (SimpleNameLookup): A mapping from simple names to qualified names.
+            source_store (SourceStore | None): The run's file contents, invalidated
+                together with the rest of a file's state.
         """
         self.repo_path = repo_path
         self.project_name = project_name
         self.ast_cache = ast_cache
         self.function_registry = function_registry
         self.simple_name_lookup = simple_name_lookup
+        self.source_store = source_store
 
     def remove_file_from_state(self, file_path: Path) -> None:
         """
@@ -68,6 +74,9 @@ class GraphStateService:
         """
         logger.debug(ls.REMOVING_STATE.format(path=file_path))
 
+        if self.source_store is not None:
+            self.source_store.invalidate(file_path)
+
         if file_path in self.ast_cache:
             del self.ast_cache[file_path]
             logger.debug(ls.REMOVED_FROM_CACHE)
@@ -8,6 +8,7 @@ from types import SimpleNamespace
 from typing import cast
 
 from codebase_rag.core import constants as cs
+from codebase_rag.infrastructure.language_runtime import compare_language_startup
 from codebase_rag.mcp.tools import MCPToolsRegistry
 from codebase_rag.services.cypher_guard import CypherGuard
 from codebase_rag.services.cypher_templates import CypherTemplateBank
@@ -104,6 +105,7 @@ async def run_mcp_benchmarks(
     live_llm: bool = False,
 ) -> dict[str, object]:
     repo_root = Path(repo_path).resolve()
+    parser_startup = compare_language_startup(repo_root)
     template_bank = CypherTemplateBank()
     cypher_guard = CypherGuard()
     live_generator = CypherGenerator() if live_llm else None
@@ -113,6 +115,7 @@ async def run_mcp_benchmarks(
         "repo_path": str(repo_root),
         "project_name": repo_root.name,
         "live_llm": live_llm,
+        "parser_startup": parser_startup,
         "client_profiles": [],
         "cypher_generation": [],
     }
@@ -11,6 +11,7 @@ connection is not available or desired during the parsing phase.
 
 from __future__ import annotations
 
+import threading
 from pathlib import Path
 
 from loguru import logger
@@ -20,6 +21,7 @@ from codebase_rag.data_models.types_defs import PropertyDict, PropertyValue
 
 from ..core import constants as cs
 from ..core import logs as ls
+from ..infrastructure.decorators import synchronized
 
 LABEL_TO_ONEOF_FIELD: dict[cs.NodeLabel, str] = {
     cs.NodeLabel.PROJECT: cs.ONEOF_PROJECT,
@@ -70,6 +72,7 @@ class ProtobufFileIngestor:
         self._nodes: dict[str, pb.Node] = {}
         self._relationships: dict[tuple[str, int, str], pb.Relationship] = {}
         self.split_index = split_index
+        self._lock = threading.RLock()
         logger.info(ls.PROTOBUF_INIT.format(path=self.output_dir))
 
     def _get_node_id(self, label: cs.NodeLabel, properties: PropertyDict) -> str:
@@ -93,6 +96,7 @@ class ProtobufFileIngestor:
             return str(properties.get(cs.KEY_NAME, ""))
         return str(properties.get(cs.KEY_QUALIFIED_NAME, ""))
 
+    @synchronized
     def ensure_node_batch(self, label: str, properties: PropertyDict) -> None:
         """
         Adds a node to the in-memory buffer.
@@ -138,6 +142,7 @@ class ProtobufFileIngestor:
 
         self._nodes[node_id] = node
 
+    @synchronized
     def ensure_relationship_batch(
         self,
         from_spec: tuple[str, str, PropertyValue],
@@ -247,6 +252,7 @@ class ProtobufFileIngestor:
             )
         )
 
+    @synchronized
     def flush_all(self) -> None:
         """
         Flushes all buffered nodes and relationships to protobuf files.
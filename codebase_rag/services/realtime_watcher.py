@@ -20,8 +20,8 @@ from codebase_rag.core.constants import (
     SupportedLanguage,
 )
 from codebase_rag.graph_db.graph_updater import GraphUpdater
+from codebase_rag.infrastructure.language_runtime import LanguageRuntime
 from codebase_rag.infrastructure.language_spec import get_language_spec
-from codebase_rag.infrastructure.parser_loader import load_parsers
 from codebase_rag.services import QueryProtocol
 from codebase_rag.services.graph_service import MemgraphIngestor
 from codebase_rag.services.graph_update_post_services import SemanticEmbeddingService
@@ -81,6 +81,8 @@ class CodeChangeEventHandler(FileSystemEventHandler):
 
         if event.event_type in (EventType.MODIFIED, EventType.CREATED):
             lang_config = get_language_spec(path.suffix)
+            if lang_config and isinstance(lang_config.language, SupportedLanguage):
+                self.updater.ensure_languages((lang_config.language,))
             if (
                 lang_config
                 and isinstance(lang_config.language, SupportedLanguage)
@@ -124,8 +126,14 @@ def run_watcher_loop(
     refresh_embeddings: bool = False,
     debounce_seconds: float = settings.REALTIME_WATCHER_DEBOUNCE_SECONDS,
 ) -> None:
-    parsers, queries = load_parsers()
-    updater = GraphUpdater(ingestor, repo_path_obj, parsers, queries)
+    language_runtime = LanguageRuntime()
+    updater = GraphUpdater(
+        ingestor,
+        repo_path_obj,
+        language_runtime.parsers,
+        language_runtime.queries,
+        language_runtime=language_runtime,
+    )
 
     logger.info(logs.INITIAL_SCAN)
     updater.run()
@@ -1,9 +1,15 @@
 from __future__ import annotations
 
+import hashlib
 import json
+import os
 import re
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Protocol, cast
+from typing import BinaryIO, Protocol, cast
+
+from loguru import logger
 
 from codebase_rag.core import constants as cs
 from codebase_rag.core.event_flow_identity import (
@@ -11,6 +17,7 @@ from codebase_rag.core.event_flow_identity import (
     normalize_channel_name,
     normalize_event_name,
 )
+from codebase_rag.utils.source_store import SourceStore
 
 
 class RuntimeGraphIngestorProtocol(Protocol):
@@ -33,6 +40,297 @@ class RuntimeGraphIngestorProtocol(Protocol):
     ) -> list[object]: ...
 
 
+_HTTP_PATTERN = re.compile(r"\b(GET|POST|PUT|DELETE|PATCH)\s+(/[\w\-/{}:.?=&]+)")
+_SQL_PATTERN = re.compile(r"\b(select|insert|update|delete)\b", re.IGNORECASE)
+_REDIS_PATTERN = re.compile(r"\b(redis|get|set|del|publish|subscribe)\b", re.IGNORECASE)
+_EVENT_NAME_PATTERN = re.compile(
+    r"\b(?:event|event_name|message_type|subject)=([A-Za-z0-9_.:\-]+)",
+    re.IGNORECASE,
+)
+_CHANNEL_PATTERN = re.compile(
+    r"\b(?:queue|queue_name|stream|stream_name|topic|topic_name|channel|channel_name)=([A-Za-z0-9_.:\-]+)",
+    re.IGNORECASE,
+)
+_DLQ_PATTERN = re.compile(
+    r"\b(?:dlq|dead_letter_queue|dead_letter_topic|retry_queue)=([A-Za-z0-9_.:\-]+)",
+    re.IGNORECASE,
+)
+_HANDLER_PATTERN = re.compile(
+    r"\b(?:handler|consumer|worker)=([A-Za-z0-9_.:\-]+)",
+    re.IGNORECASE,
+)
+_GQL_PATTERN = re.compile(r"\b(query|mutation|subscription)\b", re.IGNORECASE)
+_EXCEPTION_PATTERN = re.compile(r"\b(exception|traceback|error)\b", re.IGNORECASE)
+
+_TAIL_DIGEST_BYTES = 256
+
+EventChunk = tuple[list[dict[str, object]], int]
+
+
+@dataclass(slots=True)
+class _ArtifactEvents:
+    runtime_file: Path
+    # (event key, event, occurrences); the key names the event node.
+    events: list[tuple[str, dict[str, object], int]]
+    checkpoint: dict[str, object]
+    full_read: bool = False
+
+
+class _RuntimeLookupIndex:
+    def __init__(
+        self,
+        ingestor: RuntimeGraphIngestorProtocol,
+        project_name: str,
+        events: Iterable[dict[str, object]],
+    ) -> None:
+        self._ingestor = ingestor
+        self._project_name = project_name
+        self.queries = 0
+        kinds: set[str] = set()
+        route_paths: set[str] = set()
+        handler_names: set[str] = set()
+        needs_event_flows = False
+        needs_queues = False
+        for event in events:
+            kind = str(event.get("kind", "")).strip().lower()
+            kinds.add(kind)
+            route_path = str(event.get("route_path", "")).strip()
+            if kind == "http" and route_path:
+                route_paths.add(route_path)
+            handler_name = str(event.get("handler_name", "")).strip()
+            if handler_name:
+                handler_names.add(handler_name.split(".")[-1].lower())
+            event_name = str(event.get("event_name", "")).strip()
+            channel_name = str(
+                event.get("channel_name") or event.get("queue_name") or ""
+            ).strip()
+            dlq_name = str(event.get("dlq_name", "")).strip()
+            needs_event_flows = needs_event_flows or bool(event_name or channel_name)
+            needs_queues = needs_queues or bool(channel_name or dlq_name)
+
+        self._endpoints: dict[str, str] = {}
+        if route_paths:
+            for row in self._rows(
+                """
+                MATCH (e:Endpoint {project_name: $project_name})
+                WHERE e.route_path IN $route_paths
+                RETURN
+                  coalesce(e.route_path, '') AS route_path,
+                  coalesce(e.qualified_name, '') AS qualified_name
+                """,
+                {"route_paths": sorted(route_paths)},
+            ):
+                candidate = str(row.get("qualified_name", "")).strip()
+                if candidate:
+                    self._endpoints.setdefault(
+                        str(row.get("route_path", "")), candidate
+                    )
+
+        self._event_flow_rows = (
+            self._rows(
+                """
+                MATCH (e:EventFlow {project_name: $project_name})
+                RETURN
+                  coalesce(e.qualified_name, '') AS qualified_name,
+                  coalesce(e.canonical_key, '') AS canonical_key,
+                  coalesce(e.event_name, '') AS event_name,
+                  coalesce(e.channel_name, '') AS channel_name
+                """
+            )
+            if needs_event_flows
+            else []
+        )
+
+        self._queues: dict[str, str] = {}
+        if needs_queues:
+            for row in self._rows(
+                """
+                MATCH (q:Queue {project_name: $project_name})
+                RETURN
+                  coalesce(q.qualified_name, '') AS qualified_name,
+                  coalesce(q.queue_name, q.name, '') AS queue_name
+                """
+            ):
+                candidate = str(row.get("qualified_name", "")).strip()
+                if candidate:
+                    self._queues.setdefault(
+                        normalize_channel_name(str(row.get("queue_name", ""))),
+                        candidate,
+                    )
+
+        self._handler_rows = (
+            self._rows(
+                """
+                MATCH (n)
+                WHERE coalesce(n.project_name, $project_name) = $project_name
+                  AND (n:Function OR n:Method)
+                  AND toLower(coalesce(n.name, '')) IN $names
+                RETURN
+                  labels(n) AS labels,
+                  coalesce(n.qualified_name, '') AS qualified_name,
+                  coalesce(n.name, '') AS name
+                """,
+                {"names": sorted(handler_names)},
+            )
+            if handler_names
+            else []
+        )
+
+        self._graphql_rows = (
+            self._rows(
+                """
+                MATCH (g:GraphQLOperation {project_name: $project_name})
+                RETURN
+                  coalesce(g.qualified_name, '') AS qualified_name,
+                  coalesce(g.name, '') AS name
+                """
+            )
+            if "graphql" in kinds
+            else []
+        )
+
+        self._systems: dict[str, list[dict[str, object]]] = {}
+        for kind, label in (
+            ("sql", cs.NodeLabel.DATA_STORE),
+            ("redis", cs.NodeLabel.CACHE_STORE),
+        ):
+            if kind in kinds:
+                self._systems[label] = self._rows(
+                    f"""
+                    MATCH (n:{label} {{project_name: $project_name}})
+                    RETURN
+                      coalesce(n.qualified_name, '') AS qualified_name,
+                      coalesce(n.engine, '') AS engine
+                    LIMIT 20
+                    """
+                )
+
+        self._service: str | None = None
+        if "exception" in kinds:
+            for row in self._rows(
+                """
+                MATCH (s:Service {project_name: $project_name})
+                RETURN coalesce(s.qualified_name, '') AS qualified_name
+                LIMIT 1
+                """
+            ):
+                self._service = str(row.get("qualified_name", "")).strip() or None
+                break
+
+        self._event_flow_memo: dict[tuple[str, str], str | None] = {}
+        self._handler_memo: dict[str, tuple[str, str, str] | None] = {}
+        self._graphql_memo: dict[str, str | None] = {}
+
+    def _rows(
+        self, query: str, parameters: dict[str, object] | None = None
+    ) -> list[dict[str, object]]:
+        self.queries += 1
+        rows = self._ingestor.fetch_all(
+            query, {cs.KEY_PROJECT_NAME: self._project_name, **(parameters or {})}
+        )
+        return [cast(dict[str, object], row) for row in rows if isinstance(row, dict)]
+
+    def endpoint(self, route_path: str) -> str | None:
+        return self._endpoints.get(route_path)
+
+    def queue(self, queue_name: str) -> str | None:
+        return self._queues.get(normalize_channel_name(queue_name))
+
+    def service(self) -> str | None:
+        return self._service
+
+    def named_system(
+        self, label: str, *, preferred_engines: tuple[str, ...]
+    ) -> str | None:
+        rows = self._systems.get(label, [])
+        for preferred_engine in preferred_engines:
+            for row in rows:
+                engine = str(row.get("engine", "")).strip().lower()
+                candidate = str(row.get("qualified_name", "")).strip()
+                if candidate and preferred_engine in engine:
+                    return candidate
+        for row in rows:
+            candidate = str(row.get("qualified_name", "")).strip()
+            if candidate:
+                return candidate
+        return None
+
+    def graphql_operation(self, operation_name: str) -> str | None:
+        normalized = operation_name.strip().lower()
+        if normalized in self._graphql_memo:
+            return self._graphql_memo[normalized]
+        found: str | None = None
+        for row in self._graphql_rows:
+            candidate = str(row.get("qualified_name", "")).strip()
+            if not candidate:
+                continue
+            if (
+                not normalized
+                or str(row.get("name", "")).lower() == normalized
+                or normalized in candidate.lower()
+            ):
+                found = candidate
+                break
+        self._graphql_memo[normalized] = found
+        return found
+
+    def event_flow(self, *, event_name: str, channel_name: str) -> str | None:
+        memo_key = (event_name, channel_name)
+        if memo_key in self._event_flow_memo:
+            return self._event_flow_memo[memo_key]
+        expected_key = build_event_flow_canonical_key(
+            event_name=event_name,
+            channel_name=channel_name,
+            fallback_name=event_name or channel_name,
+        )
+        normalized_event = normalize_event_name(event_name)
+        normalized_channel = normalize_channel_name(channel_name)
+        found: str | None = None
+        for row in self._event_flow_rows:
+            candidate_qn = str(row.get("qualified_name", "")).strip()
+            if not candidate_qn:
+                continue
+            candidate_key = str(row.get("canonical_key", "")).strip().lower()
+            candidate_event = normalize_event_name(str(row.get("event_name", "")))
+            candidate_channel = normalize_channel_name(str(row.get("channel_name", "")))
+            if expected_key and candidate_key == expected_key:
+                found = candidate_qn
+                break
+            if normalized_event and candidate_event == normalized_event:
+                if not normalized_channel or candidate_channel == normalized_channel:
+                    found = candidate_qn
+                    break
+            if normalized_channel and not normalized_event:
+                if candidate_channel == normalized_channel:
+                    found = candidate_qn
+                    break
+        self._event_flow_memo[memo_key] = found
+        return found
+
+    def handler(self, handler_name: str) -> tuple[str, str, str] | None:
+        normalized = handler_name.strip()
+        if not normalized:
+            return None
+        if normalized in self._handler_memo:
+            return self._handler_memo[normalized]
+        simple_name = normalized.split(".")[-1].lower()
+        found: tuple[str, str, str] | None = None
+        for row in self._handler_rows:
+            qualified_name = str(row.get("qualified_name", "")).strip()
+            name = str(row.get("name", "")).strip().lower()
+            labels = cast(list[str], row.get("labels", []))
+            if not qualified_name or not labels:
+                continue
+            if (
+                qualified_name.lower().endswith(normalized.lower())
+                or name == simple_name
+            ):
+                found = (labels[0], cs.KEY_QUALIFIED_NAME, qualified_name)
+                break
+        self._handler_memo[normalized] = found
+        return found
+
+
 class RuntimeEvidenceIngestor:
     _RUNTIME_DIRS = (
         "output/runtime",
@@ -43,11 +341,23 @@ class RuntimeEvidenceIngestor:
     )
     _MAX_FILES = 80
     _MAX_EVENTS_PER_FILE = 40
+    _OFFSETS_VERSION = 2
+    _OFFSETS_FILENAME = "runtime_evidence_offsets.json"
 
-    def __init__(self, repo_path: Path, project_name: str, ingestor: object) -> None:
+    def __init__(
+        self,
+        repo_path: Path,
+        project_name: str,
+        ingestor: object,
+        *,
+        source_store: SourceStore | None = None,
+    ) -> None:
         self.repo_path = repo_path.resolve()
         self.project_name = project_name
         self.ingestor = ingestor
+        self.source_store = source_store or SourceStore()
+        self._offsets_path = self.repo_path / ".codebase_rag" / self._OFFSETS_FILENAME
+        self._lookups: _RuntimeLookupIndex | None = None
 
     def ingest_available(self) -> dict[str, object]:
         if not all(
@@ -63,10 +373,27 @@ class RuntimeEvidenceIngestor:
         if not runtime_files:
             return {"status": "ok", "artifacts": 0, "events": 0}
 
+        checkpoints = self._load_checkpoints()
+        ingested = self._ingested_artifact_qns(ingestor) if checkpoints else set()
+        artifacts: list[_ArtifactEvents] = []
+        for runtime_file in runtime_files:
+            relative = runtime_file.relative_to(self.repo_path).as_posix()
+            checkpoint = checkpoints.get(relative)
+            if self._artifact_qn(runtime_file) not in ingested:
+                checkpoint = None
+            artifacts.append(self._read_artifact(runtime_file, checkpoint))
+
+        self._lookups = _RuntimeLookupIndex(
+            ingestor,
+            self.project_name,
+            (event for artifact in artifacts for _, event, _ in artifact.events),
+        )
+
         project_spec = (cs.NodeLabel.PROJECT, cs.KEY_NAME, self.project_name)
         event_count = 0
 
-        for runtime_file in runtime_files:
+        for artifact in artifacts:
+            runtime_file = artifact.runtime_file
             artifact_qn = self._artifact_qn(runtime_file)
             artifact_payload = {
                 cs.KEY_QUALIFIED_NAME: artifact_qn,
@@ -87,15 +414,16 @@ class RuntimeEvidenceIngestor:
                 ),
             )
 
-            for event in self._extract_events(runtime_file):
+            for event_key, event, occurrences in artifact.events:
                 event_count += 1
-                event_qn = f"{artifact_qn}.event.{event_count}"
+                event_qn = f"{artifact_qn}.event.{event_key}"
                 event_payload = {
                     cs.KEY_QUALIFIED_NAME: event_qn,
                     cs.KEY_NAME: str(event.get("kind", "runtime_event")),
                     cs.KEY_PROJECT_NAME: self.project_name,
                     "source_parser": "runtime_evidence",
                     **event,
+                    "occurrences": occurrences,
                 }
                 ingestor.ensure_node_batch(cs.NodeLabel.RUNTIME_EVENT, event_payload)
                 ingestor.ensure_relationship_batch(
@@ -115,6 +443,18 @@ class RuntimeEvidenceIngestor:
 
         if hasattr(ingestor, "flush_all"):
             ingestor.flush_all()
+        for artifact in artifacts:
+            if artifact.full_read:
+                self._delete_stale_events(artifact)
+        self._persist_checkpoints(
+            {
+                artifact.runtime_file.relative_to(self.repo_path).as_posix(): (
+                    artifact.checkpoint
+                )
+                for artifact in artifacts
+                if artifact.checkpoint
+            }
+        )
 
         return {
             "status": "ok",
@@ -135,35 +475,113 @@ class RuntimeEvidenceIngestor:
                     files.append(path)
         return files
 
-    def _extract_events(self, runtime_file: Path) -> list[dict[str, object]]:
-        lowered_name = runtime_file.name.lower()
+    def _read_artifact(
+        self, runtime_file: Path, checkpoint: dict[str, object] | None
+    ) -> _ArtifactEvents:
         try:
-            content = runtime_file.read_text(encoding=cs.ENCODING_UTF8, errors="ignore")
-        except Exception:
-            return []
+            stat = runtime_file.stat()
+        except OSError as exc:
+            logger.debug("Runtime artifact {} is unreadable: {}", runtime_file, exc)
+            return _ArtifactEvents(runtime_file, [], {})
+        lowered_name = runtime_file.name.lower()
+        appendable = not (lowered_name.endswith(".json") or lowered_name == "lcov.info")
+        start = 0
+        previous_counts: dict[str, int] = {}
+        if checkpoint is not None:
+            offset = self._coerce_int(checkpoint.get("offset"))
+            if appendable:
+                if offset <= stat.st_size and checkpoint.get(
+                    "tail"
+                ) == self._tail_digest(runtime_file, offset):
+                    start = offset
+                    previous_counts = self._coerce_counts(checkpoint.get("counts"))
+            elif (
+                checkpoint.get("size") == stat.st_size
+                and checkpoint.get("mtime_ns") == stat.st_mtime_ns
+            ):
+                return _ArtifactEvents(runtime_file, [], checkpoint)
 
+        counts: dict[str, int] = {}
+        distinct: dict[str, dict[str, object]] = {}
+        committed = start
+        for chunk, offset in self._extract_events(runtime_file, start):
+            keys = [self._event_key(event) for event in chunk]
+            fresh = {key for key in keys if key not in distinct}
+            if distinct and len(distinct) + len(fresh) > self._MAX_EVENTS_PER_FILE:
+                break
+            for key, event in zip(keys, chunk):
+                distinct.setdefault(key, event)
+                counts[key] = counts.get(key, 0) + 1
+            committed = offset
+
+        events = [
+            (key, distinct[key], previous_counts.get(key, 0) + counts[key])
+            for key in distinct
+        ][: self._MAX_EVENTS_PER_FILE]
+        checkpoint = {
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "offset": committed,
+            "counts": previous_counts
+            | {key: occurrences for key, _, occurrences in events},
+        }
+        if appendable:
+            checkpoint["tail"] = self._tail_digest(runtime_file, committed)
+        return _ArtifactEvents(runtime_file, events, checkpoint, full_read=start == 0)
+
+    def _extract_events(self, runtime_file: Path, start: int) -> Iterator[EventChunk]:
+        lowered_name = runtime_file.name.lower()
         if lowered_name.endswith(".json"):
+            content = self.source_store.read_text(runtime_file)
+            if content is None:
+                return
             try:
                 payload = json.loads(content)
             except json.JSONDecodeError:
                 payload = {"raw_text": content}
-            return self._events_from_json(payload, runtime_file)
-        if lowered_name.endswith(".ndjson"):
+            yield self._events_from_json(payload, runtime_file), 0
+            return
+
+        try:
+            with runtime_file.open("rb") as handle:
+                handle.seek(start)
+                # Appendable logs may end in a line that is still being written;
+                # it is left for the next run instead of being checkpointed.
+                lines = self._iter_lines(
+                    handle, start, complete_only=lowered_name != "lcov.info"
+                )
+                if lowered_name.endswith(".ndjson"):
+                    yield from self._events_from_ndjson(lines, runtime_file)
+                elif lowered_name == "lcov.info":
+                    yield from self._events_from_lcov(lines)
+                else:
+                    yield from self._events_from_log(lines, runtime_file)
+        except OSError as exc:
+            logger.debug("Runtime artifact {} is unreadable: {}", runtime_file, exc)
+
+    @staticmethod
+    def _iter_lines(
+        handle: BinaryIO, start: int, *, complete_only: bool
+    ) -> Iterator[tuple[str, int]]:
+        offset = start
+        for raw_line in handle:
+            if complete_only and not raw_line.endswith(b"\n"):
+                return
+            offset += len(raw_line)
+            yield raw_line.decode(cs.ENCODING_UTF8, "ignore"), offset
+
+    def _events_from_ndjson(
+        self, lines: Iterable[tuple[str, int]], runtime_file: Path
+    ) -> Iterator[EventChunk]:
+        for line, offset in lines:
+            line = line.strip()
             events: list[dict[str, object]] = []
-            for line in content.splitlines():
-                line = line.strip()
-                if not line:
-                    continue
+            if line:
                 try:
-                    events.extend(
-                        self._events_from_json(json.loads(line), runtime_file)
-                    )
+                    events = self._events_from_json(json.loads(line), runtime_file)
                 except json.JSONDecodeError:
-                    continue
-            return events[: self._MAX_EVENTS_PER_FILE]
-        if lowered_name == "lcov.info":
-            return self._events_from_lcov(content)
-        return self._events_from_log(content, runtime_file)
+                    pass
+            yield events, offset
 
     def _events_from_json(
         self,
@@ -201,23 +619,31 @@ class RuntimeEvidenceIngestor:
             }
         ]
 
-    def _events_from_lcov(self, content: str) -> list[dict[str, object]]:
-        events: list[dict[str, object]] = []
+    @staticmethod
+    def _events_from_lcov(lines: Iterable[tuple[str, int]]) -> Iterator[EventChunk]:
         current_file = ""
         covered = 0
         total = 0
-        for line in content.splitlines():
-            if line.startswith("SF:"):
+        offset = 0
+        for line, offset in lines:
+            if line.startswith("SF:") or line.startswith("end_of_record"):
                 if current_file:
-                    events.append(
-                        {
-                            "kind": "coverage",
-                            "file_path": current_file,
-                            "covered_lines": covered,
-                            "total_lines": total,
-                        }
+                    yield (
+                        [
+                            {
+                                "kind": "coverage",
+                                "file_path": current_file,
+                                "covered_lines": covered,
+                                "total_lines": total,
+                            }
+                        ],
+                        offset,
                     )
-                current_file = line.removeprefix("SF:").strip().replace("\\", "/")
+                current_file = (
+                    line.removeprefix("SF:").strip().replace("\\", "/")
+                    if line.startswith("SF:")
+                    else ""
+                )
                 covered = 0
                 total = 0
             elif line.startswith("DA:"):
@@ -226,85 +652,63 @@ class RuntimeEvidenceIngestor:
                 if len(parts) >= 2 and parts[1].strip() != "0":
                     covered += 1
         if current_file:
-            events.append(
-                {
-                    "kind": "coverage",
-                    "file_path": current_file,
-                    "covered_lines": covered,
-                    "total_lines": total,
-                }
+            yield (
+                [
+                    {
+                        "kind": "coverage",
+                        "file_path": current_file,
+                        "covered_lines": covered,
+                        "total_lines": total,
+                    }
+                ],
+                offset,
             )
-        return events[: self._MAX_EVENTS_PER_FILE]
 
     def _events_from_log(
-        self, content: str, runtime_file: Path
-    ) -> list[dict[str, object]]:
-        events: list[dict[str, object]] = []
-        http_pattern = re.compile(r"\b(GET|POST|PUT|DELETE|PATCH)\s+(/[\w\-/{}:.?=&]+)")
-        sql_pattern = re.compile(r"\b(select|insert|update|delete)\b", re.IGNORECASE)
-        redis_pattern = re.compile(
-            r"\b(redis|get|set|del|publish|subscribe)\b", re.IGNORECASE
-        )
-        event_name_pattern = re.compile(
-            r"\b(?:event|event_name|message_type|subject)=([A-Za-z0-9_.:\-]+)",
-            re.IGNORECASE,
-        )
-        channel_pattern = re.compile(
-            r"\b(?:queue|queue_name|stream|stream_name|topic|topic_name|channel|channel_name)=([A-Za-z0-9_.:\-]+)",
-            re.IGNORECASE,
-        )
-        dlq_pattern = re.compile(
-            r"\b(?:dlq|dead_letter_queue|dead_letter_topic|retry_queue)=([A-Za-z0-9_.:\-]+)",
-            re.IGNORECASE,
-        )
-        handler_pattern = re.compile(
-            r"\b(?:handler|consumer|worker)=([A-Za-z0-9_.:\-]+)",
-            re.IGNORECASE,
-        )
-        gql_pattern = re.compile(r"\b(query|mutation|subscription)\b", re.IGNORECASE)
-        exception_pattern = re.compile(
-            r"\b(exception|traceback|error)\b", re.IGNORECASE
-        )
-
-        for line in content.splitlines()[: self._MAX_EVENTS_PER_FILE]:
-            normalized_line = line.strip()
-            if not normalized_line:
+        self, lines: Iterable[tuple[str, int]], runtime_file: Path
+    ) -> Iterator[EventChunk]:
+        relative_path = runtime_file.relative_to(self.repo_path).as_posix()
+        for line, offset in lines:
+            event = self._event_from_log_line(line.strip())
+            if event is None:
+                yield [], offset
                 continue
-            event: dict[str, object] | None = None
-            if match := http_pattern.search(normalized_line):
+            event["path"] = relative_path
+            yield [event], offset
+
+    def _event_from_log_line(self, normalized_line: str) -> dict[str, object] | None:
+        if not normalized_line:
+            return None
+        event: dict[str, object] | None = None
+        if match := _HTTP_PATTERN.search(normalized_line):
+            event = {
+                "kind": "http",
+                "method": match.group(1),
+                "route_path": match.group(2),
+            }
+        else:
+            event_name_match = _EVENT_NAME_PATTERN.search(normalized_line)
+            channel_match = _CHANNEL_PATTERN.search(normalized_line)
+            dlq_match = _DLQ_PATTERN.search(normalized_line)
+            handler_match = _HANDLER_PATTERN.search(normalized_line)
+            if event_name_match or channel_match:
                 event = {
-                    "kind": "http",
-                    "method": match.group(1),
-                    "route_path": match.group(2),
+                    "kind": "event_runtime",
+                    "event_name": event_name_match.group(1) if event_name_match else "",
+                    "queue_name": channel_match.group(1) if channel_match else "",
+                    "dlq_name": dlq_match.group(1) if dlq_match else "",
+                    "handler_name": handler_match.group(1) if handler_match else "",
+                    "stage": self._infer_runtime_stage(normalized_line),
                 }
-            else:
-                event_name_match = event_name_pattern.search(normalized_line)
-                channel_match = channel_pattern.search(normalized_line)
-                dlq_match = dlq_pattern.search(normalized_line)
-                handler_match = handler_pattern.search(normalized_line)
-                if event_name_match or channel_match:
-                    event = {
-                        "kind": "event_runtime",
-                        "event_name": event_name_match.group(1)
-                        if event_name_match
-                        else "",
-                        "queue_name": channel_match.group(1) if channel_match else "",
-                        "dlq_name": dlq_match.group(1) if dlq_match else "",
-                        "handler_name": handler_match.group(1) if handler_match else "",
-                        "stage": self._infer_runtime_stage(normalized_line),
-                    }
-            if event is None and sql_pattern.search(normalized_line):
-                event = {"kind": "sql", "statement": normalized_line[:240]}
-            elif event is None and redis_pattern.search(normalized_line):
-                event = {"kind": "redis", "statement": normalized_line[:240]}
-            elif gql_pattern.search(normalized_line):
-                event = {"kind": "graphql", "statement": normalized_line[:240]}
-            elif exception_pattern.search(normalized_line):
-                event = {"kind": "exception", "message": normalized_line[:240]}
-            if event is not None:
-                event["path"] = runtime_file.relative_to(self.repo_path).as_posix()
-                events.append(event)
-        return events
+        if event is None and _SQL_PATTERN.search(normalized_line):
+            event = {"kind": "sql", "statement": normalized_line[:240]}
+        elif event is None and _REDIS_PATTERN.search(normalized_line):
+            event = {"kind": "redis", "statement": normalized_line[:240]}
+        elif _GQL_PATTERN.search(normalized_line):
+            event = {"kind": "graphql", "statement": normalized_line[:240]}
+        elif _EXCEPTION_PATTERN.search(normalized_line):
+            event = {"kind": "exception", "message": normalized_line[:240]}
+        return event
 
     def _normalize_event(self, payload: dict[str, object]) -> dict[str, object] | None:
         kind = (
@@ -428,7 +832,8 @@ class RuntimeEvidenceIngestor:
 
     def _link_runtime_event(self, event_qn: str, event: dict[str, object]) -> None:
         ingestor = self._ingestor_api()
-        if ingestor is None:
+        lookups = self._lookups
+        if ingestor is None or lookups is None:
             return
         kind = str(event.get("kind", "")).strip().lower()
         self._link_runtime_event_semantics(event_qn, event)
@@ -449,7 +854,7 @@ class RuntimeEvidenceIngestor:
         if kind == "http":
             route_path = str(event.get("route_path", "")).strip()
             if route_path:
-                endpoint_qn = self._find_endpoint_qn(route_path)
+                endpoint_qn = lookups.endpoint(route_path)
                 if endpoint_qn:
                     ingestor.ensure_relationship_batch(
                         (
@@ -473,7 +878,7 @@ class RuntimeEvidenceIngestor:
             return
 
         if kind == "sql":
-            datastore_qn = self._find_named_system_qn(
+            datastore_qn = lookups.named_system(
                 cs.NodeLabel.DATA_STORE,
                 preferred_engines=(
                     "postgres",
@@ -505,7 +910,7 @@ class RuntimeEvidenceIngestor:
             return
 
         if kind == "redis":
-            cache_qn = self._find_named_system_qn(
+            cache_qn = lookups.named_system(
                 cs.NodeLabel.CACHE_STORE,
                 preferred_engines=("redis", "memcached"),
             )
@@ -531,7 +936,7 @@ class RuntimeEvidenceIngestor:
             return
 
         if kind == "graphql":
-            graphql_qn = self._find_graphql_operation_qn(
+            graphql_qn = lookups.graphql_operation(
                 str(event.get("operation", "")).strip()
             )
             if graphql_qn:
@@ -560,7 +965,7 @@ class RuntimeEvidenceIngestor:
             return
 
         if kind == "exception":
-            target_qn = self._find_service_qn()
+            target_qn = lookups.service()
             if target_qn:
                 ingestor.ensure_relationship_batch(
                     (
@@ -572,99 +977,12 @@ class RuntimeEvidenceIngestor:
                     (cs.NodeLabel.SERVICE, cs.KEY_QUALIFIED_NAME, target_qn),
                 )
 
-    def _find_endpoint_qn(self, route_path: str) -> str | None:
-        ingestor = self._ingestor_api()
-        if ingestor is None:
-            return None
-        rows = ingestor.fetch_all(
-            """
-            MATCH (e:Endpoint {project_name: $project_name})
-            WHERE coalesce(e.route_path, '') = $route_path
-            RETURN coalesce(e.qualified_name, '') AS qualified_name
-            LIMIT 1
-            """,
-            {
-                cs.KEY_PROJECT_NAME: self.project_name,
-                "route_path": route_path,
-            },
-        )
-        if not rows:
-            return None
-        row = rows[0]
-        if not isinstance(row, dict):
-            return None
-        candidate = str(row.get("qualified_name", "")).strip()
-        return candidate or None
-
-    def _find_named_system_qn(
-        self,
-        label: str,
-        *,
-        preferred_engines: tuple[str, ...],
-    ) -> str | None:
-        ingestor = self._ingestor_api()
-        if ingestor is None:
-            return None
-        rows = ingestor.fetch_all(
-            f"""
-            MATCH (n:{label} {{project_name: $project_name}})
-            RETURN
-              coalesce(n.qualified_name, '') AS qualified_name,
-              coalesce(n.engine, '') AS engine
-            LIMIT 20
-            """,
-            {cs.KEY_PROJECT_NAME: self.project_name},
-        )
-        for preferred_engine in preferred_engines:
-            for row in rows:
-                if not isinstance(row, dict):
-                    continue
-                row_dict = cast(dict[str, object], row)
-                engine = str(row_dict.get("engine", "")).strip().lower()
-                candidate = str(row_dict.get("qualified_name", "")).strip()
-                if candidate and preferred_engine in engine:
-                    return candidate
-        for row in rows:
-            if not isinstance(row, dict):
-                continue
-            row_dict = cast(dict[str, object], row)
-            candidate = str(row_dict.get("qualified_name", "")).strip()
-            if candidate:
-                return candidate
-        return None
-
-    def _find_graphql_operation_qn(self, operation_name: str) -> str | None:
-        ingestor = self._ingestor_api()
-        if ingestor is None:
-            return None
-        normalized_name = operation_name.strip()
-        rows = ingestor.fetch_all(
-            """
-            MATCH (g:GraphQLOperation {project_name: $project_name})
-            WHERE $operation_name = ''
-               OR toLower(coalesce(g.name, '')) = toLower($operation_name)
-               OR toLower(coalesce(g.qualified_name, '')) CONTAINS toLower($operation_name)
-            RETURN coalesce(g.qualified_name, '') AS qualified_name
-            LIMIT 1
-            """,
-            {
-                cs.KEY_PROJECT_NAME: self.project_name,
-                "operation_name": normalized_name,
-            },
-        )
-        if not rows:
-            return None
-        row = rows[0]
-        if not isinstance(row, dict):
-            return None
-        candidate = str(row.get("qualified_name", "")).strip()
-        return candidate or None
-
     def _link_runtime_event_semantics(
         self, event_qn: str, event: dict[str, object]
     ) -> None:
         ingestor = self._ingestor_api()
-        if ingestor is None:
+        lookups = self._lookups
+        if ingestor is None or lookups is None:
             return
 
         event_name = str(event.get("event_name", "")).strip()
@@ -675,7 +993,7 @@ class RuntimeEvidenceIngestor:
         handler_name = str(event.get("handler_name", "")).strip()
         stage = str(event.get("stage", "")).strip().lower()
 
-        event_flow_qn = self._find_event_flow_qn(
+        event_flow_qn = lookups.event_flow(
             event_name=event_name,
             channel_name=channel_name,
         )
@@ -713,7 +1031,7 @@ class RuntimeEvidenceIngestor:
         for queue_name, role in ((channel_name, "primary"), (dlq_name, "dlq")):
             if not queue_name:
                 continue
-            queue_qn = self._find_queue_qn(queue_name)
+            queue_qn = lookups.queue(queue_name)
             if not queue_qn:
                 continue
             payload = {
@@ -741,7 +1059,7 @@ class RuntimeEvidenceIngestor:
                 payload,
             )
 
-        handler_spec = self._find_handler_spec(handler_name)
+        handler_spec = lookups.handler(handler_name)
         if handler_spec is not None:
             payload = {
                 "observation_kind": stage or "event_runtime",
@@ -779,137 +1097,100 @@ class RuntimeEvidenceIngestor:
             payload,
         )
 
-    def _find_event_flow_qn(
-        self,
-        *,
-        event_name: str,
-        channel_name: str,
-    ) -> str | None:
-        ingestor = self._ingestor_api()
-        if ingestor is None:
-            return None
+    def _ingested_artifact_qns(
+        self, ingestor: RuntimeGraphIngestorProtocol
+    ) -> set[str]:
         rows = ingestor.fetch_all(
             """
-            MATCH (e:EventFlow {project_name: $project_name})
-            RETURN
-              coalesce(e.qualified_name, '') AS qualified_name,
-              coalesce(e.canonical_key, '') AS canonical_key,
-              coalesce(e.event_name, '') AS event_name,
-              coalesce(e.channel_name, '') AS channel_name
-            LIMIT 100
+            MATCH (a:RuntimeArtifact {project_name: $project_name})
+            RETURN coalesce(a.qualified_name, '') AS qualified_name
             """,
             {cs.KEY_PROJECT_NAME: self.project_name},
         )
-        expected_key = build_event_flow_canonical_key(
-            event_name=event_name,
-            channel_name=channel_name,
-            fallback_name=event_name or channel_name,
-        )
-        normalized_event = normalize_event_name(event_name)
-        normalized_channel = normalize_channel_name(channel_name)
-        for row in rows:
-            if not isinstance(row, dict):
-                continue
-            row_dict = cast(dict[str, object], row)
-            candidate_qn = str(row_dict.get("qualified_name", "")).strip()
-            if not candidate_qn:
-                continue
-            candidate_key = str(row_dict.get("canonical_key", "")).strip().lower()
-            candidate_event = normalize_event_name(str(row_dict.get("event_name", "")))
-            candidate_channel = normalize_channel_name(
-                str(row_dict.get("channel_name", ""))
-            )
-            if expected_key and candidate_key == expected_key:
-                return candidate_qn
-            if normalized_event and candidate_event == normalized_event:
-                if not normalized_channel or candidate_channel == normalized_channel:
-                    return candidate_qn
-            if normalized_channel and not normalized_event:
-                if candidate_channel == normalized_channel:
-                    return candidate_qn
-        return None
+        return {
+            str(cast(dict[str, object], row).get("qualified_name", ""))
+            for row in rows
+            if isinstance(row, dict)
+        }
 
-    def _find_queue_qn(self, queue_name: str) -> str | None:
-        ingestor = self._ingestor_api()
-        if ingestor is None:
-            return None
-        rows = ingestor.fetch_all(
-            """
-            MATCH (q:Queue {project_name: $project_name})
-            RETURN
-              coalesce(q.qualified_name, '') AS qualified_name,
-              coalesce(q.queue_name, q.name, '') AS queue_name
-            LIMIT 100
-            """,
-            {cs.KEY_PROJECT_NAME: self.project_name},
-        )
-        expected = normalize_channel_name(queue_name)
-        for row in rows:
-            if not isinstance(row, dict):
-                continue
-            row_dict = cast(dict[str, object], row)
-            candidate_qn = str(row_dict.get("qualified_name", "")).strip()
-            candidate_name = normalize_channel_name(str(row_dict.get("queue_name", "")))
-            if candidate_qn and candidate_name == expected:
-                return candidate_qn
-        return None
+    def _load_checkpoints(self) -> dict[str, dict[str, object]]:
+        try:
+            raw = json.loads(self._offsets_path.read_text(encoding=cs.ENCODING_UTF8))
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as exc:
+            logger.warning("Ignoring unreadable runtime evidence offsets: {}", exc)
+            return {}
+        if (
+            not isinstance(raw, dict)
+            or raw.get("version") != self._OFFSETS_VERSION
+            or not isinstance(raw.get("files"), dict)
+        ):
+            return {}
+        return {
+            str(path): entry
+            for path, entry in cast(dict[str, object], raw["files"]).items()
+            if isinstance(entry, dict)
+        }
 
-    def _find_handler_spec(self, handler_name: str) -> tuple[str, str, str] | None:
-        normalized = handler_name.strip()
-        if not normalized:
-            return None
-        simple_name = normalized.split(".")[-1].lower()
-        ingestor = self._ingestor_api()
-        if ingestor is None:
-            return None
-        rows = ingestor.fetch_all(
-            """
-            MATCH (n)
-            WHERE coalesce(n.project_name, $project_name) = $project_name
-              AND (n:Function OR n:Method)
-            RETURN
-              labels(n) AS labels,
-              coalesce(n.qualified_name, '') AS qualified_name,
-              coalesce(n.name, '') AS name
-            LIMIT 500
-            """,
-            {cs.KEY_PROJECT_NAME: self.project_name},
-        )
-        for row in rows:
-            if not isinstance(row, dict):
-                continue
-            row_dict = cast(dict[str, object], row)
-            qualified_name = str(row_dict.get("qualified_name", "")).strip()
-            name = str(row_dict.get("name", "")).strip().lower()
-            labels = cast(list[str], row_dict.get("labels", []))
-            if not qualified_name or not labels:
-                continue
-            if (
-                qualified_name.lower().endswith(normalized.lower())
-                or name == simple_name
-            ):
-                return (labels[0], cs.KEY_QUALIFIED_NAME, qualified_name)
-        return None
+    def _persist_checkpoints(self, entries: dict[str, dict[str, object]]) -> None:
+        payload = {"version": self._OFFSETS_VERSION, "files": entries}
+        tmp_path = self._offsets_path.with_suffix(".json.tmp")
+        try:
+            self._offsets_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(json.dumps(payload), encoding=cs.ENCODING_UTF8)
+            os.replace(tmp_path, self._offsets_path)
+        except OSError as exc:
+            logger.warning("Could not persist runtime evidence offsets: {}", exc)
 
-    def _find_service_qn(self) -> str | None:
-        ingestor = self._ingestor_api()
-        if ingestor is None:
+    @staticmethod
+    def _tail_digest(runtime_file: Path, offset: int) -> str | None:
+        start = max(0, offset - _TAIL_DIGEST_BYTES)
+        try:
+            with runtime_file.open("rb") as handle:
+                handle.seek(start)
+                tail = handle.read(offset - start)
+        except OSError:
             return None
-        rows = ingestor.fetch_all(
+        return hashlib.sha256(tail).hexdigest()
+
+    @staticmethod
+    def _coerce_int(value: object) -> int:
+        return value if isinstance(value, int) and value >= 0 else 0
+
+    @classmethod
+    def _coerce_counts(cls, value: object) -> dict[str, int]:
+        if not isinstance(value, dict):
+            return {}
+        return {
+            str(key): cls._coerce_int(count)
+            for key, count in cast(dict[object, object], value).items()
+        }
+
+    @staticmethod
+    def _event_key(event: dict[str, object]) -> str:
+        canonical = json.dumps(event, sort_keys=True, default=str)
+        return hashlib.sha256(canonical.encode(cs.ENCODING_UTF8)).hexdigest()[:16]
+
+    def _delete_stale_events(self, artifact: _ArtifactEvents) -> None:
+        # A full re-read replaces the artifact's events, so nodes for events the
+        # file no longer contains are removed.
+        execute_write = getattr(self.ingestor, "execute_write", None)
+        if not callable(execute_write):
+            return
+        artifact_qn = self._artifact_qn(artifact.runtime_file)
+        execute_write(
             """
-            MATCH (s:Service {project_name: $project_name})
-            RETURN coalesce(s.qualified_name, '') AS qualified_name
-            LIMIT 1
+            MATCH (:RuntimeArtifact {qualified_name: $artifact_qn})
+                  -[:CONTAINS]->(e:RuntimeEvent)
+            WHERE NOT e.qualified_name IN $keep
+            DETACH DELETE e
             """,
-            {cs.KEY_PROJECT_NAME: self.project_name},
+            {
+                "artifact_qn": artifact_qn,
+                "keep": [f"{artifact_qn}.event.{key}" for key, _, _ in artifact.events],
+            },
         )
-        if not rows:
-            return None
-        row = rows[0]
-        if not isinstance(row, dict):
-            return None
-        candidate = str(row.get("qualified_name", "")).strip()
-        return candidate or None
 
     def _ingestor_api(self) -> RuntimeGraphIngestorProtocol | None:
         required = ("ensure_node_batch", "ensure_relationship_batch", "fetch_all")
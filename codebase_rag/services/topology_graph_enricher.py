@@ -23,6 +23,7 @@ from codebase_rag.parsers.pipeline.semantic_metadata import build_semantic_metad
 from codebase_rag.parsers.pipeline.semantic_pass_registry import (
     is_semantic_pass_enabled,
 )
+from codebase_rag.utils.source_store import SourceStore
 
 
 class TopologyGraphIngestorProtocol(Protocol):
@@ -82,10 +83,18 @@ class TopologyGraphEnricher(ConfigParserMixin):
         "bull": "bull",
     }
 
-    def __init__(self, repo_path: Path, project_name: str, ingestor: object) -> None:
+    def __init__(
+        self,
+        repo_path: Path,
+        project_name: str,
+        ingestor: object,
+        *,
+        source_store: SourceStore | None = None,
+    ) -> None:
         self.repo_path = repo_path.resolve()
         self.project_name = project_name
         self.ingestor = ingestor
+        self.source_store = source_store or SourceStore()
         self.config_semantics_enabled = is_semantic_pass_enabled(
             "CODEGRAPH_CONFIG_SEMANTICS"
         )
@@ -417,9 +426,11 @@ class TopologyGraphEnricher(ConfigParserMixin):
                 continue
             try:
                 parsed = self.parse_config_file(str(file_path))
-                source = file_path.read_text(encoding="utf-8", errors="ignore")
             except Exception:
                 continue
+            source = self.source_store.read_text(file_path)
+            if source is None:
+                continue
 
             if config_type == "docker-compose":
                 services = parsed.get("services", [])
@@ -591,11 +602,8 @@ class TopologyGraphEnricher(ConfigParserMixin):
         for file_path in self._iter_repo_files(limit=200):
             if file_path.suffix.lower() not in cs.GRAPHQL_EXTENSIONS:
                 continue
-            try:
-                content = file_path.read_text(
-                    encoding=cs.ENCODING_UTF8, errors="ignore"
-                )
-            except Exception:
+            content = self.source_store.read_text(file_path)
+            if content is None:
                 continue
             relative = file_path.relative_to(self.repo_path).as_posix()
             for match in pattern.finditer(content):
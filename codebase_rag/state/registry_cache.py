@@ -1,12 +1,15 @@
 from __future__ import annotations
 
 import sys
+import threading
 import time
+from bisect import bisect_left
 from collections import OrderedDict
-from collections.abc import Callable, ItemsView, KeysView
+from collections.abc import Callable, ItemsView, Iterable, Iterator, KeysView
+from dataclasses import dataclass
 from pathlib import Path
 
-from tree_sitter import Node
+from tree_sitter import Node, Parser
 
 from codebase_rag.core import constants as cs
 from codebase_rag.core.config import settings
@@ -15,31 +18,48 @@ from codebase_rag.data_models.types_defs import (
     NodeType,
     QualifiedName,
     SimpleNameLookup,
-    TrieNode,
 )
+from codebase_rag.utils.source_store import SourceStore
+
+type ASTEntry = tuple[Node, cs.SupportedLanguage]
 
 
 class FunctionRegistryTrie:
     def __init__(self, simple_name_lookup: SimpleNameLookup | None = None) -> None:
-        self.root: TrieNode = {}
         self._entries: FunctionRegistry = {}
+        self._sequence: dict[QualifiedName, int] = {}
+        self._next_sequence = 0
+        self._sorted: list[QualifiedName] = []
+        self._unsorted: list[QualifiedName] = []
+        self._by_last_segment: dict[str, QualifiedName | list[QualifiedName]] = {}
+        # (H) Only deletes and type changes are counted per name; see name_version.
+        self._name_changes: dict[str, int] = {}
         self._simple_name_lookup = simple_name_lookup
+        # (H) Prefix lookups merge the unsorted tail lazily; passes may run
+        # (H) them concurrently, so the merge and every index update share a lock.
+        self._lock = threading.RLock()
 
     def insert(self, qualified_name: QualifiedName, func_type: NodeType) -> None:
-        self._entries[qualified_name] = func_type
-
-        parts = qualified_name.split(cs.SEPARATOR_DOT)
-        current: TrieNode = self.root
-
-        for part in parts:
-            if part not in current:
-                current[part] = {}
-            child = current[part]
-            assert isinstance(child, dict)
-            current = child
-
-        current[cs.TRIE_TYPE_KEY] = func_type
-        current[cs.TRIE_QN_KEY] = qualified_name
+        last_segment = sys.intern(qualified_name.rpartition(cs.SEPARATOR_DOT)[2])
+        with self._lock:
+            previous = self._entries.get(qualified_name)
+            if previous is not None:
+                if previous != func_type:
+                    self._entries[qualified_name] = func_type
+                    self._count_name_change(last_segment)
+                return
+            self._entries[qualified_name] = func_type
+            self._sequence[qualified_name] = self._next_sequence
+            self._next_sequence += 1
+            self._unsorted.append(qualified_name)
+            bucket = self._by_last_segment.get(last_segment)
+            if bucket is None:
+                # (H) Most simple names are unique; keep those without a list.
+                self._by_last_segment[last_segment] = qualified_name
+            elif isinstance(bucket, list):
+                bucket.append(qualified_name)
+            else:
+                self._by_last_segment[last_segment] = [bucket, qualified_name]
 
     def get(
         self, qualified_name: QualifiedName, default: NodeType | None = None
@@ -56,66 +76,56 @@ class FunctionRegistryTrie:
         self.insert(qualified_name, func_type)
 
     def __delitem__(self, qualified_name: QualifiedName) -> None:
-        if qualified_name not in self._entries:
-            return
-
-        del self._entries[qualified_name]
-
-        parts = qualified_name.split(cs.SEPARATOR_DOT)
-        self._cleanup_trie_path(parts, self.root)
-
-    def _cleanup_trie_path(self, parts: list[str], node: TrieNode) -> bool:
-        if not parts:
-            node.pop(cs.TRIE_QN_KEY, None)
-            node.pop(cs.TRIE_TYPE_KEY, None)
-            return not node
-
-        part = parts[0]
-        if part not in node:
-            return False
-
-        child = node[part]
-        assert isinstance(child, dict)
-        if self._cleanup_trie_path(parts[1:], child):
-            del node[part]
-
-        is_endpoint = cs.TRIE_QN_KEY in node
-        has_children = any(not key.startswith(cs.TRIE_INTERNAL_PREFIX) for key in node)
-        return not has_children and not is_endpoint
-
-    def _navigate_to_prefix(self, prefix: str) -> TrieNode | None:
-        parts = prefix.split(cs.SEPARATOR_DOT) if prefix else []
-        current: TrieNode = self.root
-        for part in parts:
-            if part not in current:
-                return None
-            child = current[part]
-            assert isinstance(child, dict)
-            current = child
-        return current
+        with self._lock:
+            if qualified_name not in self._entries:
+                return
+
+            del self._entries[qualified_name]
+            del self._sequence[qualified_name]
+
+            sorted_names = self._sorted_names()
+            index = bisect_left(sorted_names, qualified_name)
+            del sorted_names[index]
+
+            last_segment = qualified_name.rpartition(cs.SEPARATOR_DOT)[2]
+            self._count_name_change(last_segment)
+            bucket = self._by_last_segment[last_segment]
+            if isinstance(bucket, list):
+                bucket.remove(qualified_name)
+                if len(bucket) == 1:
+                    self._by_last_segment[last_segment] = bucket[0]
+            else:
+                del self._by_last_segment[last_segment]
+
+    def name_version(self, simple_name: str) -> int:
+        # (H) Inserts grow the bucket by one, deletes shrink it by one and count
+        # (H) one change, type changes count one: every mutation raises the value.
+        bucket = self._by_last_segment.get(simple_name)
+        size = 0 if bucket is None else len(bucket) if isinstance(bucket, list) else 1
+        return size + 2 * self._name_changes.get(simple_name, 0)
+
+    def _count_name_change(self, simple_name: str) -> None:
+        self._name_changes[simple_name] = self._name_changes.get(simple_name, 0) + 1
+
+    def _sorted_names(self) -> list[QualifiedName]:
+        # (H) Callers hold self._lock for as long as they use the returned list.
+        if self._unsorted:
+            # (H) Timsort merges the already-sorted run with the appended tail.
+            self._sorted.extend(self._unsorted)
+            self._sorted.sort()
+            self._unsorted.clear()
+        return self._sorted
+
+    def _ending_with_segment(self, suffix: str) -> list[QualifiedName]:
+        bucket = self._by_last_segment.get(suffix.rpartition(cs.SEPARATOR_DOT)[2])
+        if bucket is None:
+            return []
+        return bucket if isinstance(bucket, list) else [bucket]
 
-    def _collect_from_subtree(
-        self,
-        node: TrieNode,
-        filter_fn: Callable[[QualifiedName], bool] | None = None,
-    ) -> list[tuple[QualifiedName, NodeType]]:
-        results: list[tuple[QualifiedName, NodeType]] = []
-
-        def dfs(n: TrieNode) -> None:
-            if cs.TRIE_QN_KEY in n:
-                qn = n[cs.TRIE_QN_KEY]
-                func_type = n[cs.TRIE_TYPE_KEY]
-                assert isinstance(qn, str) and isinstance(func_type, NodeType)
-                if filter_fn is None or filter_fn(qn):
-                    results.append((qn, func_type))
-
-            for key, child in n.items():
-                if not key.startswith(cs.TRIE_INTERNAL_PREFIX):
-                    assert isinstance(child, dict)
-                    dfs(child)
-
-        dfs(node)
-        return results
+    def _in_insertion_order(
+        self, qualified_names: Iterable[QualifiedName]
+    ) -> list[QualifiedName]:
+        return sorted(qualified_names, key=self._sequence.__getitem__)
 
     def keys(self) -> KeysView[QualifiedName]:
         return self._entries.keys()
@@ -129,23 +139,50 @@ class FunctionRegistryTrie:
     def find_with_prefix_and_suffix(
         self, prefix: str, suffix: str
     ) -> list[QualifiedName]:
-        node = self._navigate_to_prefix(prefix)
-        if node is None:
-            return []
         suffix_pattern = f".{suffix}"
-        matches = self._collect_from_subtree(
-            node, lambda qn: qn.endswith(suffix_pattern)
-        )
-        return [qn for qn, _ in matches]
+        scope = f"{prefix}{cs.SEPARATOR_DOT}"
+        return [
+            qn
+            for qn in self._ending_with_segment(suffix)
+            if qn.endswith(suffix_pattern)
+            and (not prefix or qn == prefix or qn.startswith(scope))
+        ]
 
     def find_ending_with(self, suffix: str) -> list[QualifiedName]:
         if self._simple_name_lookup is not None and suffix in self._simple_name_lookup:
             return list(self._simple_name_lookup[suffix])
-        return [qn for qn in self._entries.keys() if qn.endswith(f".{suffix}")]
+        suffix_pattern = f".{suffix}"
+        return [
+            qn
+            for qn in self._ending_with_segment(suffix)
+            if qn.endswith(suffix_pattern)
+        ]
 
     def find_with_prefix(self, prefix: str) -> list[tuple[QualifiedName, NodeType]]:
-        node = self._navigate_to_prefix(prefix)
-        return [] if node is None else self._collect_from_subtree(node)
+        if not prefix:
+            return list(self._entries.items())
+        with self._lock:
+            sorted_names = self._sorted_names()
+            # (H) "/" sorts right after ".", so this range is every name under prefix.
+            start = bisect_left(sorted_names, f"{prefix}{cs.SEPARATOR_DOT}")
+            end = bisect_left(sorted_names, f"{prefix}/", start)
+            matches = sorted_names[start:end]
+        if prefix in self._entries:
+            matches.append(prefix)
+        return [(qn, self._entries[qn]) for qn in self._in_insertion_order(matches)]
+
+
+@dataclass(slots=True)
+class _SpilledTree:
+    language: cs.SupportedLanguage
+    content_hash: str
+
+
+class _ASTCacheItems(ItemsView[Path, ASTEntry]):
+    _mapping: BoundedASTCache
+
+    def __iter__(self) -> Iterator[tuple[Path, ASTEntry]]:
+        return self._mapping._iter_items()
 
 
 class BoundedASTCache:
@@ -154,8 +191,11 @@ class BoundedASTCache:
         max_entries: int | None = None,
         max_memory_mb: int | None = None,
         ttl_seconds: float | None = None,
+        *,
+        source_store: SourceStore | None = None,
+        parser_for: Callable[[cs.SupportedLanguage], Parser | None] | None = None,
     ):
-        self.cache: OrderedDict[Path, tuple[Node, cs.SupportedLanguage]] = OrderedDict()
+        self.cache: OrderedDict[Path, ASTEntry] = OrderedDict()
         self.max_entries = (
             max_entries if max_entries is not None else settings.CACHE_MAX_ENTRIES
         )
@@ -165,47 +205,86 @@ class BoundedASTCache:
         self.max_memory_bytes = max_mem * cs.BYTES_PER_MB
         self.ttl_seconds = ttl_seconds
         self._timestamps: dict[Path, float] = {}
+        self.source_store = source_store
+        self.parser_for = parser_for
+        # (H) Evicted trees leave a handle behind and are re-parsed on demand.
+        self._spilled: dict[Path, _SpilledTree] = {}
+        self._lock = threading.RLock()
         self._hits = 0
         self._misses = 0
         self._expirations = 0
+        self._spills = 0
+        self._reparses = 0
+        self._reparse_failures = 0
 
-    def __setitem__(self, key: Path, value: tuple[Node, cs.SupportedLanguage]) -> None:
-        if key in self.cache:
-            del self.cache[key]
-            self._timestamps.pop(key, None)
-
-        self.cache[key] = value
-        self._timestamps[key] = time.time()
-
-        self._enforce_limits()
-
-    def __getitem__(self, key: Path) -> tuple[Node, cs.SupportedLanguage]:
-        if self._is_expired(key):
-            self._misses += 1
+    def __setitem__(self, key: Path, value: ASTEntry) -> None:
+        with self._lock:
+            if key in self.cache:
+                del self.cache[key]
+                self._timestamps.pop(key, None)
+            self._spilled.pop(key, None)
+
+            self.cache[key] = value
+            self._timestamps[key] = time.time()
+
+            self._enforce_limits()
+
+    def __getitem__(self, key: Path) -> ASTEntry:
+        with self._lock:
+            if self._is_expired(key):
+                self._misses += 1
+                raise KeyError(key)
+            value = self.cache.get(key)
+            if value is not None:
+                self.cache.move_to_end(key)
+                self._hits += 1
+                return value
+        value = self._restore(key)
+        if value is None:
+            with self._lock:
+                self._misses += 1
             raise KeyError(key)
-        value = self.cache[key]
-        self.cache.move_to_end(key)
-        self._hits += 1
         return value
 
     def __delitem__(self, key: Path) -> None:
-        if key in self.cache:
-            del self.cache[key]
-            self._timestamps.pop(key, None)
+        with self._lock:
+            if key in self.cache:
+                del self.cache[key]
+                self._timestamps.pop(key, None)
+            if self._spilled.pop(key, None) is not None:
+                self._timestamps.pop(key, None)
 
     def __contains__(self, key: Path) -> bool:
-        if key not in self.cache:
-            return False
-        if self._is_expired(key):
+        with self._lock:
+            if self._is_expired(key):
+                return False
+            if key in self.cache:
+                return True
+            handle = self._spilled.get(key)
+            if handle is None:
+                return False
+            if self._is_restorable(key, handle):
+                return True
+            # (H) Agree with __getitem__, which cannot restore a stale handle.
+            del self._spilled[key]
+            self._timestamps.pop(key, None)
             return False
-        return True
 
-    def items(self) -> ItemsView[Path, tuple[Node, cs.SupportedLanguage]]:
-        self._evict_expired()
-        return self.cache.items()
+    def __iter__(self) -> Iterator[Path]:
+        with self._lock:
+            return iter([*self.cache, *self._spilled])
+
+    def __len__(self) -> int:
+        return len(self.cache) + len(self._spilled)
+
+    def items(self) -> ItemsView[Path, ASTEntry]:
+        with self._lock:
+            self._evict_expired()
+        return _ASTCacheItems(self)
 
     def enforce_limits(self) -> None:
-        self._enforce_limits()
+        with self._lock:
+            self._enforce_limits()
 
     def stats(self) -> dict[str, int]:
         return {
@@ -213,11 +292,78 @@ class BoundedASTCache:
             "misses": self._misses,
             "expirations": self._expirations,
             "size": len(self.cache),
+            "spilled": len(self._spilled),
+            "spills": self._spills,
+            "reparses": self._reparses,
+            "reparse_failures": self._reparse_failures,
         }
 
+    def _iter_items(self) -> Iterator[tuple[Path, ASTEntry]]:
+        for key in list(self):
+            value = self.cache.get(key)
+            if value is None:
+                value = self._restore(key)
+            if value is not None:
+                yield key, value
+
+    def _restore(self, key: Path) -> ASTEntry | None:
+        with self._lock:
+            value = self.cache.get(key)
+            if value is not None:
+                return value
+            handle = self._spilled.get(key)
+            if handle is None:
+                return None
+        # (H) Parse without the lock so other threads can use the cache meanwhile.
+        root_node = self._reparse(key, handle)
+        with self._lock:
+            value = self.cache.get(key)
+            if value is not None:
+                return value
+            # (H) The entry was deleted or replaced while it was being parsed.
+            if self._spilled.get(key) is not handle:
+                return None
+            del self._spilled[key]
+            if root_node is None:
+                self._timestamps.pop(key, None)
+                self._reparse_failures += 1
+                return None
+            self._reparses += 1
+            value = (root_node, handle.language)
+            self[key] = value
+            return value
+
+    def _is_restorable(self, key: Path, handle: _SpilledTree) -> bool:
+        if self.source_store is None or self.parser_for is None:
+            return False
+        # (H) A changed file no longer matches the graph built from the old tree.
+        return self.source_store.content_hash(key) == handle.content_hash
+
+    def _reparse(self, key: Path, handle: _SpilledTree) -> Node | None:
+        if self.source_store is None or self.parser_for is None:
+            return None
+        if not self._is_restorable(key, handle):
+            return None
+        parser = self.parser_for(handle.language)
+        source = self.source_store.read_bytes(key)
+        if parser is None or source is None:
+            return None
+        return parser.parse(source).root_node
+
+    def _evict_oldest(self) -> None:
+        key, (_, language) = self.cache.popitem(last=False)
+        content_hash = None
+        if self.source_store is not None and self.parser_for is not None:
+            content_hash = self.source_store.content_hash(key)
+        if content_hash is None:
+            self._timestamps.pop(key, None)
+            return
+        self._spilled[key] = _SpilledTree(language, content_hash)
+        self._spills += 1
+
     def _enforce_limits(self) -> None:
         while len(self.cache) > self.max_entries:
-            self.cache.popitem(last=False)
+            self._evict_oldest()
 
         if self._should_evict_for_memory():
             entries_to_remove = max(
@@ -225,17 +371,18 @@ class BoundedASTCache:
             )
             for _ in range(entries_to_remove):
                 if self.cache:
-                    self.cache.popitem(last=False)
+                    self._evict_oldest()
 
         self._evict_expired()
 
     def _evict_expired(self) -> None:
         if self.ttl_seconds is None:
             return
-        expired_keys = [key for key in list(self.cache.keys()) if self._is_expired(key)]
+        expired_keys = [key for key in list(self) if self._is_expired(key)]
         for key in expired_keys:
             if key in self.cache:
                 del self.cache[key]
+            self._spilled.pop(key, None)
             self._timestamps.pop(key, None)
             self._expirations += 1
 
@@ -13,8 +13,11 @@ from unittest.mock import MagicMock
 import pytest
 from loguru import logger
 
+from codebase_rag.core import constants as cs
+from codebase_rag.core.config import settings
 from codebase_rag.graph_db.graph_updater import GraphUpdater
 from codebase_rag.infrastructure.parser_loader import load_parsers
+from codebase_rag.parsers.core.query_cache import set_shared_query_cache
 from codebase_rag.services.graph_service import MemgraphIngestor
 
 if TYPE_CHECKING:
@@ -96,6 +99,20 @@ def disable_analysis_for_tests() -> Generator[None, None, None]:
     os.environ.pop("CODEGRAPH_ANALYSIS", None)
 
 
+@pytest.fixture(scope="session", autouse=True)
+def isolate_query_cache(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> Generator[None, None, None]:
+    original_path = settings.CODEGRAPH_QUERY_CACHE_PATH
+    settings.CODEGRAPH_QUERY_CACHE_PATH = str(
+        tmp_path_factory.mktemp("query_cache") / cs.QUERY_CACHE_FILE
+    )
+    set_shared_query_cache(None)
+    yield
+    settings.CODEGRAPH_QUERY_CACHE_PATH = original_path
+    set_shared_query_cache(None)
+
+
 @pytest.fixture
 def temp_repo() -> Generator[Path, None, None]:
     """Creates a temporary repository path for a test and cleans up afterward."""
@@ -206,7 +223,28 @@ def cleanup_qdrant_client() -> Generator[None, None, None]:
         pass
 
 
-def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption(
+        "--run-slow",
+        action="store_true",
+        default=False,
+        help="run tests marked slow (deselected by default)",
+    )
+
+
+def _deselect_slow_tests(config: pytest.Config, items: list[pytest.Item]) -> None:
+    if config.getoption("--run-slow") or "slow" in config.getoption("markexpr"):
+        return
+    deselected = [item for item in items if item.get_closest_marker("slow")]
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = [item for item in items if not item.get_closest_marker("slow")]
+
+
+def pytest_collection_modifyitems(
+    config: pytest.Config, items: list[pytest.Item]
+) -> None:
+    _deselect_slow_tests(config, items)
     if sys.platform != "win32":
         return
 
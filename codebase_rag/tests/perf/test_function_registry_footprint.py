@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import time
+import tracemalloc
+
+import pytest
+
+from codebase_rag.data_models.types_defs import NodeType
+from codebase_rag.state import registry_cache
+from codebase_rag.state.registry_cache import FunctionRegistryTrie
+
+SYMBOL_COUNT = 100_000
+# Bytes the registry itself allocates per symbol, excluding the qualified-name
+# strings that callers own.
+BYTES_PER_SYMBOL_BUDGET = 300
+ENDING_WITH_SECONDS_BUDGET = 0.5
+PREFIX_SECONDS_BUDGET = 0.5
+
+
+def _qualified_name(index: int) -> str:
+    return (
+        f"monorepo.pkg{index % 97}.mod{index % 1013}.Class{index % 5003}.method_{index}"
+    )
+
+
+@pytest.mark.slow
+def test_function_registry_memory_and_lookup_budget() -> None:
+    names = [_qualified_name(index) for index in range(SYMBOL_COUNT)]
+    own_allocations = [tracemalloc.Filter(True, registry_cache.__file__)]
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot().filter_traces(own_allocations)
+    registry = FunctionRegistryTrie()
+    for name in names:
+        registry.insert(name, NodeType.METHOD)
+    after = tracemalloc.take_snapshot().filter_traces(own_allocations)
+    tracemalloc.stop()
+    footprint = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+
+    assert footprint / SYMBOL_COUNT <= BYTES_PER_SYMBOL_BUDGET
+
+    started = time.perf_counter()
+    for index in range(0, SYMBOL_COUNT, 50):
+        assert registry.find_ending_with(f"method_{index}") == [_qualified_name(index)]
+    assert time.perf_counter() - started <= ENDING_WITH_SECONDS_BUDGET
+
+    registry.find_with_prefix("monorepo")
+    started = time.perf_counter()
+    for index in range(2_000):
+        module_qn = f"monorepo.pkg{index % 97}.mod{index % 1013}"
+        for qn, _ in registry.find_with_prefix(module_qn):
+            assert qn.startswith(f"{module_qn}.")
+    assert time.perf_counter() - started <= PREFIX_SECONDS_BUDGET
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import time
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+from tree_sitter import Parser
+
+from codebase_rag.core import constants as cs
+from codebase_rag.data_models.types_defs import LanguageQueries
+from codebase_rag.infrastructure.parser_loader import (
+    compile_language_queries,
+    load_language_grammar,
+)
+from codebase_rag.parsers.core.query_cache import (
+    CompositeQueryCache,
+    PersistentQueryIndex,
+    set_shared_query_cache,
+)
+
+WARM_COMPILE_SECONDS_BUDGET = 1.0
+_QUERY_KEYS = ("functions", "classes", "calls", "imports", "locals")
+
+
+@pytest.fixture
+def restore_shared_cache() -> Iterator[None]:
+    yield
+    set_shared_query_cache(None)
+
+
+def _compile_in_fresh_process(
+    index_path: Path, lang_name: cs.SupportedLanguage
+) -> tuple[float, CompositeQueryCache, LanguageQueries]:
+    cache = CompositeQueryCache(l2=PersistentQueryIndex(index_path))
+    set_shared_query_cache(cache)
+    language = load_language_grammar(lang_name)
+    started = time.perf_counter()
+    queries = compile_language_queries(lang_name, language, Parser(language))
+    return time.perf_counter() - started, cache, queries
+
+
+def _pattern_counts(queries: LanguageQueries) -> dict[str, int | None]:
+    counts: dict[str, int | None] = {}
+    for key in _QUERY_KEYS:
+        query = queries.get(key)
+        counts[key] = getattr(query, "pattern_count", None)
+    return counts
+
+
+@pytest.mark.usefixtures("restore_shared_cache")
+def test_warm_query_compile_reuses_persistent_index(tmp_path: Path) -> None:
+    index_path = tmp_path / "compiled_queries.json"
+
+    _, cold_cache, cold_queries = _compile_in_fresh_process(
+        index_path, cs.SupportedLanguage.PYTHON
+    )
+    warm_seconds, warm_cache, warm_queries = _compile_in_fresh_process(
+        index_path, cs.SupportedLanguage.PYTHON
+    )
+
+    cold_stats = cold_cache.stats()
+    warm_stats = warm_cache.stats()
+    assert index_path.exists()
+    assert warm_stats["compiles"] < cold_stats["compiles"]
+    assert warm_stats["l2"]["hit_rate"] == 1.0
+    assert warm_seconds <= WARM_COMPILE_SECONDS_BUDGET
+    assert _pattern_counts(warm_queries) == _pattern_counts(cold_queries)
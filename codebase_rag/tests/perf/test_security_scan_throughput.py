@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import time
+from pathlib import Path
+
+import pytest
+
+from codebase_rag.core import constants as cs
+from codebase_rag.security.security_scanner import SecurityScanner
+
+CORPUS_MB = 50
+SCAN_SECONDS_BUDGET = 120.0
+
+_MODULE_BLOCK = (
+    "def handler(request):\n"
+    '    query = "SELECT * FROM orders WHERE id=" + request.args["id"]\n'
+    "    element.innerHTML = payload\n"
+    '    API_TOKEN = "abcdefghijk123"\n'
+    '    db_password = os.environ["DB_PASSWORD"]\n'
+    + "    value = compute(alpha, beta) * gamma  # plain code\n"
+    * 40
+)
+
+
+def _materialize_corpus(base_dir: Path, total_bytes: int) -> list[Path]:
+    module_text = _MODULE_BLOCK * 32
+    count = total_bytes // len(module_text) + 1
+    paths = []
+    for index in range(count):
+        path = base_dir / f"pkg_{index // 100}" / f"module_{index}.py"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(module_text, encoding=cs.ENCODING_UTF8)
+        paths.append(path)
+    return paths
+
+
+@pytest.mark.slow
+def test_security_scan_of_large_corpus_within_budget(tmp_path: Path) -> None:
+    paths = _materialize_corpus(tmp_path, CORPUS_MB * cs.BYTES_PER_MB)
+    scanner = SecurityScanner()
+    per_file = scanner.scan_text(paths[0].read_text(encoding=cs.ENCODING_UTF8), "x")
+
+    started = time.perf_counter()
+    findings = scanner.scan_files(paths)
+    elapsed = time.perf_counter() - started
+
+    assert len(findings) == len(per_file) * len(paths)
+    assert [finding.path for finding in findings[: len(per_file)]] == [
+        str(paths[0])
+    ] * len(per_file)
+    assert elapsed <= SCAN_SECONDS_BUDGET
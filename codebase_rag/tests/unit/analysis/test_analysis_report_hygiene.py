@@ -479,3 +479,100 @@ def test_fan_report_adds_production_and_semantic_views(tmp_path: Path) -> None:
         ]
         == 1
     )
+
+
+def test_nested_functions_link_outermost_enclosing_function_per_file(
+    tmp_path: Path,
+) -> None:
+    class RecordingIngestor(SpyIngestor):
+        def __init__(self) -> None:
+            super().__init__()
+            self.links: list[tuple[str, str]] = []
+
+        def ensure_relationship_batch(self, *args: object, **kwargs: object) -> None:
+            source = cast(tuple[object, str, str], args[0])
+            target = cast(tuple[object, str, str], args[2])
+            self.links.append((source[2], target[2]))
+
+    def function(node_id: int, qn: str, path: str, start: int, end: int) -> NodeRecord:
+        return NodeRecord(
+            node_id,
+            [cs.NodeLabel.FUNCTION.value],
+            {
+                cs.KEY_QUALIFIED_NAME: qn,
+                cs.KEY_PATH: path,
+                cs.KEY_START_LINE: start,
+                cs.KEY_END_LINE: end,
+            },
+        )
+
+    ingestor = RecordingIngestor()
+    runner = AnalysisRunner(cast(IngestorProtocol, ingestor), tmp_path)
+    nodes = [
+        function(3, "a.inner", "a.py", 3, 5),
+        function(1, "a.outer", "a.py", 1, 10),
+        function(2, "a.middle", "a.py", 2, 8),
+        function(4, "a.sibling", "a.py", 12, 14),
+        function(5, "b.other", "b.py", 3, 4),
+    ]
+
+    assert runner._detect_nested_functions(nodes, {}) == 2
+    assert ingestor.links == [("a.outer", "a.middle"), ("a.outer", "a.inner")]
+
+
+def test_static_passes_share_one_source_read_per_file(tmp_path: Path) -> None:
+    (tmp_path / "sample.py").write_text(
+        "def build():\n    value = 1\n    return value\n", encoding="utf-8"
+    )
+    runner = AnalysisRunner(cast(IngestorProtocol, SpyIngestor()), tmp_path)
+    node = NodeRecord(1, [cs.NodeLabel.FILE.value], {cs.KEY_PATH: "sample.py"})
+
+    runner._unreachable_code([node], ["sample.py"])
+    runner._unused_variables([node], ["sample.py"])
+    runner._secret_scan([node], ["sample.py"])
+    assert runner._read_source_lines("sample.py", 2, 3) == "value = 1\n    return value"
+
+    stats = runner._source_store().stats
+    assert stats.misses == 1
+    assert stats.hits == 3
+
+
+def test_complexity_aggregates_ingested_metrics_without_reading_sources(
+    tmp_path: Path,
+) -> None:
+    ingestor = SpyIngestor()
+    runner = AnalysisRunner(cast(IngestorProtocol, ingestor), tmp_path)
+    nodes = [
+        NodeRecord(
+            1,
+            [cs.NodeLabel.FUNCTION.value],
+            {
+                cs.KEY_PATH: "pkg/a.py",
+                cs.KEY_COMPLEXITY: 4,
+                cs.KEY_COGNITIVE_COMPLEXITY: 6,
+            },
+        ),
+        NodeRecord(
+            2,
+            [cs.NodeLabel.METHOD.value],
+            {
+                cs.KEY_PATH: "pkg/b.py",
+                cs.KEY_COMPLEXITY: 2,
+                cs.KEY_COGNITIVE_COMPLEXITY: 1,
+            },
+        ),
+        NodeRecord(3, [cs.NodeLabel.FUNCTION.value], {cs.KEY_PATH: "pkg/c.py"}),
+    ]
+
+    summary = runner._compute_complexity(nodes, {})
+
+    assert summary == {
+        "average": 3.0,
+        "max": 4.0,
+        "count": 2.0,
+        "cognitive_average": 3.5,
+        "cognitive_max": 6.0,
+        "unmeasured": 1.0,
+    }
+    assert ingestor.node_calls == []
+    assert runner._source_store().stats.as_dict()["misses"] == 0
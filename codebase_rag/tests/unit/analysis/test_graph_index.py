@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from unittest.mock import MagicMock
+
+from codebase_rag.analysis.analysis_runner import (
+    AnalysisRunner,
+    NodeRecord,
+    RelationshipRecord,
+)
+from codebase_rag.analysis.graph_index import GraphIndex
+from codebase_rag.core import constants as cs
+
+
+def _nodes() -> list[NodeRecord]:
+    return [
+        NodeRecord(10, [cs.NodeLabel.FUNCTION.value], {cs.KEY_NAME: "a"}),
+        NodeRecord(20, [cs.NodeLabel.FUNCTION.value], {cs.KEY_NAME: "b"}),
+        NodeRecord(30, [cs.NodeLabel.FUNCTION.value], {cs.KEY_NAME: "c"}),
+    ]
+
+
+def _relationships() -> list[RelationshipRecord]:
+    return [
+        RelationshipRecord(10, 20, cs.RelationshipType.CALLS, {}),
+        RelationshipRecord(10, 30, cs.RelationshipType.CALLS, {}),
+        RelationshipRecord(20, 30, cs.RelationshipType.CALLS, {}),
+        RelationshipRecord(20, 30, cs.RelationshipType.USES_COMPONENT, {}),
+        RelationshipRecord(30, 99, cs.RelationshipType.IMPORTS, {}),
+    ]
+
+
+def test_graph_index_exposes_typed_neighbors_and_degrees() -> None:
+    index = GraphIndex.build(_nodes(), _relationships())
+
+    assert index.node_count == 4
+    assert index.successors(10, cs.RelationshipType.CALLS) == [20, 30]
+    assert index.predecessors(30, cs.RelationshipType.CALLS) == [10, 20]
+    assert index.in_edges(30, {"CALLS", "USES_COMPONENT"}) == [
+        (10, "CALLS"),
+        (20, "CALLS"),
+        (20, "USES_COMPONENT"),
+    ]
+    assert index.in_degrees(cs.RelationshipType.CALLS) == {20: 1, 30: 2}
+    assert index.out_degree(20, ("CALLS", "USES_COMPONENT")) == 2
+    assert index.edge_types_between(20, 30) == ["CALLS", "USES_COMPONENT"]
+    assert index.successors(10, "MISSING") == []
+
+
+def test_graph_index_reachability_and_dangling_edges() -> None:
+    index = GraphIndex.build(_nodes(), _relationships())
+
+    assert index.reachable([20], cs.RelationshipType.CALLS) == {20, 30}
+    assert index.adjacency(cs.RelationshipType.CALLS, within={10, 20}) == {10: {20}}
+    assert index.dangling_edge_count() == 1
+
+
+def test_runner_mixins_share_one_index_per_graph(tmp_path: Path) -> None:
+    runner = AnalysisRunner(MagicMock(), tmp_path)
+    nodes = _nodes()
+    relationships = _relationships()
+    node_by_id = {node.node_id: node for node in nodes}
+
+    first = runner._graph_index(nodes, relationships)
+    runner._dependency_risk(nodes, relationships, node_by_id)
+    runner._fan_in_out(nodes, relationships, node_by_id)
+
+    assert runner._graph_index(nodes, relationships) is first
+    fan_report = json.loads(
+        (tmp_path / "output" / "analysis" / "fan_report.json").read_text(
+            encoding="utf-8"
+        )
+    )
+    assert fan_report["summary"]["raw_fan_in_nodes"] == 2
+    assert fan_report["summary"]["semantic_fan_in_nodes"] == 2
+
+
+def test_reachable_counts_condense_cycles_and_match_traversal() -> None:
+    relationships = [
+        *_relationships(),
+        RelationshipRecord(30, 40, cs.RelationshipType.CALLS, {}),
+        RelationshipRecord(40, 30, cs.RelationshipType.CALLS, {}),
+        RelationshipRecord(50, 50, cs.RelationshipType.CALLS, {}),
+    ]
+    index = GraphIndex.build(_nodes(), relationships)
+    expected = {
+        node_id: len(index.reachable([node_id], cs.RelationshipType.CALLS) - {node_id})
+        for node_id in (10, 20, 30, 40, 50, 99)
+    }
+
+    assert index.reachable_counts(cs.RelationshipType.CALLS) == {
+        node_id: count for node_id, count in expected.items() if count
+    }
+    assert expected == {10: 3, 20: 2, 30: 1, 40: 1, 50: 0, 99: 0}
+    assert index.reachable_counts(
+        cs.RelationshipType.CALLS, exact_budget_bytes=0
+    ) == index.reachable_counts(cs.RelationshipType.CALLS)
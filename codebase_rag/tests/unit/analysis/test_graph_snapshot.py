@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, cast
+
+import pytest
+
+from codebase_rag.analysis.analysis_runner import AnalysisRunner
+from codebase_rag.analysis.graph_snapshot import GraphSnapshot, GraphSnapshotKey
+from codebase_rag.analysis.types import NodeRecord, RelationshipRecord
+from codebase_rag.graph_db.cypher_queries import (
+    CYPHER_EXPORT_PROJECT_NODES,
+    CYPHER_EXPORT_PROJECT_RELATIONSHIPS,
+    CYPHER_GRAPH_GENERATION,
+)
+from codebase_rag.services import IngestorProtocol
+
+
+def test_snapshot_round_trips_and_rejects_other_keys(tmp_path: Path) -> None:
+    key = GraphSnapshotKey("demo", "abc123", "3:7:2:9")
+    nodes = [
+        NodeRecord(7, ["Module"], {"path": "app.py", "qualified_name": "demo.app"}),
+        NodeRecord(-1, ["Function"], {"name": "ünï", "decorators": ["cache"]}),
+        NodeRecord(2**40, ["Function"], {"complexity": 3, "ratio": 0.5}),
+    ]
+    relationships = [
+        RelationshipRecord(7, -1, "DEFINES", {}),
+        RelationshipRecord(-1, 2**40, "CALLS", {"line": 4}),
+    ]
+    path = tmp_path / "graph_cache.bin"
+
+    assert GraphSnapshot(key, nodes, relationships).save(path)
+    loaded = GraphSnapshot.load(path, key)
+
+    assert loaded is not None
+    assert loaded.nodes == nodes
+    assert loaded.relationships == relationships
+    assert loaded.nodes[1].labels is not loaded.nodes[2].labels
+    for stale in (
+        GraphSnapshotKey("demo", "abc123", "4:8:2:9"),
+        GraphSnapshotKey("demo", "def456", key.generation),
+        GraphSnapshotKey("other", "abc123", key.generation),
+    ):
+        assert GraphSnapshot.load(path, stale) is None
+    assert GraphSnapshot.load(tmp_path / "missing.bin", key) is None
+
+
+class _ExportIngestor:
+    def __init__(self) -> None:
+        self.queries: list[str] = []
+        self.graph_generation = 0
+        self.generation_params: list[dict | None] = []
+
+    def fetch_all(self, query: str, params: dict | None = None) -> list[dict]:
+        self.queries.append(query)
+        if query == CYPHER_GRAPH_GENERATION:
+            self.generation_params.append(params)
+            return [{"graph_generation": self.graph_generation}]
+        if query == CYPHER_EXPORT_PROJECT_NODES:
+            return [
+                {
+                    "node_id": 1,
+                    "labels": ["Module"],
+                    "properties": {"path": "app.py", "qualified_name": "app"},
+                }
+            ]
+        return []
+
+    def execute_write(self, query: str, params: dict | None = None) -> None:
+        return None
+
+    def ensure_node_batch(self, label: str, properties: dict) -> None:
+        return None
+
+    def ensure_relationship_batch(self, *args: object, **kwargs: object) -> None:
+        return None
+
+    def flush_all(self) -> None:
+        return None
+
+
+def test_run_modules_exports_graph_once_and_reuses_snapshot(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("CODEGRAPH_ANALYSIS_DB", "0")
+    monkeypatch.setenv("CODEGRAPH_ANALYSIS_CACHE", "1")
+    monkeypatch.setattr(
+        "codebase_rag.analysis.mixins.graph_access.get_git_head", lambda _: "abc123"
+    )
+    exports = {CYPHER_EXPORT_PROJECT_NODES, CYPHER_EXPORT_PROJECT_RELATIONSHIPS}
+
+    ingestor = _ExportIngestor()
+    runner = AnalysisRunner(cast(IngestorProtocol, ingestor), tmp_path)
+    first = runner.run_modules(modules={"parameters"})
+    second = runner.run_modules(modules={"parameters"})
+    exported = [query for query in ingestor.queries if query in exports]
+
+    fresh = _ExportIngestor()
+    third = AnalysisRunner(cast(IngestorProtocol, fresh), tmp_path).run_modules(
+        modules={"parameters"}
+    )
+
+    assert "parameters" in first
+    assert first == second == third
+    assert len(exported) == 2
+    assert not [query for query in fresh.queries if query in exports]
+    assert (tmp_path / ".codebase_rag" / "graph_cache.bin").exists()
+    assert cast(Any, runner)._graph_snapshot_cache.nodes[0].node_id == 1
+    assert ingestor.generation_params[0] == {"project_name": runner.project_name}
+
+    nodes, relationships = cast(Any, runner)._load_graph_data(ingestor)
+    nodes.clear()
+    relationships.append(RelationshipRecord(1, 1, "CALLS", {}))
+    reloaded = cast(Any, runner)._load_graph_data(ingestor)
+    assert [node.node_id for node in reloaded[0]] == [1]
+    assert reloaded[1] == []
+
+
+def test_generation_bump_invalidates_snapshot_after_property_updates(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("CODEGRAPH_ANALYSIS_DB", "0")
+    monkeypatch.setenv("CODEGRAPH_ANALYSIS_CACHE", "1")
+    monkeypatch.setattr(
+        "codebase_rag.analysis.mixins.graph_access.get_git_head", lambda _: "abc123"
+    )
+    ingestor = _ExportIngestor()
+    runner = AnalysisRunner(cast(IngestorProtocol, ingestor), tmp_path)
+    runner.run_modules(modules={"parameters"})
+
+    ingestor.graph_generation += 1
+    runner.run_modules(modules={"parameters"})
+
+    assert ingestor.queries.count(CYPHER_EXPORT_PROJECT_NODES) == 2
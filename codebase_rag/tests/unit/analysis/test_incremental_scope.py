@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any, cast
+
+import pytest
+
+from codebase_rag.analysis.analysis_runner import AnalysisRunner
+from codebase_rag.analysis.graph_index import GraphIndex
+from codebase_rag.analysis.types import NodeRecord, RelationshipRecord
+from codebase_rag.services import IngestorProtocol
+
+
+def _function(node_id: int, path: str, complexity: int) -> NodeRecord:
+    return NodeRecord(
+        node_id,
+        ["Function"],
+        {
+            "qualified_name": f"{path}.fn{node_id}",
+            "path": path,
+            "start_line": 1,
+            "end_line": 2,
+            "complexity": complexity,
+        },
+    )
+
+
+NODES = [
+    NodeRecord(1, ["File"], {"path": "a.py"}),
+    NodeRecord(2, ["File"], {"path": "b.py"}),
+    NodeRecord(3, ["File"], {"path": "c.py"}),
+    _function(11, "a.py", 2),
+    _function(12, "b.py", 4),
+    _function(13, "c.py", 6),
+]
+RELATIONSHIPS = [RelationshipRecord(12, 13, "CALLS", {})]
+
+
+def test_neighborhood_expands_both_directions_up_to_hops() -> None:
+    index = GraphIndex.build(
+        [NodeRecord(node_id, ["Function"], {}) for node_id in range(1, 5)],
+        [
+            RelationshipRecord(1, 2, "CALLS", {}),
+            RelationshipRecord(3, 2, "IMPORTS", {}),
+            RelationshipRecord(3, 4, "DEFINES", {}),
+        ],
+    )
+
+    assert index.neighborhood([2], ("CALLS", "IMPORTS"), hops=0) == {2}
+    assert index.neighborhood([2], ("CALLS", "IMPORTS"), hops=1) == {1, 2, 3}
+    assert index.neighborhood([1], ("CALLS", "IMPORTS"), hops=2) == {1, 2, 3}
+    assert index.neighborhood([99], "CALLS", hops=3) == set()
+
+
+class _QueryIngestor:
+    def fetch_all(self, query: str, params: dict | None = None) -> list:
+        return []
+
+    def execute_write(self, query: str, params: dict | None = None) -> None:
+        return None
+
+    def ensure_node_batch(self, label: str, properties: dict) -> None:
+        return None
+
+    def ensure_relationship_batch(self, *args: object, **kwargs: object) -> None:
+        return None
+
+    def flush_all(self) -> None:
+        return None
+
+
+def test_incremental_run_recomputes_neighborhood_and_merges_previous(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("CODEGRAPH_ANALYSIS_DB", "0")
+    monkeypatch.setattr(
+        AnalysisRunner,
+        "_load_graph_data",
+        lambda self, ingestor: (NODES, RELATIONSHIPS),
+    )
+    for name in ("a", "b", "c"):
+        (tmp_path / f"{name}.py").write_text(f"{name}_unused = 1\n")
+    modules = {"unused_variables", "complexity", "api_stability_trend"}
+    runner = AnalysisRunner(cast(IngestorProtocol, _QueryIngestor()), tmp_path)
+
+    full = runner.run_modules(modules=modules)
+    (tmp_path / "a.py").write_text("a_stale = 1\n")
+    (tmp_path / "c.py").write_text("c_one = 1\nc_two = 2\n")
+    incremental = runner.run_modules(modules=modules, incremental_paths=["c.py"])
+
+    report = json.loads(
+        (tmp_path / "output" / "analysis" / "unused_variables_report.json").read_text()
+    )
+    scope = cast(dict[str, Any], incremental["incremental"])
+    assert "incremental" not in full
+    assert cast(dict[str, Any], full["unused_variables"])["unused_variables"] == 3
+    assert sorted(item["name"] for item in report) == [
+        "a_unused",
+        "b_unused",
+        "c_one",
+        "c_two",
+    ]
+    assert scope["changed_files"] == 1
+    assert scope["affected_files"] == 2
+    assert scope["affected_nodes"] == 3
+    assert scope["merged"] == ["complexity", "unused_variables"]
+    assert scope["full_only"] == ["api_stability_trend"]
+    assert incremental["complexity"] == full["complexity"]
+    assert (tmp_path / ".codebase_rag" / "incremental_state.json").exists()
+    assert not (tmp_path / "output" / "analysis" / "incremental_state.json").exists()
@@ -0,0 +1,199 @@
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+from typing import Any, cast
+
+import pytest
+
+from codebase_rag.analysis.analysis_runner import AnalysisRunner
+from codebase_rag.analysis.graph_index import GraphIndex
+from codebase_rag.analysis.modules.base_module import AnalysisContext
+from codebase_rag.analysis.scheduler import (
+    AnalysisTask,
+    merge_outcomes,
+    run_task_graph,
+    serialized_ingestor,
+    task_dependencies,
+)
+from codebase_rag.analysis.types import NodeRecord
+from codebase_rag.core.config import settings
+from codebase_rag.services import IngestorProtocol, QueryProtocol
+
+
+def test_independent_tasks_overlap_and_dependents_see_inputs() -> None:
+    barrier = threading.Barrier(2, timeout=5)
+
+    def independent(value: int):
+        def run(_: dict[str, Any]) -> dict[str, int]:
+            barrier.wait()
+            return {"value": value}
+
+        return run
+
+    def migration(summary: dict[str, Any]) -> dict[str, int]:
+        summary["coverage"] = {"value": 3}
+        return {"risk": summary["risk"]["value"]}
+
+    tasks = [
+        AnalysisTask("risk", independent(1), inputs=frozenset({"graph"})),
+        AnalysisTask("health", independent(2), inputs=frozenset({"sources"})),
+        AnalysisTask(
+            "migration",
+            migration,
+            inputs=frozenset({"risk"}),
+            outputs=frozenset({"coverage"}),
+        ),
+        AnalysisTask(
+            "insights",
+            lambda summary: {"coverage": summary["coverage"]["value"]},
+            inputs=frozenset({"coverage"}),
+        ),
+        AnalysisTask("empty", lambda _: {}, store_empty=True),
+    ]
+
+    outcomes = run_task_graph(tasks, max_workers=4)
+    summary = merge_outcomes({}, outcomes)
+
+    assert task_dependencies(tasks) == [(), (), (0,), (2,), ()]
+    assert list(summary) == [
+        "risk",
+        "health",
+        "coverage",
+        "migration",
+        "insights",
+        "empty",
+    ]
+    assert summary["migration"] == {"risk": 1}
+    assert summary["insights"] == {"coverage": 3}
+    assert outcomes[3].depends_on == ("migration",)
+    assert all(outcome.seconds >= 0 for outcome in outcomes)
+
+
+def test_task_failure_propagates() -> None:
+    def boom(_: dict[str, Any]) -> None:
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError, match="boom"):
+        run_task_graph(
+            [AnalysisTask("ok", lambda _: {"a": 1}), AnalysisTask("bad", boom)],
+            max_workers=2,
+        )
+
+
+class _QueryIngestor:
+    def __init__(self) -> None:
+        self.flushed = 0
+
+    def fetch_all(self, query: str, params: dict | None = None) -> list:
+        return []
+
+    def execute_write(self, query: str, params: dict | None = None) -> None:
+        return None
+
+    def ensure_node_batch(self, label: str, properties: dict) -> None:
+        return None
+
+    def ensure_relationship_batch(self, *args: object, **kwargs: object) -> None:
+        return None
+
+    def flush_all(self) -> None:
+        self.flushed += 1
+
+
+class _WriteOnlyIngestor:
+    def ensure_node_batch(self, label: str, properties: dict) -> None:
+        return None
+
+    def ensure_relationship_batch(self, *args: object, **kwargs: object) -> None:
+        return None
+
+    def flush_all(self) -> None:
+        return None
+
+
+def test_serialized_ingestor_only_exposes_wrapped_capabilities() -> None:
+    write_only = serialized_ingestor(cast(IngestorProtocol, _WriteOnlyIngestor()))
+    queryable = serialized_ingestor(cast(IngestorProtocol, _QueryIngestor()))
+
+    assert not hasattr(write_only, "fetch_all")
+    assert not isinstance(write_only, QueryProtocol)
+    assert isinstance(queryable, QueryProtocol)
+    assert cast(QueryProtocol, queryable).fetch_all("MATCH (n) RETURN n") == []
+    queryable.flush_all()
+    assert cast(_QueryIngestor, queryable).flushed == 1
+
+
+def test_parallel_runner_summary_matches_sequential(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    (tmp_path / "requirements.txt").write_text("requests\nrich==13.0\n")
+    monkeypatch.setenv("CODEGRAPH_ANALYSIS_DB", "0")
+    module = NodeRecord(1, ["Module"], {"path": "app.py", "qualified_name": "app"})
+    monkeypatch.setattr(
+        AnalysisRunner, "_load_graph_data", lambda self, ingestor: ([module], [])
+    )
+    summaries = []
+    for workers in (1, 4):
+        monkeypatch.setattr(settings, "CODEGRAPH_ANALYSIS_WORKERS", workers)
+        ingestor = _QueryIngestor()
+        runner = AnalysisRunner(cast(IngestorProtocol, ingestor), tmp_path)
+        summaries.append(
+            runner.run_modules(
+                modules={"dependency_health", "license_compliance", "security"}
+            )
+        )
+        assert runner.ingestor is ingestor
+
+    assert summaries[0] == summaries[1]
+    assert list(summaries[0]) == list(summaries[1])
+    assert summaries[0]["dependency_health"]["total"] == 2
+    assert (tmp_path / "output" / "analysis" / "analysis_timings.json").exists()
+
+
+def test_every_module_input_is_provided_by_a_task() -> None:
+    modules = AnalysisRunner._build_default_modules()
+    provided = {module.get_name() for module in modules}
+    for module in modules:
+        provided |= module.outputs
+
+    for module in modules:
+        assert module.inputs <= provided, module.get_name()
+
+
+def test_parallel_tasks_build_the_graph_index_once(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    builds: list[int] = []
+    original_build = GraphIndex.build.__func__
+
+    def slow_build(cls: type[GraphIndex], nodes: Any, relationships: Any) -> Any:
+        builds.append(1)
+        threading.Event().wait(0.05)
+        return original_build(cls, nodes, relationships)
+
+    monkeypatch.setattr(GraphIndex, "build", classmethod(slow_build))
+    nodes = [NodeRecord(1, ["Module"], {"qualified_name": "app"})]
+    context = AnalysisContext(
+        runner=cast(AnalysisRunner, object()),
+        nodes=nodes,
+        relationships=[],
+        module_path_map={},
+        node_by_id={1: nodes[0]},
+        module_paths=None,
+        incremental_paths=None,
+        use_db=False,
+        summary={},
+    )
+    results: list[GraphIndex] = []
+    workers = [
+        threading.Thread(target=lambda: results.append(context.get_graph_index()))
+        for _ in range(4)
+    ]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    assert len(builds) == 1
+    assert all(index is results[0] for index in results)
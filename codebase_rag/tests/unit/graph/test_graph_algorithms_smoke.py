@@ -1,24 +1,36 @@
 from __future__ import annotations
 
+import pytest
+
+from codebase_rag.core.config import settings
 from codebase_rag.tools.graph_algorithms import GraphAlgorithms
 
 
 class FakeQueryEngine:
-    def __init__(self, mage_available: bool = True) -> None:
+    def __init__(
+        self, mage_available: bool = True, edges: list[tuple[int, int]] | None = None
+    ) -> None:
         self.mage_available = mage_available
+        self.edges = edges or []
         self.writes: list[str] = []
+        self.write_params: list[dict | None] = []
         self.fetches: list[str] = []
+        self.fetch_params: list[dict | None] = []
 
     def fetch_all(self, query: str, params: dict | None = None) -> list[dict]:
         self.fetches.append(query)
+        self.fetch_params.append(params)
         if "mg.procedures" in query:
             if self.mage_available:
                 return [{"name": "pagerank.get"}]
             raise RuntimeError("mage unavailable")
+        if "AS source, id(b) AS target" in query:
+            return [{"source": src, "target": dst} for src, dst in self.edges]
         return []
 
     def execute_write(self, query: str, params: dict | None = None) -> None:
         self.writes.append(query)
+        self.write_params.append(params)
 
 
 def test_graph_algorithms_skip_when_no_changes() -> None:
@@ -27,16 +39,54 @@ def test_graph_algorithms_skip_when_no_changes() -> None:
     assert engine.writes == []
 
 
-def test_graph_algorithms_skip_when_mage_unavailable() -> None:
+def test_graph_algorithms_skip_mage_procedures_when_unavailable() -> None:
     engine = FakeQueryEngine(mage_available=False)
     GraphAlgorithms(engine).run_all(has_changes=True)
-    assert engine.writes == []
+    joined = "\n".join(engine.fetches + engine.writes)
+    assert "pagerank.get" not in joined
+    assert "community_detection.get" not in joined
+    assert "cycles.get" not in joined
+    assert all("SET n.has_cycle" not in query for query in engine.writes)
+
+
+def test_graph_algorithms_offline_cycle_fallback_marks_cycle_nodes(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(settings, "CODEGRAPH_MAGE_CYCLES", True)
+    engine = FakeQueryEngine(
+        mage_available=False, edges=[(1, 2), (2, 3), (3, 1), (3, 4), (5, 5)]
+    )
+    GraphAlgorithms(engine).run_all(has_changes=True)
+
+    assert "SET n.has_cycle" in engine.writes[-1]
+    rows = engine.write_params[-1]["rows"]
+    assert {row["node_id"]: row["cycle_size"] for row in rows} == {1: 3, 2: 3, 3: 3}
+
+
+def test_offline_cycle_detection_is_scoped_to_the_project(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(settings, "CODEGRAPH_MAGE_CYCLES", True)
+    engine = FakeQueryEngine(mage_available=False, edges=[(1, 2), (2, 1)])
+
+    GraphAlgorithms(engine, project_name="demo").run_all(has_changes=True)
 
+    edge_index = next(
+        index for index, query in enumerate(engine.fetches) if "AS source" in query
+    )
+    assert "n.project_name = $project_name" in engine.fetches[edge_index]
+    assert engine.fetch_params[edge_index] == {"project_name": "demo"}
+    reset_index = next(
+        index
+        for index, query in enumerate(engine.writes)
+        if "REMOVE n.has_cycle" in query
+    )
+    assert "n.project_name = $project_name" in engine.writes[reset_index]
+    assert engine.write_params[reset_index] == {"project_name": "demo"}
 
-def test_graph_algorithms_sets_properties() -> None:
-    from codebase_rag.core.config import settings
 
-    settings.CODEGRAPH_MAGE_CYCLES = True
+def test_graph_algorithms_sets_properties(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "CODEGRAPH_MAGE_CYCLES", True)
     engine = FakeQueryEngine(mage_available=True)
     GraphAlgorithms(engine).run_all(has_changes=True)
     joined = "\n".join(engine.fetches + engine.writes)
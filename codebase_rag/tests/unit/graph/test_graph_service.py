@@ -1,12 +1,17 @@
 from __future__ import annotations
 
+import socket
+import threading
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from codebase_rag.core.constants import NODE_UNIQUE_CONSTRAINTS
 from codebase_rag.graph_db.cypher_queries import wrap_with_unwind
-from codebase_rag.services.graph_service import MemgraphIngestor
+from codebase_rag.services.graph_service import (
+    MemgraphIngestor,
+    take_rows_within_budget,
+)
 
 
 class TestMemgraphIngestorInit:
@@ -55,7 +60,9 @@ class TestContextManager:
             ingestor = MemgraphIngestor(host="testhost", port=1234)
             result = ingestor.__enter__()
 
-            mock_mgclient.connect.assert_called_once_with(host="testhost", port=1234)
+            mock_mgclient.connect.assert_called_once_with(
+                host="testhost", port=1234, lazy=False
+            )
             assert ingestor.conn == mock_conn
             assert mock_conn.autocommit is True
             assert result is ingestor
@@ -434,3 +441,176 @@ class TestGetCurrentTimestamp:
 
         assert "T" in result
         assert len(result) > 10
+
+
+def _streaming_ingestor(
+    pages: list[list[tuple[object, ...]]],
+) -> tuple[MemgraphIngestor, MagicMock, MagicMock]:
+    ingestor = MemgraphIngestor(host="localhost", port=7687)
+    ingestor.conn = MagicMock()
+    lazy_conn = MagicMock()
+    mock_cursor = MagicMock()
+    mock_cursor.description = [MagicMock()]
+    mock_cursor.description[0].name = "a"
+    mock_cursor.fetchmany.side_effect = pages
+    lazy_conn.cursor.return_value = mock_cursor
+    return ingestor, lazy_conn, mock_cursor
+
+
+class TestStreamRows:
+    def test_stream_rows_pages_with_fetchmany(self) -> None:
+        ingestor, lazy_conn, mock_cursor = _streaming_ingestor(
+            [[(1,), (2,)], [(3,)], []]
+        )
+
+        with patch.object(
+            ingestor, "_open_stream_connection", return_value=lazy_conn
+        ) as connect:
+            rows = list(ingestor.stream_rows("MATCH (n) RETURN n.a AS a", page_size=2))
+
+        assert rows == [{"a": 1}, {"a": 2}, {"a": 3}]
+        connect.assert_called_once_with()
+        mock_cursor.fetchmany.assert_called_with(2)
+        mock_cursor.close.assert_called_once()
+        lazy_conn.close.assert_not_called()
+
+    def test_drained_stream_connection_is_reused_and_closed_on_exit(self) -> None:
+        ingestor, lazy_conn, mock_cursor = _streaming_ingestor([[(1,)], [], [(2,)], []])
+
+        with patch.object(
+            ingestor, "_open_stream_connection", return_value=lazy_conn
+        ) as connect:
+            first = list(ingestor.stream_rows("MATCH (n) RETURN n.a AS a"))
+            second = list(ingestor.stream_rows("MATCH (n) RETURN n.a AS a"))
+
+        assert first == [{"a": 1}]
+        assert second == [{"a": 2}]
+        connect.assert_called_once_with()
+        assert mock_cursor.close.call_count == 2
+        lazy_conn.close.assert_not_called()
+
+        with patch.object(ingestor, "flush_all"):
+            ingestor.__exit__(None, None, None)
+
+        lazy_conn.close.assert_called_once()
+
+    def test_stream_rows_stops_pulling_when_closed_early(self) -> None:
+        ingestor, lazy_conn, mock_cursor = _streaming_ingestor(
+            [[(1,), (2,)], [(3,)], []]
+        )
+
+        with patch.object(ingestor, "_open_stream_connection", return_value=lazy_conn):
+            stream = ingestor.stream_rows("MATCH (n) RETURN n.a AS a", page_size=2)
+            assert next(stream) == {"a": 1}
+            stream.close()
+
+        assert mock_cursor.fetchmany.call_count == 1
+        mock_cursor.close.assert_called_once()
+        lazy_conn.close.assert_called_once()
+
+    def test_stream_rows_requires_a_connected_ingestor(self) -> None:
+        ingestor = MemgraphIngestor(host="localhost", port=7687)
+
+        with patch.object(ingestor, "_open_stream_connection") as connect:
+            with pytest.raises(ConnectionError):
+                next(ingestor.stream_rows("MATCH (n) RETURN n"))
+
+        connect.assert_not_called()
+
+
+class TestFetchBounded:
+    def test_fetch_bounded_stops_pulling_once_row_cap_is_hit(self) -> None:
+        ingestor, lazy_conn, mock_cursor = _streaming_ingestor(
+            [[(1,), (2,), (3,)], [(4,)], []]
+        )
+
+        with patch.object(ingestor, "_open_stream_connection", return_value=lazy_conn):
+            bounded = ingestor.fetch_bounded(
+                "MATCH (n) RETURN n.a AS a", max_rows=2, max_chars=10_000
+            )
+
+        assert bounded.rows == [{"a": 1}, {"a": 2}]
+        assert bounded.truncated is True
+        mock_cursor.fetchmany.assert_called_once_with(3)
+        mock_cursor.close.assert_called_once()
+        lazy_conn.close.assert_called_once()
+        assert isinstance(ingestor.conn, MagicMock)
+        ingestor.conn.cursor.assert_not_called()
+
+    def test_fetch_bounded_holds_the_ingestor_lock(self) -> None:
+        ingestor, lazy_conn, _ = _streaming_ingestor([[(1,)], []])
+        contended: list[bool] = []
+
+        def probe_lock() -> None:
+            acquired = ingestor._lock.acquire(blocking=False)
+            if acquired:
+                ingestor._lock.release()
+            contended.append(not acquired)
+
+        def connect() -> MagicMock:
+            worker = threading.Thread(target=probe_lock)
+            worker.start()
+            worker.join()
+            return lazy_conn
+
+        with patch.object(ingestor, "_open_stream_connection", side_effect=connect):
+            ingestor.fetch_bounded("MATCH (n) RETURN n", max_rows=5, max_chars=1000)
+
+        assert contended == [True]
+
+    def test_fetch_bounded_reads_pages_without_the_ingestor_lock(self) -> None:
+        ingestor, lazy_conn, mock_cursor = _streaming_ingestor([])
+        contended: list[bool] = []
+
+        def fetch_page(size: int) -> list[tuple[object, ...]]:
+            worker = threading.Thread(target=probe_lock)
+            worker.start()
+            worker.join()
+            return []
+
+        def probe_lock() -> None:
+            acquired = ingestor._lock.acquire(blocking=False)
+            if acquired:
+                ingestor._lock.release()
+            contended.append(not acquired)
+
+        mock_cursor.fetchmany.side_effect = fetch_page
+        with patch.object(ingestor, "_open_stream_connection", return_value=lazy_conn):
+            ingestor.fetch_bounded("MATCH (n) RETURN n", max_rows=5, max_chars=1000)
+
+        assert contended == [False]
+
+    def test_stream_connection_times_out_its_own_socket(self) -> None:
+        ingestor = MemgraphIngestor(host="testhost", port=1234)
+        previous = socket.getdefaulttimeout()
+
+        with (
+            patch(
+                "codebase_rag.services.graph_service.socket.create_connection"
+            ) as probe,
+            patch.object(ingestor, "_connect") as connect,
+        ):
+            ingestor._open_stream_connection()
+
+        probe.assert_called_once_with(("testhost", 1234), timeout=15.0)
+        probe.return_value.close.assert_called_once()
+        connect.assert_called_once_with(lazy=True)
+        assert socket.getdefaulttimeout() == previous
+
+    def test_take_rows_within_budget_respects_serialized_size(self) -> None:
+        rows = [{"name": "x" * 10} for _ in range(5)]
+
+        bounded = take_rows_within_budget(rows, max_rows=10, max_chars=50)
+
+        assert len(bounded.rows) == 2
+        assert bounded.truncated is True
+        assert bounded.rows_scanned == 3
+
+    def test_take_rows_within_budget_keeps_everything_that_fits(self) -> None:
+        rows = [{"a": 1}, {"a": 2}]
+
+        bounded = take_rows_within_budget(rows, max_rows=2, max_chars=1000)
+
+        assert bounded.rows == rows
+        assert bounded.truncated is False
+        assert bounded.rows_scanned == 2
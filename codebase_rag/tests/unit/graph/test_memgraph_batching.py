@@ -88,3 +88,48 @@ def test_relationship_batch_flushes_after_threshold_and_respects_node_flush() ->
     executed_query = cursor_mock.execute.call_args[0][0]
     assert "UNWIND $batch" in executed_query
     cursor_mock.close.assert_called()
+
+
+def test_flush_bumps_graph_generation_only_after_writes() -> None:
+    ingestor, cursor_mock = _create_ingestor_with_mocked_connection(batch_size=10)
+    ingestor.project_name = "demo"
+
+    ingestor.flush_all()
+    cursor_mock.execute.assert_not_called()
+
+    ingestor.ensure_node_batch("File", {"path": "a", "name": "a.txt"})
+    ingestor.flush_all()
+
+    bump_query, bump_params = cursor_mock.execute.call_args[0]
+    assert "graph_generation" in bump_query
+    assert bump_params["project_name"] == "demo"
+    stamp = bump_params["graph_generation"]
+
+    ingestor.ensure_node_batch("File", {"path": "b", "name": "b.txt"})
+    ingestor.flush_all()
+    assert cursor_mock.execute.call_args[0][1]["graph_generation"] != stamp
+
+    cursor_mock.execute.reset_mock()
+    ingestor.flush_all()
+    cursor_mock.execute.assert_not_called()
+
+
+def test_derived_writes_do_not_bump_graph_generation() -> None:
+    ingestor, cursor_mock = _create_ingestor_with_mocked_connection(batch_size=10)
+    ingestor.project_name = "demo"
+    ingestor.ensure_node_batch("File", {"path": "a", "name": "a.txt"})
+
+    with ingestor.derived_writes():
+        bumps = [
+            call
+            for call in cursor_mock.execute.call_args_list
+            if "graph_generation" in call[0][0]
+        ]
+        assert len(bumps) == 1
+        cursor_mock.execute.reset_mock()
+        ingestor.ensure_node_batch("Parameter", {"qualified_name": "a.f.x"})
+        ingestor.execute_write("MATCH (n) SET n.seen = true")
+
+    queries = [call[0][0] for call in cursor_mock.execute.call_args_list]
+    assert any("UNWIND $batch" in query for query in queries)
+    assert not [query for query in queries if "graph_generation" in query]
@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from codebase_rag.exporters.mermaid_exporter import (
+    GraphQueryMermaidExporter,
+    MermaidConfig,
+    MermaidExporter,
+)
+from codebase_rag.graph_db.cypher_queries import (
+    build_mermaid_edges_query,
+    build_mermaid_nodes_query,
+)
+
+
+def _streaming_ingestor(*pages: list[dict[str, object]]) -> MagicMock:
+    ingestor = MagicMock()
+    ingestor.stream_rows.side_effect = [iter(page) for page in pages]
+    return ingestor
+
+
+class TestMermaidQueries:
+    def test_nodes_query_is_project_scoped_and_capped(self) -> None:
+        query = build_mermaid_nodes_query(["Function", "Method"], 25)
+
+        assert "n:Function OR n:Method" in query
+        assert "n.project_name = $project_name" in query
+        assert query.rstrip().endswith("LIMIT 25")
+
+    def test_edges_query_can_restrict_to_rendered_ids(self) -> None:
+        query = build_mermaid_edges_query(
+            ["Module"], ["Module"], ["IMPORTS"], 10, restrict_to_ids=True
+        )
+
+        assert "[r:IMPORTS]" in query
+        assert "id(a) IN $node_ids AND id(b) IN $node_ids" in query
+        assert query.rstrip().endswith("LIMIT 10")
+
+    def test_edges_query_without_caps_has_no_limit(self) -> None:
+        query = build_mermaid_edges_query(
+            ["Project"],
+            ["ExternalPackage"],
+            ["DEPENDS_ON_EXTERNAL"],
+            None,
+            scope_target=False,
+        )
+
+        assert "LIMIT" not in query
+        assert "b.project_name" not in query
+
+
+class TestGraphQueryMermaidExporter:
+    def test_build_renders_streamed_rows(self) -> None:
+        ingestor = _streaming_ingestor(
+            [
+                {"node_id": 1, "name": "foo"},
+                {"node_id": 2, "name": None, "qualified_name": "mod.bar"},
+            ],
+            [{"from_id": 1, "to_id": 2}, {"from_id": 2, "to_id": 99}],
+        )
+
+        content = GraphQueryMermaidExporter(ingestor, "proj").build("flow")
+
+        assert content.splitlines() == [
+            "%% Call Graph",
+            "graph LR",
+            '  n1["foo"]',
+            '  n2["mod.bar"]',
+            "  n1 --> n2",
+        ]
+        ingestor.export_graph_to_dict.assert_not_called()
+
+    def test_node_cap_restricts_edge_query_to_rendered_nodes(self) -> None:
+        ingestor = _streaming_ingestor(
+            [{"node_id": 1, "name": "a"}, {"node_id": 2, "name": "b"}],
+            [{"from_id": 1, "to_id": 2}],
+        )
+        exporter = GraphQueryMermaidExporter(
+            ingestor, "proj", MermaidConfig(max_nodes=2, max_edges=5)
+        )
+
+        exporter.build("module")
+
+        edge_query, edge_params = ingestor.stream_rows.call_args_list[1].args
+        assert "LIMIT 5" in edge_query
+        assert sorted(edge_params["node_ids"]) == [1, 2]
+
+    def test_empty_node_set_skips_edge_query(self) -> None:
+        ingestor = _streaming_ingestor([])
+
+        content = GraphQueryMermaidExporter(ingestor, "proj").build("class")
+
+        assert content == "%% Class Graph\ngraph LR\n"
+        assert ingestor.stream_rows.call_count == 1
+
+    def test_falls_back_to_fetch_all(self) -> None:
+        class FetchOnlyIngestor:
+            def __init__(self) -> None:
+                self.pages = [
+                    [
+                        {"node_id": 1, "name": "proj"},
+                        {"node_id": 2, "name": "requests"},
+                    ],
+                    [{"from_id": 1, "to_id": 2}],
+                ]
+
+            def fetch_all(
+                self, query: str, params: dict[str, object] | None = None
+            ) -> list[dict[str, object]]:
+                return self.pages.pop(0)
+
+            def execute_write(
+                self, query: str, params: dict[str, object] | None = None
+            ) -> None:
+                return None
+
+        content = GraphQueryMermaidExporter(FetchOnlyIngestor(), "proj").build(
+            "dependency"
+        )
+
+        assert "  n1 --> n2" in content
+
+    def test_unknown_diagram_raises(self) -> None:
+        with pytest.raises(ValueError, match="Unknown diagram type"):
+            GraphQueryMermaidExporter(MagicMock(), "proj").build("sequence")
+
+
+def test_file_exporter_keeps_call_graph_output(tmp_path: Path) -> None:
+    graph_file = tmp_path / "graph.json"
+    graph_file.write_text(
+        json.dumps(
+            {
+                "nodes": [
+                    {
+                        "node_id": 1,
+                        "labels": ["Function"],
+                        "properties": {"name": "foo"},
+                    },
+                    {"node_id": 2, "labels": ["Method"], "properties": {"name": "bar"}},
+                    {"node_id": 3, "labels": ["Module"], "properties": {"name": "mod"}},
+                ],
+                "relationships": [
+                    {"from_id": 1, "to_id": 2, "type": "CALLS", "properties": {}},
+                    {"from_id": 3, "to_id": 1, "type": "DEFINES", "properties": {}},
+                ],
+                "metadata": {},
+            }
+        ),
+        encoding="utf-8",
+    )
+
+    output = MermaidExporter(str(graph_file)).export("call", str(tmp_path / "c.mmd"))
+
+    content = output.read_text(encoding="utf-8")
+    assert '  n1["foo"]' in content
+    assert '  n2["bar"]' in content
+    assert "  n1 --> n2" in content
+    assert "n3" not in content
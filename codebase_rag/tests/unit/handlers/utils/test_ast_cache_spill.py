@@ -0,0 +1,220 @@
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+from tree_sitter import Parser, Tree
+
+from codebase_rag.core import constants as cs
+from codebase_rag.infrastructure.parser_loader import load_parsers
+from codebase_rag.services.graph_update_post_services import ResolverPassService
+from codebase_rag.state.registry_cache import BoundedASTCache
+from codebase_rag.utils.source_store import SourceStore
+
+
+@pytest.fixture(scope="module")
+def python_parser() -> Parser:
+    parsers, _ = load_parsers([cs.SupportedLanguage.PYTHON])
+    return parsers[cs.SupportedLanguage.PYTHON]
+
+
+def _parse_into(
+    cache: BoundedASTCache, parser: Parser, path: Path, source: str
+) -> None:
+    path.write_text(source, encoding="utf-8")
+    tree = parser.parse(source.encode())
+    cache[path] = (tree.root_node, cs.SupportedLanguage.PYTHON)
+
+
+def _spilling_cache(parser: Parser, max_entries: int) -> BoundedASTCache:
+    return BoundedASTCache(
+        max_entries=max_entries,
+        source_store=SourceStore(),
+        parser_for={cs.SupportedLanguage.PYTHON: parser}.get,
+    )
+
+
+def test_evicted_trees_are_reparsed_on_access(
+    tmp_path: Path, python_parser: Parser
+) -> None:
+    cache = _spilling_cache(python_parser, max_entries=1)
+    first, second = tmp_path / "a.py", tmp_path / "b.py"
+    _parse_into(cache, python_parser, first, "def a():\n    pass\n")
+    _parse_into(cache, python_parser, second, "def b():\n    pass\n")
+
+    assert first in cache
+    assert len(cache) == 2
+    root_node, language = cache[first]
+
+    assert language == cs.SupportedLanguage.PYTHON
+    assert root_node.text == b"def a():\n    pass\n"
+    stats = cache.stats()
+    assert stats["size"] == 1
+    assert stats["spilled"] == 1
+    assert stats["reparses"] == 1
+
+
+def test_items_cover_spilled_entries(tmp_path: Path, python_parser: Parser) -> None:
+    cache = _spilling_cache(python_parser, max_entries=2)
+    paths = [tmp_path / f"mod{i}.py" for i in range(5)]
+    for index, path in enumerate(paths):
+        _parse_into(cache, python_parser, path, f"x = {index}\n")
+
+    seen = {path: root.text for path, (root, _) in cache.items()}
+
+    assert seen == {path: f"x = {i}\n".encode() for i, path in enumerate(paths)}
+    assert len(cache.items()) == 5
+    assert cache.stats()["size"] == 2
+    assert cache.stats()["reparses"] == 3
+
+
+def test_changed_files_are_not_reparsed_from_stale_handles(
+    tmp_path: Path, python_parser: Parser
+) -> None:
+    store = SourceStore()
+    cache = BoundedASTCache(
+        max_entries=1,
+        source_store=store,
+        parser_for={cs.SupportedLanguage.PYTHON: python_parser}.get,
+    )
+    first = tmp_path / "a.py"
+    _parse_into(cache, python_parser, first, "x = 1\n")
+    _parse_into(cache, python_parser, tmp_path / "b.py", "y = 2\n")
+
+    first.write_text("x = 99\n", encoding="utf-8")
+    store.invalidate(first)
+
+    with pytest.raises(KeyError):
+        cache[first]
+    assert first not in cache
+    assert cache.stats()["reparse_failures"] == 1
+
+
+def test_stale_spilled_entries_are_not_reported_as_contained(
+    tmp_path: Path, python_parser: Parser
+) -> None:
+    store = SourceStore()
+    cache = BoundedASTCache(
+        max_entries=1,
+        source_store=store,
+        parser_for={cs.SupportedLanguage.PYTHON: python_parser}.get,
+    )
+    first = tmp_path / "a.py"
+    _parse_into(cache, python_parser, first, "x = 1\n")
+    _parse_into(cache, python_parser, tmp_path / "b.py", "y = 2\n")
+
+    first.write_text("x = 99\n", encoding="utf-8")
+    store.invalidate(first)
+
+    assert first not in cache
+    with pytest.raises(KeyError):
+        cache[first]
+    assert len(cache) == 1
+
+
+def test_spilled_trees_are_parsed_without_the_cache_lock(
+    tmp_path: Path, python_parser: Parser
+) -> None:
+    contended: list[bool] = []
+
+    def probe_lock() -> None:
+        acquired = cache._lock.acquire(blocking=False)
+        if acquired:
+            cache._lock.release()
+        contended.append(not acquired)
+
+    def parse(source: bytes) -> Tree:
+        worker = threading.Thread(target=probe_lock)
+        worker.start()
+        worker.join()
+        return python_parser.parse(source)
+
+    probing_parser = MagicMock()
+    probing_parser.parse.side_effect = parse
+    cache = BoundedASTCache(
+        max_entries=1,
+        source_store=SourceStore(),
+        parser_for={cs.SupportedLanguage.PYTHON: probing_parser}.get,
+    )
+    first = tmp_path / "a.py"
+    _parse_into(cache, python_parser, first, "x = 1\n")
+    _parse_into(cache, python_parser, tmp_path / "b.py", "y = 2\n")
+
+    root_node, _ = cache[first]
+
+    assert root_node.text == b"x = 1\n"
+    assert contended == [False]
+
+
+def test_deleting_a_spilled_entry_drops_its_handle(
+    tmp_path: Path, python_parser: Parser
+) -> None:
+    cache = _spilling_cache(python_parser, max_entries=1)
+    first = tmp_path / "a.py"
+    _parse_into(cache, python_parser, first, "x = 1\n")
+    _parse_into(cache, python_parser, tmp_path / "b.py", "y = 2\n")
+
+    del cache[first]
+
+    assert first not in cache
+    assert [path for path, _ in cache.items()] == [tmp_path / "b.py"]
+
+
+def test_cache_without_source_store_drops_evicted_trees(
+    tmp_path: Path, python_parser: Parser
+) -> None:
+    cache = BoundedASTCache(max_entries=1)
+    first = tmp_path / "a.py"
+    _parse_into(cache, python_parser, first, "x = 1\n")
+    _parse_into(cache, python_parser, tmp_path / "b.py", "y = 2\n")
+
+    assert first not in cache
+    assert len(cache) == 1
+    assert cache.stats()["spills"] == 0
+
+
+def test_iteration_keeps_spilled_trees_bounded(
+    tmp_path: Path, python_parser: Parser
+) -> None:
+    cache = _spilling_cache(python_parser, max_entries=2)
+    for index in range(6):
+        _parse_into(cache, python_parser, tmp_path / f"m{index}.py", f"x = {index}\n")
+    resident: list[int] = []
+
+    for _path, _entry in cache.items():
+        resident.append(cache.stats()["size"])
+
+    assert len(resident) == 6
+    assert max(resident) <= 2
+    assert cache.stats()["spilled"] == 4
+    assert cache.stats()["reparses"] == 4
+
+
+def test_call_pass_walks_the_live_cache_one_entry_at_a_time(
+    tmp_path: Path, python_parser: Parser
+) -> None:
+    cache = _spilling_cache(python_parser, max_entries=2)
+    for index in range(5):
+        _parse_into(cache, python_parser, tmp_path / f"m{index}.py", f"x = {index}\n")
+    reparsed_before_call: list[int] = []
+    call_processor = MagicMock()
+    call_processor.process_calls_in_file.side_effect = lambda *_args: (
+        reparsed_before_call.append(cache.stats()["reparses"])
+    )
+    service = ResolverPassService(
+        ingestor=MagicMock(),
+        repo_path=tmp_path,
+        project_name="demo",
+        queries={},
+        function_registry=MagicMock(),
+        import_processor=MagicMock(),
+        module_qn_to_file_path={},
+        pre_scan_index=None,
+    )
+
+    service.process_function_calls(cache, call_processor, {})
+
+    assert reparsed_before_call == [0, 0, 1, 2, 3]
+    assert cache.stats()["size"] == 2
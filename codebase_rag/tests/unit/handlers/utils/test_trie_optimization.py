@@ -1,3 +1,4 @@
+import threading
 from pathlib import Path
 from unittest.mock import MagicMock
 
@@ -90,6 +91,116 @@ class TestTrieOptimization:
             assert result.startswith("com.example.services.")
             assert result.endswith(".create")
 
+    def test_prefix_queries_respect_segment_boundaries(self) -> None:
+        """Test that prefix lookups match whole segments in insertion order."""
+        trie = FunctionRegistryTrie()
+
+        trie.insert("proj.mod.Zed", NodeType.CLASS)
+        trie.insert("proj.mod.Alpha", NodeType.CLASS)
+        trie.insert("proj.module.Other", NodeType.CLASS)
+        trie.insert("proj.mod", NodeType.MODULE)
+        trie.insert("proj.mod.Zed.run", NodeType.METHOD)
+
+        assert trie.find_with_prefix("proj.mod") == [
+            ("proj.mod.Zed", NodeType.CLASS),
+            ("proj.mod.Alpha", NodeType.CLASS),
+            ("proj.mod", NodeType.MODULE),
+            ("proj.mod.Zed.run", NodeType.METHOD),
+        ]
+        assert trie.find_with_prefix("proj.mo") == []
+        assert len(trie.find_with_prefix("")) == 5
+
+    def test_suffix_queries_match_trailing_segments(self) -> None:
+        """Test suffix lookups without a simple-name index."""
+        trie = FunctionRegistryTrie()
+
+        trie.insert("proj.a.User.get_name", NodeType.METHOD)
+        trie.insert("proj.b.Admin.get_name", NodeType.METHOD)
+        trie.insert("proj.c.SuperUser.get_name", NodeType.METHOD)
+
+        assert trie.find_ending_with("get_name") == [
+            "proj.a.User.get_name",
+            "proj.b.Admin.get_name",
+            "proj.c.SuperUser.get_name",
+        ]
+        assert trie.find_ending_with("User.get_name") == ["proj.a.User.get_name"]
+        assert trie.find_ending_with("name") == []
+        assert trie.find_with_prefix_and_suffix("proj.b", "get_name") == [
+            "proj.b.Admin.get_name"
+        ]
+
+    def test_deleted_names_leave_every_index(self) -> None:
+        """Test that deletion removes names from prefix and suffix lookups."""
+        trie = FunctionRegistryTrie()
+
+        trie.insert("proj.mod.User.save", NodeType.METHOD)
+        trie.insert("proj.mod.Order.save", NodeType.METHOD)
+        assert trie.find_with_prefix("proj.mod")
+
+        del trie["proj.mod.User.save"]
+        del trie["proj.mod.missing"]
+
+        assert "proj.mod.User.save" not in trie
+        assert trie.find_ending_with("save") == ["proj.mod.Order.save"]
+        assert trie.find_with_prefix("proj.mod") == [
+            ("proj.mod.Order.save", NodeType.METHOD)
+        ]
+
+        del trie["proj.mod.Order.save"]
+        trie.insert("proj.mod.User.save", NodeType.FUNCTION)
+
+        assert trie.find_ending_with("save") == ["proj.mod.User.save"]
+        assert trie.find_with_prefix("proj") == [
+            ("proj.mod.User.save", NodeType.FUNCTION)
+        ]
+
+    def test_name_version_changes_on_every_mutation(self) -> None:
+        """Test that each insert, delete or type change yields a new name version."""
+        trie = FunctionRegistryTrie()
+        versions = [trie.name_version("save")]
+
+        trie.insert("proj.a.save", NodeType.FUNCTION)
+        versions.append(trie.name_version("save"))
+        trie.insert("proj.b.save", NodeType.FUNCTION)
+        versions.append(trie.name_version("save"))
+        del trie["proj.a.save"]
+        versions.append(trie.name_version("save"))
+        trie.insert("proj.c.save", NodeType.FUNCTION)
+        versions.append(trie.name_version("save"))
+        trie.insert("proj.c.save", NodeType.METHOD)
+        versions.append(trie.name_version("save"))
+        trie.insert("proj.c.save", NodeType.METHOD)
+        trie.insert("proj.c.load", NodeType.METHOD)
+
+        assert versions == sorted(set(versions))
+        assert trie.name_version("save") == versions[-1]
+        assert not trie._name_changes.keys() - {"save"}
+
+    def test_concurrent_prefix_queries_see_pending_inserts(self) -> None:
+        """Test that concurrent readers merging the unsorted tail agree."""
+        trie = FunctionRegistryTrie()
+        trie.insert("proj.seed", NodeType.FUNCTION)
+        trie.find_with_prefix("proj")
+        for index in range(2000):
+            trie.insert(f"proj.mod{index % 7}.fn{index}", NodeType.FUNCTION)
+        expected = 2001
+        barrier = threading.Barrier(8)
+        counts: list[int] = []
+
+        def query() -> None:
+            barrier.wait()
+            counts.append(len(trie.find_with_prefix("proj")))
+
+        workers = [threading.Thread(target=query) for _ in range(8)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+        assert counts == [expected] * 8
+        assert len(trie._sorted) == expected
+        assert not trie._unsorted
+
     @pytest.fixture
     def graph_updater_with_trie(self) -> GraphUpdater:
         """Create GraphUpdater with populated Trie for testing."""
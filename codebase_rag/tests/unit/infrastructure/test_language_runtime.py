@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+
+from codebase_rag.core import constants as cs
+from codebase_rag.infrastructure import parser_loader
+from codebase_rag.infrastructure.language_runtime import (
+    LanguageRuntime,
+    measure_language_startup,
+    scan_repository_languages,
+)
+
+
+def _write(path: Path, text: str = "") -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+
+
+def test_inventory_skips_ignored_directories(tmp_path: Path) -> None:
+    _write(tmp_path / "app" / "main.py", "print(1)\n")
+    _write(tmp_path / "node_modules" / "lib" / "index.js", "x = 1\n")
+    _write(tmp_path / "README.md", "# readme\n")
+
+    languages = scan_repository_languages(tmp_path)
+
+    assert languages == frozenset({cs.SupportedLanguage.PYTHON})
+
+
+def test_runtime_loads_only_requested_languages() -> None:
+    runtime = LanguageRuntime()
+    try:
+        assert runtime.parsers == {}
+
+        loaded = runtime.ensure([cs.SupportedLanguage.PYTHON])
+
+        assert loaded == frozenset({cs.SupportedLanguage.PYTHON})
+        assert set(runtime.parsers) == {cs.SupportedLanguage.PYTHON}
+        assert set(runtime.queries) == {cs.SupportedLanguage.PYTHON}
+        assert runtime.queries[cs.SupportedLanguage.PYTHON]["functions"] is not None
+        assert (
+            runtime.parser_for(cs.SupportedLanguage.PYTHON)
+            is runtime.parsers[cs.SupportedLanguage.PYTHON]
+        )
+    finally:
+        runtime.shutdown()
+
+
+def test_runtime_records_unavailable_grammars(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    def missing_grammar(lang_name: cs.SupportedLanguage) -> object:
+        raise RuntimeError(f"no grammar for {lang_name}")
+
+    monkeypatch.setattr(
+        "codebase_rag.infrastructure.language_runtime.load_language_grammar",
+        missing_grammar,
+    )
+    runtime = LanguageRuntime()
+    try:
+        runtime.preload([cs.SupportedLanguage.PYTHON])
+        loaded = runtime.ensure([cs.SupportedLanguage.PYTHON])
+    finally:
+        runtime.shutdown()
+
+    assert loaded == frozenset()
+    assert cs.SupportedLanguage.PYTHON in runtime.failed
+    assert runtime.parsers == {}
+
+
+def test_grammar_packages_are_imported_on_first_lookup(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    imported: list[str] = []
+
+    def fake_try_import_language(
+        module_path: str, attr_name: str, lang_name: cs.SupportedLanguage
+    ) -> object:
+        _ = attr_name, lang_name
+        imported.append(module_path)
+        return lambda: None
+
+    monkeypatch.setattr(parser_loader, "_try_import_language", fake_try_import_language)
+    loaders = parser_loader._LazyLanguageLoaders()
+
+    assert imported == []
+    assert loaders.get(cs.SupportedLanguage.PYTHON) is not None
+    assert imported == [cs.TreeSitterModule.PYTHON]
+    assert loaders.get("not-a-language") is None
+
+
+def test_load_parsers_can_be_restricted_to_languages() -> None:
+    parsers, queries = parser_loader.load_parsers([cs.SupportedLanguage.PYTHON])
+
+    assert set(parsers) == {cs.SupportedLanguage.PYTHON}
+    assert set(queries) == {cs.SupportedLanguage.PYTHON}
+
+
+def test_startup_report_includes_memory_and_timings() -> None:
+    report = measure_language_startup([cs.SupportedLanguage.PYTHON]).as_dict()
+
+    assert report["languages"] == [cs.SupportedLanguage.PYTHON.value]
+    assert report["seconds"] >= report["per_language"]["python"] >= 0.0
+    if sys.platform.startswith("linux"):
+        assert report["rss_before_mb"] is not None
+        assert report["rss_after_mb"] is not None
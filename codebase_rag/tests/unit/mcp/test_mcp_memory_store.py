@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from codebase_rag.mcp.memory_store import MCPMemoryStore
+
+
+def _journal(root: Path) -> Path:
+    return root / ".codebase_rag" / "mcp_memory" / "entries.jsonl"
+
+
+def test_add_entry_appends_single_journal_line(tmp_path: Path) -> None:
+    store = MCPMemoryStore(str(tmp_path))
+
+    store.add_entry("first decision", ["alpha"])
+    store.add_entry("second decision", ["beta"])
+
+    lines = _journal(tmp_path).read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["text"] for line in lines] == [
+        "first decision",
+        "second decision",
+    ]
+    assert [entry["text"] for entry in store.list_entries()] == [
+        "second decision",
+        "first decision",
+    ]
+
+
+def test_reload_restores_index_from_journal(tmp_path: Path) -> None:
+    MCPMemoryStore(str(tmp_path)).add_entry("refactor api design", ["success"])
+
+    reloaded = MCPMemoryStore(str(tmp_path))
+    results = reloaded.query_patterns("api", success_only=True)
+
+    assert [item["text"] for item in results] == ["refactor api design"]
+
+
+def test_legacy_json_is_migrated_to_journal(tmp_path: Path) -> None:
+    legacy = tmp_path / ".codebase_rag" / "mcp_memory" / "entries.json"
+    legacy.parent.mkdir(parents=True)
+    legacy.write_text(
+        json.dumps(
+            [
+                {"text": "newer", "tags": [], "timestamp": 2, "vector": {}},
+                {"text": "older", "tags": [], "timestamp": 1, "vector": {}},
+            ]
+        ),
+        encoding="utf-8",
+    )
+
+    store = MCPMemoryStore(str(tmp_path))
+
+    assert [entry["text"] for entry in store.list_entries()] == ["newer", "older"]
+    assert not legacy.exists()
+    assert _journal(tmp_path).exists()
+
+
+def test_eviction_and_compaction_bound_the_journal(tmp_path: Path) -> None:
+    store = MCPMemoryStore(str(tmp_path), max_entries=3)
+
+    for idx in range(7):
+        store.add_entry(f"entry number{idx}", [f"tag{idx}"])
+
+    assert [entry["text"] for entry in store.list_entries()] == [
+        "entry number6",
+        "entry number5",
+        "entry number4",
+    ]
+    assert store.query_patterns("number0") == []
+    assert store.query_patterns("", filter_tags=["tag1"]) == []
+    lines = _journal(tmp_path).read_text(encoding="utf-8").splitlines()
+    assert len(lines) <= 3 * 2
+
+
+def test_query_matches_underscore_parts_and_tag_filters(tmp_path: Path) -> None:
+    store = MCPMemoryStore(str(tmp_path))
+    store.add_entry(
+        json.dumps(
+            {"tool_history": ["query_code_graph", "run_cypher"], "status": "ok"}
+        ),
+        ["pattern"],
+    )
+    store.add_entry("unrelated note", ["pattern", "other"])
+
+    results = store.query_patterns("graph cypher", filter_tags=["pattern"])
+    rates = store.get_chain_success_rates("graph cypher")
+
+    assert len(results) == 1
+    assert results[0]["chain_success_rate"] == 1.0
+    assert rates[0]["chain_signature"] == "query_code_graph -> run_cypher"
+    assert rates[0]["total_count"] == 1
@@ -1544,6 +1544,36 @@ class TestMCPNewTools:
         finally:
             settings.MCP_QUERY_RESULT_MAX_ROWS = previous_max_rows
 
+    async def test_run_cypher_caps_large_read_results(
+        self, mcp_registry: MCPToolsRegistry
+    ) -> None:
+        project_name = Path(mcp_registry.project_root).resolve().name
+        previous_max_rows = settings.MCP_QUERY_RESULT_MAX_ROWS
+        settings.MCP_QUERY_RESULT_MAX_ROWS = 4
+        try:
+            ingestor = cast(MagicMock, mcp_registry.ingestor)
+            ingestor.fetch_all.return_value = [
+                {"name": f"module_{idx}"} for idx in range(10)
+            ]
+
+            result = await mcp_registry.run_cypher(
+                "MATCH (m:Module {project_name: $project_name}) RETURN m.name AS name",
+                params=json.dumps({"project_name": project_name}),
+                write=False,
+                advanced_mode=True,
+            )
+
+            assert result.get("status") == "ok"
+            assert result.get("results") == [
+                {"name": f"module_{idx}"} for idx in range(4)
+            ]
+            assert result.get("truncated") is True
+            assert "partial" in str(
+                mcp_registry._session_state.get("last_graph_result_digest")
+            )
+        finally:
+            settings.MCP_QUERY_RESULT_MAX_ROWS = previous_max_rows
+
     async def test_get_function_source_returns_source(
         self, mcp_registry: MCPToolsRegistry, monkeypatch: pytest.MonkeyPatch
     ) -> None:
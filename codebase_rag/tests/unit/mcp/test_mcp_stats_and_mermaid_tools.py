@@ -451,25 +451,27 @@ class TestMCPStatsAndMermaidTools:
         assert result.get("top_importers") == [{"module": "mod1", "count": 4}]
         assert result.get("top_dependents") == [{"target": "lib1", "count": 2}]
 
-    async def test_export_mermaid(
-        self, mcp_registry: MCPToolsRegistry, monkeypatch: pytest.MonkeyPatch
-    ) -> None:
+    async def test_export_mermaid(self, mcp_registry: MCPToolsRegistry) -> None:
         ingestor = cast(MagicMock, mcp_registry.ingestor)
-        ingestor.export_graph_to_dict.return_value = {"nodes": []}
-
-        class DummyExporter:
-            def __init__(self, graph_file: str, config: object | None = None) -> None:
-                self.graph_file = graph_file
-                self.config = config
-
-            def export(self, diagram: str, output_path: str) -> Path:
-                output = Path(output_path)
-                output.write_text("graph TD;\nA-->B\n", encoding="utf-8")
-                return output
-
-        monkeypatch.setattr("codebase_rag.mcp.tools.MermaidExporter", DummyExporter)
+        ingestor.stream_rows.side_effect = [
+            iter(
+                [
+                    {"node_id": 1, "name": "pkg.a"},
+                    {"node_id": 2, "name": "pkg.b"},
+                ]
+            ),
+            iter([{"from_id": 1, "to_id": 2}]),
+        ]
 
         result = await mcp_registry.export_mermaid("module")
 
         assert result.get("status") == "ok"
-        assert "graph TD" in str(result.get("content", ""))
+        content = str(result.get("content", ""))
+        assert "graph LR" in content
+        assert "n1 --> n2" in content
+        assert Path(str(result.get("output_path"))).exists()
+        ingestor.export_graph_to_dict.assert_not_called()
+        node_query, node_params = ingestor.stream_rows.call_args_list[0].args
+        assert "$project_name" in node_query
+        assert "LIMIT" in node_query
+        assert node_params["project_name"] == Path(mcp_registry.project_root).name
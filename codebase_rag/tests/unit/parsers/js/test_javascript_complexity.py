@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import MagicMock
+
+from codebase_rag.core import constants as cs
+from codebase_rag.graph_db.graph_updater import GraphUpdater
+from codebase_rag.infrastructure.parser_loader import load_parsers
+from codebase_rag.tests.conftest import get_nodes
+
+
+def test_every_javascript_function_form_stores_complexity(
+    temp_repo: Path, mock_ingestor: MagicMock
+) -> None:
+    project = temp_repo / "js_complexity"
+    project.mkdir()
+    (project / "logic.js").write_text(
+        """
+function declared(a) {
+  if (a) {
+    return 1;
+  }
+  return 2;
+}
+
+const arrow = (items) => {
+  for (const item of items) {
+    if (item) {
+      return item;
+    }
+  }
+  return null;
+};
+
+const handlers = {
+  pick(a, b) {
+    return a && b ? a : b;
+  },
+};
+
+function Shape() {}
+Shape.prototype.area = function (w, h) {
+  if (w > 0 || h > 0) {
+    return w * h;
+  }
+  return 0;
+};
+""",
+        encoding="utf-8",
+    )
+    parsers, queries = load_parsers()
+
+    GraphUpdater(
+        ingestor=mock_ingestor, repo_path=project, parsers=parsers, queries=queries
+    ).run()
+
+    props_by_qn: dict[str, dict] = {}
+    for label in (cs.NodeLabel.FUNCTION, cs.NodeLabel.METHOD):
+        for call in get_nodes(mock_ingestor, label):
+            props_by_qn.setdefault(call[0][1][cs.KEY_QUALIFIED_NAME], call[0][1])
+
+    def metrics(qn: str) -> tuple[object, object, object]:
+        props = props_by_qn[f"js_complexity.logic.{qn}"]
+        return (
+            props.get(cs.KEY_COMPLEXITY),
+            props.get(cs.KEY_COGNITIVE_COMPLEXITY),
+            props.get(cs.KEY_LINES_OF_CODE),
+        )
+
+    assert metrics("declared") == (2, 1, 6)
+    assert metrics("arrow") == (3, 3, 8)
+    assert metrics("pick") == (3, 3, 3)
+    assert metrics("Shape.area") == (3, 2, 6)
@@ -71,3 +71,61 @@ def test_extended_relation_pass(monkeypatch, tmp_path: Path) -> None:
     assert cs.RelationshipType.DECORATES.value in rel_types
     assert cs.RelationshipType.THROWS.value in rel_types
     assert cs.RelationshipType.CAUGHT_BY.value in rel_types
+
+
+def test_shared_walk_attributes_exceptions_like_per_function_walks(
+    tmp_path: Path,
+) -> None:
+    import tree_sitter_python as tspython
+    from tree_sitter import Language, Parser
+
+    from codebase_rag.infrastructure.parser_loader import load_parsers
+    from codebase_rag.parsers.type_inference.enhanced_function_extractor import (
+        EnhancedFunctionExtractor,
+    )
+
+    source = (
+        b"def outer():\n"
+        b"    try:\n"
+        b"        raise ValueError('x')\n"
+        b"    except KeyError:\n"
+        b"        pass\n"
+        b"    def inner():\n"
+        b"        raise TypeError()\n"
+        b"    return inner\n"
+        b"\n"
+        b"class Box:\n"
+        b"    def get(self):\n"
+        b"        try:\n"
+        b"            return 1\n"
+        b"        except (OSError, IndexError):\n"
+        b"            raise RuntimeError()\n"
+    )
+    root = Parser(Language(tspython.language())).parse(source).root_node
+    _, queries = load_parsers()
+    item = (tmp_path / "mod.py", (root, cs.SupportedLanguage.PYTHON))
+
+    extractor = EnhancedFunctionExtractor(tmp_path, "pkg")
+    walked = extractor.extract_from_ast(
+        item[0], root, cs.SupportedLanguage.PYTHON, queries
+    )
+    ingestor = FakeIngestor()
+    extended_pass = ExtendedRelationPass(ingestor, tmp_path, "pkg", queries)
+    extended_pass.process_ast_cache([item])
+    fused = extractor.extract_from_ast(
+        item[0],
+        root,
+        cs.SupportedLanguage.PYTHON,
+        queries,
+        exception_nodes=extended_pass.exception_nodes[item[0]],
+    )
+
+    assert fused == walked
+    outer = next(metadata for metadata in fused if metadata.name == "outer")
+    assert outer.thrown_exceptions == ["ValueError", "TypeError"]
+    thrown_by = {
+        source[2]
+        for source in ingestor.relationships
+        if source[1] == cs.RelationshipType.THROWS.value
+    }
+    assert ("Type", cs.KEY_QUALIFIED_NAME, "RuntimeError") in thrown_by
@@ -19,6 +19,7 @@ from codebase_rag.infrastructure.parser_loader import load_parsers
 from codebase_rag.parsers.pipeline.call_resolver import CallResolver
 from codebase_rag.parsers.pipeline.import_processor import ImportProcessor
 from codebase_rag.parsers.type_inference import TypeInferenceEngine
+from codebase_rag.state.registry_cache import FunctionRegistryTrie
 
 if TYPE_CHECKING:
     from codebase_rag.parsers.pipeline.call_processor import CallProcessor
@@ -302,6 +303,87 @@ class TestTryResolveViaTrie:
         assert result is None
 
 
+class TestTrieResolutionCache:
+    @pytest.fixture
+    def registry(self) -> FunctionRegistryTrie:
+        registry = FunctionRegistryTrie()
+        registry["proj.app.helpers.helper"] = NodeType.FUNCTION
+        registry["proj.lib.helper"] = NodeType.FUNCTION
+        return registry
+
+    @pytest.fixture
+    def resolver(
+        self, registry: FunctionRegistryTrie, mock_import_processor: ImportProcessor
+    ) -> CallResolver:
+        return CallResolver(
+            function_registry=registry,
+            import_processor=mock_import_processor,
+            class_inheritance={},
+        )
+
+    def test_repeated_lookups_hit_the_cache(
+        self, resolver: CallResolver, registry: FunctionRegistryTrie
+    ) -> None:
+        registry.find_ending_with = MagicMock(wraps=registry.find_ending_with)  # type: ignore[method-assign]
+
+        first = resolver._try_resolve_via_trie("helper", "proj.app.api")
+        second = resolver._try_resolve_via_trie("helpers.helper", "proj.app.api")
+
+        assert first == second == (NodeType.FUNCTION, "proj.app.helpers.helper")
+        assert registry.find_ending_with.call_count == 1
+        assert resolver.stats.as_dict() == {
+            "hits": 1,
+            "misses": 1,
+            "ambiguous": 1,
+            "invalidations": 0,
+        }
+
+    def test_cache_is_keyed_by_caller_module(self, resolver: CallResolver) -> None:
+        app = resolver._try_resolve_via_trie("helper", "proj.app.api")
+        lib = resolver._try_resolve_via_trie("helper", "proj.lib.other")
+
+        assert app is not None and app[1] == "proj.app.helpers.helper"
+        assert lib is not None and lib[1] == "proj.lib.helper"
+        assert resolver.stats.misses == 2
+
+    def test_registry_edits_invalidate_only_affected_names(
+        self, resolver: CallResolver, registry: FunctionRegistryTrie
+    ) -> None:
+        registry["proj.lib.render"] = NodeType.FUNCTION
+        resolver._try_resolve_via_trie("helper", "proj.app.api")
+        resolver._try_resolve_via_trie("render", "proj.app.api")
+
+        del registry["proj.app.helpers.helper"]
+        helper = resolver._try_resolve_via_trie("helper", "proj.app.api")
+        render = resolver._try_resolve_via_trie("render", "proj.app.api")
+
+        assert helper is not None and helper[1] == "proj.lib.helper"
+        assert render is not None and render[1] == "proj.lib.render"
+        assert resolver.stats.invalidations == 1
+        assert resolver.stats.hits == 1
+
+    def test_cached_misses_resolve_once_the_name_is_registered(
+        self, resolver: CallResolver, registry: FunctionRegistryTrie
+    ) -> None:
+        assert resolver._try_resolve_via_trie("missing", "proj.app.api") is None
+
+        registry["proj.app.missing"] = NodeType.FUNCTION
+
+        result = resolver._try_resolve_via_trie("missing", "proj.app.api")
+        assert result == (NodeType.FUNCTION, "proj.app.missing")
+
+    def test_registries_without_versions_are_not_cached(
+        self, call_resolver: CallResolver
+    ) -> None:
+        call_resolver.function_registry["proj.utils.helper"] = NodeType.FUNCTION
+
+        call_resolver._try_resolve_via_trie("helper", "proj.utils")
+        call_resolver._try_resolve_via_trie("helper", "proj.utils")
+
+        assert call_resolver.stats.hits == 0
+        assert call_resolver.stats.misses == 2
+
+
 class TestTryResolveWildcardImports:
     def test_resolves_wildcard_import(self, call_resolver: CallResolver) -> None:
         call_resolver.function_registry["external.utils.helper"] = NodeType.FUNCTION
@@ -0,0 +1,301 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import tree_sitter_python as tspython
+from tree_sitter import Language, Node, Parser
+
+from codebase_rag.core import constants as cs
+from codebase_rag.parsers.pipeline.fused_visitor import (
+    FusedAstVisitor,
+    NodeSubscription,
+    ParsedSourceCache,
+    iter_tree,
+)
+from codebase_rag.parsers.pipeline.python_event_flows import (
+    extract_python_event_flows,
+)
+from codebase_rag.parsers.pipeline.semantic_pass_registry import (
+    SemanticPassContext,
+    SemanticPassDefinition,
+    SemanticPassRegistry,
+)
+from codebase_rag.state.registry_cache import FunctionRegistryTrie
+
+SOURCE = b"def alpha():\n    return beta()\n\nclass Gamma:\n    def delta(self):\n        pass\n"
+
+
+def _parse(source: bytes) -> Node:
+    return Parser(Language(tspython.language())).parse(source).root_node
+
+
+def _recursive(node: Node) -> Iterator[Node]:
+    yield node
+    for child in node.children:
+        yield from _recursive(child)
+
+
+def test_iter_tree_matches_recursive_preorder_and_stays_in_subtree() -> None:
+    root = _parse(SOURCE)
+    function = root.children[0]
+
+    assert [node.id for node in iter_tree(root)] == [
+        node.id for node in _recursive(root)
+    ]
+    assert [node.id for node in iter_tree(function)] == [
+        node.id for node in _recursive(function)
+    ]
+
+
+def test_fused_walk_dispatches_one_traversal_to_every_subscriber() -> None:
+    root = _parse(SOURCE)
+    seen: dict[str, list[str]] = {"defs": [], "calls": [], "js": []}
+
+    def broken(_path: Path, _node: Node) -> None:
+        raise RuntimeError("boom")
+
+    visitor = FusedAstVisitor(
+        [
+            NodeSubscription(
+                "defs",
+                frozenset({"function_definition", "class_definition"}),
+                lambda _path, node: seen["defs"].append(node.type),
+                frozenset({cs.SupportedLanguage.PYTHON}),
+            ),
+            NodeSubscription("broken", frozenset({"function_definition"}), broken),
+            NodeSubscription(
+                "calls",
+                frozenset({"call"}),
+                lambda _path, node: seen["calls"].append(node.type),
+            ),
+            NodeSubscription(
+                "js",
+                frozenset({"call"}),
+                lambda _path, node: seen["js"].append(node.type),
+                frozenset({cs.SupportedLanguage.JS}),
+            ),
+        ]
+    )
+
+    stats = visitor.walk(
+        [
+            (Path("a.py"), (root, cs.SupportedLanguage.PYTHON)),
+            (Path("b.sql"), (root, cs.SupportedLanguage.SQL)),
+        ]
+    )
+
+    assert seen == {
+        "defs": ["function_definition", "class_definition", "function_definition"],
+        "calls": ["call", "call"],
+        "js": [],
+    }
+    assert stats.files == 2
+    assert stats.nodes == 2 * sum(1 for _ in _recursive(root))
+    assert stats.pass_matches == {"defs": 3, "broken": 4, "calls": 2}
+    assert set(stats.pass_seconds) == {"defs", "broken", "calls"}
+    assert stats.traversal_seconds >= 0.0
+
+
+def test_parsed_source_cache_feeds_extractors_one_tree(tmp_path: Path) -> None:
+    path = tmp_path / "events.py"
+    path.write_text("def publish():\n    bus.publish('orders.created', {})\n")
+    broken = tmp_path / "broken.py"
+    broken.write_text("def oops(:\n")
+    cache = ParsedSourceCache()
+
+    source = cache.read(path)
+    assert source is not None and cache.read(path) is source
+    tree = cache.python_tree(source)
+
+    assert tree is not None and cache.python_tree(source) is tree
+    assert extract_python_event_flows(source, tree=tree) == (
+        extract_python_event_flows(source)
+    )
+    assert cache.python_tree(str(cache.read(broken))) is None
+    assert cache.read(tmp_path / "missing.py") is None
+    assert (cache.reads, cache.parses, cache.hits) == (3, 2, 2)
+
+
+def test_parsed_source_cache_evicts_least_recently_used(tmp_path: Path) -> None:
+    cache = ParsedSourceCache(max_entries=2)
+    paths = [tmp_path / f"m{i}.py" for i in range(3)]
+    for index, path in enumerate(paths):
+        path.write_text(f"x = {index}\n")
+        cache.python_tree(str(cache.read(path)))
+
+    cache.read(paths[2])
+    cache.read(paths[0])
+
+    assert (cache.reads, cache.parses, cache.hits) == (4, 3, 1)
+    assert len(cache._sources) == len(cache._trees) == 2
+
+
+class _RecordingPass:
+    def __init__(self, pass_id: str, context: SemanticPassContext) -> None:
+        self.pass_id = pass_id
+        self.cache = context.source_cache
+        self.functions: list[str] = []
+
+    def node_subscriptions(self) -> tuple[NodeSubscription, ...]:
+        return (
+            NodeSubscription(
+                self.pass_id,
+                frozenset({"function_definition"}),
+                lambda _path, node: self.functions.append(node.type),
+            ),
+        )
+
+    def process_ast_cache(self, ast_cache_items) -> None:
+        assert self.cache is not None
+        for file_path, _ in ast_cache_items:
+            self.cache.python_tree(str(self.cache.read(file_path)))
+
+
+def test_registry_shares_walk_and_sources_across_passes(
+    tmp_path: Path, monkeypatch
+) -> None:
+    monkeypatch.setenv("CGR_PASS_ONE", "1")
+    monkeypatch.setenv("CGR_PASS_TWO", "1")
+    path = tmp_path / "main.py"
+    path.write_bytes(SOURCE)
+    built: list[_RecordingPass] = []
+
+    def factory(pass_id: str):
+        def build(context: SemanticPassContext) -> _RecordingPass:
+            built.append(_RecordingPass(pass_id, context))
+            return built[-1]
+
+        return build
+
+    registry = SemanticPassRegistry(
+        SemanticPassContext(
+            ingestor=object(),
+            repo_path=tmp_path,
+            project_name="demo",
+            function_registry={},
+        ),
+        definitions=tuple(
+            SemanticPassDefinition(
+                pass_id=pass_id,
+                display_name=pass_id,
+                env_flag=f"CGR_PASS_{pass_id.upper()}",
+                order=order,
+                factory=factory(pass_id),
+            )
+            for order, pass_id in enumerate(("one", "two"))
+        ),
+    )
+
+    executed = registry.run_enabled(
+        [(path, (_parse(SOURCE), cs.SupportedLanguage.PYTHON))]
+    )
+
+    cache = built[0].cache
+    assert executed == ["one", "two"]
+    assert cache is not None and built[1].cache is cache
+    assert (cache.reads, cache.parses) == (1, 1)
+    assert [len(item.functions) for item in built] == [2, 2]
+    assert registry.last_walk_stats.files == 1
+    assert set(registry.last_timings) == {"one", "two"}
+
+
+def test_default_passes_run_over_javascript_and_typescript_sources(
+    tmp_path: Path,
+) -> None:
+    import tree_sitter_javascript as tsjavascript
+
+    js_parser = Parser(Language(tsjavascript.language()))
+    files = {
+        "web/orders.spec.js": (
+            'import { test } from "vitest";\n'
+            'test("submits order", async () => { await createOrder(); });\n',
+            cs.SupportedLanguage.JS,
+        ),
+        "src/client.ts": (
+            "export function createOrder(payload: OrderRequest): OrderResponse {\n"
+            "  return payload as OrderResponse;\n}\n",
+            cs.SupportedLanguage.TS,
+        ),
+        "src/contracts.ts": (
+            "export interface OrderResponse {\n  id: string;\n}\n",
+            cs.SupportedLanguage.TS,
+        ),
+    }
+    items = []
+    for relative, (source, language) in files.items():
+        path = tmp_path / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(source, encoding="utf-8")
+        items.append((path, (js_parser.parse(source.encode()).root_node, language)))
+    ingestor = MagicMock()
+
+    executed = SemanticPassRegistry(
+        SemanticPassContext(
+            ingestor=ingestor,
+            repo_path=tmp_path,
+            project_name="demo",
+            function_registry=FunctionRegistryTrie(),
+        )
+    ).run_enabled(items)
+
+    assert executed == [
+        "contract_semantics",
+        "event_flow_semantics",
+        "query_fingerprint_semantics",
+        "transaction_flow_semantics",
+        "frontend_operation_semantics",
+        "config_semantics",
+        "test_semantics",
+    ]
+    test_cases = [
+        call.args[1]
+        for call in ingestor.ensure_node_batch.call_args_list
+        if call.args[0] == cs.NodeLabel.TEST_CASE
+    ]
+    assert [props[cs.KEY_NAME] for props in test_cases] == ["submits order"]
+
+
+def test_registry_source_cache_holds_every_file_of_the_run(
+    tmp_path: Path, monkeypatch
+) -> None:
+    monkeypatch.setenv("CGR_PASS_ONE", "1")
+    monkeypatch.setenv("CGR_PASS_TWO", "1")
+    tree = _parse(SOURCE)
+    items = []
+    for index in range(cs.PARSED_SOURCE_CACHE_MAX_ENTRIES + 44):
+        path = tmp_path / f"mod_{index}.py"
+        path.write_bytes(SOURCE + f"# {index}\n".encode())
+        items.append((path, (tree, cs.SupportedLanguage.PYTHON)))
+    built: list[_RecordingPass] = []
+
+    def build(context: SemanticPassContext) -> _RecordingPass:
+        built.append(_RecordingPass(f"p{len(built)}", context))
+        return built[-1]
+
+    registry = SemanticPassRegistry(
+        SemanticPassContext(
+            ingestor=object(),
+            repo_path=tmp_path,
+            project_name="demo",
+            function_registry={},
+        ),
+        definitions=tuple(
+            SemanticPassDefinition(
+                pass_id=pass_id,
+                display_name=pass_id,
+                env_flag=f"CGR_PASS_{pass_id.upper()}",
+                order=order,
+                factory=build,
+            )
+            for order, pass_id in enumerate(("one", "two"))
+        ),
+    )
+
+    registry.run_enabled(items)
+
+    cache = built[0].cache
+    assert cache is not None
+    assert (cache.reads, cache.parses) == (len(items), len(items))
+    assert cache.hits == 2 * len(items)
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import MagicMock
+
+from codebase_rag.core import constants as cs
+from codebase_rag.graph_db.graph_updater import GraphUpdater
+from codebase_rag.infrastructure.parser_loader import load_parsers
+from codebase_rag.tests.conftest import get_nodes
+
+
+def _props_by_qn(mock_ingestor: MagicMock, label: str) -> dict[str, dict]:
+    return {
+        call[0][1][cs.KEY_QUALIFIED_NAME]: call[0][1]
+        for call in get_nodes(mock_ingestor, label)
+    }
+
+
+def test_function_and_method_complexity_is_stored_at_ingest(
+    temp_repo: Path, mock_ingestor: MagicMock
+) -> None:
+    project = temp_repo / "complexity_project"
+    project.mkdir()
+    (project / "__init__.py").write_text("", encoding="utf-8")
+    (project / "logic.py").write_text(
+        """
+def straight(value):
+    return value
+
+
+def branchy(a, b, items):
+    if a and b and items:
+        for item in items:
+            if item or a:
+                pass
+    elif b:
+        pass
+    else:
+        pass
+
+    def helper():
+        if a:
+            return 1
+        return 2
+
+    return 1 if a else 2
+
+
+class Worker:
+    def run(self, job):
+        while job:
+            try:
+                job = job.next
+            except ValueError:
+                return None
+        return job
+""",
+        encoding="utf-8",
+    )
+    parsers, queries = load_parsers()
+
+    GraphUpdater(
+        ingestor=mock_ingestor, repo_path=project, parsers=parsers, queries=queries
+    ).run()
+
+    functions = _props_by_qn(mock_ingestor, cs.NodeLabel.FUNCTION)
+    methods = _props_by_qn(mock_ingestor, cs.NodeLabel.METHOD)
+    straight = functions["complexity_project.logic.straight"]
+    branchy = functions["complexity_project.logic.branchy"]
+    helper = functions["complexity_project.logic.branchy.helper"]
+    run = methods["complexity_project.logic.Worker.run"]
+
+    assert (straight[cs.KEY_COMPLEXITY], straight[cs.KEY_COGNITIVE_COMPLEXITY]) == (
+        1,
+        0,
+    )
+    assert (branchy[cs.KEY_COMPLEXITY], branchy[cs.KEY_COGNITIVE_COMPLEXITY]) == (
+        9,
+        11,
+    )
+    assert (helper[cs.KEY_COMPLEXITY], helper[cs.KEY_COGNITIVE_COMPLEXITY]) == (2, 1)
+    assert (run[cs.KEY_COMPLEXITY], run[cs.KEY_COGNITIVE_COMPLEXITY]) == (3, 3)
+    assert branchy[cs.KEY_LINES_OF_CODE] == 16
@@ -1,14 +1,25 @@
 import time
+from pathlib import Path
 from typing import cast
 
 import pytest
-from tree_sitter import Query
+import tree_sitter_python as tspython
+from tree_sitter import Language, Query, QueryError
 
+from codebase_rag.core.config import settings
 from codebase_rag.parsers.core.query_cache import (
     CacheStats,
     CompositeQueryCache,
+    PersistentQueryIndex,
     QueryCache,
+    binding_version,
+    compile_query,
+    get_shared_query_cache,
     make_cache_key,
+    query_compiles,
+    query_index_path,
+    query_key,
+    set_shared_query_cache,
 )
 
 
@@ -224,6 +235,108 @@ class TestCompositeQueryCache:
         assert "misses" in stats["l1"]
 
 
+class TestPersistentQueryIndex:
+    """Test compilation outcomes shared between processes."""
+
+    @pytest.fixture
+    def language(self):
+        return Language(tspython.language())
+
+    def test_index_round_trips_through_disk(self, tmp_path: Path):
+        index = PersistentQueryIndex(tmp_path / "queries.json")
+        index.record("key", valid=True, patterns=2, captures=3)
+        assert index.flush()
+        assert not index.flush()
+
+        reloaded = PersistentQueryIndex(tmp_path / "queries.json")
+
+        assert reloaded.lookup("key") == {"valid": True, "patterns": 2, "captures": 3}
+        assert reloaded.lookup("other") is None
+        assert reloaded.stats.hits == 1
+        assert reloaded.stats.misses == 1
+
+    def test_concurrent_flushes_merge_instead_of_overwriting(self, tmp_path: Path):
+        path = tmp_path / "queries.json"
+        first = PersistentQueryIndex(path)
+        second = PersistentQueryIndex(path)
+        assert first.lookup("a") is None
+        assert second.lookup("b") is None
+
+        first.record("a", valid=True, patterns=1, captures=1)
+        second.record("b", valid=False, error="bad")
+        assert first.flush()
+        assert second.flush()
+
+        reloaded = PersistentQueryIndex(path)
+
+        assert reloaded.lookup("a") == {"valid": True, "patterns": 1, "captures": 1}
+        assert reloaded.lookup("b") == {
+            "valid": False,
+            "patterns": 0,
+            "captures": 0,
+            "error": "bad",
+        }
+        assert list(tmp_path.iterdir()) == [path]
+
+    def test_corrupt_index_is_ignored(self, tmp_path: Path):
+        path = tmp_path / "queries.json"
+        path.write_text("{not json", encoding="utf-8")
+
+        assert PersistentQueryIndex(path).size() == 0
+
+    def test_key_depends_on_grammar_and_text(self, language):
+        key = query_key(language, "(identifier) @name")
+
+        assert key.startswith("python-")
+        assert f"@{binding_version()}" in key
+        assert key == query_key(language, "(identifier) @name")
+        assert key != query_key(language, "(string) @name")
+
+    def test_warm_cache_skips_known_invalid_queries(self, tmp_path: Path, language):
+        path = tmp_path / "queries.json"
+        cold = CompositeQueryCache(l2=PersistentQueryIndex(path))
+
+        assert compile_query(language, "(identifier) @name", cold).pattern_count == 1
+        assert compile_query(language, "(identifier) @name", cold) is not None
+        assert not query_compiles(language, "(no_such_node) @x", cold)
+        assert cold.compiles == 2
+        cold.flush()
+
+        warm = CompositeQueryCache(l2=PersistentQueryIndex(path))
+
+        assert not query_compiles(language, "(no_such_node) @x", warm)
+        with pytest.raises(QueryError):
+            compile_query(language, "(no_such_node) @x", warm)
+        assert compile_query(language, "(identifier) @name", warm) is not None
+        assert warm.compiles == 1
+        assert warm.stats()["l2"]["hit_rate"] == 1.0
+
+    def test_shared_cache_uses_configured_index_path(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        path = tmp_path / "queries.json"
+        monkeypatch.setattr(settings, "CODEGRAPH_QUERY_CACHE_PATH", str(path))
+        set_shared_query_cache(None)
+        try:
+            cache = get_shared_query_cache()
+
+            assert query_index_path() == path
+            assert cache.l2_cache is not None
+            assert cache.l2_cache.path == path
+        finally:
+            set_shared_query_cache(None)
+
+    def test_shared_cache_without_persistence_has_no_index(
+        self, monkeypatch: pytest.MonkeyPatch
+    ):
+        monkeypatch.setattr(settings, "CODEGRAPH_QUERY_CACHE_PERSIST", False)
+        set_shared_query_cache(None)
+        try:
+            assert get_shared_query_cache().l2_cache is None
+        finally:
+            set_shared_query_cache(None)
+
+
 class TestCacheKey:
     """Test cache key generation."""
 
@@ -1,5 +1,12 @@
 from __future__ import annotations
 
+import re
+from pathlib import Path
+
+import pytest
+
+from codebase_rag.core import constants as cs
+from codebase_rag.security import security_scanner
 from codebase_rag.security.security_scanner import SecurityScanner
 
 
@@ -32,3 +39,114 @@ def test_scan_secret_text_reports_identifier_without_raw_secret_value() -> None:
     assert payload["secret_name"] == "APP_SECRET"
     assert payload["masked"] is True
     assert "super-secret-value" not in str(payload)
+
+
+def _reference_scan(scanner: SecurityScanner, text: str) -> list[dict[str, object]]:
+    payloads: list[dict[str, object]] = []
+    lines = text.splitlines()
+    for name, pattern in scanner.patterns:
+        flags = 0 if name.startswith(("sql_", "xss_")) else re.IGNORECASE
+        for match in re.finditer(pattern, text, flags):
+            line_number = text[: match.start()].count("\n") + 1
+            line_text = lines[line_number - 1] if line_number <= len(lines) else ""
+            finding = scanner._build_finding(
+                path="sample.py",
+                pattern_name=name,
+                line_number=line_number,
+                line_text=line_text,
+                match=match,
+            )
+            payloads.append(finding.to_payload())
+    return payloads
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        'query = "SELECT * FROM t WHERE id=" + request.args["id"]\n' * 3,
+        "tokentoken_x = 'abcdefg'\n token=os.environ\nAPI_TOKEN\n = 'abcdefgh'\n",
+        "ſession_key = 'abcdefgh'\nPRİVATE_KEY = 'abcdefgh'\r\nx = 1",
+        "f\"SELECT {x}\"; `SELECT ${y}`; q = 'x' + email\nBearer abc.def==",
+        "el.innerHTML = v\n$('x').html(y)\nAKIAABCDEFGHIJKLMNOP ghp_" + "a" * 36,
+    ],
+)
+def test_scan_text_matches_per_pattern_reference(text: str) -> None:
+    scanner = SecurityScanner()
+
+    findings = [
+        finding.to_payload() for finding in scanner.scan_text(text, "sample.py")
+    ]
+
+    assert findings == _reference_scan(scanner, text)
+
+
+def test_case_fold_table_covers_engine_ascii_folds() -> None:
+    ascii_letter = re.compile("[a-z]", re.IGNORECASE)
+    folds = {
+        chr(code)
+        for code in range(128, 0x10000)
+        if not 0xD800 <= code <= 0xDFFF and ascii_letter.fullmatch(chr(code))
+    }
+
+    assert folds == {source for source, _ in security_scanner._ASCII_CASE_FOLDS}
+
+
+@pytest.mark.parametrize(
+    ("pattern", "anchors", "prefixed"),
+    [
+        (r"\bsecret_\w+\s*=", ("secret_", "="), True),
+        (r"(?i)api[_-]?key", ("api", "key"), True),
+        (r"a{,}b{}c", ("b{}c",), True),
+        (r"(token|key)=['\"]\w+", ("=",), False),
+        (r"token|key", (), False),
+        (r"(a)x\1", (), False),
+    ],
+)
+def test_pattern_prefilter_extracts_required_literals(
+    pattern: str, anchors: tuple[str, ...], prefixed: bool
+) -> None:
+    compiled = security_scanner._compile_pattern("sql_probe", pattern)
+    text = "secret_id = 1; API-key; a{}c; key='v'; token; axa"
+
+    assert compiled.anchors == anchors
+    assert (compiled.prefix is not None) is prefixed
+    assert [
+        m.span()
+        for m in security_scanner._iter_matches(
+            compiled, security_scanner._ScanText(text)
+        )
+    ] == [m.span() for m in compiled.regex.finditer(text)]
+
+
+def test_scan_files_skips_oversized_files(tmp_path: Path) -> None:
+    small = tmp_path / "small.js"
+    small.write_text("element.innerHTML = userInput\n", encoding="utf-8")
+    large = tmp_path / "large.js"
+    large.write_text("element.innerHTML = userInput\n" * 10, encoding="utf-8")
+    scanner = SecurityScanner(max_file_bytes=100)
+
+    findings = scanner.scan_files([small, large, tmp_path / "missing.js"])
+
+    assert {finding.path for finding in findings} == {str(small)}
+
+
+def test_parallel_scan_preserves_serial_findings(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    paths = []
+    for index in range(6):
+        path = tmp_path / f"module_{index}.py"
+        path.write_text(
+            f'API_TOKEN_{index} = "abcdefghijk"\nel.innerHTML = v{index}\n',
+            encoding="utf-8",
+        )
+        paths.append(path)
+    serial = SecurityScanner(workers=1).scan_files(paths)
+    monkeypatch.setattr(security_scanner.multiprocessing, "cpu_count", lambda: 2)
+    monkeypatch.setattr(cs, "SECURITY_SCAN_PARALLEL_MIN_BYTES", 0)
+
+    parallel = SecurityScanner(workers=2).scan_files(paths)
+
+    assert [finding.to_payload() for finding in parallel] == [
+        finding.to_payload() for finding in serial
+    ]
@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from codebase_rag.services.analysis_evidence import AnalysisEvidenceService
+
+
+@pytest.fixture
+def evidence_repo(tmp_path: Path) -> Path:
+    report_dir = tmp_path / "output" / "analysis"
+    report_dir.mkdir(parents=True)
+    (report_dir / "security_report.json").write_text(
+        json.dumps({"summary": {"issues": 1}, "violations": [{"path": "src/a.py"}]}),
+        encoding="utf-8",
+    )
+    (report_dir / "api_report.json").write_text(
+        json.dumps({"endpoints": [{"path": "src/api.py"}]}),
+        encoding="utf-8",
+    )
+    return tmp_path
+
+
+def test_parse_artifact_is_cached_by_mtime(
+    evidence_repo: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    service = AnalysisEvidenceService(evidence_repo)
+    report = evidence_repo / "output" / "analysis" / "security_report.json"
+    reads: list[Path] = []
+    original_read_text = Path.read_text
+
+    def counting_read_text(path: Path, *args: object, **kwargs: object) -> str:
+        reads.append(path)
+        return original_read_text(path, *args, **kwargs)  # type: ignore[arg-type]
+
+    monkeypatch.setattr(Path, "read_text", counting_read_text)
+
+    first = service._parse_artifact(report)
+    second = service._parse_artifact(report)
+    assert len(reads) == 1
+    assert first == second
+    assert first is not second
+
+    report.write_text(json.dumps({"violations": []}), encoding="utf-8")
+    stat = report.stat()
+    os.utime(report, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    refreshed = service._parse_artifact(report)
+
+    assert len(reads) == 2
+    assert refreshed == {"violations": []}
+
+
+def test_parse_artifact_cache_is_bounded_and_hands_out_copies(
+    evidence_repo: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(AnalysisEvidenceService, "_PAYLOAD_CACHE_LIMIT", 1)
+    service = AnalysisEvidenceService(evidence_repo)
+    security = evidence_repo / "output" / "analysis" / "security_report.json"
+    api = evidence_repo / "output" / "analysis" / "api_report.json"
+
+    payload = service._parse_artifact(security)
+    assert isinstance(payload, dict)
+    payload["violations"].clear()
+    service._parse_artifact(api)
+
+    assert list(service._payload_cache) == [api]
+    assert service._parse_artifact(security) == {
+        "summary": {"issues": 1},
+        "violations": [{"path": "src/a.py"}],
+    }
+
+
+def test_bundle_resource_ignores_unknown_query_arguments(
+    evidence_repo: Path,
+) -> None:
+    service = AnalysisEvidenceService(evidence_repo)
+
+    bundle = service.read_resource(
+        "analysis://bundle/risk_bundle?goal=review+security&artifacts=x&session_state=y"
+    )
+
+    assert "error" not in bundle
+    bundle.pop("timings_ms")
+    expected = service.build_bundle("risk_bundle", goal="review security")
+    expected.pop("timings_ms")
+    assert bundle == expected
+
+
+async def test_build_bundle_async_matches_sync_bundle(evidence_repo: Path) -> None:
+    service = AnalysisEvidenceService(evidence_repo)
+
+    async_bundle = await service.build_bundle_async(
+        "risk_bundle", goal="review security", max_concurrency=2
+    )
+    sync_bundle = service.build_bundle("risk_bundle", goal="review security")
+
+    async_timings = async_bundle.pop("timings_ms")
+    sync_timings = sync_bundle.pop("timings_ms")
+    assert async_bundle == sync_bundle
+    assert set(async_timings) == set(sync_timings) == {"artifacts", "assembly", "total"}
+
+    prepared = service.build_bundle_from_artifacts(
+        "risk_bundle", service.load_artifact_metadata(), goal="review security"
+    )
+    assert set(prepared.pop("timings_ms")) == {"assembly", "total"}
+    assert prepared == sync_bundle
+
+
+def test_index_refresh_reads_each_artifact_through_the_payload_cache(
+    evidence_repo: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    service = AnalysisEvidenceService(evidence_repo)
+    reads: list[Path] = []
+    original_read_text = Path.read_text
+
+    def counting_read_text(path: Path, *args: object, **kwargs: object) -> str:
+        if path.parent.name == "analysis":
+            reads.append(path)
+        return original_read_text(path, *args, **kwargs)  # type: ignore[arg-type]
+
+    monkeypatch.setattr(Path, "read_text", counting_read_text)
+
+    service.load_artifact_metadata()
+    report = evidence_repo / "output" / "analysis" / "security_report.json"
+    service._parse_artifact(report)
+
+    assert sorted(reads) == sorted(set(reads))
+    assert report in reads
+
+
+async def test_collect_artifact_metadata_keeps_sorted_order(
+    evidence_repo: Path,
+) -> None:
+    service = AnalysisEvidenceService(evidence_repo)
+
+    artifacts = await service.collect_artifact_metadata(max_concurrency=1)
+
+    assert [item["name"] for item in artifacts] == [
+        "api_report.json",
+        "security_report.json",
+    ]
+
+
+def test_artifact_index_reparses_only_changed_reports(
+    evidence_repo: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    AnalysisEvidenceService(evidence_repo).load_artifact_metadata()
+    index_path = evidence_repo / ".codebase_rag" / "analysis_artifact_index.json"
+    assert set(json.loads(index_path.read_text(encoding="utf-8"))["artifacts"]) == {
+        "api_report.json",
+        "security_report.json",
+    }
+
+    report = evidence_repo / "output" / "analysis" / "security_report.json"
+    report.write_text(json.dumps({"violations": []}), encoding="utf-8")
+    stat = report.stat()
+    os.utime(report, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    service = AnalysisEvidenceService(evidence_repo)
+    parsed: list[str] = []
+    original = service._parse_artifact
+
+    def counting_parse_artifact(path: Path) -> object:
+        parsed.append(path.name)
+        return original(path)
+
+    monkeypatch.setattr(service, "_parse_artifact", counting_parse_artifact)
+
+    artifacts = service.load_artifact_metadata()
+    resources = service.list_resources()
+
+    assert parsed == ["security_report.json"]
+    assert [artifact["name"] for artifact in artifacts] == [
+        "api_report.json",
+        "security_report.json",
+    ]
+    assert [resource["name"] for resource in resources[-2:]] == [
+        "api_report",
+        "security_report",
+    ]
+
+
+def test_artifact_index_drops_deleted_reports(evidence_repo: Path) -> None:
+    service = AnalysisEvidenceService(evidence_repo)
+    service.load_artifact_metadata()
+
+    (evidence_repo / "output" / "analysis" / "api_report.json").unlink()
+    artifacts = service.load_artifact_metadata()
+
+    index_path = evidence_repo / ".codebase_rag" / "analysis_artifact_index.json"
+    assert [artifact["name"] for artifact in artifacts] == ["security_report.json"]
+    assert list(json.loads(index_path.read_text(encoding="utf-8"))["artifacts"]) == [
+        "security_report.json"
+    ]
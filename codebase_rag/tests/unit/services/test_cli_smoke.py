@@ -1,6 +1,7 @@
 import subprocess
 import sys
 from pathlib import Path
+from unittest.mock import MagicMock
 
 import pytest
 
@@ -34,3 +35,26 @@ def test_import_cli_module() -> None:
         assert hasattr(cli, "app"), "CLI module missing app attribute"
     except ImportError as e:
         pytest.fail(f"Failed to import cli module: {e}")
+
+
+def test_index_shuts_down_language_runtime_when_update_fails(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from typer.testing import CliRunner
+
+    from codebase_rag.core import cli
+
+    runtime = MagicMock()
+    updater = MagicMock()
+    updater.run.side_effect = RuntimeError("parse failed")
+    monkeypatch.setattr(cli, "LanguageRuntime", lambda: runtime)
+    monkeypatch.setattr(cli, "GraphUpdater", lambda *args, **kwargs: updater)
+    monkeypatch.setattr(cli, "ProtobufFileIngestor", MagicMock())
+
+    result = CliRunner().invoke(
+        cli.app,
+        ["index", "--repo-path", str(tmp_path), "-o", str(tmp_path / "out")],
+    )
+
+    assert result.exit_code == 1
+    runtime.shutdown.assert_called_once_with()
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from codebase_rag.services.graph_pass_scheduler import (
+    AST_CACHE,
+    FUNCTION_REGISTRY,
+    GRAPH_ANY,
+    GraphPass,
+    graph,
+    run_graph_passes,
+)
+
+
+def _recording(name: str, log: list[str]):
+    def run() -> None:
+        log.append(name)
+
+    return run
+
+
+def test_dependencies_follow_read_write_hazards_only() -> None:
+    log: list[str] = []
+    passes = [
+        GraphPass(
+            "framework",
+            _recording("framework", log),
+            reads=frozenset({FUNCTION_REGISTRY}),
+            writes=graph("Endpoint"),
+        ),
+        GraphPass(
+            "calls",
+            _recording("calls", log),
+            reads=frozenset({AST_CACHE, FUNCTION_REGISTRY}),
+            writes=graph("CALLS"),
+        ),
+        GraphPass(
+            "resolver",
+            _recording("resolver", log),
+            reads=frozenset({AST_CACHE}) | graph("Endpoint"),
+            writes=graph("Parameter"),
+        ),
+        GraphPass(
+            "endpoint_rewrite",
+            _recording("endpoint_rewrite", log),
+            writes=graph("Endpoint"),
+        ),
+        GraphPass(
+            "bridging", _recording("bridging", log), reads=frozenset({GRAPH_ANY})
+        ),
+    ]
+
+    report = run_graph_passes(passes)
+
+    depends = {timing.name: timing.depends_on for timing in report.timings}
+    assert log == [graph_pass.name for graph_pass in passes]
+    assert depends == {
+        "framework": (),
+        "calls": (),
+        "resolver": ("framework",),
+        "endpoint_rewrite": ("framework", "resolver"),
+        "bridging": ("framework", "calls", "resolver", "endpoint_rewrite"),
+    }
+    assert report.critical_path[0] == "framework"
+    assert report.critical_path[-1] == "bridging"
+    assert report.as_dict()["passes"]["resolver"]["depends_on"] == ["framework"]
+
+
+def test_independent_passes_overlap_on_the_pool() -> None:
+    barrier = threading.Barrier(2, timeout=5)
+    log: list[str] = []
+
+    def meet(name: str):
+        def run() -> None:
+            barrier.wait()
+            log.append(name)
+
+        return run
+
+    passes = [
+        GraphPass(
+            "types", meet("types"), reads=frozenset({AST_CACHE}), writes=graph("Type")
+        ),
+        GraphPass(
+            "overrides",
+            meet("overrides"),
+            reads=frozenset({AST_CACHE}),
+            writes=graph("OVERRIDES"),
+        ),
+        GraphPass("after", _recording("after", log), reads=frozenset({GRAPH_ANY})),
+    ]
+
+    report = run_graph_passes(passes, max_workers=2)
+
+    assert sorted(log[:2]) == ["overrides", "types"]
+    assert log[2] == "after"
+    assert report.workers == 2
+    assert report.critical_seconds >= max(t.seconds for t in report.timings)
+
+
+def test_pass_errors_propagate() -> None:
+    def broken() -> None:
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError, match="boom"):
+        run_graph_passes(
+            [GraphPass("broken", broken), GraphPass("next", lambda: None)],
+            max_workers=2,
+        )
@@ -12,6 +12,8 @@ class _FakeRuntimeIngestor:
     def __init__(self, project_name: str) -> None:
         self.project_name = project_name
         self.nodes: list[tuple[str, dict[str, object]]] = []
+        self.queries: list[str] = []
+        self.writes: list[tuple[str, dict[str, object]]] = []
         self.relationships: list[
             tuple[
                 tuple[str, str, str],
@@ -65,12 +67,24 @@ class _FakeRuntimeIngestor:
     def flush_all(self) -> None:
         return None
 
+    def execute_write(
+        self, query: str, parameters: dict[str, object] | None = None
+    ) -> None:
+        self.writes.append((query, parameters or {}))
+
     def fetch_all(
         self,
         query: str,
         parameters: dict[str, object] | None = None,
     ) -> list[object]:
         _ = parameters
+        self.queries.append(query)
+        if "MATCH (a:RuntimeArtifact" in query:
+            return [
+                {"qualified_name": props[cs.KEY_QUALIFIED_NAME]}
+                for label, props in self.nodes
+                if label == cs.NodeLabel.RUNTIME_ARTIFACT
+            ]
         if "MATCH (e:EventFlow" in query:
             return cast(list[object], self.event_flow_rows)
         if "MATCH (q:Queue" in query:
@@ -179,3 +193,109 @@ def test_runtime_evidence_reconciles_runtime_events_to_static_event_graph(
         and rel[2][0] == cs.NodeLabel.RUNTIME_EVENT
         for rel in observed_relationships
     )
+
+
+def test_runtime_evidence_aggregates_events_and_preloads_lookups_once(
+    temp_repo: Path,
+) -> None:
+    repo_path = temp_repo / "runtime_event_aggregation"
+    repo_path.mkdir()
+    runtime_dir = repo_path / "output" / "runtime"
+    runtime_dir.mkdir(parents=True)
+    line = json.dumps(
+        {
+            "event_name": "invoice.created",
+            "queue": "invoice_events",
+            "handler": "InvoiceWorker.handle_invoice_created",
+        }
+    )
+    (runtime_dir / "events.ndjson").write_text(f"{line}\n" * 25, encoding="utf-8")
+
+    ingestor = _FakeRuntimeIngestor(project_name=repo_path.name)
+    result = RuntimeEvidenceIngestor(
+        repo_path=repo_path,
+        project_name=repo_path.name,
+        ingestor=ingestor,
+    ).ingest_available()
+
+    assert result == {"status": "ok", "artifacts": 1, "events": 1}
+    runtime_events = [
+        props for label, props in ingestor.nodes if label == cs.NodeLabel.RUNTIME_EVENT
+    ]
+    assert [props["occurrences"] for props in runtime_events] == [25]
+    assert sum("MATCH (e:EventFlow" in query for query in ingestor.queries) == 1
+    assert sum("MATCH (q:Queue" in query for query in ingestor.queries) == 1
+    assert sum("n:Function OR n:Method" in query for query in ingestor.queries) == 1
+
+
+def test_runtime_evidence_resumes_appended_logs_from_offset(temp_repo: Path) -> None:
+    repo_path = temp_repo / "runtime_event_resume"
+    repo_path.mkdir()
+    log_path = repo_path / "logs" / "worker.log"
+    log_path.parent.mkdir(parents=True)
+    log_path.write_text("GET /invoices 200\n", encoding="utf-8")
+
+    ingestor = _FakeRuntimeIngestor(project_name=repo_path.name)
+
+    def ingest() -> dict[str, object]:
+        return RuntimeEvidenceIngestor(
+            repo_path=repo_path,
+            project_name=repo_path.name,
+            ingestor=ingestor,
+        ).ingest_available()
+
+    assert ingest()["events"] == 1
+    with log_path.open("a", encoding="utf-8") as handle:
+        handle.write("POST /invoices 201\n")
+    assert ingest()["events"] == 1
+    assert ingest()["events"] == 0
+
+    runtime_events = [
+        props for label, props in ingestor.nodes if label == cs.NodeLabel.RUNTIME_EVENT
+    ]
+    assert [props["method"] for props in runtime_events] == ["GET", "POST"]
+    get_qn = runtime_events[0][cs.KEY_QUALIFIED_NAME]
+
+    log_path.write_text("DELETE /invoices/1 204\nGET /invoices 200\n")
+    assert ingest()["events"] == 2
+    rewritten = [props for _, props in ingestor.nodes[-2:]]
+    assert rewritten[1][cs.KEY_QUALIFIED_NAME] == get_qn
+    assert ingestor.writes[-1][1]["keep"] == [
+        props[cs.KEY_QUALIFIED_NAME] for props in rewritten
+    ]
+
+
+def test_runtime_evidence_leaves_partial_lines_for_the_next_run(
+    temp_repo: Path,
+) -> None:
+    repo_path = temp_repo / "runtime_event_partial"
+    repo_path.mkdir()
+    log_path = repo_path / "output" / "runtime" / "requests.ndjson"
+    log_path.parent.mkdir(parents=True)
+    first = json.dumps({"kind": "http", "method": "GET", "route_path": "/a"})
+    second = json.dumps({"kind": "http", "method": "POST", "route_path": "/b"})
+    log_path.write_text(f"{first}\n{second[:20]}", encoding="utf-8")
+    ingestor = _FakeRuntimeIngestor(project_name=repo_path.name)
+
+    def ingest() -> dict[str, object]:
+        return RuntimeEvidenceIngestor(
+            repo_path=repo_path,
+            project_name=repo_path.name,
+            ingestor=ingestor,
+        ).ingest_available()
+
+    assert ingest()["events"] == 1
+    with log_path.open("a", encoding="utf-8") as handle:
+        handle.write(f"{second[20:]}\n{first}\n")
+    assert ingest()["events"] == 2
+
+    runtime_events = [
+        props for label, props in ingestor.nodes if label == cs.NodeLabel.RUNTIME_EVENT
+    ]
+    assert [
+        (props["route_path"], props["occurrences"]) for props in runtime_events
+    ] == [("/a", 1), ("/b", 1), ("/a", 2)]
+    assert (
+        runtime_events[0][cs.KEY_QUALIFIED_NAME]
+        == (runtime_events[2][cs.KEY_QUALIFIED_NAME])
+    )
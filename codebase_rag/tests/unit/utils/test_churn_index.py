@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import shutil
+import subprocess
+from pathlib import Path
+from typing import Any, cast
+from unittest.mock import MagicMock
+
+import pytest
+
+from codebase_rag.analysis.analysis_runner import AnalysisRunner
+from codebase_rag.analysis.types import NodeRecord
+from codebase_rag.services import IngestorProtocol
+from codebase_rag.utils.churn_index import ChurnIndex
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="git missing")
+
+
+def _git(repo: Path, *args: str) -> None:
+    subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True)
+
+
+def _commit(repo: Path, author: str, *paths: str) -> None:
+    for path in paths:
+        target = repo / path
+        target.parent.mkdir(parents=True, exist_ok=True)
+        with target.open("a", encoding="utf-8") as handle:
+            handle.write(f"{author}\n")
+    _git(repo, "add", *paths)
+    _git(
+        repo,
+        "-c",
+        f"user.name={author}",
+        "-c",
+        f"user.email={author}@example.com",
+        "commit",
+        "-q",
+        "-m",
+        f"{author} edit",
+    )
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> Path:
+    _git(tmp_path, "init", "-q")
+    _commit(tmp_path, "ada", "src/a.py", "src/b.py")
+    _commit(tmp_path, "bob", "src/a.py")
+    return tmp_path
+
+
+def test_churn_index_reads_only_new_commits_and_persists(
+    repo: Path, tmp_path: Path
+) -> None:
+    index_path = tmp_path / ".codebase_rag" / "churn_index.json"
+    index = ChurnIndex()
+
+    first = index.refresh(repo)
+    index.save(index_path)
+    _commit(repo, "bob", "src/a.py", "src/c.py")
+    reloaded = ChurnIndex.load(index_path)
+    second = reloaded.refresh(repo)
+
+    assert (first.mode, first.commits) == ("full", 2)
+    assert (second.mode, second.commits) == ("incremental", 1)
+    assert reloaded.refresh(repo).mode == "unchanged"
+    assert reloaded.churn == {"src/a.py": 3, "src/b.py": 1, "src/c.py": 1}
+    assert reloaded.authors["src/a.py"] == {"ada": 1, "bob": 2}
+    assert reloaded.owner("src/a.py") == "bob"
+    assert reloaded.commits == 3
+
+
+def test_churn_index_rebuilds_when_history_is_rewritten(repo: Path) -> None:
+    index = ChurnIndex()
+    index.refresh(repo)
+
+    _git(repo, "reset", "-q", "--hard", "HEAD~1")
+    _commit(repo, "cy", "src/b.py")
+    refresh = index.refresh(repo)
+
+    assert (refresh.mode, refresh.commits) == ("full", 2)
+    assert index.churn == {"src/a.py": 1, "src/b.py": 2}
+    assert index.owner("src/b.py") in {"ada", "cy"}
+    assert index.commits == 2
+
+
+def test_runner_keeps_churn_index_out_of_analysis_reports(repo: Path) -> None:
+    runner = AnalysisRunner(cast(IngestorProtocol, MagicMock()), repo)
+    nodes = [NodeRecord(1, ["File"], {"path": "src/a.py"})]
+
+    cast(Any, runner)._churn_ownership(nodes)
+
+    assert (repo / ".codebase_rag" / "churn_index.json").exists()
+    assert not (repo / "output" / "analysis" / "churn_index.json").exists()
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from codebase_rag.utils.graph_cycles import analyze_cycles, cyclic_components
+
+
+def test_cyclic_components_handle_deep_chains_without_recursion() -> None:
+    depth = 50_000
+    graph = {node_id: {node_id + 1} for node_id in range(depth)}
+    graph[depth] = {0}
+    graph[depth + 1] = {depth + 2}
+
+    components = cyclic_components(graph)
+
+    assert len(components) == 1
+    assert len(components[0]) == depth + 1
+
+
+def test_analyze_cycles_enumerates_elementary_cycles_per_component() -> None:
+    graph = {1: {2, 3}, 2: {1}, 3: {1}, 7: {7}, 8: {9}}
+
+    analysis = analyze_cycles(graph)
+
+    assert analysis.components == [[1, 2, 3], [7]]
+    assert sorted(analysis.cycles) == [[1, 2], [1, 3], [7]]
+    assert analysis.cyclic_nodes == {1, 2, 3, 7}
+    assert analysis.component_stats()["largest_component"] == 3
+    assert not analysis.truncated
+
+
+def test_analyze_cycles_respects_per_component_limit() -> None:
+    graph = {node_id: set(range(8)) for node_id in range(8)}
+
+    analysis = analyze_cycles(graph, max_cycles_per_component=5, min_cycle_size=2)
+
+    assert len(analysis.cycles) == 5
+    assert all(len(cycle) >= 2 for cycle in analysis.cycles)
+    assert analysis.truncated
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import hashlib
+from array import array
+from itertools import accumulate
+from pathlib import Path
+
+from codebase_rag.utils.source_store import SourceStore
+
+
+def test_source_store_reads_each_file_once_and_slices_lines(tmp_path: Path) -> None:
+    source = tmp_path / "module.py"
+    source.write_bytes(b"def a():\r\n    return 1\n\ndef b():\n    return 2\n")
+    store = SourceStore()
+
+    assert store.read_lines(source, 4, 5) == "def b():\n    return 2\n"
+    assert store.read_lines(source, 1, 2) == "def a():\n    return 1\n"
+    assert store.read_lines(source, 9, 12) is None
+    assert store.line_count(source) == 5
+    assert store.read_text(source, max_bytes=4) is None
+    assert store.read_text(tmp_path / "missing.py") is None
+
+    stats = store.stats.as_dict()
+    assert stats["misses"] == 1
+    assert stats["hits"] == 3
+    assert stats["bytes_read"] == source.stat().st_size
+    assert stats["read_errors"] == 1
+
+
+def test_source_store_evicts_least_recently_used_files(tmp_path: Path) -> None:
+    paths = []
+    for index in range(3):
+        path = tmp_path / f"f{index}.txt"
+        path.write_text("x" * 40, encoding="utf-8")
+        paths.append(path)
+    store = SourceStore(max_bytes=100)
+
+    store.read_bytes(paths[0])
+    store.read_bytes(paths[1])
+    store.read_bytes(paths[0])
+    store.read_bytes(paths[2])
+    store.read_bytes(paths[0])
+    store.read_bytes(paths[1])
+
+    assert store.stats.evictions >= 1
+    assert store.stats.misses == 4
+    assert store.stats.hits == 2
+
+
+def test_source_store_keeps_hashes_after_eviction(
+    tmp_path: Path,
+) -> None:
+    large = tmp_path / "large.py"
+    large.write_bytes(b"x = 1\r\n" * 40)
+    small = tmp_path / "small.py"
+    small.write_bytes(b"y = 2\n" * 20)
+    store = SourceStore(max_bytes=300)
+
+    assert store.read_bytes(large) == large.read_bytes()
+    assert store.read_lines(large, 2, 3) == "x = 1\nx = 1\n"
+    digest = hashlib.sha256(large.read_bytes()).hexdigest()
+    assert store.content_hash(large) == digest
+    store.read_text(small)
+    store.read_text(tmp_path / "." / "small.py")
+
+    assert store.stats.evictions >= 1
+    assert store.content_hash(large) == digest
+    assert store.stats.misses == 2
+    assert store.stats.as_dict()["duplicate_reads_avoided"] == store.stats.hits
+
+
+def test_source_store_invalidate_rereads_changed_file(tmp_path: Path) -> None:
+    source = tmp_path / "module.py"
+    source.write_text("old = 1\n", encoding="utf-8")
+    store = SourceStore()
+
+    assert store.read_text(source) == "old = 1\n"
+    source.write_text("new = 2\n", encoding="utf-8")
+    assert store.read_text(source) == "old = 1\n"
+
+    store.invalidate(source)
+
+    assert store.read_text(source) == "new = 2\n"
+    assert store.stats.misses == 2
+
+
+def test_source_store_holds_no_file_open_and_survives_truncation(
+    tmp_path: Path,
+) -> None:
+    source = tmp_path / "large.py"
+    payload = b"a = 1\r\nb = 2\rc = 3\n\nd = 4" * 40_000
+    source.write_bytes(payload)
+    store = SourceStore()
+
+    first = store.read_bytes(source)
+    assert first == payload
+    source.write_bytes(b"")
+    source.unlink()
+
+    assert store.read_bytes(source) is first
+    assert store.line_offsets(source) == array(
+        "q", accumulate(map(len, payload.splitlines(keepends=True)), initial=0)
+    )
+    assert store.read_lines(source, 2, 3) == "b = 2\nc = 3\n"
+
+
+def test_source_store_counts_digest_lookups_apart_from_reads(tmp_path: Path) -> None:
+    source = tmp_path / "module.py"
+    source.write_text("x = 1\n", encoding="utf-8")
+    store = SourceStore()
+
+    store.content_hash(source)
+    store.content_hash(source)
+    store.content_hash(source)
+
+    stats = store.stats.as_dict()
+    assert stats["misses"] == 1
+    assert stats["digest_hits"] == 2
+    assert stats["duplicate_reads_avoided"] == 0
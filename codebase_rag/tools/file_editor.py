@@ -30,11 +30,14 @@ from tree_sitter import Node, Parser
 from codebase_rag.data_models.schemas import EditResult
 from codebase_rag.data_models.types_defs import FunctionMatch
 from codebase_rag.infrastructure.decorators import validate_project_path
+from codebase_rag.infrastructure.language_runtime import (
+    LanguageRuntime,
+    get_language_runtime,
+)
 from codebase_rag.infrastructure.language_spec import (
     get_language_for_extension,
     get_language_spec,
 )
-from codebase_rag.infrastructure.parser_loader import load_parsers
 
 from ..core import constants as cs
 from ..core import logs as ls
@@ -47,16 +50,23 @@ class FileEditor:
     A tool for performing safe, targeted edits on files within the project.
     """
 
-    def __init__(self, project_root: str = ".") -> None:
+    def __init__(
+        self,
+        project_root: str = ".",
+        language_runtime: LanguageRuntime | None = None,
+    ) -> None:
         """
         Initializes the FileEditor.
 
         Args:
             project_root (str): The absolute path to the root of the project.
+            language_runtime (LanguageRuntime | None): Loads grammars on first use;
+                defaults to the process-wide runtime.
         """
         self.project_root = Path(project_root).resolve()
         self.dmp = diff_match_patch.diff_match_patch()
-        self.parsers, _ = load_parsers()
+        self.language_runtime = language_runtime or get_language_runtime()
+        self.parsers = self.language_runtime.parsers
         logger.info(ls.FILE_EDITOR_INIT.format(root=self.project_root))
 
     def _get_real_extension(self, file_path_obj: Path) -> str:
@@ -90,7 +100,7 @@ class FileEditor:
         extension = self._get_real_extension(file_path_obj)
 
         lang_name = get_language_for_extension(extension)
-        return self.parsers.get(lang_name) if lang_name else None
+        return self.language_runtime.parser_for(lang_name) if lang_name else None
 
     def get_ast(self, file_path: str) -> Node | None:
         """
@@ -5,6 +5,13 @@ from typing import Any, Protocol
 from loguru import logger
 
 from codebase_rag.core.config import settings
+from codebase_rag.utils.graph_cycles import analyze_cycles
+
+_PROJECT_NODES = """
+MATCH (n)
+WHERE n.project_name = $project_name
+   OR n.qualified_name STARTS WITH ($project_name + '.')
+"""
 
 
 class GraphQueryProtocol(Protocol):
@@ -22,8 +29,11 @@ class GraphAlgorithms:
     This tool is strictly for maintenance/analytics hooks, not for general agent tool use.
     """
 
-    def __init__(self, query_engine: GraphQueryProtocol):
+    def __init__(
+        self, query_engine: GraphQueryProtocol, project_name: str | None = None
+    ):
         self.query_engine = query_engine
+        self.project_name = project_name
         self._mage_checked = False
         self._mage_available = False
 
@@ -110,7 +120,13 @@ class GraphAlgorithms:
         Can be configured with:
         - CODEGRAPH_CYCLE_LIMIT: Max number of cycles to process (default: 100)
         - CODEGRAPH_CYCLE_MIN_SIZE: Minimum cycle size to consider (default: 2)
+
+        Falls back to an in-process SCC/Johnson pass when MAGE is unavailable.
         """
+        if not self._is_mage_available():
+            self.detect_cycles_offline()
+            return
+
         logger.info("Running MAGE Cycle Detection...")
 
         try:
@@ -156,6 +172,76 @@ class GraphAlgorithms:
                 "Consider disabling cycle detection with CODEGRAPH_MAGE_CYCLES=false in .env for large graphs."
             )
 
+    def detect_cycles_offline(self) -> None:
+        """
+        Marks cycle participants without MAGE by loading dependency edges and
+        running Tarjan SCC detection plus bounded Johnson cycle enumeration.
+        Honours the same CODEGRAPH_CYCLE_LIMIT / CODEGRAPH_CYCLE_MIN_SIZE settings.
+        When a project name is set, only edges leaving that project's nodes are
+        loaded and only its nodes are reset, so other projects keep their marks.
+        """
+        logger.info("Running offline cycle detection...")
+
+        try:
+            cycle_limit = settings.CODEGRAPH_CYCLE_LIMIT
+            min_cycle_size = settings.CODEGRAPH_CYCLE_MIN_SIZE
+
+            if self.project_name is None:
+                scope = "MATCH (n)\n"
+                params: dict[str, Any] | None = None
+            else:
+                scope = _PROJECT_NODES
+                params = {"project_name": self.project_name}
+            edge_query = f"""{scope}
+            MATCH (n)-[:CALLS|IMPORTS|INHERITS]->(b)
+            RETURN DISTINCT id(n) AS source, id(b) AS target;
+            """
+            graph: dict[int, set[int]] = {}
+            for row in self.query_engine.fetch_all(edge_query, params):
+                graph.setdefault(int(row["source"]), set()).add(int(row["target"]))
+
+            analysis = analyze_cycles(
+                graph, max_cycles=cycle_limit, min_cycle_size=min_cycle_size
+            )
+            cycle_sizes: dict[int, int] = {}
+            for cycle in analysis.cycles:
+                for node_id in cycle:
+                    cycle_sizes[node_id] = max(cycle_sizes.get(node_id, 0), len(cycle))
+
+            reset_query = f"""{scope}
+            WITH n WHERE n.has_cycle = true
+            REMOVE n.has_cycle, n.cycle_size;
+            """
+            self.query_engine.execute_write(reset_query, params)
+            if not cycle_sizes:
+                logger.info("Offline cycle detection completed: No cycles found.")
+                return
+
+            write_query = """
+            UNWIND $rows AS row
+            MATCH (n) WHERE id(n) = row.node_id
+            SET n.has_cycle = true, n.cycle_size = row.cycle_size;
+            """
+            self.query_engine.execute_write(
+                write_query,
+                {
+                    "rows": [
+                        {"node_id": node_id, "cycle_size": size}
+                        for node_id, size in cycle_sizes.items()
+                    ]
+                },
+            )
+            stats = analysis.component_stats()
+            logger.info(
+                f"Offline cycle detection completed: {len(cycle_sizes)} nodes marked "
+                f"from {len(analysis.cycles)} cycles across {stats['components']} "
+                f"strongly connected components (largest: {stats['largest_component']}, "
+                f"truncated: {analysis.truncated}, limit: {cycle_limit})"
+            )
+
+        except Exception as e:
+            logger.error(f"Failed to run offline cycle detection: {e}")
+
     def run_all(self, has_changes: bool = True) -> None:
         """Runs all registered graph analysis algorithms."""
         if not has_changes:
@@ -163,6 +249,8 @@ class GraphAlgorithms:
             return
         if not self._is_mage_available():
             logger.info("Skipping MAGE graph algorithms: MAGE not available.")
+            if settings.CODEGRAPH_MAGE_CYCLES:
+                self.detect_cycles_offline()
             return
         self.run_pagerank()
         self.detect_communities()
@@ -11,6 +11,7 @@ Key functionalities:
 -   Verifying the connection to the Memgraph database.
 -   Ensuring that required API keys are set in the environment or settings.
 -   Checking for the presence of essential command-line tools (e.g., `rg`).
+-   Measuring the cold-start time and resident memory of the tree-sitter grammars.
 -   Aggregating the results of all checks into a summary.
 """
 
@@ -18,12 +19,14 @@ from __future__ import annotations
 
 import os
 import subprocess
+from pathlib import Path
 
 import mgclient  # ty: ignore[unresolved-import]
 from loguru import logger
 
 from codebase_rag.core.config import settings
 from codebase_rag.data_models.schemas import HealthCheckResult
+from codebase_rag.infrastructure.language_runtime import compare_language_startup
 
 from ..core import constants as cs
 
@@ -249,6 +252,62 @@ class HealthChecker:
                 error=str(e),
             )
 
+    def check_parser_startup(self, repo_path: Path | None = None) -> HealthCheckResult:
+        """
+        Measures how long the tree-sitter grammars take to load and their memory cost.
+
+        The languages of the repository, which is all on-demand loading pays for,
+        are measured first, followed by every available language.
+
+        Args:
+            repo_path (Path | None): The repository to inventory. Defaults to the
+                current working directory.
+
+        Returns:
+            HealthCheckResult: The result of the grammar startup check.
+        """
+        try:
+            startup = compare_language_startup(repo_path or Path.cwd())
+        except Exception as e:
+            return HealthCheckResult(
+                name=cs.HEALTH_CHECK_PARSER_STARTUP_FAILED,
+                passed=False,
+                message=cs.HEALTH_CHECK_TOOL_FAILED_MSG,
+                error=str(e),
+            )
+
+        on_demand = startup["on_demand"]
+        every_language = startup["all_languages"]
+        if not every_language["languages"]:
+            return HealthCheckResult(
+                name=cs.HEALTH_CHECK_PARSER_STARTUP_FAILED,
+                passed=False,
+                message=cs.HEALTH_CHECK_TOOL_FAILED_MSG,
+                error=", ".join(every_language["failed"]) or None,
+            )
+        return HealthCheckResult(
+            name=cs.HEALTH_CHECK_PARSER_STARTUP.format(
+                on_demand_count=len(on_demand["languages"]),
+                on_demand_seconds=on_demand["seconds"],
+                on_demand_rss=self._format_rss(on_demand),
+                all_count=len(every_language["languages"]),
+                all_seconds=every_language["seconds"],
+                all_rss=self._format_rss(every_language),
+            ),
+            passed=True,
+            message=cs.HEALTH_CHECK_PARSER_STARTUP_MSG.format(
+                languages=", ".join(every_language["languages"])
+            ),
+        )
+
+    @staticmethod
+    def _format_rss(report: dict[str, object]) -> str:
+        before = report.get("rss_before_mb")
+        after = report.get("rss_after_mb")
+        if not isinstance(before, float) or not isinstance(after, float):
+            return cs.HEALTH_CHECK_PARSER_RSS_UNKNOWN
+        return cs.HEALTH_CHECK_PARSER_RSS.format(before=before, after=after)
+
     def run_all_checks(self) -> list[HealthCheckResult]:
         """
         Runs all defined health checks.
@@ -262,6 +321,7 @@ class HealthChecker:
         self.results.extend(self.check_api_keys())
         for tool_name, cmd in cs.HEALTH_CHECK_EXTERNAL_TOOLS:
             self.results.append(self.check_external_tool(tool_name, cmd))
+        self.results.append(self.check_parser_startup())
         return self.results
 
     def get_summary(self) -> tuple[int, int]:
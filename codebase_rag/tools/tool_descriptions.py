@@ -308,8 +308,9 @@ MCP_TEST_BUNDLE = (
 )
 
 MCP_EXPORT_MERMAID = (
-    "Export a Mermaid diagram generated from current graph data to disk. "
-    "Provide a diagram type/name supported by MermaidExporter and optionally an output path."
+    "Export a Mermaid diagram for the active project to disk. "
+    "Provide a diagram type/name (module, call, flow, dependency, class, entity) "
+    "and optionally an output path. Node and edge counts are capped server-side."
 )
 
 MCP_RUN_CYPHER = (
@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Literal
+
+from loguru import logger
+
+from ..core.constants import ENCODING_UTF8
+from .git_delta import get_git_head
+
+CHURN_INDEX_VERSION = 1
+_COMMIT_MARKER = "\x1e"
+
+ChurnRefreshMode = Literal["unchanged", "incremental", "full", "unavailable"]
+
+
+@dataclass(frozen=True, slots=True)
+class ChurnRefresh:
+    mode: ChurnRefreshMode
+    commits: int
+
+    @property
+    def changed(self) -> bool:
+        return self.mode in ("incremental", "full")
+
+
+@dataclass(slots=True)
+class ChurnIndex:
+    head: str | None = None
+    commits: int = 0
+    churn: dict[str, int] = field(default_factory=dict)
+    authors: dict[str, dict[str, int]] = field(default_factory=dict)
+
+    @classmethod
+    def load(cls, path: Path) -> ChurnIndex:
+        try:
+            payload = json.loads(path.read_text(encoding=ENCODING_UTF8))
+        except (OSError, ValueError):
+            return cls()
+        if not isinstance(payload, dict) or (
+            payload.get("version") != CHURN_INDEX_VERSION
+        ):
+            return cls()
+        return cls(
+            head=payload.get("head"),
+            commits=int(payload.get("commits") or 0),
+            churn=dict(payload.get("churn") or {}),
+            authors={
+                path: dict(counts)
+                for path, counts in (payload.get("authors") or {}).items()
+            },
+        )
+
+    def save(self, path: Path) -> None:
+        payload = {
+            "version": CHURN_INDEX_VERSION,
+            "head": self.head,
+            "commits": self.commits,
+            "churn": self.churn,
+            "authors": self.authors,
+        }
+        path.parent.mkdir(parents=True, exist_ok=True)
+        staging = path.with_name(f"{path.name}.tmp")
+        staging.write_text(
+            json.dumps(payload, ensure_ascii=False), encoding=ENCODING_UTF8
+        )
+        os.replace(staging, path)
+
+    def refresh(self, repo_path: Path) -> ChurnRefresh:
+        head = get_git_head(repo_path)
+        if head is None:
+            return ChurnRefresh("unavailable", 0)
+        if head == self.head:
+            return ChurnRefresh("unchanged", 0)
+        if self.head is not None and _is_ancestor(repo_path, self.head, head):
+            commits = self._ingest(_git_log(repo_path, f"{self.head}..{head}"))
+            if commits is not None:
+                self.head = head
+                return ChurnRefresh("incremental", commits)
+        self.commits = 0
+        self.churn.clear()
+        self.authors.clear()
+        commits = self._ingest(_git_log(repo_path, head))
+        if commits is None:
+            self.head = None
+            return ChurnRefresh("unavailable", 0)
+        self.head = head
+        return ChurnRefresh("full", commits)
+
+    def owner(self, path: str) -> str | None:
+        counts = self.authors.get(path)
+        if not counts:
+            return None
+        return max(counts.items(), key=lambda item: item[1])[0]
+
+    def _ingest(self, lines: Iterable[str] | None) -> int | None:
+        if lines is None:
+            return None
+        commits = 0
+        author: str | None = None
+        for line in lines:
+            if line.startswith(_COMMIT_MARKER):
+                commits += 1
+                author = line[1:].strip() or None
+                continue
+            path = line.strip().replace("\\", "/")
+            if not path:
+                continue
+            self.churn[path] = self.churn.get(path, 0) + 1
+            if author:
+                counts = self.authors.setdefault(path, {})
+                counts[author] = counts.get(author, 0) + 1
+        self.commits += commits
+        return commits
+
+
+def _is_ancestor(repo_path: Path, ancestor: str, head: str) -> bool:
+    try:
+        result = subprocess.run(
+            ["git", "merge-base", "--is-ancestor", ancestor, head],
+            cwd=str(repo_path),
+            capture_output=True,
+            check=False,
+        )
+    except OSError as exc:
+        logger.debug("Failed to compare churn index head: {}", exc)
+        return False
+    return result.returncode == 0
+
+
+def _git_log(repo_path: Path, revision_range: str) -> list[str] | None:
+    try:
+        result = subprocess.run(
+            [
+                "git",
+                "-c",
+                "core.quotePath=false",
+                "log",
+                "--name-only",
+                f"--pretty=format:{_COMMIT_MARKER}%an",
+                revision_range,
+                "--",
+            ],
+            cwd=str(repo_path),
+            capture_output=True,
+            text=True,
+            encoding=ENCODING_UTF8,
+            errors="replace",
+            check=False,
+        )
+    except OSError as exc:
+        logger.debug("Failed to read git history for churn index: {}", exc)
+        return None
+    if result.returncode != 0:
+        return None
+    return result.stdout.split("\n")
@@ -0,0 +1,219 @@
+from __future__ import annotations
+
+import time
+from array import array
+from collections import defaultdict
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from dataclasses import dataclass
+from itertools import repeat
+
+DEFAULT_CYCLES_PER_COMPONENT = 10
+DEFAULT_CYCLE_TIME_BUDGET_SECONDS = 5.0
+
+
+@dataclass(frozen=True, slots=True)
+class CycleAnalysis:
+    components: list[list[int]]
+    cycles: list[list[int]]
+    truncated: bool
+
+    @property
+    def cyclic_nodes(self) -> set[int]:
+        return {node_id for component in self.components for node_id in component}
+
+    def component_stats(self) -> dict[str, int | float]:
+        sizes = [len(component) for component in self.components]
+        return {
+            "components": len(sizes),
+            "largest_component": max(sizes, default=0),
+            "nodes_in_components": sum(sizes),
+            "mean_component_size": round(sum(sizes) / len(sizes), 2) if sizes else 0,
+        }
+
+
+def tarjan_components(
+    node_count: int, successors: Callable[[int], Iterable[int]]
+) -> list[list[int]]:
+    order = array("i", repeat(-1, node_count))
+    low = array("i", repeat(0, node_count))
+    on_stack = bytearray(node_count)
+    stack: list[int] = []
+    components: list[list[int]] = []
+    counter = 0
+    for root in range(node_count):
+        if order[root] != -1:
+            continue
+        order[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack[root] = 1
+        work: list[tuple[int, Iterator[int]]] = [(root, iter(successors(root)))]
+        while work:
+            current, pending = work[-1]
+            for successor in pending:
+                if order[successor] == -1:
+                    order[successor] = low[successor] = counter
+                    counter += 1
+                    stack.append(successor)
+                    on_stack[successor] = 1
+                    work.append((successor, iter(successors(successor))))
+                    break
+                if on_stack[successor] and order[successor] < low[current]:
+                    low[current] = order[successor]
+            else:
+                work.pop()
+                if work and low[current] < low[work[-1][0]]:
+                    low[work[-1][0]] = low[current]
+                if low[current] == order[current]:
+                    component: list[int] = []
+                    while True:
+                        member = stack.pop()
+                        on_stack[member] = 0
+                        component.append(member)
+                        if member == current:
+                            break
+                    components.append(component)
+    return components
+
+
+def cyclic_components(graph: Mapping[int, Iterable[int]]) -> list[list[int]]:
+    node_ids: list[int] = []
+    dense_ids: dict[int, int] = {}
+    for source_id, targets in graph.items():
+        for node_id in (source_id, *targets):
+            if node_id not in dense_ids:
+                dense_ids[node_id] = len(node_ids)
+                node_ids.append(node_id)
+    adjacency = [[] for _ in node_ids]
+    for source_id, targets in graph.items():
+        adjacency[dense_ids[source_id]].extend(dense_ids[t] for t in targets)
+
+    components: list[list[int]] = []
+    for component in tarjan_components(len(node_ids), adjacency.__getitem__):
+        if len(component) == 1 and component[0] not in adjacency[component[0]]:
+            continue
+        components.append(sorted(node_ids[member] for member in component))
+    components.sort(key=lambda component: (-len(component), component[0]))
+    return components
+
+
+def analyze_cycles(
+    graph: Mapping[int, Iterable[int]],
+    *,
+    max_cycles_per_component: int = DEFAULT_CYCLES_PER_COMPONENT,
+    max_cycles: int | None = None,
+    min_cycle_size: int = 1,
+    time_budget_seconds: float = DEFAULT_CYCLE_TIME_BUDGET_SECONDS,
+) -> CycleAnalysis:
+    components = cyclic_components(graph)
+    deadline = time.monotonic() + time_budget_seconds
+    cycles: list[list[int]] = []
+    truncated = False
+    for component in components:
+        if max_cycles is not None and len(cycles) >= max_cycles:
+            truncated = True
+            break
+        budget = max_cycles_per_component
+        if max_cycles is not None:
+            budget = min(budget, max_cycles - len(cycles))
+        found, exhausted = _sample_component_cycles(
+            graph,
+            component,
+            limit=budget,
+            min_cycle_size=min_cycle_size,
+            deadline=deadline,
+        )
+        cycles.extend(found)
+        if not exhausted:
+            truncated = True
+        if time.monotonic() >= deadline:
+            truncated = True
+            break
+    return CycleAnalysis(components=components, cycles=cycles, truncated=truncated)
+
+
+def _sample_component_cycles(
+    graph: Mapping[int, Iterable[int]],
+    component: Sequence[int],
+    *,
+    limit: int,
+    min_cycle_size: int,
+    deadline: float,
+) -> tuple[list[list[int]], bool]:
+    found: list[list[int]] = []
+    if limit <= 0:
+        return found, False
+    pending = [list(component)]
+    while pending:
+        members = pending.pop()
+        member_set = set(members)
+        local = {
+            node_id: [
+                target for target in graph.get(node_id, ()) if target in member_set
+            ]
+            for node_id in members
+        }
+        start = members[0]
+        for cycle in _johnson_circuits(start, local):
+            if len(cycle) >= min_cycle_size:
+                found.append(cycle)
+                if len(found) >= limit:
+                    return found, False
+            if time.monotonic() >= deadline:
+                return found, False
+        pending.extend(
+            reversed(
+                cyclic_components(
+                    {
+                        node_id: [
+                            target for target in local[node_id] if target != start
+                        ]
+                        for node_id in members[1:]
+                    }
+                )
+            )
+        )
+    return found, True
+
+
+def _johnson_circuits(
+    start: int, local: Mapping[int, list[int]]
+) -> Iterator[list[int]]:
+    path = [start]
+    blocked = {start}
+    closed: set[int] = set()
+    blocked_by: defaultdict[int, set[int]] = defaultdict(set)
+    stack = [(start, list(local[start]))]
+    while stack:
+        current, pending = stack[-1]
+        if pending:
+            target = pending.pop()
+            if target == start:
+                yield list(path)
+                closed.update(path)
+            elif target not in blocked:
+                path.append(target)
+                stack.append((target, list(local[target])))
+                closed.discard(target)
+                blocked.add(target)
+                continue
+        if not pending:
+            if current in closed:
+                _unblock(current, blocked, blocked_by)
+            else:
+                for target in local[current]:
+                    blocked_by[target].add(current)
+            stack.pop()
+            path.pop()
+
+
+def _unblock(
+    node_id: int, blocked: set[int], blocked_by: defaultdict[int, set[int]]
+) -> None:
+    pending = {node_id}
+    while pending:
+        current = pending.pop()
+        if current in blocked:
+            blocked.remove(current)
+            pending.update(blocked_by[current])
+            blocked_by[current].clear()
@@ -8,10 +8,16 @@ from loguru import logger
 from codebase_rag.core.constants import ENCODING_UTF8
 
 from ..core import logs as ls
+from .source_store import SourceStore
 
 
 def extract_source_lines(
-    file_path: Path, start_line: int, end_line: int, encoding: str = ENCODING_UTF8
+    file_path: Path,
+    start_line: int,
+    end_line: int,
+    encoding: str = ENCODING_UTF8,
+    *,
+    source_store: SourceStore | None = None,
 ) -> str | None:
     if not file_path.exists():
         logger.warning(ls.SOURCE_FILE_NOT_FOUND.format(path=file_path))
@@ -21,6 +27,11 @@ def extract_source_lines(
         logger.warning(ls.SOURCE_INVALID_RANGE.format(start=start_line, end=end_line))
         return None
 
+    if source_store is not None and (
+        text := source_store.read_lines(file_path, start_line, end_line)
+    ):
+        return text.strip()
+
     try:
         with open(file_path, encoding=encoding) as f:
             lines = f.readlines()
@@ -53,6 +64,8 @@ def extract_source_with_fallback(
     qualified_name: str | None = None,
     ast_extractor: Callable[[str, Path], str | None] | None = None,
     encoding: str = ENCODING_UTF8,
+    *,
+    source_store: SourceStore | None = None,
 ) -> str | None:
     if ast_extractor and qualified_name:
         try:
@@ -61,7 +74,9 @@ def extract_source_with_fallback(
         except Exception as e:
             logger.debug(ls.SOURCE_AST_FAILED.format(name=qualified_name, error=e))
 
-    return extract_source_lines(file_path, start_line, end_line, encoding)
+    return extract_source_lines(
+        file_path, start_line, end_line, encoding, source_store=source_store
+    )
 
 
 def validate_source_location(
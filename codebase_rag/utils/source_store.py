@@ -0,0 +1,212 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+from array import array
+from collections import OrderedDict
+from dataclasses import dataclass
+from itertools import accumulate
+from pathlib import Path
+
+from loguru import logger
+
+from ..core.constants import BYTES_PER_MB, ENCODING_UTF8
+
+_OFFSET_TYPECODE = "q"
+
+
+@dataclass(slots=True)
+class _SourceEntry:
+    data: bytes
+    text: str | None = None
+    line_offsets: array | None = None
+
+    @property
+    def footprint(self) -> int:
+        footprint = len(self.data)
+        if self.text is not None:
+            footprint += len(self.text)
+        if self.line_offsets is not None:
+            footprint += len(self.line_offsets) * self.line_offsets.itemsize
+        return footprint
+
+
+@dataclass(slots=True)
+class SourceStoreStats:
+    hits: int = 0
+    digest_hits: int = 0
+    misses: int = 0
+    bytes_read: int = 0
+    evictions: int = 0
+    read_errors: int = 0
+
+    @property
+    def duplicate_reads_avoided(self) -> int:
+        return self.hits
+
+    def as_dict(self) -> dict[str, int]:
+        return {
+            "hits": self.hits,
+            "digest_hits": self.digest_hits,
+            "misses": self.misses,
+            "bytes_read": self.bytes_read,
+            "evictions": self.evictions,
+            "read_errors": self.read_errors,
+            "duplicate_reads_avoided": self.duplicate_reads_avoided,
+        }
+
+
+class SourceStore:
+    """Run-scoped cache of repository file contents.
+
+    Every file is read from disk once; later callers get the cached bytes,
+    decoded text, line offsets and SHA-256 content hash. Contents are always
+    copied onto the heap: a mapping kept open for the run would fault when
+    another process truncates the file and would lock it on Windows.
+    Resident contents are capped at ``max_bytes`` and evicted least recently
+    used first; content hashes outlive eviction, so hashing an evicted file
+    does not read it again.
+    """
+
+    def __init__(self, max_bytes: int = 256 * BYTES_PER_MB) -> None:
+        self.max_bytes = max_bytes
+        self.stats = SourceStoreStats()
+        self._entries: OrderedDict[str, _SourceEntry] = OrderedDict()
+        self._digests: dict[str, str] = {}
+        self._resident_bytes = 0
+        self._lock = threading.RLock()
+
+    def read_bytes(
+        self, path: Path | str, *, max_bytes: int | None = None
+    ) -> bytes | None:
+        entry = self._entry(path, max_bytes=max_bytes)
+        return entry.data if entry is not None else None
+
+    def read_text(
+        self, path: Path | str, *, max_bytes: int | None = None
+    ) -> str | None:
+        key = os.path.abspath(path)
+        entry = self._entry(key, max_bytes=max_bytes)
+        if entry is None:
+            return None
+        if entry.text is None:
+            text = str(entry.data, ENCODING_UTF8, "ignore")
+            with self._lock:
+                if entry.text is None:
+                    entry.text = text
+                    self._grow(key, entry, len(text))
+        return entry.text
+
+    def content_hash(self, path: Path | str) -> str | None:
+        key = os.path.abspath(path)
+        with self._lock:
+            digest = self._digests.get(key)
+        if digest is not None:
+            with self._lock:
+                self.stats.digest_hits += 1
+            return digest
+        entry = self._entry(key)
+        if entry is None:
+            return None
+        digest = hashlib.sha256(entry.data).hexdigest()
+        with self._lock:
+            self._digests[key] = digest
+        return digest
+
+    def line_offsets(self, path: Path | str) -> array | None:
+        key = os.path.abspath(path)
+        entry = self._entry(key)
+        return self._line_offsets(key, entry) if entry is not None else None
+
+    def line_count(self, path: Path | str) -> int:
+        offsets = self.line_offsets(path)
+        return len(offsets) - 1 if offsets is not None else 0
+
+    def read_lines(
+        self, path: Path | str, start_line: int, end_line: int
+    ) -> str | None:
+        if start_line < 1 or end_line < start_line:
+            return None
+        key = os.path.abspath(path)
+        entry = self._entry(key)
+        if entry is None:
+            return None
+        offsets = self._line_offsets(key, entry)
+        if start_line > len(offsets) - 1:
+            return None
+        end_line = min(end_line, len(offsets) - 1)
+        chunk = entry.data[offsets[start_line - 1] : offsets[end_line]]
+        text = chunk.decode(ENCODING_UTF8, errors="ignore")
+        if "\r" in text:
+            text = text.replace("\r\n", "\n").replace("\r", "\n")
+        return text
+
+    def invalidate(self, path: Path | str) -> None:
+        key = os.path.abspath(path)
+        with self._lock:
+            self._digests.pop(key, None)
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self._resident_bytes -= entry.footprint
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._digests.clear()
+            self._resident_bytes = 0
+
+    def _line_offsets(self, key: str, entry: _SourceEntry) -> array:
+        if entry.line_offsets is None:
+            offsets = array(_OFFSET_TYPECODE, [0])
+            offsets.extend(accumulate(map(len, entry.data.splitlines(keepends=True))))
+            with self._lock:
+                if entry.line_offsets is None:
+                    entry.line_offsets = offsets
+                    self._grow(key, entry, len(offsets) * offsets.itemsize)
+        return entry.line_offsets
+
+    def _entry(
+        self, path: Path | str, *, max_bytes: int | None = None
+    ) -> _SourceEntry | None:
+        key = os.path.abspath(path)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if max_bytes is not None and len(entry.data) > max_bytes:
+                    return None
+                self._entries.move_to_end(key)
+                self.stats.hits += 1
+                return entry
+        try:
+            file_path = Path(key)
+            size = file_path.stat().st_size
+            if max_bytes is not None and size > max_bytes:
+                return None
+            data = file_path.read_bytes()
+        except (OSError, ValueError) as exc:
+            logger.debug("Source store could not read {}: {}", key, exc)
+            with self._lock:
+                self.stats.read_errors += 1
+            return None
+        entry = _SourceEntry(data)
+        with self._lock:
+            self.stats.misses += 1
+            self.stats.bytes_read += len(data)
+            existing = self._entries.get(key)
+            if existing is not None:
+                return existing
+            if len(data) <= self.max_bytes:
+                self._entries[key] = entry
+                self._grow(key, entry, len(data))
+        return entry
+
+    def _grow(self, key: str, entry: _SourceEntry, size: int) -> None:
+        if self._entries.get(key) is not entry:
+            return
+        self._entries.move_to_end(key)
+        self._resident_bytes += size
+        while self._resident_bytes > self.max_bytes and len(self._entries) > 1:
+            _, evicted = self._entries.popitem(last=False)
+            self._resident_bytes -= evicted.footprint
+            self.stats.evictions += 1